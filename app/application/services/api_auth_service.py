@@ -1,11 +1,19 @@
 from datetime import datetime, UTC
+from app.application.services.api_key_usage_accumulator import ApiKeyUsageAccumulator
 from app.domain.models.api_key import ApiKey
 from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
 from app.infrastructure.exceptions.database_exception import DatabaseException
 
 class ApiAuthService:
-    def __init__(self, api_key_repository: AbstractApiKeyRepository):
+    def __init__(self, api_key_repository: AbstractApiKeyRepository,
+                 validated_keys: LruTtlCache[str, bool] | None = None,
+                 usage: ApiKeyUsageAccumulator | None = None):
         self._repository = api_key_repository
+        # Keys validated within the cache TTL skip the lookup
+        self._validated_keys = validated_keys
+        # With an accumulator, last_used and request counts are written in batches
+        self._usage = usage
 
     def generate_api_key(self, description: str | None = None) -> ApiKey:
         try:
@@ -17,22 +25,58 @@ class ApiAuthService:
 
     def validate_api_key(self, key: str) -> bool:
         """Validate the provided API key and update last used timestamp"""
+        if self._validated_keys is not None and self._validated_keys.get(key):
+            self._record_usage(key)
+            return True
+
         try:
             api_key = self._repository.get_api_key(key)
             if not api_key:
                 return False
 
-            # Update last used timestamp
-            now = datetime.now(UTC)
-            try:
-                self._repository.update_api_key(key, now)
-            except Exception as e:
-                pass
-                # Continue even if update_last_used fails
+            if self._usage is not None:
+                self._record_usage(key)
+            else:
+                # Update last used timestamp
+                now = datetime.now(UTC)
+                try:
+                    self._repository.update_api_key(key, now)
+                except Exception as e:
+                    pass
+                    # Continue even if update_last_used fails
 
+            if self._validated_keys is not None:
+                self._validated_keys.put(key, True)
             return True
 
         except DatabaseException as e:
             raise e
         except Exception as e:
             raise e
+
+    def revoke_api_key(self, key: str) -> bool:
+        """Deletes the key and stops accepting it in this process; returns False if it did not exist"""
+        self.forget_api_key(key)
+        return self._repository.delete_api_key(key)
+
+    def forget_api_key(self, key: str) -> None:
+        """Revocation hook: drop a key revoked elsewhere from the validated-key cache"""
+        if self._validated_keys is not None:
+            self._validated_keys.invalidate(key)
+
+    def _record_usage(self, key: str) -> None:
+        if self._usage is not None and self._usage.record(key, datetime.now(UTC)):
+            self.flush_usage()
+
+    def flush_usage(self) -> None:
+        """Writes the accumulated usage; failed writes are kept for the next flush"""
+        if self._usage is None:
+            return
+        usages = self._usage.drain()
+        if not usages:
+            return
+        try:
+            failed = self._repository.record_api_key_usage(usages)
+        except Exception:
+            failed = usages
+        self._usage.restore(failed)
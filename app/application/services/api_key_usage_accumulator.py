@@ -0,0 +1,66 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+from app.domain.models.api_key_usage import ApiKeyUsage
+
+
+class ApiKeyUsageAccumulator:
+    """Collects API key usage in memory so it can be written once per key per flush instead of per request.
+
+    Usage is bucketed into fixed intervals (hourly by default) keyed on the request time; a
+    flush is due once flush_interval_seconds have passed since the last one or max_pending_keys
+    distinct buckets are waiting.
+    """
+
+    def __init__(self,
+                 flush_interval_seconds: float = 60.0,
+                 max_pending_keys: int = 500,
+                 usage_interval_seconds: int = 3600,
+                 clock: Callable[[], float] = time.monotonic):
+        self._flush_interval = flush_interval_seconds
+        self._max_pending_keys = max_pending_keys
+        self._usage_interval = usage_interval_seconds
+        self._clock = clock
+        self._pending: dict[tuple[str, datetime], ApiKeyUsage] = {}
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+
+    def _interval_start(self, timestamp: datetime) -> datetime:
+        seconds = int(timestamp.timestamp())
+        return datetime.fromtimestamp(seconds - seconds % self._usage_interval, tz=timestamp.tzinfo)
+
+    def record(self, key: str, timestamp: datetime, count: int = 1) -> bool:
+        """Returns True when a flush is due"""
+        bucket = (key, self._interval_start(timestamp))
+        with self._lock:
+            usage = self._pending.get(bucket)
+            if usage is None:
+                self._pending[bucket] = ApiKeyUsage(key, bucket[1], count, timestamp)
+            else:
+                self._pending[bucket] = ApiKeyUsage(
+                    key, bucket[1], usage.request_count + count, max(usage.last_used, timestamp))
+            return self._is_flush_due()
+
+    def is_flush_due(self) -> bool:
+        with self._lock:
+            return self._is_flush_due()
+
+    def _is_flush_due(self) -> bool:
+        if not self._pending:
+            return False
+        return (len(self._pending) >= self._max_pending_keys
+                or self._clock() - self._last_flush >= self._flush_interval)
+
+    def drain(self) -> list[ApiKeyUsage]:
+        with self._lock:
+            usages = list(self._pending.values())
+            self._pending = {}
+            self._last_flush = self._clock()
+            return usages
+
+    def restore(self, usages: list[ApiKeyUsage]) -> None:
+        """Puts back usage whose write failed so the next flush retries it"""
+        for usage in usages:
+            self.record(usage.key, usage.last_used, usage.request_count)
@@ -0,0 +1,22 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ApiKeyUsageConfig:
+    # 0 restores the per-request last_used write
+    flush_interval_seconds: float = 60.0
+    max_pending_keys: int = 500
+    usage_interval_seconds: int = 3600
+
+    @property
+    def enabled(self) -> bool:
+        return self.flush_interval_seconds > 0
+
+    @classmethod
+    def from_environment(cls) -> 'ApiKeyUsageConfig':
+        return cls(
+            flush_interval_seconds=float(os.getenv('API_KEY_USAGE_FLUSH_SECONDS', '60')),
+            max_pending_keys=int(os.getenv('API_KEY_USAGE_MAX_PENDING_KEYS', '500')),
+            usage_interval_seconds=int(os.getenv('API_KEY_USAGE_INTERVAL_SECONDS', '3600'))
+        )
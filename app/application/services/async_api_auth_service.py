@@ -0,0 +1,73 @@
+from datetime import datetime, UTC
+from app.application.services.api_key_usage_accumulator import ApiKeyUsageAccumulator
+from app.domain.models.api_key import ApiKey
+from app.domain.repositories.async_api_key_repository import AbstractAsyncApiKeyRepository
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+class AsyncApiAuthService:
+    """Async counterpart of ApiAuthService used by the API key verifier and router"""
+
+    def __init__(self, api_key_repository: AbstractAsyncApiKeyRepository,
+                 validated_keys: LruTtlCache[str, bool] | None = None,
+                 usage: ApiKeyUsageAccumulator | None = None):
+        self._repository = api_key_repository
+        # Keys validated within the cache TTL skip the lookup
+        self._validated_keys = validated_keys
+        # With an accumulator, last_used and request counts are written in batches
+        self._usage = usage
+
+    async def generate_api_key(self, description: str | None = None) -> ApiKey:
+        api_key = ApiKey.generate(description)
+        await self._repository.store_api_key(api_key)
+        return api_key
+
+    async def validate_api_key(self, key: str) -> bool:
+        """Validate the provided API key and update last used timestamp"""
+        if self._validated_keys is not None and self._validated_keys.get(key):
+            await self._record_usage(key)
+            return True
+
+        api_key = await self._repository.get_api_key(key)
+        if not api_key:
+            return False
+
+        if self._usage is not None:
+            await self._record_usage(key)
+        else:
+            try:
+                await self._repository.update_api_key(key, datetime.now(UTC))
+            except Exception:
+                # Continue even if update_last_used fails
+                pass
+
+        if self._validated_keys is not None:
+            self._validated_keys.put(key, True)
+        return True
+
+    async def revoke_api_key(self, key: str) -> bool:
+        """Deletes the key and stops accepting it in this process; returns False if it did not exist"""
+        self.forget_api_key(key)
+        return await self._repository.delete_api_key(key)
+
+    def forget_api_key(self, key: str) -> None:
+        """Revocation hook: drop a key revoked elsewhere from the validated-key cache"""
+        if self._validated_keys is not None:
+            self._validated_keys.invalidate(key)
+
+    async def _record_usage(self, key: str) -> None:
+        if self._usage is not None and self._usage.record(key, datetime.now(UTC)):
+            await self.flush_usage()
+
+    async def flush_usage(self) -> None:
+        """Writes the accumulated usage; failed writes are kept for the next flush"""
+        if self._usage is None:
+            return
+        usages = self._usage.drain()
+        if not usages:
+            return
+        try:
+            failed = await self._repository.record_api_key_usage(usages)
+        except Exception:
+            failed = usages
+        self._usage.restore(failed)
@@ -0,0 +1,44 @@
+from datetime import datetime, UTC
+
+import numpy as np
+import numpy.typing as npt
+
+from app.application.services.credential_batch import CredentialBatch, STATUS_CODES, epoch_micros
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.validity_reason import ValidityReason
+from app.domain.models.credential import STATUS_TRANSITION_GUARDS
+
+
+class BatchValidityEvaluator:
+    """Classifies a whole CredentialBatch with array operations instead of one Credential at a time.
+
+    Row i of evaluate() equals the credentials' validity_reason(at), so VALID rows are exactly those
+    is_valid() accepts and EXPIRED covers the ones it would raise for. transition_allowed() applies
+    STATUS_TRANSITION_GUARDS, the table update_status checks against the current status.
+    """
+
+    def evaluate(self, batch: CredentialBatch, at: datetime | None = None) -> npt.NDArray[np.uint8]:
+        """One ValidityReason code per row, as a uint8 array"""
+        now = epoch_micros(at if at is not None else datetime.now(UTC))
+        status = batch.status
+        # np.select takes the first matching condition, the same precedence as Credential.validity_reason
+        conditions = [
+            (batch.valid_until < now) | (status == STATUS_CODES[CredentialStatus.EXPIRED]),
+            status == STATUS_CODES[CredentialStatus.REVOKED],
+            status == STATUS_CODES[CredentialStatus.SUSPENDED],
+            batch.valid_from > now
+        ]
+        choices = [ValidityReason.EXPIRED, ValidityReason.REVOKED, ValidityReason.SUSPENDED,
+                   ValidityReason.NOT_YET_VALID]
+        return np.select(conditions, choices, default=ValidityReason.VALID).astype(np.uint8)
+
+    @staticmethod
+    def transition_allowed(batch: CredentialBatch, status: CredentialStatus) -> npt.NDArray[np.bool_]:
+        """Rows whose current status may move to status; reason checks depend on the request, not the row"""
+        forbidden = [STATUS_CODES[current] for current in STATUS_TRANSITION_GUARDS[status]]
+        return ~np.isin(batch.status, forbidden)
+
+    @staticmethod
+    def summarize(reasons: npt.NDArray[np.uint8]) -> dict[ValidityReason, int]:
+        counts = np.bincount(reasons, minlength=len(ValidityReason))
+        return {reason: int(counts[reason]) for reason in ValidityReason}
@@ -0,0 +1,144 @@
+import gzip
+import json
+import warnings
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.infrastructure.persistence.mappers.credential_mapper import decode_status
+
+# Codes held in CredentialBatch.status, in declaration order of CredentialStatus
+STATUS_CODES: dict[CredentialStatus, int] = {status: code for code, status in enumerate(CredentialStatus)}
+
+_CODES_BY_STATUS_VALUE = {status.value: code for status, code in STATUS_CODES.items()}
+_CREDENTIAL_TYPE_VALUES = frozenset(credential_type.value for credential_type in CredentialType)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_UTC_SUFFIX = '+00:00'
+
+
+def epoch_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _stored_micros(value: str | int | Decimal) -> int:
+    """epoch_micros of a stored timestamp in either item encoding, without building a datetime for numbers"""
+    if isinstance(value, str):
+        return epoch_micros(datetime.fromisoformat(value))
+    return int(value * 1_000_000)
+
+
+def _iso_micros(values: list[str]) -> npt.NDArray[np.int64]:
+    """epoch_micros of ISO-8601 strings, parsed by numpy in one call.
+
+    Credentials hold UTC timestamps, so exports end in +00:00, which is dropped. numpy still applies
+    any other offset, only warning that datetime64 itself carries none.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', 'no explicit representation of timezones', UserWarning)
+        return np.array([value.removesuffix(_UTC_SUFFIX) for value in values],
+                        dtype='datetime64[us]').astype(np.int64)
+
+
+def _status_codes(values: list[str]) -> npt.NDArray[np.uint8]:
+    """STATUS_CODES of full status values, without building a CredentialStatus per row"""
+    try:
+        return np.fromiter(map(_CODES_BY_STATUS_VALUE.__getitem__, values), dtype=np.uint8, count=len(values))
+    except KeyError as error:
+        raise ValueError(f"{error.args[0]!r} is not a valid CredentialStatus") from None
+
+
+class CredentialBatch:
+    """Validity windows and statuses of many credentials as parallel columns.
+
+    credential_id, credential_type (CredentialType values) and issuing_country are string arrays that
+    identify each row; valid_from and valid_until are int64 microseconds since the epoch and status
+    holds STATUS_CODES. Build one with the from_* constructors and classify it with
+    BatchValidityEvaluator.
+    """
+
+    def __init__(self, credential_id: npt.NDArray[np.str_], credential_type: npt.NDArray[np.str_],
+                 issuing_country: npt.NDArray[np.str_], valid_from: npt.NDArray[np.int64],
+                 valid_until: npt.NDArray[np.int64], status: npt.NDArray[np.uint8]):
+        if not (len(credential_id) == len(credential_type) == len(issuing_country) == len(valid_from)
+                == len(valid_until) == len(status)):
+            raise ValueError("Batch columns must all have the same length")
+        self.credential_id = credential_id
+        self.credential_type = credential_type
+        self.issuing_country = issuing_country
+        self.valid_from = valid_from
+        self.valid_until = valid_until
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.credential_id)
+
+    def key(self, row: int) -> CredentialKey:
+        return CredentialKey(str(self.credential_id[row]), CredentialType(self.credential_type[row]),
+                             str(self.issuing_country[row]))
+
+    @classmethod
+    def from_credentials(cls, credentials: Iterable[Credential]) -> 'CredentialBatch':
+        credentials = list(credentials)
+        return cls._from_columns(
+            [str(credential.credential_id) for credential in credentials],
+            [credential.get_credential_type().value for credential in credentials],
+            [credential.issuing_country for credential in credentials],
+            np.array([epoch_micros(credential.valid_from) for credential in credentials], dtype=np.int64),
+            np.array([epoch_micros(credential.valid_until) for credential in credentials], dtype=np.int64),
+            np.array([STATUS_CODES[credential.status] for credential in credentials], dtype=np.uint8))
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> 'CredentialBatch':
+        """Credential items as read through the mappers' table, in either item encoding"""
+        items = list(items)
+        return cls._from_columns(
+            [item['credential_id'] for item in items],
+            [item['credential_type'] for item in items],
+            [item['issuing_country'] for item in items],
+            np.array([_stored_micros(item['valid_from']) for item in items], dtype=np.int64),
+            np.array([_stored_micros(item['valid_until']) for item in items], dtype=np.int64),
+            np.array([STATUS_CODES[decode_status(item['status'])] for item in items], dtype=np.uint8))
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> 'CredentialBatch':
+        """Records in the shape CredentialTableExporter writes: ISO-8601 timestamps and full status values"""
+        records = list(records)
+        return cls._from_columns(
+            [record['credential_id'] for record in records],
+            [record['credential_type'] for record in records],
+            [record['issuing_country'] for record in records],
+            _iso_micros([record['valid_from'] for record in records]),
+            _iso_micros([record['valid_until'] for record in records]),
+            _status_codes([record['status'] for record in records]))
+
+    @classmethod
+    def from_export(cls, paths: Iterable[Path]) -> 'CredentialBatch':
+        """Every record of the given gzip-compressed NDJSON export files"""
+        return cls.from_records(cls._read_records(paths))
+
+    @staticmethod
+    def _read_records(paths: Iterable[Path]) -> Iterable[dict[str, Any]]:
+        for path in paths:
+            with gzip.open(path, 'rt', encoding='utf-8') as lines:
+                # One json.loads per file rather than per line
+                yield from json.loads('[' + ','.join(line for line in lines if line.strip()) + ']')
+
+    @classmethod
+    def _from_columns(cls, credential_id: list[str], credential_type: list[str], issuing_country: list[str],
+                      valid_from: npt.NDArray[np.int64], valid_until: npt.NDArray[np.int64],
+                      status: npt.NDArray[np.uint8]) -> 'CredentialBatch':
+        unknown = set(credential_type) - _CREDENTIAL_TYPE_VALUES
+        if unknown:
+            raise ValueError(f"{min(unknown)!r} is not a valid CredentialType")
+        return cls(np.array(credential_id, dtype=np.str_), np.array(credential_type, dtype=np.str_),
+                   np.array(issuing_country, dtype=np.str_), valid_from, valid_until, status)
@@ -1,25 +1,63 @@
+import time
+from typing import Any, Callable, Collection, Iterator
+
 from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.repositories.credential_repository import AbstractCredentialRepository
 from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
 
 class CredentialService:
-    def __init__(self, repository: AbstractCredentialRepository):
+    def __init__(self, repository: AbstractCredentialRepository, conflict_backoff: BackoffPolicy | None = None):
         self._repository = repository
+        self._conflict_backoff = conflict_backoff or BackoffPolicy(max_attempts=5, base_delay=0.01, max_delay=0.2)
 
     def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
         return self._repository.get_credential(credential_id, credential_type, issuing_country)
 
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        return self._repository.get_credentials(keys)
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str, fields: Collection[str]) -> dict[str, Any]:
+        return self._repository.get_credential_fields(credential_id, credential_type, issuing_country, fields)
+
     def validate_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> CredentialStatus:
-        return self._repository.get_credential(credential_id, credential_type, issuing_country).status
+        fields = self._repository.get_credential_fields(credential_id, credential_type, issuing_country, ['status'])
+        credential_status: CredentialStatus = fields['status']
+        return credential_status
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None, credential_type: CredentialType | None = None, limit: int = 50, cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_credentials(issuing_country, status, credential_type, limit, cursor)
+
+    def iter_credentials(self, issuing_country: str, status: CredentialStatus | None = None, credential_type: CredentialType | None = None, page_size: int = 100) -> Iterator[Credential]:
+        return self._repository.iter_credentials(issuing_country, status, credential_type, page_size)
 
     def create_credential(self, credential: Credential) -> Credential:
         return self._repository.create_credential(credential)
 
-    def update_credential(self, credential_id: str, issuing_country: str, credential_type: CredentialType, new_status: CredentialStatus, update_reason: str | None):
-        credential: Credential = self._repository.get_credential(credential_id, credential_type, issuing_country)
-        credential.update_status(new_status, update_reason)
-        self._repository.update_credential_status(credential)
-        return credential
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        """Returns the credentials that could not be written"""
+        return self._repository.create_credentials(credentials)
 
+    def update_credential(self, credential_id: str, issuing_country: str, credential_type: CredentialType, new_status: CredentialStatus, update_reason: str | None, expected_version: int | None = None) -> Credential:
+        Credential.validate_status_update(new_status, update_reason)
+        return self._repository.transition_credential_status(
+            credential_id, credential_type, issuing_country, new_status, update_reason, expected_version)
 
+    def modify_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str, mutation: Callable[[Credential], None]) -> Credential:
+        """Read-modify-write guarded by the stored version; on a conflict re-reads and re-applies with jittered backoff"""
+        attempt = 0
+        while True:
+            credential: Credential = self._repository.get_credential(credential_id, credential_type, issuing_country)
+            mutation(credential)
+            try:
+                self._repository.update_credential_status(credential)
+                return credential
+            except CredentialVersionConflictException:
+                attempt += 1
+                if attempt >= self._conflict_backoff.max_attempts:
+                    raise
+                time.sleep(self._conflict_backoff.delay(attempt))
@@ -0,0 +1,22 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ExpirySweepConfig:
+    workers: int = 4
+    page_size: int = 100
+    # Stop starting new pages this long before the Lambda deadline
+    safety_margin_seconds: float = 30.0
+    # Unset keeps expired credentials forever; otherwise DynamoDB TTL deletes them after this many days
+    archive_after_days: int | None = None
+
+    @classmethod
+    def from_environment(cls) -> 'ExpirySweepConfig':
+        archive_after_days = os.getenv('CREDENTIAL_ARCHIVE_AFTER_DAYS')
+        return cls(
+            workers=int(os.getenv('EXPIRY_SWEEP_WORKERS', '4')),
+            page_size=int(os.getenv('EXPIRY_SWEEP_PAGE_SIZE', '100')),
+            safety_margin_seconds=float(os.getenv('EXPIRY_SWEEP_SAFETY_MARGIN_SECONDS', '30')),
+            archive_after_days=int(archive_after_days) if archive_after_days else None
+        )
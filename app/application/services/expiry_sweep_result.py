@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ExpirySweepResult:
+    expired: int
+    # Revoked, expired or deleted by someone else between the index read and the write
+    skipped: int
+    failed: int
+    shards_completed: int
+    shards_total: int
+
+    @property
+    def complete(self) -> bool:
+        """False when the time budget ran out; the next run resumes from the checkpoints"""
+        return self.shards_completed == self.shards_total
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from typing import Callable
+
+from app.application.services.expiry_sweep_result import ExpirySweepResult
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.models.credential import Credential
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.domain.repositories.job_checkpoint_repository import AbstractJobCheckpointRepository
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+
+logger = logging.getLogger(__name__)
+
+
+class ExpirySweeper:
+    """Marks credentials whose validity window has passed as EXPIRED.
+
+    Expiry shards are swept in parallel on a thread pool. Within a shard, credentials are expired
+    page by page and the shard's cursor is checkpointed after each page, so a run stopped by its
+    time budget resumes where it left off. A fully swept shard clears its checkpoint, which lets
+    the next run retry credentials whose write failed. A checkpoint the repository can no longer
+    read, e.g. one signed with another cursor key, is dropped and its shard swept from the start.
+    """
+
+    JOB_NAME = 'expiry_sweep'
+
+    def __init__(self, repository: AbstractCredentialRepository, checkpoints: AbstractJobCheckpointRepository,
+                 workers: int = 4, page_size: int = 100,
+                 clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+                 monotonic: Callable[[], float] = time.monotonic):
+        self._repository = repository
+        self._checkpoints = checkpoints
+        self._workers = workers
+        self._page_size = page_size
+        self._clock = clock
+        self._monotonic = monotonic
+        self._lock = threading.Lock()
+
+    def sweep(self, time_budget_seconds: float | None = None) -> ExpirySweepResult:
+        now = self._clock()
+        deadline = self._monotonic() + time_budget_seconds if time_budget_seconds is not None else None
+        counts = {'expired': 0, 'skipped': 0, 'failed': 0, 'shards_completed': 0}
+
+        shards = range(self._repository.expiry_shard_count())
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            # list() re-raises the first error from a shard, e.g. a failed listing or checkpoint write
+            list(pool.map(lambda shard: self._sweep_shard(shard, now, deadline, counts), shards))
+
+        return ExpirySweepResult(shards_total=len(shards), **counts)
+
+    def _sweep_shard(self, shard: int, now: datetime, deadline: float | None, counts: dict[str, int]) -> None:
+        cursor = self._checkpoints.get_checkpoint(self.JOB_NAME, shard)
+        while deadline is None or self._monotonic() < deadline:
+            try:
+                page = self._repository.list_expiring_credentials(shard, now, limit=self._page_size, cursor=cursor)
+            except InvalidCursorException:
+                if cursor is None:
+                    raise
+                logger.warning("Discarding unreadable %s checkpoint for shard %d; sweeping it from the start",
+                               self.JOB_NAME, shard)
+                self._checkpoints.clear_checkpoint(self.JOB_NAME, shard)
+                cursor = None
+                continue
+            for credential in page.credentials:
+                self._count(counts, self._expire(credential))
+
+            cursor = page.next_cursor
+            if cursor is None:
+                self._checkpoints.clear_checkpoint(self.JOB_NAME, shard)
+                self._count(counts, 'shards_completed')
+                return
+            self._checkpoints.save_checkpoint(self.JOB_NAME, shard, cursor)
+
+    def _expire(self, credential: Credential) -> str:
+        try:
+            self._repository.transition_credential_status(
+                credential.credential_id, credential.get_credential_type(), credential.issuing_country,
+                CredentialStatus.EXPIRED, None)
+            return 'expired'
+        except (InvalidCredentialStateException, CredentialNotFoundException):
+            return 'skipped'
+        except Exception:
+            logger.exception("Could not expire credential %s/%s", credential.issuing_country,
+                             credential.credential_id)
+            return 'failed'
+
+    def _count(self, counts: dict[str, int], outcome: str) -> None:
+        with self._lock:
+            counts[outcome] += 1
@@ -0,0 +1,413 @@
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, TypeVar, cast
+
+from app.application.services.api_auth_service import ApiAuthService
+from app.application.services.api_key_usage_accumulator import ApiKeyUsageAccumulator
+from app.application.services.api_key_usage_config import ApiKeyUsageConfig
+from app.application.services.async_api_auth_service import AsyncApiAuthService
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.application.services.credential_service import CredentialService
+from app.application.services.expiry_sweep_config import ExpirySweepConfig
+from app.application.services.expiry_sweeper import ExpirySweeper
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
+from app.domain.repositories.async_api_key_repository import AbstractAsyncApiKeyRepository
+from app.domain.repositories.async_credential_repository import AbstractAsyncCredentialRepository
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.domain.repositories.job_checkpoint_repository import AbstractJobCheckpointRepository
+from app.infrastructure.cache.cache_config import CacheConfig
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.cache.credential_cache_backend import CredentialCacheBackend
+from app.infrastructure.cache.in_process_credential_cache_backend import InProcessCredentialCacheBackend
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.cache.redis_credential_cache_backend import RedisCredentialCacheBackend
+from app.infrastructure.concurrency.async_single_flight import AsyncSingleFlight
+from app.infrastructure.concurrency.coalescing_config import CoalescingConfig
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+from app.infrastructure.concurrency.micro_batch_stats import MicroBatchStats
+from app.infrastructure.concurrency.micro_batcher import MicroBatcher
+from app.infrastructure.concurrency.read_batching_config import ReadBatchingConfig
+from app.infrastructure.concurrency.single_flight import SingleFlight
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+from app.infrastructure.persistence.inline_call_executor import InlineCallExecutor
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.dynamodb.schema_bootstrap import SchemaBootstrap
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+from app.infrastructure.persistence.repositories.batching_credential_repository import BatchingCredentialRepository
+from app.infrastructure.persistence.repositories.caching_credential_repository import (
+    CachingCredentialRepository, estimate_credential_size)
+from app.infrastructure.persistence.repositories.negative_caching_credential_repository import (
+    NegativeCachingCredentialRepository, estimate_miss_size)
+from app.infrastructure.persistence.repositories.coalescing_async_credential_repository import (
+    CoalescingAsyncCredentialRepository)
+from app.infrastructure.persistence.repositories.coalescing_credential_repository import CoalescingCredentialRepository
+from app.infrastructure.persistence.repositories.dynamodb_api_key_repository import DynamoDBApiKeyRepository
+from app.infrastructure.persistence.repositories.dynamodb_client_credential_repository import (
+    DynamoDBClientCredentialRepository)
+from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
+from app.infrastructure.persistence.repositories.dynamodb_job_checkpoint_repository import (
+    DynamoDBJobCheckpointRepository)
+from app.infrastructure.persistence.repositories.executor_api_key_repository import ExecutorApiKeyRepository
+from app.infrastructure.persistence.repositories.executor_credential_repository import ExecutorCredentialRepository
+from app.infrastructure.persistence.repositories.in_memory_api_key_repository import InMemoryApiKeyRepository
+from app.infrastructure.persistence.repositories.in_memory_credential_repository import InMemoryCredentialRepository
+from app.infrastructure.persistence.repositories.in_memory_job_checkpoint_repository import (
+    InMemoryJobCheckpointRepository)
+from app.infrastructure.persistence.repositories.sqlite_api_key_repository import SqliteApiKeyRepository
+from app.infrastructure.persistence.repositories.sqlite_credential_repository import SqliteCredentialRepository
+from app.infrastructure.persistence.repositories.sqlite_job_checkpoint_repository import SqliteJobCheckpointRepository
+from app.infrastructure.persistence.repository_config import RepositoryConfig
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+from app.rest.assemblers.assembler_registry import AssemblerRegistry
+
+T = TypeVar('T')
+
+
+class ApplicationContainer:
+    """Process-wide owner of the DynamoDB resource, repositories and services.
+
+    Components are built lazily on first use and then reused for the lifetime of
+    the process (a warm Lambda container under Mangum, or a uvicorn worker).
+    """
+
+    def __init__(self, config: DatabaseConfig | None = None, **overrides: Any):
+        self._config = config
+        self._components: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.override(**overrides)
+
+    def override(self, **components: Any) -> None:
+        """Replace components (e.g. a repository with a fake) for tests"""
+        with self._lock:
+            for name, component in components.items():
+                if not hasattr(type(self), name):
+                    raise AttributeError(f"Unknown container component: '{name}'")
+                self._components[name] = component
+
+    def reset(self) -> None:
+        with self._lock:
+            self._components.clear()
+
+    def _get_or_create(self, name: str, factory: Callable[[], T]) -> T:
+        component = self._components.get(name)
+        if component is not None:
+            return cast(T, component)
+
+        with self._lock:
+            if name not in self._components:
+                self._components[name] = factory()
+            return cast(T, self._components[name])
+
+    @property
+    def config(self) -> DatabaseConfig:
+        return self._get_or_create('config', lambda: self._config or DatabaseConfig.from_environment())
+
+    @property
+    def repository_config(self) -> RepositoryConfig:
+        return self._get_or_create('repository_config', self._build_repository_config)
+
+    @staticmethod
+    def _build_repository_config() -> RepositoryConfig:
+        config = RepositoryConfig.from_environment()
+        if config.type not in ('dynamodb', 'memory', 'sqlite'):
+            raise ValueError(f"Unknown repository type: '{config.type}'")
+        return config
+
+    @property
+    def cache_config(self) -> CacheConfig:
+        return self._get_or_create('cache_config', CacheConfig.from_environment)
+
+    @property
+    def coalescing_config(self) -> CoalescingConfig:
+        return self._get_or_create('coalescing_config', CoalescingConfig.from_environment)
+
+    @property
+    def read_batching_config(self) -> ReadBatchingConfig:
+        return self._get_or_create('read_batching_config', ReadBatchingConfig.from_environment)
+
+    @property
+    def db_manager(self) -> DynamoDBManager:
+        return self._get_or_create('db_manager', self._build_db_manager)
+
+    def _build_db_manager(self) -> DynamoDBManager:
+        db_manager = DynamoDBManager(self.config)
+        if self.config.bootstrap_schema:
+            # Local development convenience; deployed stacks get their tables from template.yml
+            SchemaBootstrap(db_manager).ensure_tables()
+        return db_manager
+
+    @property
+    def mapper_provider(self) -> CredentialMapperProvider:
+        return self._get_or_create('mapper_provider', CredentialMapperProvider)
+
+    @property
+    def assembler_registry(self) -> AssemblerRegistry:
+        return self._get_or_create('assembler_registry', AssemblerRegistry)
+
+    @property
+    def credential_repository(self) -> AbstractCredentialRepository:
+        return self._get_or_create('credential_repository', self._build_credential_repository)
+
+    def _build_credential_repository(self) -> AbstractCredentialRepository:
+        repository = self.base_credential_repository
+        if self.read_batching_config.enabled:
+            repository = BatchingCredentialRepository(repository, self.credential_read_batcher)
+        if self.coalescing_config.enabled:
+            # Below the caches so concurrent misses for the same key share one read
+            repository = CoalescingCredentialRepository(repository, self.credential_read_flight)
+        if self.cache_config.negative_enabled:
+            repository = NegativeCachingCredentialRepository(repository, self.negative_credential_cache)
+        if self.cache_config.enabled:
+            repository = CachingCredentialRepository(repository, self.credential_cache_backend)
+        return repository
+
+    @property
+    def credential_read_flight(self) -> SingleFlight:
+        return self._get_or_create('credential_read_flight',
+                                   lambda: SingleFlight(self.coalescing_config.timeout_seconds))
+
+    @property
+    def async_credential_read_flight(self) -> AsyncSingleFlight:
+        return self._get_or_create('async_credential_read_flight',
+                                   lambda: AsyncSingleFlight(self.coalescing_config.timeout_seconds))
+
+    def coalescing_stats(self) -> dict[str, CoalescingStats]:
+        """Read coalescing counters for this process, keyed by the layer that coalesced"""
+        if not self.coalescing_config.enabled:
+            return {}
+        return {
+            'credentials': self.credential_read_flight.stats(),
+            'async_credentials': self.async_credential_read_flight.stats()
+        }
+
+    @property
+    def base_credential_repository(self) -> AbstractCredentialRepository:
+        """The undecorated repository of the configured type, at the bottom of the credential_repository chain"""
+        if self.repository_config.type == 'memory':
+            return self.in_memory_credential_repository
+        if self.repository_config.type == 'sqlite':
+            return self.sqlite_credential_repository
+        return self.dynamodb_credential_repository
+
+    @property
+    def in_memory_credential_repository(self) -> InMemoryCredentialRepository:
+        return self._get_or_create('in_memory_credential_repository', lambda: InMemoryCredentialRepository(
+            self._memory_log('credentials.log'), self.pagination_cursor_codec, self.mapper_provider))
+
+    def _memory_log(self, name: str) -> AppendOnlyLog | None:
+        data_dir = self.repository_config.memory_data_dir
+        if data_dir is None:
+            return None
+        return AppendOnlyLog(Path(data_dir) / name, self.repository_config.memory_snapshot_every)
+
+    @property
+    def sqlite_database(self) -> SqliteDatabase:
+        return self._get_or_create('sqlite_database', lambda: SqliteDatabase(self.repository_config.sqlite_path))
+
+    @property
+    def sqlite_credential_repository(self) -> SqliteCredentialRepository:
+        return self._get_or_create('sqlite_credential_repository', lambda: SqliteCredentialRepository(
+            self.sqlite_database, self.pagination_cursor_codec, self.mapper_provider))
+
+    @property
+    def dynamodb_credential_repository(self) -> DynamoDBCredentialRepository:
+        return self._get_or_create('dynamodb_credential_repository', self._build_dynamodb_credential_repository)
+
+    def _build_dynamodb_credential_repository(self) -> DynamoDBCredentialRepository:
+        if self.config.client_api not in ('resource', 'client'):
+            raise ValueError(f"Unknown DynamoDB client API: '{self.config.client_api}'")
+        repository_class = (DynamoDBClientCredentialRepository if self.config.client_api == 'client'
+                            else DynamoDBCredentialRepository)
+        archive_after_days = self.expiry_sweep_config.archive_after_days
+        return repository_class(
+            self.db_manager, self.mapper_provider, cursor_codec=self.pagination_cursor_codec,
+            archive_expired_after=timedelta(days=archive_after_days) if archive_after_days else None)
+
+    @property
+    def pagination_cursor_codec(self) -> PaginationCursorCodec | None:
+        """None without a configured secret; the repository then signs with a per-process key"""
+        secret = self.config.cursor_secret
+        return self._get_or_create('pagination_cursor_codec',
+                                   lambda: PaginationCursorCodec(secret.encode()) if secret else None)
+
+    @property
+    def credential_read_batcher(self) -> MicroBatcher[CredentialKey, Credential]:
+        return self._get_or_create('credential_read_batcher', lambda: MicroBatcher(
+            self.base_credential_repository.get_credentials, self.read_batching_config.window_seconds,
+            self.read_batching_config.max_batch_size))
+
+    def read_batching_stats(self) -> MicroBatchStats | None:
+        """Counters of the point-read batcher, or None when batching is off"""
+        return self.credential_read_batcher.stats() if self.read_batching_config.enabled else None
+
+    @property
+    def negative_credential_cache(self) -> LruTtlCache[CredentialKey, CredentialKey]:
+        return self._get_or_create('negative_credential_cache', lambda: LruTtlCache(
+            self.cache_config.negative_max_entries, self.cache_config.negative_max_bytes,
+            self.cache_config.negative_ttl_seconds, size_of=estimate_miss_size))
+
+    @property
+    def credential_cache_backend(self) -> CredentialCacheBackend:
+        return self._get_or_create('credential_cache_backend', self._build_credential_cache_backend)
+
+    def _build_credential_cache_backend(self) -> CredentialCacheBackend:
+        cache_config = self.cache_config
+        if cache_config.backend == 'redis':
+            if cache_config.redis_url is None:
+                raise ValueError("CREDENTIAL_CACHE_REDIS_URL is required for the redis credential cache backend")
+            return RedisCredentialCacheBackend.from_url(cache_config.redis_url, cache_config.ttl_seconds)
+        if cache_config.backend != 'memory':
+            raise ValueError(f"Unknown credential cache backend: '{cache_config.backend}'")
+        return InProcessCredentialCacheBackend(LruTtlCache(
+            cache_config.max_entries, cache_config.max_bytes, cache_config.ttl_seconds,
+            size_of=estimate_credential_size))
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Counters for the caches enabled in this process, keyed by cache name"""
+        stats = {}
+        if self.cache_config.enabled:
+            stats['credentials'] = self.credential_cache_backend.stats()
+        if self.cache_config.negative_enabled:
+            stats['credential_misses'] = self.negative_credential_cache.stats()
+        if self.cache_config.api_key_ttl_seconds > 0:
+            stats['api_keys'] = self.api_key_cache.stats()
+        return stats
+
+    @property
+    def expiry_sweep_config(self) -> ExpirySweepConfig:
+        return self._get_or_create('expiry_sweep_config', ExpirySweepConfig.from_environment)
+
+    @property
+    def job_checkpoint_repository(self) -> AbstractJobCheckpointRepository:
+        return self._get_or_create('job_checkpoint_repository', self._build_job_checkpoint_repository)
+
+    def _build_job_checkpoint_repository(self) -> AbstractJobCheckpointRepository:
+        if self.repository_config.type == 'memory':
+            return InMemoryJobCheckpointRepository()
+        if self.repository_config.type == 'sqlite':
+            return SqliteJobCheckpointRepository(self.sqlite_database)
+        return DynamoDBJobCheckpointRepository(self.db_manager)
+
+    @property
+    def expiry_sweeper(self) -> ExpirySweeper:
+        # Jobs write straight to the store; the read caches and batching only help the API
+        return self._get_or_create('expiry_sweeper', lambda: ExpirySweeper(
+            self.base_credential_repository, self.job_checkpoint_repository,
+            self.expiry_sweep_config.workers, self.expiry_sweep_config.page_size))
+
+    @property
+    def api_key_repository(self) -> AbstractApiKeyRepository:
+        return self._get_or_create('api_key_repository', self._build_api_key_repository)
+
+    def _build_api_key_repository(self) -> AbstractApiKeyRepository:
+        if self.repository_config.type == 'memory':
+            return InMemoryApiKeyRepository(self._memory_log('api_keys.log'))
+        if self.repository_config.type == 'sqlite':
+            return SqliteApiKeyRepository(self.sqlite_database)
+        return DynamoDBApiKeyRepository(self.db_manager)
+
+    @property
+    def blocking_executor(self) -> BlockingCallExecutor:
+        return self._get_or_create('blocking_executor', self._build_blocking_executor)
+
+    def _build_blocking_executor(self) -> BlockingCallExecutor:
+        # The in-memory store answers without I/O, but read batching waits out its window and Redis does network I/O
+        if (self.repository_config.type == 'memory' and not self.read_batching_config.enabled
+                and not (self.cache_config.enabled and self.cache_config.backend == 'redis')):
+            return InlineCallExecutor()
+        return BlockingCallExecutor(self.config.executor_max_workers)
+
+    @property
+    def async_credential_repository(self) -> AbstractAsyncCredentialRepository:
+        return self._get_or_create('async_credential_repository', self._build_async_credential_repository)
+
+    def _build_async_credential_repository(self) -> AbstractAsyncCredentialRepository:
+        repository: AbstractAsyncCredentialRepository = ExecutorCredentialRepository(
+            self.credential_repository, self.blocking_executor)
+        if self.coalescing_config.enabled:
+            # Coalesce on the event loop too, so waiters do not each occupy an executor thread
+            repository = CoalescingAsyncCredentialRepository(repository, self.async_credential_read_flight)
+        return repository
+
+    @property
+    def async_api_key_repository(self) -> AbstractAsyncApiKeyRepository:
+        return self._get_or_create(
+            'async_api_key_repository',
+            lambda: ExecutorApiKeyRepository(self.api_key_repository, self.blocking_executor))
+
+    @property
+    def credential_service(self) -> CredentialService:
+        return self._get_or_create('credential_service', lambda: CredentialService(self.credential_repository))
+
+    @property
+    def api_key_cache(self) -> LruTtlCache[str, bool]:
+        return self._get_or_create('api_key_cache', lambda: LruTtlCache(
+            self.cache_config.api_key_max_entries, self.cache_config.api_key_max_entries * 256,
+            self.cache_config.api_key_ttl_seconds, size_of=lambda _: 256))
+
+    def _validated_api_keys(self) -> LruTtlCache[str, bool] | None:
+        return self.api_key_cache if self.cache_config.api_key_ttl_seconds > 0 else None
+
+    @property
+    def api_key_usage_config(self) -> ApiKeyUsageConfig:
+        return self._get_or_create('api_key_usage_config', ApiKeyUsageConfig.from_environment)
+
+    @property
+    def api_key_usage(self) -> ApiKeyUsageAccumulator:
+        return self._get_or_create('api_key_usage', lambda: ApiKeyUsageAccumulator(
+            self.api_key_usage_config.flush_interval_seconds, self.api_key_usage_config.max_pending_keys,
+            self.api_key_usage_config.usage_interval_seconds))
+
+    def _batched_api_key_usage(self) -> ApiKeyUsageAccumulator | None:
+        return self.api_key_usage if self.api_key_usage_config.enabled else None
+
+    def flush_api_key_usage(self, force: bool = False) -> None:
+        """Writes accumulated API key usage if a flush is due (or always, with force)"""
+        if not self.api_key_usage_config.enabled:
+            return
+        if force or self.api_key_usage.is_flush_due():
+            self.api_key_service.flush_usage()
+
+    @property
+    def api_key_service(self) -> ApiAuthService:
+        return self._get_or_create(
+            'api_key_service', lambda: ApiAuthService(self.api_key_repository, self._validated_api_keys(),
+                                                self._batched_api_key_usage()))
+
+    @property
+    def async_credential_service(self) -> AsyncCredentialService:
+        return self._get_or_create(
+            'async_credential_service', lambda: AsyncCredentialService(self.async_credential_repository))
+
+    @property
+    def async_api_key_service(self) -> AsyncApiAuthService:
+        return self._get_or_create(
+            'async_api_key_service',
+            lambda: AsyncApiAuthService(self.async_api_key_repository, self._validated_api_keys(),
+                                        self._batched_api_key_usage()))
+
+
+_container: ApplicationContainer | None = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> ApplicationContainer:
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                _container = ApplicationContainer()
+    return _container
+
+
+def set_container(container: ApplicationContainer | None) -> None:
+    """Install a pre-built container (tests) or drop the current one so it is rebuilt"""
+    global _container
+    with _container_lock:
+        _container = container
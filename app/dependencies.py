@@ -1,49 +1,85 @@
-from fastapi import Depends
-from typing import Annotated
+from fastapi import Depends, Security
+from typing import Annotated, Awaitable, Callable
 
+from app.container import ApplicationContainer, get_container
 from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+from app.infrastructure.concurrency.micro_batch_stats import MicroBatchStats
 from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
 from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
-from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
-from app.infrastructure.persistence.repositories.dynamodb_api_key_repository import DynamoDBApiKeyRepository
 from app.application.services.credential_service import CredentialService
 from app.application.services.api_auth_service import ApiAuthService
+from app.application.services.async_api_auth_service import AsyncApiAuthService
+from app.application.services.async_credential_service import AsyncCredentialService
 from app.rest.assemblers.assembler_registry import AssemblerRegistry
-from app.rest.exceptions.api_auth_middleware import verify_api_key
+from app.rest.exceptions.api_auth_middleware import api_key_header, verify_api_key
 
 
-def get_db_config() -> DatabaseConfig:
-    return DatabaseConfig.from_environment()
+def get_db_config(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> DatabaseConfig:
+    return container.config
 
 def get_db_manager(
-    config: Annotated[DatabaseConfig, Depends(get_db_config)]
+    container: Annotated[ApplicationContainer, Depends(get_container)]
 ) -> DynamoDBManager:
-    return DynamoDBManager(config)
+    return container.db_manager
 
 def get_credential_repository(
-    db_manager: Annotated[DynamoDBManager, Depends(get_db_manager)]
+    container: Annotated[ApplicationContainer, Depends(get_container)]
 ) -> AbstractCredentialRepository:
-    return DynamoDBCredentialRepository(db_manager)
+    return container.credential_repository
 
 def get_api_key_repository(
-    db_manager: Annotated[DynamoDBManager, Depends(get_db_manager)]
+    container: Annotated[ApplicationContainer, Depends(get_container)]
 ) -> AbstractApiKeyRepository:
-    return DynamoDBApiKeyRepository(db_manager)
+    return container.api_key_repository
 
-def get_assembler_registry() -> AssemblerRegistry:
-    return AssemblerRegistry()
+def get_assembler_registry(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> AssemblerRegistry:
+    return container.assembler_registry
 
 def get_credential_service(
-    repository: Annotated[AbstractCredentialRepository, Depends(get_credential_repository)]
+    container: Annotated[ApplicationContainer, Depends(get_container)]
 ) -> CredentialService:
-    return CredentialService(repository)
+    return container.credential_service
 
 def get_api_key_service(
-    repository: Annotated[AbstractApiKeyRepository, Depends(get_api_key_repository)]
+    container: Annotated[ApplicationContainer, Depends(get_container)]
 ) -> ApiAuthService:
-    return ApiAuthService(repository)
+    return container.api_key_service
 
-def get_api_key_verifier():
-    auth_service = get_api_key_service(get_api_key_repository(get_db_manager(get_db_config())))
-    return verify_api_key(auth_service)
\ No newline at end of file
+def get_async_credential_service(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> AsyncCredentialService:
+    return container.async_credential_service
+
+def get_async_api_key_service(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> AsyncApiAuthService:
+    return container.async_api_key_service
+
+def get_cache_stats(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> dict[str, CacheStats]:
+    return container.cache_stats()
+
+def get_coalescing_stats(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> dict[str, CoalescingStats]:
+    return container.coalescing_stats()
+
+def get_read_batching_stats(
+    container: Annotated[ApplicationContainer, Depends(get_container)]
+) -> MicroBatchStats | None:
+    return container.read_batching_stats()
+
+def get_api_key_verifier() -> Callable[..., Awaitable[str]]:
+    async def verify_key(
+            api_key: str = Security(api_key_header),
+            auth_service: AsyncApiAuthService = Depends(get_async_api_key_service)) -> str:
+        return await verify_api_key(auth_service)(api_key)
+    return verify_key
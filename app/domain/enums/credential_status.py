@@ -3,4 +3,6 @@ from enum import Enum
 class CredentialStatus(Enum):
     ACTIVE = "active"
     SUSPENDED = "suspended"
-    REVOKED = "revoked"
\ No newline at end of file
+    REVOKED = "revoked"
+    # Set by the expiry sweeper once valid_until has passed; never requested by clients
+    EXPIRED = "expired"
\ No newline at end of file
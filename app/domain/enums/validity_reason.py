@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+class ValidityReason(IntEnum):
+    """Why a credential is or is not valid at a given instant; integer-valued so batches can hold it in an array"""
+    VALID = 0
+    EXPIRED = 1
+    NOT_YET_VALID = 2
+    SUSPENDED = 3
+    REVOKED = 4
@@ -0,0 +1,15 @@
+from app.domain.exceptions.domain_exception import DomainException
+
+
+class CredentialVersionConflictException(DomainException):
+    def __init__(self, credential_id: str, expected_version: int, actual_version: int | None = None):
+        self._credential_id = credential_id
+        self._expected_version = expected_version
+        self._actual_version = actual_version
+
+        detail = f" (current version is {actual_version})" if actual_version is not None else ""
+        super().__init__(f"Credential '{credential_id}' is no longer at version {expected_version}{detail}.")
+
+    @property
+    def actual_version(self) -> int | None:
+        return self._actual_version
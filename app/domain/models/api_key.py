@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, UTC
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiKey:
     key: str
     created_at: datetime
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeyUsage:
+    """Requests made with one API key during one usage interval"""
+    key: str
+    interval_start: datetime
+    request_count: int
+    last_used: datetime
@@ -4,12 +4,29 @@ from typing import Optional
 
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
+from app.domain.enums.validity_reason import ValidityReason
+from app.domain.models.credential_snapshot import CredentialSnapshot
 
 from app.domain.exceptions.credential.expired_credential_exception import ExpiredCredentialException
 from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
 
+# For each target status, the current statuses it cannot be reached from and the reason why.
+# Repositories that apply transitions atomically translate this table into write conditions.
+STATUS_TRANSITION_GUARDS: dict[CredentialStatus, dict[CredentialStatus, str]] = {
+    CredentialStatus.SUSPENDED: {CredentialStatus.REVOKED: "Cannot suspend a revoked credential",
+                                 CredentialStatus.EXPIRED: "Cannot suspend an expired credential"},
+    CredentialStatus.ACTIVE: {CredentialStatus.REVOKED: "Cannot reinstate a revoked credential",
+                              CredentialStatus.EXPIRED: "Cannot reinstate an expired credential"},
+    CredentialStatus.REVOKED: {},
+    CredentialStatus.EXPIRED: {CredentialStatus.REVOKED: "Cannot expire a revoked credential",
+                               CredentialStatus.EXPIRED: "Credential is already expired"}
+}
 
 class Credential(ABC):
+    # Warm containers cache hundreds of thousands of these; slots drop the per-instance __dict__
+    __slots__ = ('_credential_id', '_valid_from', '_valid_until', '_status', '_issuing_country',
+                 '_suspension_reason', '_revocation_reason', '_version')
+
     def __init__(self, credential_id: str, valid_from: datetime, valid_until: datetime, issuing_country: str):
         self._credential_id = credential_id
 
@@ -28,6 +45,7 @@ class Credential(ABC):
         self._issuing_country = issuing_country.lower()
         self._suspension_reason: Optional[str] = None
         self._revocation_reason: Optional[str] = None
+        self._version = 1
 
 
     @abstractmethod
@@ -39,6 +57,43 @@ class Credential(ABC):
     def get_credential_type(self) -> CredentialType:
         pass
 
+    def _snapshot_details(self) -> tuple:
+        """Subclasses with attributes of their own return them here, in a hashable form"""
+        return ()
+
+    def _restore_details(self, details: tuple) -> None:
+        pass
+
+    def snapshot(self) -> CredentialSnapshot:
+        return CredentialSnapshot(
+            credential_class=type(self),
+            credential_type=self.get_credential_type(),
+            credential_id=self._credential_id,
+            issuing_country=self._issuing_country,
+            valid_from=self._valid_from,
+            valid_until=self._valid_until,
+            status=self._status,
+            suspension_reason=self._suspension_reason,
+            revocation_reason=self._revocation_reason,
+            version=self._version,
+            details=self._snapshot_details()
+        )
+
+    @staticmethod
+    def from_snapshot(snapshot: CredentialSnapshot) -> 'Credential':
+        """A new mutable credential in the snapshot's state; skips __init__, whose checks the snapshot already passed"""
+        credential: Credential = object.__new__(snapshot.credential_class)
+        credential._credential_id = snapshot.credential_id
+        credential._valid_from = snapshot.valid_from
+        credential._valid_until = snapshot.valid_until
+        credential._status = snapshot.status
+        credential._issuing_country = snapshot.issuing_country
+        credential._suspension_reason = snapshot.suspension_reason
+        credential._revocation_reason = snapshot.revocation_reason
+        credential._version = snapshot.version
+        credential._restore_details(snapshot.details)
+        return credential
+
     @property
     def credential_id(self) -> str:
         return self._credential_id
@@ -48,28 +103,41 @@ class Credential(ABC):
         return self._status
 
     def suspend(self, reason: str) -> None:
-        if not reason:
-            raise InvalidCredentialStateException("Suspension reason cannot be empty")
-
-        if self._status == CredentialStatus.REVOKED:
-            raise InvalidCredentialStateException("Cannot suspend a revoked credential")
+        self.validate_status_update(CredentialStatus.SUSPENDED, reason)
+        self._check_transition_from_current(CredentialStatus.SUSPENDED)
         self._status = CredentialStatus.SUSPENDED
         self.set_suspension_reason(reason)
 
     def reinstate(self) -> None:
-        if self._status == CredentialStatus.REVOKED:
-            raise InvalidCredentialStateException("Cannot reinstate a revoked credential")
-
+        self._check_transition_from_current(CredentialStatus.ACTIVE)
         self._status = CredentialStatus.ACTIVE
         self.set_suspension_reason(None)
-        self.set_suspension_reason(None)
 
     def revoke(self, reason: str) -> None :
-        if not reason:
-            raise InvalidCredentialStateException("Revocation reason cannot be empty")
+        self.validate_status_update(CredentialStatus.REVOKED, reason)
+        self._check_transition_from_current(CredentialStatus.REVOKED)
         self._status = CredentialStatus.REVOKED
         self.set_revocation_reason(reason)
 
+    def expire(self) -> None:
+        self._check_transition_from_current(CredentialStatus.EXPIRED)
+        self._status = CredentialStatus.EXPIRED
+
+    @staticmethod
+    def validate_status_update(status: CredentialStatus, reason: str | None) -> None:
+        """Checks the parts of a status update that do not depend on the current status"""
+        if status == CredentialStatus.EXPIRED:
+            raise InvalidCredentialStateException("Credentials expire on their own once valid_until has passed")
+        if status == CredentialStatus.SUSPENDED and not reason:
+            raise InvalidCredentialStateException("Suspension reason cannot be empty")
+        if status == CredentialStatus.REVOKED and not reason:
+            raise InvalidCredentialStateException("Revocation reason cannot be empty")
+
+    def _check_transition_from_current(self, status: CredentialStatus) -> None:
+        message = STATUS_TRANSITION_GUARDS[status].get(self._status)
+        if message:
+            raise InvalidCredentialStateException(message)
+
     def is_valid(self) -> bool:
         now = datetime.now(UTC)
 
@@ -80,6 +148,19 @@ class Credential(ABC):
                 and (now >= self._valid_from)
                 and (now <= self._valid_until))
 
+    def validity_reason(self, at: datetime | None = None) -> ValidityReason:
+        """Classifies the credential without raising; VALID exactly when is_valid() would return True"""
+        now = at if at is not None else datetime.now(UTC)
+        if now > self._valid_until or self._status == CredentialStatus.EXPIRED:
+            return ValidityReason.EXPIRED
+        if self._status == CredentialStatus.REVOKED:
+            return ValidityReason.REVOKED
+        if self._status == CredentialStatus.SUSPENDED:
+            return ValidityReason.SUSPENDED
+        if now < self._valid_from:
+            return ValidityReason.NOT_YET_VALID
+        return ValidityReason.VALID
+
     def set_suspension_reason(self, reason: str | None):
         self._suspension_reason = reason
 
@@ -89,6 +170,9 @@ class Credential(ABC):
     def set_status(self, value):
         self._status = value
 
+    def set_version(self, version: int) -> None:
+        self._version = version
+
     @property
     def valid_from(self):
         return self._valid_from
@@ -105,6 +189,11 @@ class Credential(ABC):
     def revocation_reason(self):
         return self._revocation_reason
 
+    @property
+    def version(self) -> int:
+        """Incremented by every stored write; used for optimistic concurrency"""
+        return self._version
+
     @property
     def issuing_country(self) -> str:
         return self._issuing_country
@@ -116,4 +205,6 @@ class Credential(ABC):
             case CredentialStatus.REVOKED:
                 self.revoke(reason)
             case CredentialStatus.ACTIVE:
-                self.reinstate()
\ No newline at end of file
+                self.reinstate()
+            case CredentialStatus.EXPIRED:
+                self.expire()
\ No newline at end of file
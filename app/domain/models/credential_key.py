@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.domain.enums.credential_type import CredentialType
+
+
+@dataclass(frozen=True, slots=True)
+class CredentialKey:
+    credential_id: str
+    credential_type: CredentialType
+    issuing_country: str
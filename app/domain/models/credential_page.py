@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.domain.models.credential import Credential
+
+
+@dataclass(frozen=True)
+class CredentialPage:
+    """One page of a credential listing; next_cursor is None on the last page"""
+    credentials: list[Credential]
+    next_cursor: str | None
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+
+
+@dataclass(frozen=True, slots=True)
+class CredentialSnapshot:
+    """Immutable, hashable state of a credential at one version.
+
+    Caches keep these instead of credentials, so one entry can be handed to any number of readers
+    without copying; Credential.from_snapshot gives a reader its own mutable credential.
+    """
+    credential_class: type
+    credential_type: CredentialType
+    credential_id: str
+    issuing_country: str
+    valid_from: datetime
+    valid_until: datetime
+    status: CredentialStatus
+    suspension_reason: str | None
+    revocation_reason: str | None
+    version: int
+    # Subclass attributes in declaration order, lists frozen to tuples
+    details: tuple[Any, ...] = ()
@@ -7,6 +7,8 @@ from app.domain.enums.credential_type import CredentialType
 
 
 class DriversLicense(Credential, ABC):
+    __slots__ = ('_vehicle_classes', '_issuing_region')
+
     def __init__(self, credential_id: str, valid_from: datetime, valid_until: datetime, vehicle_classes: List[str], issuing_country: str, issuing_region: str):
         super().__init__(credential_id, valid_from, valid_until, issuing_country)
         self._vehicle_classes = vehicle_classes
@@ -19,6 +21,13 @@ class DriversLicense(Credential, ABC):
     def get_credential_type(self) -> CredentialType:
         return CredentialType.DRIVERS_LICENSE
 
+    def _snapshot_details(self) -> tuple:
+        return tuple(self._vehicle_classes), self._issuing_region
+
+    def _restore_details(self, details: tuple) -> None:
+        vehicle_classes, self._issuing_region = details
+        self._vehicle_classes = list(vehicle_classes)
+
     @property
     def vehicle_classes(self) -> List[str]:
         return self._vehicle_classes
@@ -5,6 +5,8 @@ from app.domain.enums.credential_type import CredentialType
 
 
 class Passport(Credential):
+    __slots__ = ('_nationality',)
+
     def __init__(self, credential_id: str, valid_from: datetime, valid_until: datetime, nationality: str, issuing_country: str):
         super().__init__(credential_id, valid_from, valid_until, issuing_country)
         self._nationality = nationality
@@ -16,6 +18,12 @@ class Passport(Credential):
     def get_credential_type(self) -> CredentialType:
         return CredentialType.PASSPORT
 
+    def _snapshot_details(self) -> tuple:
+        return (self._nationality,)
+
+    def _restore_details(self, details: tuple) -> None:
+        self._nationality, = details
+
     @property
     def nationality(self) -> str:
         return self._nationality
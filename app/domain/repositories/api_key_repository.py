@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
 
 class AbstractApiKeyRepository(ABC):
     @abstractmethod
@@ -14,4 +15,17 @@ class AbstractApiKeyRepository(ABC):
 
     @abstractmethod
     def update_api_key(self, key: str, timestamp: datetime) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def delete_api_key(self, key: str) -> bool:
+        """Returns False if the key did not exist"""
+        pass
+
+    @abstractmethod
+    def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        """Adds the counts to each key's totals and per-interval usage; returns the usage that could not be written.
+
+        Usage whose counts were written but whose last_used was not comes back with a request_count of 0.
+        """
+        pass
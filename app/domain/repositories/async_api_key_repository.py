@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+
+
+class AbstractAsyncApiKeyRepository(ABC):
+    """Non-blocking counterpart of AbstractApiKeyRepository for the async route handlers"""
+
+    @abstractmethod
+    async def store_api_key(self, api_key: ApiKey) -> None:
+        pass
+
+    @abstractmethod
+    async def get_api_key(self, key: str) -> ApiKey | None:
+        pass
+
+    @abstractmethod
+    async def update_api_key(self, key: str, timestamp: datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_api_key(self, key: str) -> bool:
+        """Returns False if the key did not exist"""
+        pass
+
+    @abstractmethod
+    async def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        """Adds the counts to each key's totals and per-interval usage; returns the usage that could not be written"""
+        pass
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.enums.credential_type import CredentialType
+
+
+class AbstractAsyncCredentialRepository(ABC):
+    """Non-blocking counterpart of AbstractCredentialRepository for the async route handlers"""
+
+    @abstractmethod
+    async def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        pass
+
+    @abstractmethod
+    async def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                    fields: Collection[str]) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        pass
+
+    @abstractmethod
+    async def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                               credential_type: CredentialType | None = None, limit: int = 50,
+                               cursor: str | None = None) -> CredentialPage:
+        pass
+
+    async def iter_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                               credential_type: CredentialType | None = None,
+                               page_size: int = 100) -> AsyncIterator[Credential]:
+        cursor = None
+        while True:
+            page = await self.list_credentials(issuing_country, status, credential_type, page_size, cursor)
+            for credential in page.credentials:
+                yield credential
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    @abstractmethod
+    async def create_credential(self, credential: Credential) -> None:
+        pass
+
+    @abstractmethod
+    async def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        pass
+
+    @abstractmethod
+    async def update_credential_status(self, credential: Credential) -> None:
+        pass
+
+    @abstractmethod
+    async def transition_credential_status(self, credential_id: str, credential_type: CredentialType,
+                                           issuing_country: str, new_status: CredentialStatus,
+                                           reason: str | None, expected_version: int | None = None) -> Credential:
+        pass
@@ -1,6 +1,11 @@
 from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Collection, Iterator
 
+from app.domain.enums.credential_status import CredentialStatus
 from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
 from app.domain.enums.credential_type import CredentialType
 
 
@@ -9,10 +14,86 @@ class AbstractCredentialRepository:
     def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
         pass
 
+    @abstractmethod
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        """Returns only the named attributes, decoded, without hydrating the whole credential"""
+        pass
+
+    @abstractmethod
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        """Returns the credentials that exist; keys that were not found are absent from the result"""
+        pass
+
+    @abstractmethod
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        """Returns up to limit credentials of the country, optionally narrowed by status and type.
+
+        Pass the page's next_cursor back to continue; an unusable cursor raises InvalidCursorException.
+        """
+        pass
+
+    def iter_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, page_size: int = 100) -> Iterator[Credential]:
+        """Streams every matching credential, holding only the current page in memory"""
+        cursor = None
+        while True:
+            page = self.list_credentials(issuing_country, status, credential_type, page_size, cursor)
+            yield from page.credentials
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    @abstractmethod
+    def expiry_shard_count(self) -> int:
+        """Number of independent partitions list_expiring_credentials can be called on in parallel"""
+        pass
+
+    @abstractmethod
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        """Returns active or suspended credentials of one shard whose valid_until falls in the range"""
+        pass
+
+    def iter_expiring_credentials(self, valid_until_before: datetime, valid_until_from: datetime | None = None,
+                                  page_size: int = 100) -> Iterator[Credential]:
+        """Streams active or suspended credentials with valid_until in the range, shard after shard"""
+        for shard in range(self.expiry_shard_count()):
+            cursor = None
+            while True:
+                page = self.list_expiring_credentials(shard, valid_until_before, valid_until_from, page_size, cursor)
+                yield from page.credentials
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+
     @abstractmethod
     def create_credential(self, credential: Credential):
         pass
 
+    @abstractmethod
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        """Writes the credentials in bulk and returns the ones that could not be written"""
+        pass
+
     @abstractmethod
     def update_credential_status(self, credential: Credential):
+        """Saves the status fields if the stored credential is still at credential.version.
+
+        Raises CredentialVersionConflictException otherwise and bumps credential.version on success.
+        """
+        pass
+
+    @abstractmethod
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        """Atomically moves a stored credential to new_status, enforcing STATUS_TRANSITION_GUARDS.
+
+        Raises CredentialNotFoundException, InvalidCredentialStateException or, when expected_version
+        is given and stale, CredentialVersionConflictException. Returns the updated credential.
+        """
         pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractJobCheckpointRepository(ABC):
+    """Where long-running jobs remember how far each partition of their work got"""
+
+    @abstractmethod
+    def get_checkpoint(self, job: str, partition: int) -> str | None:
+        pass
+
+    @abstractmethod
+    def save_checkpoint(self, job: str, partition: int, cursor: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear_checkpoint(self, job: str, partition: int) -> None:
+        pass
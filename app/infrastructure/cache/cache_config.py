@@ -0,0 +1,38 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = False
+    max_entries: int = 50_000
+    # Well under the function's 256 MB MemorySize, leaving room for the runtime and boto3
+    max_bytes: int = 32 * 1024 * 1024
+    ttl_seconds: float = 30.0
+    backend: str = 'memory'
+    redis_url: str | None = None
+    # Remembered CredentialNotFoundException results; kept short so issuance elsewhere shows up quickly
+    negative_enabled: bool = False
+    negative_max_entries: int = 100_000
+    negative_max_bytes: int = 16 * 1024 * 1024
+    negative_ttl_seconds: float = 5.0
+    # Validated API keys; a key revoked in another container keeps working here for at most this long
+    api_key_ttl_seconds: float = 60.0
+    api_key_max_entries: int = 1_000
+
+    @classmethod
+    def from_environment(cls) -> 'CacheConfig':
+        return cls(
+            enabled=os.getenv('CREDENTIAL_CACHE_ENABLED') == 'true',
+            max_entries=int(os.getenv('CREDENTIAL_CACHE_MAX_ENTRIES', '50000')),
+            max_bytes=int(os.getenv('CREDENTIAL_CACHE_MAX_BYTES', str(32 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv('CREDENTIAL_CACHE_TTL_SECONDS', '30')),
+            backend=os.getenv('CREDENTIAL_CACHE_BACKEND', 'memory'),
+            redis_url=os.getenv('CREDENTIAL_CACHE_REDIS_URL'),
+            negative_enabled=os.getenv('CREDENTIAL_NEGATIVE_CACHE_ENABLED') == 'true',
+            negative_max_entries=int(os.getenv('CREDENTIAL_NEGATIVE_CACHE_MAX_ENTRIES', '100000')),
+            negative_max_bytes=int(os.getenv('CREDENTIAL_NEGATIVE_CACHE_MAX_BYTES', str(16 * 1024 * 1024))),
+            negative_ttl_seconds=float(os.getenv('CREDENTIAL_NEGATIVE_CACHE_TTL_SECONDS', '5')),
+            api_key_ttl_seconds=float(os.getenv('API_KEY_CACHE_TTL_SECONDS', '60')),
+            api_key_max_entries=int(os.getenv('API_KEY_CACHE_MAX_ENTRIES', '1000'))
+        )
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.infrastructure.cache.cache_stats import CacheStats
+
+
+class CredentialCacheBackend(ABC):
+    """Storage behind CachingCredentialRepository.
+
+    Implementations hand out credentials the caller may mutate and must never raise for
+    an unavailable cache; a lookup that cannot be answered is a miss. put never replaces an
+    entry at a higher version, so a read that loses a race with a write cannot undo it.
+    """
+
+    @abstractmethod
+    def get(self, key: CredentialKey) -> Credential | None:
+        pass
+
+    def get_many(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        found = {}
+        for key in keys:
+            credential = self.get(key)
+            if credential is not None:
+                found[key] = credential
+        return found
+
+    @abstractmethod
+    def put(self, key: CredentialKey, credential: Credential) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, key: CredentialKey) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        pass
@@ -0,0 +1,75 @@
+import json
+from datetime import datetime, timedelta, UTC
+from typing import Any
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_FORMAT_VERSION = 1
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + value * _MICROSECOND
+
+
+class CredentialCodec:
+    """Compact wire format for cached credentials.
+
+    A positional JSON array with integer epoch-microsecond timestamps: smaller than the
+    DynamoDB item and decoded without the mappers' ISO parsing or Decimal handling.
+    """
+    FORMAT_VERSION = _FORMAT_VERSION
+    # Array positions a store can read without decoding the credential, e.g. for a conditional write
+    VERSION_INDEX = 9
+
+    def encode(self, credential: Credential) -> bytes:
+        common = [
+            _FORMAT_VERSION,
+            credential.get_credential_type().value,
+            credential.credential_id,
+            credential.issuing_country,
+            _to_micros(credential.valid_from),
+            _to_micros(credential.valid_until),
+            credential.status.value,
+            credential.suspension_reason,
+            credential.revocation_reason,
+            credential.version
+        ]
+        specific: list[Any]
+        if isinstance(credential, Passport):
+            specific = [credential.nationality]
+        elif isinstance(credential, DriversLicense):
+            specific = [credential.vehicle_classes, credential.issuing_region]
+        else:
+            raise ValueError(f"No cache encoding for {type(credential).__name__}")
+        return json.dumps(common + specific, separators=(',', ':')).encode()
+
+    def decode(self, payload: bytes) -> Credential | None:
+        """Returns None for payloads written in another format version"""
+        values = json.loads(payload)
+        if values[0] != _FORMAT_VERSION:
+            return None
+
+        (_, credential_type, credential_id, issuing_country, valid_from, valid_until,
+         status, suspension_reason, revocation_reason, version, *specific) = values
+        credential: Credential
+        if credential_type == CredentialType.PASSPORT.value:
+            credential = Passport(credential_id, _from_micros(valid_from), _from_micros(valid_until),
+                                  specific[0], issuing_country)
+        else:
+            credential = DriversLicense(credential_id, _from_micros(valid_from), _from_micros(valid_until),
+                                        specific[0], issuing_country, specific[1])
+        credential.set_status(CredentialStatus(status))
+        credential.set_suspension_reason(suspension_reason)
+        credential.set_revocation_reason(revocation_reason)
+        credential.set_version(version)
+        return credential
@@ -0,0 +1,30 @@
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_snapshot import CredentialSnapshot
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.cache.credential_cache_backend import CredentialCacheBackend
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+class InProcessCredentialCacheBackend(CredentialCacheBackend):
+    """Per-process cache; also the stand-in for the shared backend in tests and local runs.
+
+    Entries are immutable snapshots, so a caller mutating what it was handed cannot reach the cache.
+    """
+
+    def __init__(self, cache: LruTtlCache[CredentialKey, CredentialSnapshot]):
+        self._cache = cache
+
+    def get(self, key: CredentialKey) -> Credential | None:
+        snapshot = self._cache.get(key)
+        return Credential.from_snapshot(snapshot) if snapshot is not None else None
+
+    def put(self, key: CredentialKey, credential: Credential) -> None:
+        snapshot = credential.snapshot()
+        self._cache.put(key, snapshot, keep=lambda cached: cached.version > snapshot.version)
+
+    def invalidate(self, key: CredentialKey) -> None:
+        self._cache.invalidate(key)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
@@ -0,0 +1,100 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.infrastructure.cache.cache_stats import CacheStats
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LruTtlCache(Generic[K, V]):
+    """Thread-safe LRU cache bounded by entry count and estimated bytes, with a per-entry TTL.
+
+    Expired entries are dropped lazily when looked up and when the least recently used
+    end of the cache is trimmed.
+    """
+
+    def __init__(self,
+                 max_entries: int,
+                 max_bytes: int,
+                 ttl_seconds: float,
+                 size_of: Callable[[V], int] = sys.getsizeof,
+                 clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V, keep: Callable[[V], bool] | None = None) -> None:
+        """Stores value, unless keep is given and returns True for the live entry already stored under key"""
+        size = self._size_of(value)
+        with self._lock:
+            if key in self._entries:
+                current, expires_at, _ = self._entries[key]
+                if keep is not None and expires_at > self._clock() and keep(current):
+                    return
+                self._remove(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (value, self._clock() + self._ttl, size)
+            self._size_bytes += size
+            self._trim()
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                              len(self._entries), self._size_bytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _trim(self) -> None:
+        now = self._clock()
+        while self._entries and (len(self._entries) > self._max_entries or self._size_bytes > self._max_bytes):
+            key, (_, expires_at, _) = next(iter(self._entries.items()))
+            self._remove(key)
+            if expires_at <= now:
+                self._expirations += 1
+            else:
+                self._evictions += 1
+
+    def _remove(self, key: K) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
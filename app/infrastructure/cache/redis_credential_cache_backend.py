@@ -0,0 +1,117 @@
+import logging
+import threading
+from typing import Any
+
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.cache.credential_cache_backend import CredentialCacheBackend
+from app.infrastructure.cache.credential_codec import CredentialCodec
+
+logger = logging.getLogger(__name__)
+
+# Writes ARGV[1] with a TTL of ARGV[3] seconds unless the stored payload is in the same format
+# (ARGV[5]) and holds a version, at array position ARGV[4], above ARGV[2]
+_PUT_UNLESS_NEWER = """
+local cached = redis.call('GET', KEYS[1])
+if cached then
+  local ok, values = pcall(cjson.decode, cached)
+  if ok and type(values) == 'table' and values[1] == tonumber(ARGV[5]) then
+    local version = tonumber(values[tonumber(ARGV[4])])
+    if version and version > tonumber(ARGV[2]) then
+      return 0
+    end
+  end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+
+class RedisCredentialCacheBackend(CredentialCacheBackend):
+    """Cache shared by every container and worker through Redis (or a protocol-compatible store such as Valkey).
+
+    The client is injected: anything with redis-py's get/mget/eval/delete works. Puts run as
+    one server-side script so an older version never replaces a newer one.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float, codec: CredentialCodec | None = None,
+                 key_prefix: str = 'cred'):
+        self._client = client
+        self._ttl = max(1, int(ttl_seconds))
+        self._codec = codec or CredentialCodec()
+        self._key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float) -> 'RedisCredentialCacheBackend':
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("The redis cache backend requires the 'redis' package") from e
+        return cls(redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.2), ttl_seconds)
+
+    def _name(self, key: CredentialKey) -> str:
+        return f'{self._key_prefix}:{key.issuing_country}:{key.credential_type.value}:{key.credential_id}'
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+
+    def _decode(self, payload: bytes | None) -> Credential | None:
+        """None for an absent, malformed or unreadable payload: any of them is a miss"""
+        if payload is None:
+            return None
+        try:
+            return self._codec.decode(payload)
+        except Exception as e:
+            logger.warning("Credential cache entry could not be decoded: %s", e)
+            return None
+
+    def get(self, key: CredentialKey) -> Credential | None:
+        try:
+            credential = self._decode(self._client.get(self._name(key)))
+        except Exception as e:
+            logger.warning("Credential cache read failed: %s", e)
+            credential = None
+        self._count(credential is not None, credential is None)
+        return credential
+
+    def get_many(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        if not keys:
+            return {}
+        try:
+            payloads = self._client.mget([self._name(key) for key in keys])
+        except Exception as e:
+            logger.warning("Credential cache read failed: %s", e)
+            payloads = [None] * len(keys)
+
+        found = {}
+        for key, payload in zip(keys, payloads):
+            credential = self._decode(payload)
+            if credential is not None:
+                found[key] = credential
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    def put(self, key: CredentialKey, credential: Credential) -> None:
+        try:
+            self._client.eval(_PUT_UNLESS_NEWER, 1, self._name(key), self._codec.encode(credential),
+                              credential.version, self._ttl, CredentialCodec.VERSION_INDEX + 1,
+                              CredentialCodec.FORMAT_VERSION)
+        except Exception as e:
+            logger.warning("Credential cache write failed: %s", e)
+
+    def invalidate(self, key: CredentialKey) -> None:
+        try:
+            self._client.delete(self._name(key))
+        except Exception as e:
+            # The entry still expires after the TTL
+            logger.warning("Credential cache invalidation failed: %s", e)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, 0, 0, 0, 0)
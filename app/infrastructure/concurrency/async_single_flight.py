@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar, cast
+
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+from app.infrastructure.exceptions.coalesced_read_timeout_exception import CoalescedReadTimeoutException
+
+T = TypeVar('T')
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight for the async route handlers.
+
+    The shared execution runs as its own task, so a caller that times out or is cancelled
+    does not cancel it for the others.
+    """
+
+    def __init__(self, timeout_seconds: float | None = None):
+        self._timeout = timeout_seconds
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+        self._total = 0
+        self._executions = 0
+        self._shared = 0
+        self._timeouts = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self._total += 1
+        task = self._tasks.get(key)
+        leader = task is None
+        if task is None:
+            self._executions += 1
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._shared += 1
+
+        # Like SingleFlight, only waiters are bounded. asyncio.wait neither cancels the shared
+        # task on timeout nor when this caller is cancelled
+        timeout = None if leader else self._timeout
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if timeout is not None and not done:
+            self._timeouts += 1
+            raise CoalescedReadTimeoutException(timeout)
+        return cast(T, task.result())
+
+    def _finish(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when every waiter has already given up
+            task.exception()
+
+    def stats(self) -> CoalescingStats:
+        return CoalescingStats(self._total, self._executions, self._shared, self._timeouts)
@@ -0,0 +1,15 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class CoalescingConfig:
+    enabled: bool = False
+    timeout_seconds: float = 5.0
+
+    @classmethod
+    def from_environment(cls) -> 'CoalescingConfig':
+        return cls(
+            enabled=os.getenv('READ_COALESCING_ENABLED') == 'true',
+            timeout_seconds=float(os.getenv('READ_COALESCING_TIMEOUT_SECONDS', '5'))
+        )
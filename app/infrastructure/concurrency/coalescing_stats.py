@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    calls: int
+    executions: int
+    shared: int
+    timeouts: int
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Share of calls answered by another caller's in-flight execution"""
+        return self.shared / self.calls if self.calls else 0.0
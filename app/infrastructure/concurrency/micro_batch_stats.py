@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MicroBatchStats:
+    loads: int
+    batches: int
+    keys: int
+
+    @property
+    def average_batch_size(self) -> float:
+        """Distinct keys per batch call; 1.0 means batching saved nothing"""
+        return self.keys / self.batches if self.batches else 0.0
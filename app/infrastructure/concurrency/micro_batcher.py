@@ -0,0 +1,81 @@
+import threading
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.infrastructure.concurrency.micro_batch_stats import MicroBatchStats
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class _Batch(Generic[K, V]):
+    def __init__(self) -> None:
+        self.keys: dict[K, None] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: dict[K, V] = {}
+        self.error: BaseException | None = None
+
+
+class MicroBatcher(Generic[K, V]):
+    """Collects single-key loads from concurrent threads into one batch call (DataLoader-style).
+
+    The first caller to arrive opens a batch and holds it open for up to window_seconds, or
+    until max_batch_size distinct keys have joined, then runs batch_fn once for all of them.
+    The other callers block until the results are fanned back out. Keys absent from the
+    returned mapping load as None; an exception from batch_fn is raised to every caller.
+    """
+
+    def __init__(self, batch_fn: Callable[[list[K]], dict[K, V]], window_seconds: float = 0.002,
+                 max_batch_size: int = 100):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._batch_fn = batch_fn
+        self._window = window_seconds
+        self._max_batch_size = max_batch_size
+        self._open: _Batch[K, V] | None = None
+        self._lock = threading.Lock()
+        self._loads = 0
+        self._batches = 0
+        self._keys = 0
+
+    def load(self, key: K) -> V | None:
+        with self._lock:
+            self._loads += 1
+            batch = self._open
+            leader = batch is None
+            if batch is None:
+                batch = self._open = _Batch()
+            batch.keys[key] = None
+            if len(batch.keys) >= self._max_batch_size:
+                # Later callers start the next batch while this one is dispatched
+                self._open = None
+                batch.full.set()
+
+        if leader:
+            self._dispatch(batch)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.results.get(key)
+
+    def _dispatch(self, batch: _Batch[K, V]) -> None:
+        if self._window > 0:
+            batch.full.wait(self._window)
+        with self._lock:
+            if self._open is batch:
+                self._open = None
+            self._batches += 1
+            self._keys += len(batch.keys)
+
+        try:
+            batch.results = self._batch_fn(list(batch.keys))
+        except BaseException as e:
+            batch.error = e
+        finally:
+            batch.done.set()
+
+    def stats(self) -> MicroBatchStats:
+        with self._lock:
+            return MicroBatchStats(self._loads, self._batches, self._keys)
@@ -0,0 +1,19 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ReadBatchingConfig:
+    enabled: bool = False
+    # Added to every point read that opens a batch; the price paid for fewer round trips
+    window_seconds: float = 0.002
+    # BatchGetItem accepts at most 100 keys per request
+    max_batch_size: int = 100
+
+    @classmethod
+    def from_environment(cls) -> 'ReadBatchingConfig':
+        return cls(
+            enabled=os.getenv('READ_BATCHING_ENABLED') == 'true',
+            window_seconds=float(os.getenv('READ_BATCHING_WINDOW_MS', '2')) / 1000,
+            max_batch_size=int(os.getenv('READ_BATCHING_MAX_KEYS', '100'))
+        )
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Callable, Generic, Hashable, TypeVar, cast
+
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+from app.infrastructure.exceptions.coalesced_read_timeout_exception import CoalescedReadTimeoutException
+
+T = TypeVar('T')
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-based request coalescing: concurrent calls with the same key share one execution.
+
+    The first caller runs the function; callers arriving while it is in flight wait up to
+    timeout_seconds for its result or exception. Nothing is cached once the call completes.
+    """
+
+    def __init__(self, timeout_seconds: float | None = None):
+        self._timeout = timeout_seconds
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+        self._total = 0
+        self._executions = 0
+        self._shared = 0
+        self._timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._shared += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        elif self._timeout is None:
+            call.done.wait()
+        elif not call.done.wait(self._timeout):
+            with self._lock:
+                self._timeouts += 1
+            raise CoalescedReadTimeoutException(self._timeout)
+
+        if call.error is not None:
+            raise call.error
+        return cast(T, call.result)
+
+    def stats(self) -> CoalescingStats:
+        with self._lock:
+            return CoalescingStats(self._total, self._executions, self._shared, self._timeouts)
@@ -0,0 +1,41 @@
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can be overdrawn.
+
+    For costs only known after the call (such as DynamoDB's consumed capacity): acquire() before
+    the call waits until the bucket is out of debt, and take() charges the actual cost afterwards.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float | None = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self._rate = rate_per_second
+        self._capacity = capacity if capacity is not None else rate_per_second
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        with self._lock:
+            self._refill()
+            wait = -self._tokens / self._rate
+        # Sleep once for the debt as it stood; re-checking would spin on float rounding
+        if wait > 0:
+            self._sleep(wait)
+
+    def take(self, amount: float) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
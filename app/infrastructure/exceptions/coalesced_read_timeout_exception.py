@@ -0,0 +1,6 @@
+from app.infrastructure.exceptions.database_exception import DatabaseException
+
+
+class CoalescedReadTimeoutException(DatabaseException):
+    def __init__(self, timeout_seconds: float):
+        super().__init__(f"Timed out after {timeout_seconds}s waiting for an in-flight read of the same credential")
@@ -0,0 +1,6 @@
+from app.infrastructure.exceptions.infrastructure_exception import InfrastructureException
+
+
+class InvalidCursorException(InfrastructureException):
+    def __init__(self, detail: str = 'cursor is malformed, was tampered with or belongs to another query'):
+        super().__init__(f"Invalid pagination cursor: {detail}")
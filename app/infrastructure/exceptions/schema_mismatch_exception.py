@@ -0,0 +1,6 @@
+from app.infrastructure.exceptions.database_exception import DatabaseException
+
+
+class SchemaMismatchException(DatabaseException):
+    def __init__(self, table_name: str, detail: str):
+        super().__init__(f"Table '{table_name}' does not match the expected schema: {detail}")
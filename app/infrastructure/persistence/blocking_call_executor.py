@@ -0,0 +1,29 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar('T')
+
+
+class BlockingCallExecutor:
+    """Runs blocking persistence calls (boto3, sqlite3) on a bounded thread pool.
+
+    The pool size caps the number of in-flight database calls per process; it should not
+    exceed the HTTP connection pool of the underlying client or calls queue for a connection.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db')
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class CredentialExportResult:
+    credentials: int
+    consumed_read_capacity: float
+    files: list[Path] = field(default_factory=list)
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from app.domain.enums.credential_type import CredentialType
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.credential_migration_result import CredentialMigrationResult
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.mappers.credential_mapper import ITEM_FORMAT_ATTRIBUTE
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+
+
+class CredentialItemMigrator:
+    """Rewrites credential items that are not yet fully in the current encoding.
+
+    A parallel segmented Scan finds items without the format marker and each one is replaced
+    through CredentialMapper.upgrade_item, conditional on it not having changed since it was read.
+    The scan filter is the checkpoint: a re-run only sees what is still left to migrate.
+    """
+
+    def __init__(self, db_manager: DynamoDBManager, mapper_provider: CredentialMapperProvider | None = None,
+                 read_capacity_limiter: TokenBucket | None = None, page_size: int | None = None):
+        self._table = db_manager.client.Table(db_manager.config.credentials_table)
+        self._mapper_provider = mapper_provider or CredentialMapperProvider()
+        self._limiter = read_capacity_limiter
+        self._page_size = page_size
+
+    def migrate(self, total_segments: int = 8, workers: int = 4) -> CredentialMigrationResult:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(lambda segment: self._migrate_segment(segment, total_segments),
+                                   range(total_segments)))
+        return CredentialMigrationResult(migrated=sum(m for m, _ in counts), skipped=sum(s for _, s in counts))
+
+    def _migrate_segment(self, segment: int, total_segments: int) -> tuple[int, int]:
+        migrated = skipped = 0
+        cursor = None
+        while True:
+            response = self._scan_page(segment, total_segments, cursor)
+            for item in response.get('Items', []):
+                if self._rewrite(item):
+                    migrated += 1
+                else:
+                    skipped += 1
+            cursor = response.get('LastEvaluatedKey')
+            if cursor is None:
+                return migrated, skipped
+
+    def _scan_page(self, segment: int, total_segments: int, cursor: dict | None) -> dict:
+        kwargs = {
+            'Segment': segment,
+            'TotalSegments': total_segments,
+            'FilterExpression': 'begins_with(SK, :metadata) AND attribute_not_exists(#fmt)',
+            'ExpressionAttributeNames': {'#fmt': ITEM_FORMAT_ATTRIBUTE},
+            'ExpressionAttributeValues': {':metadata': 'METADATA#'},
+            'ReturnConsumedCapacity': 'TOTAL'
+        }
+        if cursor is not None:
+            kwargs['ExclusiveStartKey'] = cursor
+        if self._page_size is not None:
+            kwargs['Limit'] = self._page_size
+
+        if self._limiter is not None:
+            self._limiter.acquire()
+        try:
+            response: dict = self._table.scan(**kwargs)
+        except ClientError as e:
+            raise DatabaseException(f"Error scanning credentials: {e.response['Error']['Message']}")
+        if self._limiter is not None:
+            self._limiter.take(float(response.get('ConsumedCapacity', {}).get('CapacityUnits', 0.0)))
+        return response
+
+    def _rewrite(self, item: dict) -> bool:
+        mapper = self._mapper_provider.get_mapper(CredentialType(item['credential_type']))
+        values = {}
+        if 'version' in item:
+            version_condition = 'version = :version'
+            values[':version'] = item['version']
+        else:
+            version_condition = 'attribute_not_exists(version)'
+
+        try:
+            self._table.put_item(
+                Item=mapper.upgrade_item(item),
+                ConditionExpression=f'attribute_exists(PK) AND attribute_not_exists(#fmt) AND {version_condition}',
+                ExpressionAttributeNames={'#fmt': ITEM_FORMAT_ATTRIBUTE},
+                **({'ExpressionAttributeValues': values} if values else {})
+            )
+        except ClientError as e:
+            if e.response['Error'].get('Code') == 'ConditionalCheckFailedException':
+                return False
+            raise DatabaseException(f"Error migrating credential: {e.response['Error']['Message']}")
+        return True
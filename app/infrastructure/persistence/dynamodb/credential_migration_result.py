@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CredentialMigrationResult:
+    migrated: int
+    # Items written to concurrently between the scan and the rewrite; the next run picks them up
+    skipped: int
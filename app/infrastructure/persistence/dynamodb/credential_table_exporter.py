@@ -0,0 +1,133 @@
+import gzip
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from app.domain.enums.credential_type import CredentialType
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.credential_export_result import CredentialExportResult
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.export_checkpoint_file import ExportCheckpointFile
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+
+CHECKPOINT_FILE = 'export-checkpoint.json'
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class CredentialTableExporter:
+    """Dumps every credential to gzip-compressed NDJSON with a parallel segmented Scan.
+
+    Each segment is scanned by one worker at a time and written to its own file, one gzip member
+    per scan page (concatenated members read back as a single stream). Only the current page is
+    held in memory. After every page the segment's cursor and file size are checkpointed, so an
+    interrupted export resumes without duplicates. The optional rate limiter is charged with the
+    read capacity each page actually consumed.
+    """
+
+    def __init__(self, db_manager: DynamoDBManager, mapper_provider: CredentialMapperProvider | None = None,
+                 read_capacity_limiter: TokenBucket | None = None, page_size: int | None = None):
+        self._table = db_manager.client.Table(db_manager.config.credentials_table)
+        self._mapper_provider = mapper_provider or CredentialMapperProvider()
+        self._limiter = read_capacity_limiter
+        self._page_size = page_size
+
+    def export(self, directory: Path, total_segments: int = 8, workers: int = 4) -> CredentialExportResult:
+        directory.mkdir(parents=True, exist_ok=True)
+        checkpoints = ExportCheckpointFile(directory / CHECKPOINT_FILE, total_segments)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            progress = list(pool.map(
+                lambda segment: self._export_segment(directory, segment, total_segments, checkpoints),
+                range(total_segments)))
+
+        return CredentialExportResult(
+            credentials=sum(p['credentials'] for p in progress),
+            consumed_read_capacity=sum(p['consumed_read_capacity'] for p in progress),
+            files=[self._segment_path(directory, segment, total_segments) for segment in range(total_segments)]
+        )
+
+    @staticmethod
+    def _segment_path(directory: Path, segment: int, total_segments: int) -> Path:
+        return directory / f'credentials-{segment:04d}-of-{total_segments:04d}.ndjson.gz'
+
+    def _export_segment(self, directory: Path, segment: int, total_segments: int,
+                        checkpoints: ExportCheckpointFile) -> dict:
+        progress = checkpoints.segment(segment) or {
+            'cursor': None, 'offset': 0, 'credentials': 0, 'consumed_read_capacity': 0.0, 'done': False}
+        if progress['done']:
+            return progress
+
+        path = self._segment_path(directory, segment, total_segments)
+        with open(path, 'r+b' if path.exists() else 'wb') as output:
+            # Drop whatever a previous run wrote after its last checkpoint
+            output.truncate(progress['offset'])
+            output.seek(progress['offset'])
+
+            while not progress['done']:
+                response = self._scan_page(segment, total_segments, progress['cursor'])
+                items = response.get('Items', [])
+                if items:
+                    with gzip.GzipFile(fileobj=output, mode='wb', mtime=0) as member:
+                        for item in items:
+                            member.write(json.dumps(self._record(item), separators=(',', ':')).encode() + b'\n')
+                    output.flush()
+                    os.fsync(output.fileno())
+
+                cursor = response.get('LastEvaluatedKey')
+                progress = {
+                    'cursor': cursor,
+                    'offset': output.tell(),
+                    'credentials': progress['credentials'] + len(items),
+                    'consumed_read_capacity': (progress['consumed_read_capacity']
+                                               + response.get('ConsumedCapacity', {}).get('CapacityUnits', 0.0)),
+                    'done': cursor is None
+                }
+                checkpoints.save_segment(segment, progress)
+        return progress
+
+    def _scan_page(self, segment: int, total_segments: int, cursor: dict | None) -> dict:
+        kwargs = {
+            'Segment': segment,
+            'TotalSegments': total_segments,
+            # Skips job checkpoints and any other non-credential items sharing the table
+            'FilterExpression': 'begins_with(SK, :metadata)',
+            'ExpressionAttributeValues': {':metadata': 'METADATA#'},
+            'ReturnConsumedCapacity': 'TOTAL'
+        }
+        if cursor is not None:
+            kwargs['ExclusiveStartKey'] = cursor
+        if self._page_size is not None:
+            kwargs['Limit'] = self._page_size
+
+        if self._limiter is not None:
+            self._limiter.acquire()
+        try:
+            response: dict = self._table.scan(**kwargs)
+        except ClientError as e:
+            raise DatabaseException(f"Error scanning credentials: {e.response['Error']['Message']}")
+        if self._limiter is not None:
+            self._limiter.take(float(response.get('ConsumedCapacity', {}).get('CapacityUnits', 0.0)))
+        return response
+
+    def _record(self, item: dict) -> dict:
+        credential_type = CredentialType(item['credential_type'])
+        mapper = self._mapper_provider.get_mapper(credential_type)
+        credential = mapper.to_domain(item)
+        record = {'credential_type': credential_type.value}
+        for field in sorted(mapper.FIELDS):
+            record[field] = _encode(getattr(credential, field))
+        return record
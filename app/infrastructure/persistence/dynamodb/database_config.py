@@ -1,5 +1,8 @@
 import os
 from dataclasses import dataclass
+from typing import Any
+
+RETRY_MODES = ('standard', 'adaptive')
 
 
 @dataclass
@@ -8,19 +11,55 @@ class DatabaseConfig:
     region: str
     access_key_id: str | None
     secret_access_key: str | None
-    max_retries: int = 1
+    # Retries after the first attempt. With the timeouts below, three attempts and their backoff
+    # still fit in the 15 s API Lambda timeout
+    max_retries: int = 2
+    # 'standard', or 'adaptive' to also rate-limit this client once DynamoDB starts throttling it
+    retry_mode: str = 'standard'
+    connect_timeout_seconds: float = 1.0
+    read_timeout_seconds: float = 3.0
+    # Keep at least executor_max_workers, or workers beyond the pool open and drop a connection per call
+    max_pool_connections: int = 50
+    tcp_keepalive: bool = True
+    # 'resource', or 'client' for the credential repository built on the low-level client
+    client_api: str = 'resource'
+    credentials_table: str = 'Credentials'
+    api_keys_table: str = 'ApiKeys'
+    bootstrap_schema: bool = False
+    executor_max_workers: int = 10
+    # HMAC key for listing cursors; must be the same in every container serving the API
+    cursor_secret: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.retry_mode not in RETRY_MODES:
+            raise ValueError(f"Unknown DynamoDB retry mode: '{self.retry_mode}'")
 
     @classmethod
     def from_environment(cls) -> 'DatabaseConfig':
         is_local = os.getenv('AWS_SAM_LOCAL') == 'true'
         region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1').lower()
+        settings: dict[str, Any] = {
+            'credentials_table': os.getenv('DYNAMODB_CREDENTIALS_TABLE', 'Credentials'),
+            'api_keys_table': os.getenv('DYNAMODB_API_KEYS_TABLE', 'ApiKeys'),
+            'bootstrap_schema': os.getenv('DYNAMODB_BOOTSTRAP_SCHEMA') == 'true',
+            'executor_max_workers': int(os.getenv('DYNAMODB_EXECUTOR_MAX_WORKERS', '10')),
+            'max_retries': int(os.getenv('DYNAMODB_MAX_RETRIES', '2')),
+            'retry_mode': os.getenv('DYNAMODB_RETRY_MODE', 'standard').lower(),
+            'connect_timeout_seconds': float(os.getenv('DYNAMODB_CONNECT_TIMEOUT_SECONDS', '1')),
+            'read_timeout_seconds': float(os.getenv('DYNAMODB_READ_TIMEOUT_SECONDS', '3')),
+            'max_pool_connections': int(os.getenv('DYNAMODB_MAX_POOL_CONNECTIONS', '50')),
+            'tcp_keepalive': os.getenv('DYNAMODB_TCP_KEEPALIVE', 'true') == 'true',
+            'client_api': os.getenv('DYNAMODB_CLIENT_API', 'resource').lower(),
+            'cursor_secret': os.getenv('PAGINATION_CURSOR_SECRET') or None
+        }
 
         if is_local:
             config = cls(
-                endpoint_url="http://host.docker.internal:8000",
+                endpoint_url=os.getenv('DYNAMODB_ENDPOINT_URL', "http://host.docker.internal:8000"),
                 region=region,
                 access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+                secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                **settings
             )
             return config
 
@@ -28,5 +67,6 @@ class DatabaseConfig:
             endpoint_url=None,
             region=region,
             access_key_id=None,
-            secret_access_key=None
-        )
\ No newline at end of file
+            secret_access_key=None,
+            **settings
+        )
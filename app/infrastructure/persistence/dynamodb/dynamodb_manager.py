@@ -1,3 +1,5 @@
+from typing import Any
+
 import boto3
 from botocore.config import Config
 
@@ -6,15 +8,36 @@ from app.infrastructure.persistence.dynamodb.database_config import DatabaseConf
 
 class DynamoDBManager:
     def __init__(self, config: DatabaseConfig):
+        self._config = config
         self._dynamodb = boto3.resource(
             'dynamodb',
             endpoint_url=config.endpoint_url,
             region_name=config.region,
             aws_access_key_id=config.access_key_id,
             aws_secret_access_key=config.secret_access_key,
-            config=Config(retries={'max_attempts': config.max_retries})
+            config=self.client_config(config)
+        )
+
+    @staticmethod
+    def client_config(config: DatabaseConfig) -> Config:
+        """The botocore transport settings: connection pool, timeouts, keepalive and retries"""
+        return Config(
+            retries={'max_attempts': config.max_retries, 'mode': config.retry_mode},
+            connect_timeout=config.connect_timeout_seconds,
+            read_timeout=config.read_timeout_seconds,
+            max_pool_connections=config.max_pool_connections,
+            tcp_keepalive=config.tcp_keepalive
         )
 
     @property
     def client(self):
-        return self._dynamodb
\ No newline at end of file
+        return self._dynamodb
+
+    @property
+    def low_level_client(self) -> Any:
+        """The botocore client under the resource, sharing its configuration and connection pool"""
+        return self._dynamodb.meta.client
+
+    @property
+    def config(self) -> DatabaseConfig:
+        return self._config
@@ -0,0 +1,35 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class ExportCheckpointFile:
+    """Per-segment progress of an export, rewritten atomically after every page.
+
+    Each segment records the scan cursor, how many credentials it wrote and the size of its
+    output file at that point, so a resumed export can cut off anything written after it.
+    """
+
+    def __init__(self, path: Path, total_segments: int):
+        self._path = path
+        self._lock = threading.Lock()
+        self._segments: dict[str, dict] = {}
+        if path.exists():
+            state = json.loads(path.read_text())
+            if state['total_segments'] != total_segments:
+                raise ValueError(f"{path} was written by an export with {state['total_segments']} segments; "
+                                 f"resume with the same number or start over in an empty directory")
+            self._segments = state['segments']
+        self._total_segments = total_segments
+
+    def segment(self, segment: int) -> dict | None:
+        with self._lock:
+            return self._segments.get(str(segment))
+
+    def save_segment(self, segment: int, progress: dict) -> None:
+        with self._lock:
+            self._segments[str(segment)] = progress
+            temporary = self._path.with_suffix('.tmp')
+            temporary.write_text(json.dumps({'total_segments': self._total_segments, 'segments': self._segments}))
+            os.replace(temporary, self._path)
@@ -0,0 +1,47 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+class PaginationCursorCodec:
+    """Turns a DynamoDB LastEvaluatedKey into an opaque, signed continuation cursor and back.
+
+    The signature covers the query scope as well, so a cursor cannot be edited to start elsewhere
+    in the table or replayed against a different filter. Every container must share the secret.
+    """
+
+    def __init__(self, secret: bytes):
+        if not secret:
+            raise ValueError("A pagination cursor secret is required")
+        self._secret = secret
+
+    def _sign(self, payload: str, scope: str) -> str:
+        return _b64encode(hmac.new(self._secret, f'{scope}\n{payload}'.encode(), hashlib.sha256).digest())
+
+    def encode(self, last_evaluated_key: dict, scope: str) -> str:
+        payload = _b64encode(json.dumps(last_evaluated_key, separators=(',', ':'), sort_keys=True).encode())
+        return f'{payload}.{self._sign(payload, scope)}'
+
+    def decode(self, cursor: str, scope: str) -> dict:
+        payload, _, signature = cursor.partition('.')
+        if not hmac.compare_digest(signature, self._sign(payload, scope)):
+            raise InvalidCursorException()
+        try:
+            key = json.loads(_b64decode(payload))
+        except (binascii.Error, ValueError):
+            raise InvalidCursorException()
+        if not isinstance(key, dict):
+            raise InvalidCursorException()
+        return key
@@ -0,0 +1,88 @@
+import time
+
+from botocore.exceptions import ClientError
+
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.exceptions.schema_mismatch_exception import SchemaMismatchException
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.table_definitions import TableDefinition, api_keys_table, credentials_table
+
+
+class SchemaBootstrap:
+    """Creates the application tables and indexes if they are missing and verifies them otherwise.
+
+    This is a deployment/startup step; repositories never issue control-plane calls themselves.
+    """
+
+    def __init__(self, db_manager: DynamoDBManager, poll_interval: float = 5.0):
+        self._poll_interval = poll_interval
+        self._client = db_manager.client.meta.client
+        self._definitions = [
+            credentials_table(db_manager.config.credentials_table),
+            api_keys_table(db_manager.config.api_keys_table)
+        ]
+
+    @property
+    def definitions(self) -> list[TableDefinition]:
+        return self._definitions
+
+    def ensure_tables(self) -> list[str]:
+        """Returns the tables and indexes that had to be created, e.g. ['Credentials', 'Credentials/StatusIndex']"""
+        created = []
+        for definition in self._definitions:
+            created.extend(self._ensure_table(definition))
+        return created
+
+    def _ensure_table(self, definition: TableDefinition) -> list[str]:
+        try:
+            description = self._client.describe_table(TableName=definition.name)['Table']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                raise DatabaseException(f"Error describing table: {str(e)}")
+            self._create_table(definition)
+            return [definition.name]
+
+        self._verify_key_schema(definition, description)
+        return self._create_missing_indexes(definition, description)
+
+    def _create_table(self, definition: TableDefinition) -> None:
+        try:
+            self._client.create_table(**definition.create_table_kwargs())
+            self._client.get_waiter('table_exists').wait(TableName=definition.name)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceInUseException':
+                # Another process created it between describe and create
+                return
+            raise DatabaseException(f"Error creating table: {str(e)}")
+
+    def _verify_key_schema(self, definition: TableDefinition, description: dict) -> None:
+        if description.get('KeySchema') != definition.key_schema:
+            raise SchemaMismatchException(definition.name, f"unexpected key schema {description.get('KeySchema')}")
+
+    def _create_missing_indexes(self, definition: TableDefinition, description: dict) -> list[str]:
+        existing_indexes = {index['IndexName'] for index in description.get('GlobalSecondaryIndexes', [])}
+        created = []
+        for index in definition.global_secondary_indexes:
+            if index['IndexName'] in existing_indexes:
+                continue
+            # DynamoDB only accepts one index creation per UpdateTable call
+            try:
+                self._client.update_table(
+                    TableName=definition.name,
+                    AttributeDefinitions=definition.attribute_definitions,
+                    GlobalSecondaryIndexUpdates=[{'Create': index}]
+                )
+            except ClientError as e:
+                raise DatabaseException(f"Error creating index {index['IndexName']}: {str(e)}")
+            self._wait_for_index(definition.name, index['IndexName'])
+            created.append(f"{definition.name}/{index['IndexName']}")
+        return created
+
+    def _wait_for_index(self, table_name: str, index_name: str) -> None:
+        while True:
+            description = self._client.describe_table(TableName=table_name)['Table']
+            statuses = {index['IndexName']: index.get('IndexStatus')
+                        for index in description.get('GlobalSecondaryIndexes', [])}
+            if statuses.get(index_name) == 'ACTIVE':
+                return
+            time.sleep(self._poll_interval)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class TableDefinition:
+    name: str
+    key_schema: list[dict]
+    attribute_definitions: list[dict]
+    global_secondary_indexes: list[dict] = field(default_factory=list)
+
+    def create_table_kwargs(self) -> dict:
+        kwargs = {
+            'TableName': self.name,
+            'KeySchema': self.key_schema,
+            'AttributeDefinitions': self.attribute_definitions,
+            'BillingMode': 'PAY_PER_REQUEST'
+        }
+        if self.global_secondary_indexes:
+            kwargs['GlobalSecondaryIndexes'] = self.global_secondary_indexes
+        return kwargs
+
+
+_PRIMARY_KEY_SCHEMA = [
+    {'AttributeName': 'PK', 'KeyType': 'HASH'},   # Partition key
+    {'AttributeName': 'SK', 'KeyType': 'RANGE'}   # Sort key
+]
+
+_PRIMARY_KEY_ATTRIBUTES = [
+    {'AttributeName': 'PK', 'AttributeType': 'S'},
+    {'AttributeName': 'SK', 'AttributeType': 'S'}
+]
+
+
+# Lists credentials by issuing country, narrowed by status and then credential type
+CREDENTIAL_STATUS_INDEX = 'CountryStatusIndex'
+# Sparse: only credentials that can still expire (active or suspended), ordered by valid_until.
+# Spread over shards so neither writes nor the sweeper concentrate on one partition.
+CREDENTIAL_EXPIRY_INDEX = 'ExpiryIndex'
+EXPIRY_INDEX_SHARDS = 16
+# DynamoDB TTL attribute (epoch seconds) set on expired credentials when archival is enabled
+ARCHIVE_AT_ATTRIBUTE = 'archive_at'
+
+
+def credentials_table(name: str) -> TableDefinition:
+    return TableDefinition(
+        name=name,
+        key_schema=_PRIMARY_KEY_SCHEMA,
+        attribute_definitions=_PRIMARY_KEY_ATTRIBUTES + [
+            {'AttributeName': 'GSI1PK', 'AttributeType': 'S'},
+            {'AttributeName': 'GSI1SK', 'AttributeType': 'S'},
+            {'AttributeName': 'EXP_PK', 'AttributeType': 'S'},
+            {'AttributeName': 'EXP_SK', 'AttributeType': 'S'}
+        ],
+        global_secondary_indexes=[{
+            'IndexName': CREDENTIAL_STATUS_INDEX,
+            'KeySchema': [
+                {'AttributeName': 'GSI1PK', 'KeyType': 'HASH'},    # COUNTRY#<issuing_country>
+                {'AttributeName': 'GSI1SK', 'KeyType': 'RANGE'}    # <status>#<credential_type>#<credential_id>
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }, {
+            'IndexName': CREDENTIAL_EXPIRY_INDEX,
+            'KeySchema': [
+                {'AttributeName': 'EXP_PK', 'KeyType': 'HASH'},    # EXPIRY#<shard>
+                {'AttributeName': 'EXP_SK', 'KeyType': 'RANGE'}    # <valid_until>#<issuing_country>#<credential_type>#<credential_id>
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }]
+    )
+
+
+def api_keys_table(name: str) -> TableDefinition:
+    return TableDefinition(
+        name=name,
+        key_schema=_PRIMARY_KEY_SCHEMA,
+        attribute_definitions=_PRIMARY_KEY_ATTRIBUTES
+    )
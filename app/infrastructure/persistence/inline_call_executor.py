@@ -0,0 +1,22 @@
+from typing import Any, Callable, TypeVar
+
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+
+T = TypeVar('T')
+
+
+class InlineCallExecutor(BlockingCallExecutor):
+    """Runs calls directly on the event loop instead of offloading them to a thread pool.
+
+    Only for stores whose calls never block, such as the in-memory repositories, where the hop to a
+    worker thread and back costs more than the call itself.
+    """
+
+    def __init__(self) -> None:
+        self._max_workers = 1
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return function(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        pass
@@ -1,13 +1,185 @@
+import zlib
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from typing import Any, Callable, Collection, Generic, TypeVar
 
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
 from app.domain.models.credential import Credential
+from app.infrastructure.persistence.dynamodb.table_definitions import EXPIRY_INDEX_SHARDS
 
+# Statuses a credential can still expire from; only these are kept in the sparse ExpiryIndex
+EXPIRABLE_STATUSES = frozenset({CredentialStatus.ACTIVE, CredentialStatus.SUSPENDED})
+
+# Version 1 items store ISO-8601 timestamps, full status names and null attributes. Version 2 stores
+# epoch-second numbers and one-letter status codes, omits nulls, and is marked by ITEM_FORMAT_ATTRIBUTE
+# once every attribute is in the new encoding. Readers accept either encoding attribute by attribute,
+# since status writes re-encode only the attributes they touch.
+ITEM_FORMAT_ATTRIBUTE = 'fmt'
+ITEM_FORMAT_VERSION = 2
+TIMESTAMP_ATTRIBUTES = ('valid_from', 'valid_until', 'created_at', 'updated_at')
+
+_STATUS_CODES = {
+    CredentialStatus.ACTIVE: 'A',
+    CredentialStatus.SUSPENDED: 'S',
+    CredentialStatus.REVOKED: 'R',
+    CredentialStatus.EXPIRED: 'E'
+}
+_STATUSES_BY_CODE = {code: status for status, code in _STATUS_CODES.items()}
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+C = TypeVar('C', bound=Credential)
+
+
+def encode_timestamp(value: datetime) -> int | Decimal:
+    """Whole seconds since the epoch, with a microsecond fraction only when there is one"""
+    microseconds = (value - _EPOCH) // _MICROSECOND
+    if microseconds % 1_000_000 == 0:
+        return microseconds // 1_000_000
+    return Decimal(microseconds).scaleb(-6)
+
+
+def decode_timestamp(value: str | int | Decimal) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    seconds = int(value)
+    if seconds == value:
+        return datetime.fromtimestamp(seconds, UTC)
+    return _EPOCH + timedelta(microseconds=int(value * 1_000_000))
+
+
+def encode_wire_timestamp(value: datetime) -> dict:
+    return {'N': str(encode_timestamp(value))}
+
+
+def decode_wire_timestamp(value: dict) -> datetime:
+    """decode_timestamp for a low-level attribute value, without going through Decimal for whole seconds"""
+    number = value.get('N')
+    if number is None:
+        return datetime.fromisoformat(value['S'])
+    if '.' in number:
+        return decode_timestamp(Decimal(number))
+    return datetime.fromtimestamp(int(number), UTC)
+
+
+def wire_string(value: str | None) -> dict | None:
+    return {'S': value} if value is not None else None
+
+
+def wire_optional_string(item: dict, name: str) -> str | None:
+    value = item.get(name)
+    return value['S'] if value is not None and 'S' in value else None
+
+
+def encode_status(status: CredentialStatus) -> str:
+    return _STATUS_CODES[status]
+
+
+def decode_status(value: str) -> CredentialStatus:
+    status = _STATUSES_BY_CODE.get(value)
+    return status if status is not None else CredentialStatus(value)
+
+
+class CredentialMapper(ABC, Generic[C]):
+    # Stored attributes that can be projected and decoded individually
+    FIELDS: frozenset[str] = frozenset({
+        'credential_id', 'valid_from', 'valid_until', 'issuing_country', 'status',
+        'suspension_reason', 'revocation_reason', 'version'
+    })
+
+    _FIELD_DECODERS: dict[str, Callable[[Any], Any]] = {
+        'valid_from': decode_timestamp,
+        'valid_until': decode_timestamp,
+        'status': decode_status,
+        'version': int
+    }
+
+    @staticmethod
+    def status_index_keys(issuing_country: str, status: CredentialStatus, credential_type: CredentialType,
+                          credential_id: str) -> dict:
+        """Key attributes of the CountryStatusIndex; rewritten whenever the status changes"""
+        return {
+            'GSI1PK': f'COUNTRY#{issuing_country}',
+            'GSI1SK': f'{status.value}#{credential_type.value}#{credential_id}'
+        }
+
+    @staticmethod
+    def expiry_index_keys(issuing_country: str, credential_type: CredentialType, credential_id: str,
+                          valid_until: datetime) -> dict:
+        """Key attributes of the ExpiryIndex; the shard is a stable hash of the credential key"""
+        shard = zlib.crc32(f'{issuing_country}#{credential_type.value}#{credential_id}'.encode()) % EXPIRY_INDEX_SHARDS
+        return {
+            'EXP_PK': f'EXPIRY#{shard:02d}',
+            'EXP_SK': f'{valid_until.isoformat()}#{issuing_country}#{credential_type.value}#{credential_id}'
+        }
+
+    def index_keys(self, credential: Credential) -> dict:
+        """Secondary index attributes of a full item"""
+        credential_id = str(credential.credential_id)
+        keys = self.status_index_keys(credential.issuing_country, credential.status,
+                                      credential.get_credential_type(), credential_id)
+        if credential.status in EXPIRABLE_STATUSES:
+            keys.update(self.expiry_index_keys(credential.issuing_country, credential.get_credential_type(),
+                                               credential_id, credential.valid_until))
+        return keys
+
+    def wire_index_keys(self, credential: Credential) -> dict:
+        return {name: {'S': value} for name, value in self.index_keys(credential).items()}
+
+    @staticmethod
+    def _compact_wire(attributes: dict) -> dict:
+        """_compact for low-level attribute maps"""
+        item = {name: value for name, value in attributes.items() if value is not None}
+        item[ITEM_FORMAT_ATTRIBUTE] = {'N': str(ITEM_FORMAT_VERSION)}
+        return item
+
+    @staticmethod
+    def _compact(attributes: dict) -> dict:
+        """Drops null attributes and marks the item as fully written in the current encoding"""
+        item = {name: value for name, value in attributes.items() if value is not None}
+        item[ITEM_FORMAT_ATTRIBUTE] = ITEM_FORMAT_VERSION
+        return item
+
+    def upgrade_item(self, item: dict) -> dict:
+        """Re-encodes a stored item of either version, keeping created_at and every other attribute.
+
+        Also fills in secondary index keys that items written before those indexes existed lack.
+        """
+        credential = self.to_domain(item)
+        upgraded = {name: value for name, value in item.items() if value is not None and name not in ('EXP_PK', 'EXP_SK')}
+        for name in TIMESTAMP_ATTRIBUTES:
+            if name in upgraded:
+                upgraded[name] = encode_timestamp(decode_timestamp(upgraded[name]))
+        upgraded['status'] = encode_status(credential.status)
+        upgraded.update(self.index_keys(credential))
+        upgraded[ITEM_FORMAT_ATTRIBUTE] = ITEM_FORMAT_VERSION
+        return upgraded
 
-class CredentialMapper(ABC):
     @abstractmethod
-    def to_dynamo(self, credential: Credential) -> dict:
+    def to_dynamo(self, credential: C) -> dict:
         pass
 
     @abstractmethod
-    def to_domain(self, dynamo_dict: dict) -> Credential:
-        pass
\ No newline at end of file
+    def to_domain(self, dynamo_dict: dict) -> C:
+        pass
+
+    @abstractmethod
+    def to_wire(self, credential: C) -> dict:
+        """The item of to_dynamo as the low-level client sends it: attribute values tagged S, N or L"""
+        pass
+
+    @abstractmethod
+    def from_wire(self, item: dict) -> C:
+        """to_domain for an item as the low-level client returns it"""
+        pass
+
+    def to_fields(self, item: dict, fields: Collection[str]) -> dict[str, Any]:
+        """Partial hydration of a projected item: decodes only the requested attributes"""
+        values = {}
+        for field in fields:
+            value = item.get(field, 1 if field == 'version' else None)
+            decoder = self._FIELD_DECODERS.get(field)
+            values[field] = decoder(value) if decoder and value is not None else value
+        return values
@@ -1,13 +1,19 @@
+from typing import Any
+
 from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
 from app.infrastructure.persistence.mappers.credential_mapper import CredentialMapper
 from app.infrastructure.persistence.mappers.drivers_license_mapper import DriversLicenseMapper
 from app.infrastructure.persistence.mappers.passport_mapper import PassportMapper
 
 
 class CredentialMapperProvider:
-    def get_mapper(self, credential_type: CredentialType) -> CredentialMapper:
-        match credential_type:
-            case CredentialType.DRIVERS_LICENSE:
-                return DriversLicenseMapper()
-            case CredentialType.PASSPORT:
-                return PassportMapper()
\ No newline at end of file
+    def __init__(self) -> None:
+        # Mappers are stateless, so one instance per type is shared by every caller
+        self._mappers: dict[CredentialType, CredentialMapper[Any]] = {
+            CredentialType.DRIVERS_LICENSE: DriversLicenseMapper(),
+            CredentialType.PASSPORT: PassportMapper()
+        }
+
+    def get_mapper(self, credential_type: CredentialType) -> CredentialMapper[Credential]:
+        return self._mappers[credential_type]
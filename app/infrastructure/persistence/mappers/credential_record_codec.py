@@ -0,0 +1,61 @@
+import json
+from datetime import datetime, timedelta, UTC
+from typing import Any
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _from_legacy_array(values: list[Any]) -> Credential:
+    """Records the local stores wrote before this encoding: version 1 of the cache's positional array.
+
+    Decoded here rather than by CredentialCodec, so changes to the cache format cannot orphan them.
+    """
+    (_, credential_type, credential_id, issuing_country, valid_from, valid_until,
+     status, suspension_reason, revocation_reason, version, *specific) = values
+    credential: Credential
+    if credential_type == CredentialType.PASSPORT.value:
+        credential = Passport(credential_id, _EPOCH + valid_from * _MICROSECOND, _EPOCH + valid_until * _MICROSECOND,
+                              specific[0], issuing_country)
+    else:
+        credential = DriversLicense(credential_id, _EPOCH + valid_from * _MICROSECOND,
+                                    _EPOCH + valid_until * _MICROSECOND, specific[0], issuing_country, specific[1])
+    credential.set_status(CredentialStatus(status))
+    credential.set_suspension_reason(suspension_reason)
+    credential.set_revocation_reason(revocation_reason)
+    credential.set_version(version)
+    return credential
+
+
+class CredentialRecordCodec:
+    """Durable encoding of credentials for the local stores: the SQLite rows and the append-only log.
+
+    A record is the credential's DynamoDB item in the low-level wire form, which is plain JSON. It
+    carries the item format version, and the mappers read every version attribute by attribute like
+    the DynamoDB repositories do, so stored records survive encoding changes. Unlike cache entries,
+    they are never tied to the cache's CredentialCodec format.
+    """
+
+    def __init__(self, mapper_provider: CredentialMapperProvider | None = None):
+        self._mapper_provider = mapper_provider or CredentialMapperProvider()
+
+    def to_record(self, credential: Credential) -> dict:
+        return self._mapper_provider.get_mapper(credential.get_credential_type()).to_wire(credential)
+
+    def from_record(self, record: dict | list) -> Credential:
+        if isinstance(record, list):
+            return _from_legacy_array(record)
+        return self._mapper_provider.get_mapper(CredentialType(record['credential_type']['S'])).from_wire(record)
+
+    def encode(self, credential: Credential) -> str:
+        return json.dumps(self.to_record(credential), separators=(',', ':'))
+
+    def decode(self, payload: str | bytes) -> Credential:
+        return self.from_record(json.loads(payload))
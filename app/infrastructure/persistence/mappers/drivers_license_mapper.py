@@ -1,40 +1,82 @@
 from datetime import datetime, UTC
 
-from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
 from app.domain.models.drivers_license import DriversLicense
-from app.infrastructure.persistence.mappers.credential_mapper import CredentialMapper
+from app.infrastructure.persistence.mappers.credential_mapper import (
+    CredentialMapper, decode_status, decode_timestamp, decode_wire_timestamp, encode_status, encode_timestamp,
+    encode_wire_timestamp, wire_optional_string, wire_string)
 
 
-class DriversLicenseMapper(CredentialMapper):
+class DriversLicenseMapper(CredentialMapper[DriversLicense]):
+    FIELDS = CredentialMapper.FIELDS | {'vehicle_classes', 'issuing_region'}
+
     def to_dynamo(self, credential: DriversLicense) -> dict:
-        return {
+        now = encode_timestamp(datetime.now(UTC))
+        return self._compact({
             'PK': f'CRED#{credential.issuing_country}#{str(credential.credential_id)}',
             'SK': f'METADATA#drivers_license',
             'credential_type': CredentialType.DRIVERS_LICENSE.value,
             'credential_id': str(credential.credential_id),
-            'valid_from': credential.valid_from.isoformat(),
-            'valid_until': credential.valid_until.isoformat(),
-            'status': credential.status.value,
+            'valid_from': encode_timestamp(credential.valid_from),
+            'valid_until': encode_timestamp(credential.valid_until),
+            'status': encode_status(credential.status),
             'vehicle_classes': credential.vehicle_classes,
             'issuing_region': credential.issuing_region,
             'issuing_country': credential.issuing_country,
             'suspension_reason': credential.suspension_reason,
             'revocation_reason': credential.revocation_reason,
-            'created_at': datetime.now(UTC).isoformat(),
-            'updated_at': datetime.now(UTC).isoformat(),
-            'version': 1
-        }
+            'created_at': now,
+            'updated_at': now,
+            'version': credential.version,
+            **self.index_keys(credential)
+        })
     def to_domain(self, item: dict) -> DriversLicense:
         drivers_license: DriversLicense = DriversLicense(
             credential_id=item['credential_id'],
-            valid_from=datetime.fromisoformat(item['valid_from']),
-            valid_until=datetime.fromisoformat(item['valid_until']),
+            valid_from=decode_timestamp(item['valid_from']),
+            valid_until=decode_timestamp(item['valid_until']),
             vehicle_classes=item['vehicle_classes'],
             issuing_country=item['issuing_country'],
             issuing_region=item['issuing_region'])
 
-        drivers_license.set_suspension_reason(item['suspension_reason'])
-        drivers_license.set_revocation_reason(item['revocation_reason'])
-        drivers_license.set_status(CredentialStatus(item['status']))
-        return drivers_license
\ No newline at end of file
+        drivers_license.set_suspension_reason(item.get('suspension_reason'))
+        drivers_license.set_revocation_reason(item.get('revocation_reason'))
+        drivers_license.set_status(decode_status(item['status']))
+        drivers_license.set_version(int(item.get('version', 1)))
+        return drivers_license
+
+    def to_wire(self, credential: DriversLicense) -> dict:
+        now = encode_wire_timestamp(datetime.now(UTC))
+        return self._compact_wire({
+            'PK': {'S': f'CRED#{credential.issuing_country}#{str(credential.credential_id)}'},
+            'SK': {'S': 'METADATA#drivers_license'},
+            'credential_type': {'S': CredentialType.DRIVERS_LICENSE.value},
+            'credential_id': {'S': str(credential.credential_id)},
+            'valid_from': encode_wire_timestamp(credential.valid_from),
+            'valid_until': encode_wire_timestamp(credential.valid_until),
+            'status': {'S': encode_status(credential.status)},
+            'vehicle_classes': {'L': [{'S': vehicle_class} for vehicle_class in credential.vehicle_classes]},
+            'issuing_region': wire_string(credential.issuing_region),
+            'issuing_country': {'S': credential.issuing_country},
+            'suspension_reason': wire_string(credential.suspension_reason),
+            'revocation_reason': wire_string(credential.revocation_reason),
+            'created_at': now,
+            'updated_at': now,
+            'version': {'N': str(credential.version)},
+            **self.wire_index_keys(credential)
+        })
+
+    def from_wire(self, item: dict) -> DriversLicense:
+        drivers_license: DriversLicense = DriversLicense(
+            credential_id=item['credential_id']['S'],
+            valid_from=decode_wire_timestamp(item['valid_from']),
+            valid_until=decode_wire_timestamp(item['valid_until']),
+            vehicle_classes=[vehicle_class['S'] for vehicle_class in item['vehicle_classes']['L']],
+            issuing_country=item['issuing_country']['S'],
+            issuing_region=item['issuing_region']['S'])
+
+        drivers_license.set_suspension_reason(wire_optional_string(item, 'suspension_reason'))
+        drivers_license.set_revocation_reason(wire_optional_string(item, 'revocation_reason'))
+        drivers_license.set_status(decode_status(item['status']['S']))
+        drivers_license.set_version(int(item['version']['N']) if 'version' in item else 1)
+        return drivers_license
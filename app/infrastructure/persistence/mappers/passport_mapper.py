@@ -1,40 +1,81 @@
 from datetime import datetime, UTC
 
-from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
 from app.domain.models.passport import Passport
-from app.infrastructure.persistence.mappers.credential_mapper import CredentialMapper
+from app.infrastructure.persistence.mappers.credential_mapper import (
+    CredentialMapper, decode_status, decode_timestamp, decode_wire_timestamp, encode_status, encode_timestamp,
+    encode_wire_timestamp, wire_optional_string, wire_string)
 
 
-class PassportMapper(CredentialMapper):
+class PassportMapper(CredentialMapper[Passport]):
+    FIELDS = CredentialMapper.FIELDS | {'nationality'}
+
     def to_dynamo(self, credential: Passport) -> dict:
-        return {
+        now = encode_timestamp(datetime.now(UTC))
+        return self._compact({
             'PK': f'CRED#{credential.issuing_country}#{str(credential.credential_id)}',
             'SK': f'METADATA#passport',
             'credential_type': CredentialType.PASSPORT.value,
             'credential_id': str(credential.credential_id),
-            'valid_from': credential.valid_from.isoformat(),
-            'valid_until': credential.valid_until.isoformat(),
-            'status': credential.status.value,
+            'valid_from': encode_timestamp(credential.valid_from),
+            'valid_until': encode_timestamp(credential.valid_until),
+            'status': encode_status(credential.status),
             'nationality': credential.nationality,
             'issuing_country': credential.issuing_country,
             'suspension_reason': credential.suspension_reason,
             'revocation_reason': credential.revocation_reason,
-            'created_at': datetime.now(UTC).isoformat(),
-            'updated_at': datetime.now(UTC).isoformat(),
-            'version': 1
-        }
+            'created_at': now,
+            'updated_at': now,
+            'version': credential.version,
+            **self.index_keys(credential)
+        })
 
     def to_domain(self, item: dict) -> Passport:
         passport: Passport = Passport(
             credential_id=item['credential_id'],
-            valid_from=datetime.fromisoformat(item['valid_from']),
-            valid_until=datetime.fromisoformat(item['valid_until']),
+            valid_from=decode_timestamp(item['valid_from']),
+            valid_until=decode_timestamp(item['valid_until']),
             nationality=item['nationality'],
             issuing_country=item['issuing_country']
         )
-        passport.set_suspension_reason(item['suspension_reason'])
-        passport.set_revocation_reason(item['revocation_reason'])
-        passport.set_status(CredentialStatus(item['status']))
+        passport.set_suspension_reason(item.get('suspension_reason'))
+        passport.set_revocation_reason(item.get('revocation_reason'))
+        passport.set_status(decode_status(item['status']))
+        passport.set_version(int(item.get('version', 1)))
+
+        return passport
+
+    def to_wire(self, credential: Passport) -> dict:
+        now = encode_wire_timestamp(datetime.now(UTC))
+        return self._compact_wire({
+            'PK': {'S': f'CRED#{credential.issuing_country}#{str(credential.credential_id)}'},
+            'SK': {'S': 'METADATA#passport'},
+            'credential_type': {'S': CredentialType.PASSPORT.value},
+            'credential_id': {'S': str(credential.credential_id)},
+            'valid_from': encode_wire_timestamp(credential.valid_from),
+            'valid_until': encode_wire_timestamp(credential.valid_until),
+            'status': {'S': encode_status(credential.status)},
+            'nationality': {'S': credential.nationality},
+            'issuing_country': {'S': credential.issuing_country},
+            'suspension_reason': wire_string(credential.suspension_reason),
+            'revocation_reason': wire_string(credential.revocation_reason),
+            'created_at': now,
+            'updated_at': now,
+            'version': {'N': str(credential.version)},
+            **self.wire_index_keys(credential)
+        })
+
+    def from_wire(self, item: dict) -> Passport:
+        passport: Passport = Passport(
+            credential_id=item['credential_id']['S'],
+            valid_from=decode_wire_timestamp(item['valid_from']),
+            valid_until=decode_wire_timestamp(item['valid_until']),
+            nationality=item['nationality']['S'],
+            issuing_country=item['issuing_country']['S']
+        )
 
+        passport.set_suspension_reason(wire_optional_string(item, 'suspension_reason'))
+        passport.set_revocation_reason(wire_optional_string(item, 'revocation_reason'))
+        passport.set_status(decode_status(item['status']['S']))
+        passport.set_version(int(item['version']['N']) if 'version' in item else 1)
         return passport
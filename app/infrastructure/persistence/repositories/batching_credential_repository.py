@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.concurrency.micro_batch_stats import MicroBatchStats
+from app.infrastructure.concurrency.micro_batcher import MicroBatcher
+
+
+class BatchingCredentialRepository(AbstractCredentialRepository):
+    """Turns concurrent point reads of different credentials into shared BatchGetItem calls.
+
+    The batcher must load through the wrapped repository's get_credentials.
+    """
+
+    def __init__(self, repository: AbstractCredentialRepository,
+                 batcher: MicroBatcher[CredentialKey, Credential]):
+        self._repository = repository
+        self._batcher = batcher
+
+    def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        credential = self._batcher.load(CredentialKey(credential_id, credential_type, issuing_country))
+        if credential is None:
+            raise CredentialNotFoundException(credential_id, credential_type.value)
+        # Callers asking for the same key in one batch share the loaded object; each gets its own copy
+        return Credential.from_snapshot(credential.snapshot())
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        # Joining the batch saves more than a projection would on a busy server
+        credential = self.get_credential(credential_id, credential_type, issuing_country)
+        return {field: getattr(credential, field) for field in fields}
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        return self._repository.get_credentials(keys)
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_credentials(issuing_country, status, credential_type, limit, cursor)
+
+    def expiry_shard_count(self) -> int:
+        return self._repository.expiry_shard_count()
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_expiring_credentials(shard, valid_until_before, valid_until_from, limit, cursor)
+
+    def create_credential(self, credential: Credential) -> None:
+        self._repository.create_credential(credential)
+
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        return self._repository.create_credentials(credentials)
+
+    def update_credential_status(self, credential: Credential) -> None:
+        self._repository.update_credential_status(credential)
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        return self._repository.transition_credential_status(
+            credential_id, credential_type, issuing_country, new_status, reason, expected_version)
+
+    def batching_stats(self) -> MicroBatchStats:
+        return self._batcher.stats()
@@ -0,0 +1,171 @@
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.models.credential_snapshot import CredentialSnapshot
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.cache.credential_cache_backend import CredentialCacheBackend
+
+# OrderedDict node, key tuple and bookkeeping tuple kept per entry
+_ENTRY_OVERHEAD_BYTES = 400
+
+
+def estimate_credential_size(snapshot: CredentialSnapshot) -> int:
+    size = _ENTRY_OVERHEAD_BYTES + sys.getsizeof(snapshot)
+    for name in ('credential_id', 'issuing_country', 'valid_from', 'valid_until', 'suspension_reason',
+                 'revocation_reason', 'details'):
+        value = getattr(snapshot, name)
+        size += sys.getsizeof(value)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(element) for element in value)
+    return size
+
+
+class CachingCredentialRepository(AbstractCredentialRepository):
+    """Read-through cache in front of another credential repository.
+
+    Writes made through this instance refresh or drop the cached entry. With a per-process
+    backend, writes made by other processes become visible once the entry's TTL runs out.
+    A read-through miss that overlaps a write to the same key does not fill the cache, since
+    it may have read the item from before the write.
+    """
+
+    def __init__(self, repository: AbstractCredentialRepository, backend: CredentialCacheBackend):
+        self._repository = repository
+        self._backend = backend
+        self._lock = threading.Lock()
+        self._fills_in_flight: dict[CredentialKey, int] = {}
+        self._written_during_fill: set[CredentialKey] = set()
+
+    @staticmethod
+    def _cache_key(credential_id: str, credential_type: CredentialType, issuing_country: str) -> CredentialKey:
+        return CredentialKey(credential_id, credential_type, issuing_country.lower())
+
+    def _key_of(self, credential: Credential) -> CredentialKey:
+        return self._cache_key(credential.credential_id, credential.get_credential_type(), credential.issuing_country)
+
+    def _remember(self, credential: Credential) -> None:
+        self._backend.put(self._key_of(credential), credential)
+
+    def _begin_fill(self, key: CredentialKey) -> None:
+        with self._lock:
+            self._fills_in_flight[key] = self._fills_in_flight.get(key, 0) + 1
+
+    def _end_fill(self, key: CredentialKey, credential: Credential | None) -> None:
+        with self._lock:
+            stale = key in self._written_during_fill
+            remaining = self._fills_in_flight[key] - 1
+            if remaining:
+                self._fills_in_flight[key] = remaining
+            else:
+                del self._fills_in_flight[key]
+                self._written_during_fill.discard(key)
+        if credential is not None and not stale:
+            self._backend.put(key, credential)
+
+    def _written(self, key: CredentialKey) -> None:
+        """Called once a write has finished, before the cache is refreshed or invalidated for it"""
+        with self._lock:
+            if key in self._fills_in_flight:
+                self._written_during_fill.add(key)
+
+    def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        key = self._cache_key(credential_id, credential_type, issuing_country)
+        credential = self._backend.get(key)
+        if credential is None:
+            self._begin_fill(key)
+            try:
+                credential = self._repository.get_credential(credential_id, credential_type, issuing_country)
+            finally:
+                self._end_fill(key, credential)
+        return credential
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        # A miss loads the whole credential so later reads of any field set are hits
+        credential = self.get_credential(credential_id, credential_type, issuing_country)
+        return {field: getattr(credential, field) for field in fields}
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        cache_keys = {key: self._cache_key(key.credential_id, key.credential_type, key.issuing_country) for key in keys}
+        cached = self._backend.get_many(list(dict.fromkeys(cache_keys.values())))
+
+        found = {key: cached[cache_key] for key, cache_key in cache_keys.items() if cache_key in cached}
+        missing = [key for key in keys if key not in found]
+        if missing:
+            for key in missing:
+                self._begin_fill(cache_keys[key])
+            fetched: dict[CredentialKey, Credential] = {}
+            try:
+                fetched = self._repository.get_credentials(missing)
+            finally:
+                for key in missing:
+                    self._end_fill(cache_keys[key], fetched.get(key))
+            found.update(fetched)
+        return found
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_credentials(issuing_country, status, credential_type, limit, cursor)
+
+    def expiry_shard_count(self) -> int:
+        return self._repository.expiry_shard_count()
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_expiring_credentials(shard, valid_until_before, valid_until_from, limit, cursor)
+
+    def create_credential(self, credential: Credential) -> None:
+        try:
+            self._repository.create_credential(credential)
+        finally:
+            self._written(self._key_of(credential))
+        self._remember(credential)
+
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        try:
+            return self._repository.create_credentials(credentials)
+        finally:
+            for credential in credentials:
+                key = self._key_of(credential)
+                self._written(key)
+                self._backend.invalidate(key)
+
+    def update_credential_status(self, credential: Credential) -> None:
+        key = self._key_of(credential)
+        try:
+            self._repository.update_credential_status(credential)
+        except Exception:
+            # A conflict means the cached copy is stale
+            self._written(key)
+            self._backend.invalidate(key)
+            raise
+        self._written(key)
+        self._remember(credential)
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        key = self._cache_key(credential_id, credential_type, issuing_country)
+        try:
+            credential = self._repository.transition_credential_status(
+                credential_id, credential_type, issuing_country, new_status, reason, expected_version)
+        except Exception:
+            self._written(key)
+            self._backend.invalidate(key)
+            raise
+        self._written(key)
+        self._remember(credential)
+        return credential
+
+    def cache_stats(self) -> CacheStats:
+        return self._backend.stats()
@@ -0,0 +1,62 @@
+import copy
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.repositories.async_credential_repository import AbstractAsyncCredentialRepository
+from app.infrastructure.concurrency.async_single_flight import AsyncSingleFlight
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+
+
+class CoalescingAsyncCredentialRepository(AbstractAsyncCredentialRepository):
+    """Shares one in-flight point read among handlers asking for the same credential at the same time.
+
+    Coalescing happens before the read is offloaded, so waiters do not hold executor threads.
+    """
+
+    def __init__(self, repository: AbstractAsyncCredentialRepository, single_flight: AsyncSingleFlight):
+        self._repository = repository
+        self._single_flight = single_flight
+
+    async def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        credential = await self._single_flight.do(
+            ('credential', credential_id, credential_type, issuing_country.lower()),
+            lambda: self._repository.get_credential(credential_id, credential_type, issuing_country))
+        # Every caller gets its own object, mutable attributes included, since callers may mutate it
+        return Credential.from_snapshot(credential.snapshot())
+
+    async def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                    fields: Collection[str]) -> dict[str, Any]:
+        values = await self._single_flight.do(
+            ('fields', credential_id, credential_type, issuing_country.lower(), tuple(fields)),
+            lambda: self._repository.get_credential_fields(credential_id, credential_type, issuing_country, fields))
+        return copy.deepcopy(values)
+
+    async def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        return await self._repository.get_credentials(keys)
+
+    async def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                               credential_type: CredentialType | None = None, limit: int = 50,
+                               cursor: str | None = None) -> CredentialPage:
+        return await self._repository.list_credentials(issuing_country, status, credential_type, limit, cursor)
+
+    async def create_credential(self, credential: Credential) -> None:
+        await self._repository.create_credential(credential)
+
+    async def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        return await self._repository.create_credentials(credentials)
+
+    async def update_credential_status(self, credential: Credential) -> None:
+        await self._repository.update_credential_status(credential)
+
+    async def transition_credential_status(self, credential_id: str, credential_type: CredentialType,
+                                           issuing_country: str, new_status: CredentialStatus,
+                                           reason: str | None, expected_version: int | None = None) -> Credential:
+        return await self._repository.transition_credential_status(
+            credential_id, credential_type, issuing_country, new_status, reason, expected_version)
+
+    def coalescing_stats(self) -> CoalescingStats:
+        return self._single_flight.stats()
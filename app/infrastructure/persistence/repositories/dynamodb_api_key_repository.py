@@ -1,6 +1,9 @@
+import dataclasses
 from datetime import datetime
+
 from botocore.exceptions import ClientError
 from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
 from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
 from app.infrastructure.exceptions.database_exception import DatabaseException
@@ -9,49 +12,10 @@ from app.infrastructure.exceptions.database_exception import DatabaseException
 class DynamoDBApiKeyRepository(AbstractApiKeyRepository):
     def __init__(self, db_manager: DynamoDBManager):
         self.dynamodb = db_manager.client
-        self._table = self._create_api_keys_table()
-
-    def _create_api_keys_table(self):
-        try:
-            # Create the table
-            table = self.dynamodb.create_table(
-                TableName="ApiKeys",
-                KeySchema=[
-                    {
-                        'AttributeName': 'PK',
-                        'KeyType': 'HASH'  # Partition key
-                    },
-                    {
-                        'AttributeName': 'SK',
-                        'KeyType': 'RANGE'  # Sort key
-                    }
-                ],
-                AttributeDefinitions=[
-                    {
-                        'AttributeName': 'PK',
-                        'AttributeType': 'S'  # String
-                    },
-                    {
-                        'AttributeName': 'SK',
-                        'AttributeType': 'S'  # String
-                    }
-                ],
-                ProvisionedThroughput={
-                    'ReadCapacityUnits': 5,
-                    'WriteCapacityUnits': 5
-                }
-            )
-
-            # Wait for the table to be created
-            table.meta.client.get_waiter('table_exists').wait(TableName='ApiKeys')
-            return table
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceInUseException':
-                # Table already exists
-                return self.dynamodb.Table('ApiKeys')
-            raise DatabaseException(f"Error creating table: {str(e)}")
-        except Exception as e:
-            raise DatabaseException(f"Error creating table: {str(e)}")
+        self._table_name = db_manager.config.api_keys_table
+        self._table = self.dynamodb.Table(self._table_name)
+        # The resource's client, so transaction items take plain Python values like the table calls
+        self._client = self.dynamodb.meta.client
 
     def store_api_key(self, api_key: ApiKey) -> None:
         try:
@@ -110,4 +74,81 @@ class DynamoDBApiKeyRepository(AbstractApiKeyRepository):
                 }
             )
         except Exception as e:
-            raise DatabaseException(f"Error updating API key last used: {str(e)}")
\ No newline at end of file
+            raise DatabaseException(f"Error updating API key last used: {str(e)}")
+
+    def delete_api_key(self, key: str) -> bool:
+        try:
+            response = self._table.delete_item(
+                Key={
+                    'PK': f'APIKEY#{key}',
+                    'SK': 'METADATA'
+                },
+                ReturnValues='ALL_OLD'
+            )
+            return 'Attributes' in response
+        except Exception as e:
+            raise DatabaseException(f"Error deleting API key: {str(e)}")
+
+    def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        failed = []
+        for usage in usages:
+            try:
+                if not self._add_request_count(usage):
+                    # Keys revoked since the requests were made are skipped rather than recreated
+                    continue
+            except Exception:
+                failed.append(usage)
+                continue
+            try:
+                self._touch(usage.key, 'METADATA', usage.last_used)
+                self._touch(usage.key, f'USAGE#{usage.interval_start.isoformat()}', usage.last_used)
+            except Exception:
+                # The counts are written, so only last_used is retried
+                failed.append(dataclasses.replace(usage, request_count=0))
+        return failed
+
+    def _add_request_count(self, usage: ApiKeyUsage) -> bool:
+        """Adds to the key's total and to its interval in one transaction, so a retried flush never counts twice.
+
+        Returns False if the key no longer exists.
+        """
+        try:
+            self._client.transact_write_items(TransactItems=[
+                {'Update': {
+                    'TableName': self._table_name,
+                    'Key': {'PK': f'APIKEY#{usage.key}', 'SK': 'METADATA'},
+                    'UpdateExpression': 'ADD request_count :count',
+                    'ConditionExpression': 'attribute_exists(PK)',
+                    'ExpressionAttributeValues': {':count': usage.request_count}
+                }},
+                {'Update': {
+                    'TableName': self._table_name,
+                    'Key': {'PK': f'APIKEY#{usage.key}', 'SK': f'USAGE#{usage.interval_start.isoformat()}'},
+                    'UpdateExpression': 'ADD request_count :count',
+                    'ExpressionAttributeValues': {':count': usage.request_count}
+                }}
+            ])
+        except ClientError as e:
+            reasons = e.response.get('CancellationReasons', [])
+            if reasons and reasons[0].get('Code') == 'ConditionalCheckFailed':
+                return False
+            raise
+        return True
+
+    def _touch(self, key: str, sort_key: str, timestamp: datetime) -> None:
+        try:
+            self._table.update_item(
+                Key={
+                    'PK': f'APIKEY#{key}',
+                    'SK': sort_key
+                },
+                UpdateExpression='SET last_used = :timestamp',
+                # A container flushing late must not move last_used back
+                ConditionExpression='attribute_exists(PK) AND (attribute_not_exists(last_used) OR last_used < :timestamp)',
+                ExpressionAttributeValues={
+                    ':timestamp': timestamp.isoformat()
+                }
+            )
+        except ClientError as e:
+            if e.response['Error'].get('Code') != 'ConditionalCheckFailedException':
+                raise
@@ -0,0 +1,64 @@
+from datetime import timedelta
+from typing import Any
+
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
+
+
+def _wire_strings(values: dict) -> dict:
+    # Keys and the expression values of our queries are all strings
+    return {name: {'S': value} for name, value in values.items()}
+
+
+class DynamoDBClientCredentialRepository(DynamoDBCredentialRepository):
+    """DynamoDBCredentialRepository on the low-level client for reads, puts, queries and batches.
+
+    The resource API runs boto3's TypeSerializer/TypeDeserializer over every attribute and hands
+    back numbers as Decimal; here the mappers' to_wire/from_wire go straight between credentials and
+    the client's attribute maps. Status updates, projections and their condition handling stay on
+    the inherited resource path, which shares this client's connection pool.
+    """
+
+    def __init__(self,
+                 db_manager: DynamoDBManager,
+                 mapper_provider: CredentialMapperProvider | None = None,
+                 backoff_policy: BackoffPolicy | None = None,
+                 cursor_codec: PaginationCursorCodec | None = None,
+                 archive_expired_after: timedelta | None = None):
+        super().__init__(db_manager, mapper_provider, backoff_policy, cursor_codec, archive_expired_after)
+        self._client = db_manager.low_level_client
+        self._batch_api = self._client
+
+    def _to_domain(self, item: dict) -> Credential:
+        return self._mapperFactory.get_mapper(CredentialType(item['credential_type']['S'])).from_wire(item)
+
+    def _to_item(self, credential: Credential) -> dict:
+        return self._mapperFactory.get_mapper(credential.get_credential_type()).to_wire(credential)
+
+    @staticmethod
+    def _item_key(item: dict) -> tuple[str, str]:
+        return item['PK']['S'], item['SK']['S']
+
+    def _get_item(self, key: dict) -> dict | None:
+        item: dict | None = self._client.get_item(TableName=self._table_name, Key=_wire_strings(key)).get('Item')
+        return item
+
+    def _put_item(self, item: dict) -> None:
+        self._client.put_item(TableName=self._table_name, Item=item)
+
+    def _query(self, values: dict, **kwargs: Any) -> tuple[list[dict], dict | None]:
+        if 'ExclusiveStartKey' in kwargs:
+            kwargs['ExclusiveStartKey'] = _wire_strings(kwargs['ExclusiveStartKey'])
+        response = self._client.query(TableName=self._table_name, ExpressionAttributeValues=_wire_strings(values),
+                                      **kwargs)
+        last_key = response.get('LastEvaluatedKey')
+        # Cursors stay interchangeable with the resource path's
+        return response.get('Items', []), {name: value['S'] for name, value in last_key.items()} if last_key else None
+
+    def _batch_get(self, keys: list[dict]) -> list[dict]:
+        return super()._batch_get([_wire_strings(key) for key in keys])
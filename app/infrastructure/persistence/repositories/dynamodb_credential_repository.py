@@ -1,40 +1,107 @@
-from datetime import datetime, UTC
+import secrets
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Collection
 
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 
-from app.infrastructure.persistence.mappers.credential_mapper import CredentialMapper
+from app.infrastructure.persistence.mappers.credential_mapper import (
+    CredentialMapper, EXPIRABLE_STATUSES, decode_status, encode_status, encode_timestamp)
 
-from app.domain.models.credential import Credential
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.models.credential import Credential, STATUS_TRANSITION_GUARDS
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
 from app.domain.repositories.credential_repository import AbstractCredentialRepository
 from app.domain.enums.credential_type import CredentialType
 from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.dynamodb.table_definitions import (
+    ARCHIVE_AT_ATTRIBUTE, CREDENTIAL_EXPIRY_INDEX, CREDENTIAL_STATUS_INDEX, EXPIRY_INDEX_SHARDS)
 from app.infrastructure.exceptions.database_exception import DatabaseException
 from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
 
 
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Attributes written by each status transition, mirroring Credential.suspend/reinstate/revoke
+_TRANSITION_UPDATES = {
+    CredentialStatus.SUSPENDED: ['suspension_reason = :reason'],
+    CredentialStatus.ACTIVE: [],
+    CredentialStatus.REVOKED: ['revocation_reason = :reason'],
+    CredentialStatus.EXPIRED: []
+}
+# Attributes cleared by each transition; null attributes are removed rather than stored
+_TRANSITION_REMOVALS = {
+    CredentialStatus.ACTIVE: ['suspension_reason']
+}
+
+
 class DynamoDBCredentialRepository(AbstractCredentialRepository):
-    def __init__(self, db_manager: DynamoDBManager):
+    def __init__(self,
+                 db_manager: DynamoDBManager,
+                 mapper_provider: CredentialMapperProvider | None = None,
+                 backoff_policy: BackoffPolicy | None = None,
+                 cursor_codec: PaginationCursorCodec | None = None,
+                 archive_expired_after: timedelta | None = None):
         self.dynamodb = db_manager.client
-        self._table = self._create_credentials_table()
-        self._mapperFactory = CredentialMapperProvider()
+        self._table_name = db_manager.config.credentials_table
+        self._table = self.dynamodb.Table(self._table_name)
+        # The resource and the low-level client take the same batch requests, in their own item format
+        self._batch_api = self.dynamodb
+        self._mapperFactory = mapper_provider or CredentialMapperProvider()
+        self._backoff = backoff_policy or BackoffPolicy()
+        # Without a shared secret, cursors only resolve in the process that issued them
+        self._cursor_codec = cursor_codec or PaginationCursorCodec(secrets.token_bytes(32))
+        # When set, expired credentials get a TTL so DynamoDB deletes (and streams) them after this long
+        self._archive_expired_after = archive_expired_after
+
+    @staticmethod
+    def _key(credential_id: str, credential_type: CredentialType, issuing_country: str) -> dict:
+        return {
+            'PK': f'CRED#{issuing_country}#{str(credential_id)}',
+            'SK': f'METADATA#{credential_type.value}'
+        }
+
+    # Item access points; DynamoDBClientCredentialRepository replaces these to skip the resource API's
+    # type (de)serialization, and inherits everything built on top of them
+
+    def _to_domain(self, item: dict) -> Credential:
+        return self._mapperFactory.get_mapper(CredentialType(item['credential_type'])).to_domain(item)
+
+    def _to_item(self, credential: Credential) -> dict:
+        return self._mapperFactory.get_mapper(credential.get_credential_type()).to_dynamo(credential)
+
+    @staticmethod
+    def _item_key(item: dict) -> tuple[str, str]:
+        return item['PK'], item['SK']
+
+    def _get_item(self, key: dict) -> dict | None:
+        item: dict | None = self._table.get_item(Key=key).get('Item')
+        return item
+
+    def _put_item(self, item: dict) -> None:
+        self._table.put_item(Item=item)
+
+    def _query(self, values: dict, **kwargs: Any) -> tuple[list[dict], dict | None]:
+        """Items of one query page and its LastEvaluatedKey, which cursors carry as plain strings"""
+        response = self._table.query(ExpressionAttributeValues=values, **kwargs)
+        return response.get('Items', []), response.get('LastEvaluatedKey')
 
     def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential | None:
         try:
-            response = self._table.get_item(
-                Key={
-                    'PK': f'CRED#{issuing_country}#{str(credential_id)}',
-                    'SK': f'METADATA#{credential_type.value}'
-                })
-
-            item = response.get('Item')
+            item = self._get_item(self._key(credential_id, credential_type, issuing_country))
 
             if not item:
                 raise CredentialNotFoundException(credential_id, credential_type.value)
 
-            mapper = self._mapperFactory.get_mapper(CredentialType(item.get('credential_type')))
-            credential = mapper.to_domain(item)
-            return credential
+            return self._to_domain(item)
         except CredentialNotFoundException:
             # Let CredentialNotFoundException bubble up
             raise
@@ -42,62 +109,193 @@ class DynamoDBCredentialRepository(AbstractCredentialRepository):
             raise DatabaseException(
                 f"Error getting credential: {str(e)}")
 
-    def _create_credentials_table(self):
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        """Reads only the named attributes through a ProjectionExpression and decodes just those"""
+        mapper = self._mapperFactory.get_mapper(credential_type)
+        unknown = set(fields) - mapper.FIELDS
+        if unknown:
+            raise ValueError(f"Unknown {credential_type.value} fields: {', '.join(sorted(unknown))}")
+
         try:
-            # Create the table
-            table = self.dynamodb.create_table(
-                TableName="Credentials",
-                KeySchema=[
-                    {
-                        'AttributeName': 'PK',
-                        'KeyType': 'HASH'  # Partition key
-                    },
-                    {
-                        'AttributeName': 'SK',
-                        'KeyType': 'RANGE'  # Sort key
-                    }
-                ],
-                AttributeDefinitions=[
-                    {
-                        'AttributeName': 'PK',
-                        'AttributeType': 'S'  # String
-                    },
-                    {
-                        'AttributeName': 'SK',
-                        'AttributeType': 'S'  # String
-                    }
-                ],
-                ProvisionedThroughput={
-                    'ReadCapacityUnits': 5,
-                    'WriteCapacityUnits': 5
-                }
-            )
+            item = self._projected_item(self._key(credential_id, credential_type, issuing_country), fields)
+        except (ClientError, Exception) as e:
+            raise DatabaseException(f"Error getting credential: {str(e)}")
+
+        if item is None:
+            raise CredentialNotFoundException(credential_id, credential_type.value)
+        return mapper.to_fields(item, fields)
+
+    def _projected_item(self, key: dict, fields: Collection[str]) -> dict | None:
+        # PK is always projected so an existing item is never mistaken for a missing one
+        names = {'#pk': 'PK', **{f'#f{i}': field for i, field in enumerate(fields)}}
+        response = self._table.get_item(
+            Key=key,
+            ProjectionExpression=', '.join(names),
+            ExpressionAttributeNames=names
+        )
+        item: dict | None = response.get('Item')
+        return item
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        # BatchGetItem rejects duplicate keys within a request
+        requested: dict[tuple[str, str], CredentialKey] = {}
+        for key in keys:
+            dynamo_key = self._key(key.credential_id, key.credential_type, key.issuing_country)
+            requested.setdefault((dynamo_key['PK'], dynamo_key['SK']), key)
+
+        credentials = {}
+        pending = list(requested)
+        try:
+            for start in range(0, len(pending), BATCH_GET_MAX_KEYS):
+                chunk = pending[start:start + BATCH_GET_MAX_KEYS]
+                for item in self._batch_get([{'PK': pk, 'SK': sk} for pk, sk in chunk]):
+                    credentials[requested[self._item_key(item)]] = self._to_domain(item)
+            return credentials
+        except DatabaseException:
+            raise
+        except (ClientError, Exception) as e:
+            raise DatabaseException(f"Error getting credentials: {str(e)}")
+
+    def _batch_get(self, keys: list[dict]) -> list[dict]:
+        items = []
+        request_items = {self._table_name: {'Keys': keys}}
+        attempt = 0
+        while request_items:
+            response = self._batch_api.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(self._table_name, []))
+            request_items = response.get('UnprocessedKeys') or {}
+            if request_items:
+                attempt += 1
+                if attempt >= self._backoff.max_attempts:
+                    raise DatabaseException(
+                        f"Error getting credentials: keys still unprocessed after {attempt} attempts")
+                time.sleep(self._backoff.delay(attempt))
+        return items
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        """Queries the CountryStatusIndex; status and type narrow the sort key prefix.
+
+        A type filter without a status is applied after the read, so such pages can hold fewer
+        than limit credentials (even none) and still carry a cursor.
+        """
+        scope = f"{issuing_country}|{status.value if status else ''}|{credential_type.value if credential_type else ''}"
+        values = {':pk': f'COUNTRY#{issuing_country}'}
+        key_condition = 'GSI1PK = :pk'
+        if status is not None:
+            values[':prefix'] = f'{status.value}#{credential_type.value}#' if credential_type else f'{status.value}#'
+            key_condition += ' AND begins_with(GSI1SK, :prefix)'
+
+        kwargs = {'IndexName': CREDENTIAL_STATUS_INDEX, 'KeyConditionExpression': key_condition, 'Limit': limit}
+        if status is None and credential_type is not None:
+            kwargs['FilterExpression'] = 'credential_type = :type'
+            values[':type'] = credential_type.value
+        if cursor is not None:
+            kwargs['ExclusiveStartKey'] = self._cursor_codec.decode(cursor, scope)
+
+        try:
+            items, last_key = self._query(values, **kwargs)
+            credentials = [self._to_domain(item) for item in items]
+        except (ClientError, Exception) as e:
+            raise DatabaseException(f"Error listing credentials: {str(e)}")
+
+        return CredentialPage(credentials, self._cursor_codec.encode(last_key, scope) if last_key else None)
+
+    def expiry_shard_count(self) -> int:
+        return EXPIRY_INDEX_SHARDS
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        """Range query on one ExpiryIndex shard, ordered by valid_until"""
+        # Cursors only embed the shard, so a sweep checkpoint stays usable as time moves on
+        scope = f'expiry|{shard}'
+        values = {':pk': f'EXPIRY#{shard:02d}', ':before': valid_until_before.astimezone(UTC).isoformat()}
+        key_condition = 'EXP_PK = :pk AND EXP_SK < :before'
+        if valid_until_from is not None:
+            values[':from'] = valid_until_from.astimezone(UTC).isoformat()
+            key_condition = 'EXP_PK = :pk AND EXP_SK BETWEEN :from AND :before'
+
+        kwargs = {'IndexName': CREDENTIAL_EXPIRY_INDEX, 'KeyConditionExpression': key_condition, 'Limit': limit}
+        if cursor is not None:
+            kwargs['ExclusiveStartKey'] = self._cursor_codec.decode(cursor, scope)
+
+        try:
+            items, last_key = self._query(values, **kwargs)
+            credentials = [self._to_domain(item) for item in items]
+        except (ClientError, Exception) as e:
+            raise DatabaseException(f"Error listing expiring credentials: {str(e)}")
+
+        return CredentialPage(credentials, self._cursor_codec.encode(last_key, scope) if last_key else None)
 
-            # Wait for the table to be created
-            table.meta.client.get_waiter('table_exists').wait(TableName='Credentials')
-            return table
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceInUseException':
-                return self.dynamodb.Table('Credentials')
-            raise DatabaseException(f"Error creating table: {str(e)}")
-        except Exception as e:
-            raise DatabaseException(f"Error creating table: {str(e)}")
     def create_credential(self, credential: Credential):
         try:
-            credential_mapper: CredentialMapper = self._mapperFactory.get_mapper(credential.get_credential_type())
-            credential_item = credential_mapper.to_dynamo(credential)
-            response = self._table.put_item(Item=credential_item)
-            return response
+            self._put_item(self._to_item(credential))
         except (ClientError, Exception) as e:
             raise DatabaseException(f"Error creating credential: {str(e)}")
 
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        failed: list[Credential] = []
+        for chunk in self._write_chunks(credentials):
+            try:
+                items = {}
+                for credential in chunk:
+                    item = self._to_item(credential)
+                    items[self._item_key(item)] = (item, credential)
+                unprocessed = self._batch_write([item for item, _ in items.values()])
+            except (ClientError, Exception) as e:
+                raise DatabaseException(f"Error creating credentials: {str(e)}")
+            failed.extend(items[self._item_key(item)][1] for item in unprocessed)
+        return failed
+
+    @staticmethod
+    def _write_chunks(credentials: list[Credential]) -> list[list[Credential]]:
+        # BatchWriteItem rejects a request that touches the same key twice, so a repeated
+        # key starts a new chunk and the later write wins, as it would with put_item
+        chunks: list[list[Credential]] = []
+        chunk_keys: set = set()
+        for credential in credentials:
+            key = (credential.issuing_country, credential.credential_id, credential.get_credential_type())
+            if not chunks or len(chunks[-1]) == BATCH_WRITE_MAX_ITEMS or key in chunk_keys:
+                chunks.append([])
+                chunk_keys = set()
+            chunks[-1].append(credential)
+            chunk_keys.add(key)
+        return chunks
+
+    def _batch_write(self, items: list[dict]) -> list[dict]:
+        """Returns the items still unprocessed once the retry budget is spent"""
+        request_items = {self._table_name: [{'PutRequest': {'Item': item}} for item in items]}
+        attempt = 0
+        while True:
+            response = self._batch_api.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems') or {}
+            if not request_items:
+                return []
+            attempt += 1
+            if attempt >= self._backoff.max_attempts:
+                return [request['PutRequest']['Item'] for request in request_items.get(self._table_name, [])]
+            time.sleep(self._backoff.delay(attempt))
+
     def update_credential_status(self, credential: Credential) -> None:
-        update_expression = """
-            SET #status = :status,
-                suspension_reason = :suspension_reason,
-                revocation_reason = :revocation_reason,
-                updated_at = :updated_at
-        """
+        """Writes the credential's status fields if the stored item is still at credential.version"""
+        mapper = self._mapperFactory.get_mapper(credential.get_credential_type())
+        index_keys = mapper.index_keys(credential)
+        reasons = {'suspension_reason': credential.suspension_reason, 'revocation_reason': credential.revocation_reason}
+        # The validity window is rewritten too, so the write leaves those attributes in the current encoding
+        updates = ['#status = :status', 'valid_from = :valid_from', 'valid_until = :valid_until',
+                   'updated_at = :updated_at', 'version = :next_version']
+        updates += [f'{name} = :{name}' for name, reason in reasons.items() if reason is not None]
+        updates += [f'{name} = :{name.lower()}' for name in index_keys]
+        removals = [name for name, reason in reasons.items() if reason is None]
+        # Credentials that can no longer expire leave the sparse ExpiryIndex
+        if credential.status not in EXPIRABLE_STATUSES:
+            removals += ['EXP_PK', 'EXP_SK']
+        update_expression = 'SET ' + ', '.join(updates)
+        if removals:
+            update_expression += ' REMOVE ' + ', '.join(removals)
 
         try:
             response = self._table.update_item(
@@ -106,17 +304,122 @@ class DynamoDBCredentialRepository(AbstractCredentialRepository):
                     'SK': f'METADATA#{credential.get_credential_type().value}'
                 },
                 UpdateExpression=update_expression,
+                ConditionExpression=self._version_condition(credential.version),
                 ExpressionAttributeNames={
                     '#status': 'status'
                 },
                 ExpressionAttributeValues={
-                    ':status': credential.status.value,
-                    ':suspension_reason': credential.suspension_reason,
-                    ':revocation_reason': credential.revocation_reason,
-                    ':updated_at': datetime.now(UTC).isoformat()
+                    ':status': encode_status(credential.status),
+                    ':valid_from': encode_timestamp(credential.valid_from),
+                    ':valid_until': encode_timestamp(credential.valid_until),
+                    ':updated_at': encode_timestamp(datetime.now(UTC)),
+                    **{f':{name}': reason for name, reason in reasons.items() if reason is not None},
+                    ':expected_version': credential.version,
+                    ':next_version': credential.version + 1,
+                    **{f':{name.lower()}': value for name, value in index_keys.items()}
                 },
-                ReturnValues="UPDATED_NEW"
+                ReturnValues="UPDATED_NEW",
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
             )
-            return response
-        except (ClientError, Exception) as e:
+        except ClientError as e:
+            if e.response['Error'].get('Code') == 'ConditionalCheckFailedException':
+                old_item = self._old_item(e, credential.credential_id, credential.get_credential_type(),
+                                          credential.issuing_country)
+                if not old_item:
+                    raise CredentialNotFoundException(credential.credential_id, credential.get_credential_type().value)
+                raise CredentialVersionConflictException(
+                    credential.credential_id, credential.version, int(old_item.get('version', 1)))
+            raise DatabaseException(f"Error updating item in DynamoDB: {e.response['Error']['Message']}")
+        except Exception as e:
+            raise DatabaseException(f"Error updating item in DynamoDB: {str(e)}")
+
+        credential.set_version(credential.version + 1)
+        return response
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        """Applies a status transition in one conditional UpdateItem instead of a read followed by a write.
+
+        With expected_version the write only succeeds if the stored item is still at that version.
+        """
+        guards = STATUS_TRANSITION_GUARDS[new_status]
+        # Items not yet migrated still hold the full status name, so each guard checks both encodings
+        conditions = ['attribute_exists(PK)'] + [f'#status <> :forbidden{i} AND #status <> :forbidden{i}_name'
+                                                 for i in range(len(guards))]
+        now = datetime.now(UTC)
+        values = {
+            ':status': encode_status(new_status),
+            ':updated_at': encode_timestamp(now),
+            ':one': 1,
+            **{f':{name.lower()}': value for name, value in CredentialMapper.status_index_keys(
+                issuing_country, new_status, credential_type, str(credential_id)).items()},
+            **{f':forbidden{i}': encode_status(status) for i, status in enumerate(guards)},
+            **{f':forbidden{i}_name': status.value for i, status in enumerate(guards)}
+        }
+        updates = ['#status = :status', *_TRANSITION_UPDATES[new_status], 'updated_at = :updated_at',
+                   'version = if_not_exists(version, :one) + :one', 'GSI1PK = :gsi1pk', 'GSI1SK = :gsi1sk']
+        removals = list(_TRANSITION_REMOVALS.get(new_status, []))
+        if new_status in (CredentialStatus.SUSPENDED, CredentialStatus.REVOKED):
+            values[':reason'] = reason
+        if new_status == CredentialStatus.EXPIRED and self._archive_expired_after is not None:
+            updates.append(f'{ARCHIVE_AT_ATTRIBUTE} = :archive_at')
+            values[':archive_at'] = int((now + self._archive_expired_after).timestamp())
+        # Suspending or reinstating keeps the credential in the ExpiryIndex: guards rule out
+        # reaching either status from one that already left it
+        if new_status not in EXPIRABLE_STATUSES:
+            removals += ['EXP_PK', 'EXP_SK']
+        update_expression = 'SET ' + ', '.join(updates)
+        if removals:
+            update_expression += ' REMOVE ' + ', '.join(removals)
+        if expected_version is not None:
+            conditions.append(f'({self._version_condition(expected_version)})')
+            values[':expected_version'] = expected_version
+
+        try:
+            response = self._table.update_item(
+                Key=self._key(credential_id, credential_type, issuing_country),
+                UpdateExpression=update_expression,
+                ConditionExpression=' AND '.join(conditions),
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues=values,
+                ReturnValues='ALL_NEW',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+        except ClientError as e:
+            if e.response['Error'].get('Code') == 'ConditionalCheckFailedException':
+                self._raise_transition_rejected(
+                    self._old_item(e, credential_id, credential_type, issuing_country),
+                    credential_id, credential_type, guards, expected_version)
             raise DatabaseException(f"Error updating item in DynamoDB: {e.response['Error']['Message']}")
+        except Exception as e:
+            raise DatabaseException(f"Error updating item in DynamoDB: {str(e)}")
+
+        item = response['Attributes']
+        return self._mapperFactory.get_mapper(CredentialType(item['credential_type'])).to_domain(item)
+
+    @staticmethod
+    def _version_condition(expected_version: int) -> str:
+        # Items written before versioning have no attribute and read as version 1
+        if expected_version == 1:
+            return 'version = :expected_version OR attribute_not_exists(version)'
+        return 'version = :expected_version'
+
+    def _old_item(self, error: ClientError, credential_id: str, credential_type: CredentialType,
+                  issuing_country: str) -> dict | None:
+        if 'Item' in error.response:
+            return {name: TypeDeserializer().deserialize(value) for name, value in error.response['Item'].items()}
+        # DynamoDB Local may not honour ReturnValuesOnConditionCheckFailure; only this failure path pays a read
+        return self._projected_item(self._key(credential_id, credential_type, issuing_country), ['status', 'version'])
+
+    @staticmethod
+    def _raise_transition_rejected(old_item: dict | None, credential_id: str, credential_type: CredentialType,
+                                   guards: dict[CredentialStatus, str], expected_version: int | None) -> None:
+        if not old_item:
+            raise CredentialNotFoundException(credential_id, credential_type.value)
+
+        actual_version = int(old_item.get('version', 1))
+        if expected_version is not None and actual_version != expected_version:
+            raise CredentialVersionConflictException(credential_id, expected_version, actual_version)
+        raise InvalidCredentialStateException(
+            guards.get(decode_status(old_item['status']), "Credential was modified concurrently"))
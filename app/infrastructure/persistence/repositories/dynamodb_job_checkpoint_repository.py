@@ -0,0 +1,38 @@
+from datetime import datetime, UTC
+
+from app.domain.repositories.job_checkpoint_repository import AbstractJobCheckpointRepository
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+
+
+class DynamoDBJobCheckpointRepository(AbstractJobCheckpointRepository):
+    """Keeps checkpoints as JOB#<job> items in the credentials table, next to the data they track"""
+
+    def __init__(self, db_manager: DynamoDBManager):
+        self.dynamodb = db_manager.client
+        self._table = self.dynamodb.Table(db_manager.config.credentials_table)
+
+    @staticmethod
+    def _key(job: str, partition: int) -> dict:
+        return {'PK': f'JOB#{job}', 'SK': f'PARTITION#{partition:04d}'}
+
+    def get_checkpoint(self, job: str, partition: int) -> str | None:
+        try:
+            response = self._table.get_item(Key=self._key(job, partition), ConsistentRead=True)
+        except Exception as e:
+            raise DatabaseException(f"Error reading checkpoint: {str(e)}")
+        cursor: str | None = response.get('Item', {}).get('cursor')
+        return cursor
+
+    def save_checkpoint(self, job: str, partition: int, cursor: str) -> None:
+        try:
+            self._table.put_item(Item={**self._key(job, partition), 'cursor': cursor,
+                                       'updated_at': datetime.now(UTC).isoformat()})
+        except Exception as e:
+            raise DatabaseException(f"Error saving checkpoint: {str(e)}")
+
+    def clear_checkpoint(self, job: str, partition: int) -> None:
+        try:
+            self._table.delete_item(Key=self._key(job, partition))
+        except Exception as e:
+            raise DatabaseException(f"Error clearing checkpoint: {str(e)}")
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
+from app.domain.repositories.async_api_key_repository import AbstractAsyncApiKeyRepository
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+
+
+class ExecutorApiKeyRepository(AbstractAsyncApiKeyRepository):
+    """Adapts a blocking API key repository to the async interface by offloading each call"""
+
+    def __init__(self, repository: AbstractApiKeyRepository, executor: BlockingCallExecutor):
+        self._repository = repository
+        self._executor = executor
+
+    async def store_api_key(self, api_key: ApiKey) -> None:
+        await self._executor.run(self._repository.store_api_key, api_key)
+
+    async def get_api_key(self, key: str) -> ApiKey | None:
+        return await self._executor.run(self._repository.get_api_key, key)
+
+    async def update_api_key(self, key: str, timestamp: datetime) -> None:
+        await self._executor.run(self._repository.update_api_key, key, timestamp)
+
+    async def delete_api_key(self, key: str) -> bool:
+        return await self._executor.run(self._repository.delete_api_key, key)
+
+    async def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        return await self._executor.run(self._repository.record_api_key_usage, usages)
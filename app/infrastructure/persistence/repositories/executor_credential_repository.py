@@ -0,0 +1,51 @@
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.repositories.async_credential_repository import AbstractAsyncCredentialRepository
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+
+
+class ExecutorCredentialRepository(AbstractAsyncCredentialRepository):
+    """Adapts a blocking credential repository to the async interface by offloading each call"""
+
+    def __init__(self, repository: AbstractCredentialRepository, executor: BlockingCallExecutor):
+        self._repository = repository
+        self._executor = executor
+
+    async def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        return await self._executor.run(self._repository.get_credential, credential_id, credential_type, issuing_country)
+
+    async def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                    fields: Collection[str]) -> dict[str, Any]:
+        return await self._executor.run(self._repository.get_credential_fields,
+                                        credential_id, credential_type, issuing_country, fields)
+
+    async def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        return await self._executor.run(self._repository.get_credentials, keys)
+
+    async def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                               credential_type: CredentialType | None = None, limit: int = 50,
+                               cursor: str | None = None) -> CredentialPage:
+        return await self._executor.run(self._repository.list_credentials,
+                                        issuing_country, status, credential_type, limit, cursor)
+
+    async def create_credential(self, credential: Credential) -> None:
+        await self._executor.run(self._repository.create_credential, credential)
+
+    async def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        return await self._executor.run(self._repository.create_credentials, credentials)
+
+    async def update_credential_status(self, credential: Credential) -> None:
+        await self._executor.run(self._repository.update_credential_status, credential)
+
+    async def transition_credential_status(self, credential_id: str, credential_type: CredentialType,
+                                           issuing_country: str, new_status: CredentialStatus,
+                                           reason: str | None, expected_version: int | None = None) -> Credential:
+        return await self._executor.run(self._repository.transition_credential_status,
+                                        credential_id, credential_type, issuing_country, new_status, reason,
+                                        expected_version)
@@ -0,0 +1,91 @@
+import dataclasses
+import threading
+from datetime import datetime
+from typing import Any, Iterable
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+
+
+def _to_record(api_key: ApiKey) -> dict:
+    return {
+        'key': api_key.key,
+        'created_at': api_key.created_at.isoformat(),
+        'last_used': api_key.last_used.isoformat() if api_key.last_used else None,
+        'description': api_key.description
+    }
+
+
+def _from_record(record: dict) -> ApiKey:
+    return ApiKey(key=record['key'], created_at=datetime.fromisoformat(record['created_at']),
+                  last_used=datetime.fromisoformat(record['last_used']) if record['last_used'] else None,
+                  description=record['description'])
+
+
+class InMemoryApiKeyRepository(AbstractApiKeyRepository):
+    """API keys held in process memory; the companion of InMemoryCredentialRepository.
+
+    Request counts are kept per key and per usage interval, as in DynamoDB, but only in memory:
+    the log records the keys themselves.
+    """
+
+    def __init__(self, log: AppendOnlyLog | None = None):
+        self._lock = threading.Lock()
+        self._keys: dict[str, ApiKey] = {}
+        self._request_counts: dict[str, int] = {}
+        self._interval_counts: dict[tuple[str, datetime], int] = {}
+        self._log = None
+        if log is not None:
+            for operation, value in log.replay():
+                if operation == 'put':
+                    self._keys[value['key']] = _from_record(value)
+                else:
+                    self._keys.pop(value, None)
+            self._log = log
+
+    def _append(self, operation: str, value: Any) -> None:
+        if self._log is not None:
+            self._log.append([operation, value], self._snapshot)
+
+    def _snapshot(self) -> Iterable[list]:
+        return [['put', _to_record(api_key)] for api_key in self._keys.values()]
+
+    def store_api_key(self, api_key: ApiKey) -> None:
+        with self._lock:
+            self._keys[api_key.key] = dataclasses.replace(api_key)
+            self._append('put', _to_record(api_key))
+
+    def get_api_key(self, key: str) -> ApiKey | None:
+        api_key = self._keys.get(key)
+        return dataclasses.replace(api_key) if api_key is not None else None
+
+    def update_api_key(self, key: str, timestamp: datetime) -> None:
+        with self._lock:
+            api_key = self._keys.get(key)
+            if api_key is not None:
+                self._keys[key] = dataclasses.replace(api_key, last_used=timestamp)
+                self._append('put', _to_record(self._keys[key]))
+
+    def delete_api_key(self, key: str) -> bool:
+        with self._lock:
+            if self._keys.pop(key, None) is None:
+                return False
+            self._request_counts.pop(key, None)
+            self._append('delete', key)
+            return True
+
+    def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        with self._lock:
+            for usage in usages:
+                api_key = self._keys.get(usage.key)
+                # Keys revoked since the requests were made are skipped rather than recreated
+                if api_key is None:
+                    continue
+                self._keys[usage.key] = dataclasses.replace(api_key, last_used=usage.last_used)
+                self._request_counts[usage.key] = self._request_counts.get(usage.key, 0) + usage.request_count
+                interval = (usage.key, usage.interval_start)
+                self._interval_counts[interval] = self._interval_counts.get(interval, 0) + usage.request_count
+                self._append('put', _to_record(self._keys[usage.key]))
+        return []
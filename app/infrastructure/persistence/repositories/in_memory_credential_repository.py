@@ -0,0 +1,228 @@
+import bisect
+import secrets
+import threading
+from datetime import datetime, UTC
+from typing import Any, Collection, Iterable
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential import Credential, STATUS_TRANSITION_GUARDS
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.models.credential_snapshot import CredentialSnapshot
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.mappers.credential_mapper import EXPIRABLE_STATUSES
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+from app.infrastructure.persistence.mappers.credential_record_codec import CredentialRecordCodec
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+
+_PrimaryKey = tuple[str, CredentialType, str]
+# (status, type, id): the CountryStatusIndex sort key, so listings come back in the same order
+_StatusKey = tuple[str, str, str]
+# (valid_until, country, type, id): the ExpiryIndex sort key
+_ExpiryKey = tuple[datetime, str, str, str]
+
+
+class InMemoryCredentialRepository(AbstractCredentialRepository):
+    """Credential store held in process memory, for local development, load tests and tiny deployments.
+
+    Credentials are kept as immutable snapshots under a hash index on their primary key, and every
+    read gets its own credential built from one. Sorted per-country status and valid_until indexes
+    answer listings and expiry queries with bisection. Writes and index walks hold one lock, point
+    reads are single dict lookups, and nothing blocks or awaits under the lock. With a log, every
+    write is appended to it as a CredentialRecordCodec record and replayed on start-up.
+    """
+
+    def __init__(self, log: AppendOnlyLog | None = None, cursor_codec: PaginationCursorCodec | None = None,
+                 mapper_provider: CredentialMapperProvider | None = None):
+        self._cursor_codec = cursor_codec or PaginationCursorCodec(secrets.token_bytes(32))
+        self._mapper_provider = mapper_provider or CredentialMapperProvider()
+        self._codec = CredentialRecordCodec(self._mapper_provider)
+        self._lock = threading.RLock()
+        self._items: dict[_PrimaryKey, CredentialSnapshot] = {}
+        self._by_status: dict[str, list[_StatusKey]] = {}
+        self._by_expiry: list[_ExpiryKey] = []
+        self._log = None
+        if log is not None:
+            for record in log.replay():
+                # Logs from before CredentialRecordCodec hold each record as an encoded string
+                self._put(self._codec.decode(record) if isinstance(record, str) else self._codec.from_record(record))
+            self._log = log
+
+    @staticmethod
+    def _key(credential_id: str, credential_type: CredentialType, issuing_country: str) -> _PrimaryKey:
+        return issuing_country, credential_type, str(credential_id)
+
+    @staticmethod
+    def _status_key(snapshot: CredentialSnapshot) -> _StatusKey:
+        return snapshot.status.value, snapshot.credential_type.value, str(snapshot.credential_id)
+
+    @staticmethod
+    def _expiry_key(snapshot: CredentialSnapshot) -> _ExpiryKey:
+        return (snapshot.valid_until, snapshot.issuing_country, snapshot.credential_type.value,
+                str(snapshot.credential_id))
+
+    def _load(self, key: _PrimaryKey) -> Credential | None:
+        snapshot = self._items.get(key)
+        return Credential.from_snapshot(snapshot) if snapshot is not None else None
+
+    def _indexed(self, key: _PrimaryKey) -> Credential:
+        # Index entries are only kept for stored items
+        return Credential.from_snapshot(self._items[key])
+
+    def _put(self, credential: Credential) -> None:
+        snapshot = credential.snapshot()
+        key = self._key(snapshot.credential_id, snapshot.credential_type, snapshot.issuing_country)
+        previous = self._items.get(key)
+        status_key = self._status_key(snapshot)
+        expiry_key = self._expiry_key(snapshot) if snapshot.status in EXPIRABLE_STATUSES else None
+
+        # Index lists only shift when an entry's sort key actually changes
+        previous_status_key = self._status_key(previous) if previous is not None else None
+        if previous_status_key != status_key:
+            statuses = self._by_status.setdefault(snapshot.issuing_country, [])
+            if previous_status_key is not None:
+                del statuses[bisect.bisect_left(statuses, previous_status_key)]
+            bisect.insort(statuses, status_key)
+        previous_expiry_key = (self._expiry_key(previous)
+                               if previous is not None and previous.status in EXPIRABLE_STATUSES else None)
+        if previous_expiry_key != expiry_key:
+            if previous_expiry_key is not None:
+                del self._by_expiry[bisect.bisect_left(self._by_expiry, previous_expiry_key)]
+            if expiry_key is not None:
+                bisect.insort(self._by_expiry, expiry_key)
+
+        self._items[key] = snapshot
+        if self._log is not None:
+            self._log.append(self._codec.to_record(credential), self._log_snapshot)
+
+    def _log_snapshot(self) -> Iterable[dict]:
+        return [self._codec.to_record(Credential.from_snapshot(snapshot)) for snapshot in self._items.values()]
+
+    def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        credential = self._load(self._key(credential_id, credential_type, issuing_country))
+        if credential is None:
+            raise CredentialNotFoundException(credential_id, credential_type.value)
+        return credential
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        unknown = set(fields) - self._mapper_provider.get_mapper(credential_type).FIELDS
+        if unknown:
+            raise ValueError(f"Unknown {credential_type.value} fields: {', '.join(sorted(unknown))}")
+        credential = self.get_credential(credential_id, credential_type, issuing_country)
+        return {field: getattr(credential, field) for field in fields}
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        credentials = {}
+        for key in keys:
+            credential = self._load(self._key(key.credential_id, key.credential_type, key.issuing_country))
+            if credential is not None:
+                credentials[key] = credential
+        return credentials
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        scope = f"{issuing_country}|{status.value if status else ''}|{credential_type.value if credential_type else ''}"
+        after = tuple(self._cursor_codec.decode(cursor, scope)['after']) if cursor is not None else None
+
+        # Like the index's sort key prefix: a type only narrows the range together with a status
+        prefix = (status.value, credential_type.value) if status and credential_type else (
+            (status.value,) if status else ())
+        credentials: list[Credential] = []
+        with self._lock:
+            statuses = self._by_status.get(issuing_country, [])
+            start = bisect.bisect_right(statuses, after) if after else bisect.bisect_left(statuses, prefix)
+            for index in range(start, len(statuses)):
+                status_value, type_value, credential_id = statuses[index]
+                if statuses[index][:len(prefix)] != prefix:
+                    break
+                if credential_type is not None and type_value != credential_type.value:
+                    continue
+                if len(credentials) == limit:
+                    return CredentialPage(credentials, self._cursor_codec.encode(
+                        {'after': list(self._status_key(credentials[-1].snapshot()))}, scope))
+                credentials.append(self._indexed((issuing_country, CredentialType(type_value), credential_id)))
+        return CredentialPage(credentials, None)
+
+    def expiry_shard_count(self) -> int:
+        # One sorted index already answers any range directly
+        return 1
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        scope = f'expiry|{shard}'
+        if cursor is not None:
+            valid_until, *rest = self._cursor_codec.decode(cursor, scope)['after']
+            after = (datetime.fromisoformat(valid_until), *rest)
+        else:
+            after = None
+
+        credentials: list[Credential] = []
+        with self._lock:
+            if after is not None:
+                start = bisect.bisect_right(self._by_expiry, after)
+            else:
+                start = bisect.bisect_left(self._by_expiry, (valid_until_from,)) if valid_until_from else 0
+            for index in range(start, len(self._by_expiry)):
+                valid_until, issuing_country, type_value, credential_id = self._by_expiry[index]
+                if valid_until >= valid_until_before:
+                    break
+                if len(credentials) == limit:
+                    last = self._expiry_key(credentials[-1].snapshot())
+                    return CredentialPage(credentials, self._cursor_codec.encode(
+                        {'after': [last[0].isoformat(), *last[1:]]}, scope))
+                credentials.append(self._indexed((issuing_country, CredentialType(type_value), credential_id)))
+        return CredentialPage(credentials, None)
+
+    def create_credential(self, credential: Credential) -> None:
+        with self._lock:
+            self._put(credential)
+
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        with self._lock:
+            for credential in credentials:
+                self._put(credential)
+        return []
+
+    def update_credential_status(self, credential: Credential) -> None:
+        credential_type = credential.get_credential_type()
+        with self._lock:
+            stored = self._load(self._key(credential.credential_id, credential_type, credential.issuing_country))
+            if stored is None:
+                raise CredentialNotFoundException(credential.credential_id, credential_type.value)
+            if stored.version != credential.version:
+                raise CredentialVersionConflictException(credential.credential_id, credential.version, stored.version)
+            credential.set_version(credential.version + 1)
+            self._put(credential)
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        with self._lock:
+            credential = self._load(self._key(credential_id, credential_type, issuing_country))
+            if credential is None:
+                raise CredentialNotFoundException(credential_id, credential_type.value)
+            if expected_version is not None and credential.version != expected_version:
+                raise CredentialVersionConflictException(credential_id, expected_version, credential.version)
+            message = STATUS_TRANSITION_GUARDS[new_status].get(credential.status)
+            if message:
+                raise InvalidCredentialStateException(message)
+
+            # Mirrors the attributes DynamoDBCredentialRepository writes for each transition
+            credential.set_status(new_status)
+            if new_status == CredentialStatus.SUSPENDED:
+                credential.set_suspension_reason(reason)
+            elif new_status == CredentialStatus.ACTIVE:
+                credential.set_suspension_reason(None)
+            elif new_status == CredentialStatus.REVOKED:
+                credential.set_revocation_reason(reason)
+            credential.set_version(credential.version + 1)
+            self._put(credential)
+            return credential
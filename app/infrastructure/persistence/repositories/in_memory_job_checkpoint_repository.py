@@ -0,0 +1,22 @@
+import threading
+
+from app.domain.repositories.job_checkpoint_repository import AbstractJobCheckpointRepository
+
+
+class InMemoryJobCheckpointRepository(AbstractJobCheckpointRepository):
+    """Checkpoints that last as long as the process, for jobs run against the in-memory store"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cursors: dict[tuple[str, int], str] = {}
+
+    def get_checkpoint(self, job: str, partition: int) -> str | None:
+        return self._cursors.get((job, partition))
+
+    def save_checkpoint(self, job: str, partition: int, cursor: str) -> None:
+        with self._lock:
+            self._cursors[(job, partition)] = cursor
+
+    def clear_checkpoint(self, job: str, partition: int) -> None:
+        with self._lock:
+            self._cursors.pop((job, partition), None)
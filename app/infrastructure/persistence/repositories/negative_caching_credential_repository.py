@@ -0,0 +1,114 @@
+import sys
+from datetime import datetime
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+# OrderedDict node, CredentialKey and bookkeeping tuple kept per remembered miss
+_ENTRY_OVERHEAD_BYTES = 350
+
+
+def estimate_miss_size(key: CredentialKey) -> int:
+    return _ENTRY_OVERHEAD_BYTES + sys.getsizeof(key.credential_id) + sys.getsizeof(key.issuing_country)
+
+
+class NegativeCachingCredentialRepository(AbstractCredentialRepository):
+    """Remembers lookups that ended in CredentialNotFoundException and answers repeats without a read.
+
+    Creates through this instance forget the key at once; a credential issued by another
+    process can stay hidden here for at most the cache TTL.
+    """
+
+    def __init__(self, repository: AbstractCredentialRepository, cache: LruTtlCache[CredentialKey, CredentialKey]):
+        self._repository = repository
+        self._cache = cache
+
+    @staticmethod
+    def _cache_key(credential_id: str, credential_type: CredentialType, issuing_country: str) -> CredentialKey:
+        return CredentialKey(credential_id, credential_type, issuing_country.lower())
+
+    def _forget(self, credential: Credential) -> None:
+        self._cache.invalidate(self._cache_key(
+            credential.credential_id, credential.get_credential_type(), credential.issuing_country))
+
+    def _check_known_missing(self, key: CredentialKey) -> None:
+        if self._cache.get(key) is not None:
+            raise CredentialNotFoundException(key.credential_id, key.credential_type.value)
+
+    def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        key = self._cache_key(credential_id, credential_type, issuing_country)
+        self._check_known_missing(key)
+        try:
+            return self._repository.get_credential(credential_id, credential_type, issuing_country)
+        except CredentialNotFoundException:
+            self._cache.put(key, key)
+            raise
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        key = self._cache_key(credential_id, credential_type, issuing_country)
+        self._check_known_missing(key)
+        try:
+            return self._repository.get_credential_fields(credential_id, credential_type, issuing_country, fields)
+        except CredentialNotFoundException:
+            self._cache.put(key, key)
+            raise
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        cache_keys = {key: self._cache_key(key.credential_id, key.credential_type, key.issuing_country) for key in keys}
+        to_fetch = [key for key in keys if self._cache.get(cache_keys[key]) is None]
+        if not to_fetch:
+            return {}
+
+        found = self._repository.get_credentials(to_fetch)
+        for key in to_fetch:
+            if key not in found:
+                self._cache.put(cache_keys[key], cache_keys[key])
+        return found
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_credentials(issuing_country, status, credential_type, limit, cursor)
+
+    def expiry_shard_count(self) -> int:
+        return self._repository.expiry_shard_count()
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        return self._repository.list_expiring_credentials(shard, valid_until_before, valid_until_from, limit, cursor)
+
+    def create_credential(self, credential: Credential) -> None:
+        self._forget(credential)
+        self._repository.create_credential(credential)
+        # Forget again in case a concurrent lookup remembered the miss while the write was in flight
+        self._forget(credential)
+
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        for credential in credentials:
+            self._forget(credential)
+        failed = self._repository.create_credentials(credentials)
+        for credential in credentials:
+            self._forget(credential)
+        return failed
+
+    def update_credential_status(self, credential: Credential) -> None:
+        self._repository.update_credential_status(credential)
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        return self._repository.transition_credential_status(
+            credential_id, credential_type, issuing_country, new_status, reason, expected_version)
+
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats()
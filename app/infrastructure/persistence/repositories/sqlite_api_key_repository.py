@@ -0,0 +1,78 @@
+import sqlite3
+from datetime import datetime
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+from app.domain.repositories.api_key_repository import AbstractApiKeyRepository
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+_INSERT_KEY = '''INSERT OR REPLACE INTO api_keys (key, created_at, last_used, description, request_count)
+                 VALUES (?, ?, ?, ?, 0)'''
+_SELECT_KEY = 'SELECT key, created_at, last_used, description FROM api_keys WHERE key = ?'
+_TOUCH_KEY = 'UPDATE api_keys SET last_used = ? WHERE key = ?'
+_COUNT_KEY = '''UPDATE api_keys SET last_used = ?, request_count = request_count + ?
+                WHERE key = ?'''
+_COUNT_INTERVAL = '''INSERT INTO api_key_usage (key, interval_start, request_count, last_used) VALUES (?, ?, ?, ?)
+                     ON CONFLICT (key, interval_start) DO UPDATE SET
+                         request_count = request_count + excluded.request_count,
+                         last_used = excluded.last_used'''
+
+
+class SqliteApiKeyRepository(AbstractApiKeyRepository):
+    """API keys in the SQLite database shared with SqliteCredentialRepository.
+
+    Usage is added to the key's running count and to a per-interval row in one transaction per
+    flush, like the DynamoDB counters.
+    """
+
+    def __init__(self, database: SqliteDatabase):
+        self._database = database
+
+    def store_api_key(self, api_key: ApiKey) -> None:
+        try:
+            self._database.connection().execute(_INSERT_KEY, (
+                api_key.key, api_key.created_at.isoformat(),
+                api_key.last_used.isoformat() if api_key.last_used else None, api_key.description))
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error storing API key: {str(e)}")
+
+    def get_api_key(self, key: str) -> ApiKey | None:
+        try:
+            row = self._database.connection().execute(_SELECT_KEY, (key,)).fetchone()
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error getting API key: {str(e)}")
+        if row is None:
+            return None
+        return ApiKey(key=row[0], created_at=datetime.fromisoformat(row[1]),
+                      last_used=datetime.fromisoformat(row[2]) if row[2] else None, description=row[3])
+
+    def update_api_key(self, key: str, timestamp: datetime) -> None:
+        try:
+            self._database.connection().execute(_TOUCH_KEY, (timestamp.isoformat(), key))
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error updating API key: {str(e)}")
+
+    def delete_api_key(self, key: str) -> bool:
+        try:
+            with self._database.transaction() as connection:
+                deleted = connection.execute('DELETE FROM api_keys WHERE key = ?', (key,)).rowcount
+                connection.execute('DELETE FROM api_key_usage WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error deleting API key: {str(e)}")
+        return deleted > 0
+
+    def record_api_key_usage(self, usages: list[ApiKeyUsage]) -> list[ApiKeyUsage]:
+        try:
+            with self._database.transaction() as connection:
+                for usage in usages:
+                    last_used = usage.last_used.isoformat()
+                    # Keys revoked since the requests were made are skipped rather than recreated
+                    if not connection.execute(_COUNT_KEY, (last_used, usage.request_count, usage.key)).rowcount:
+                        continue
+                    connection.execute(_COUNT_INTERVAL, (
+                        usage.key, usage.interval_start.isoformat(), usage.request_count, last_used))
+        except sqlite3.Error:
+            # Nothing was committed; the aggregator keeps the whole batch for its next flush
+            return list(usages)
+        return []
@@ -0,0 +1,223 @@
+import secrets
+import sqlite3
+from datetime import datetime, timedelta, UTC
+from typing import Any, Collection
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential import Credential, STATUS_TRANSITION_GUARDS
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.credential_page import CredentialPage
+from app.domain.repositories.credential_repository import AbstractCredentialRepository
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+from app.infrastructure.persistence.mappers.credential_record_codec import CredentialRecordCodec
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+BULK_INSERT_CHUNK = 500
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+_SELECT_PAYLOAD = 'SELECT payload FROM credentials WHERE pk = ? AND sk = ?'
+_UPSERT = '''INSERT INTO credentials (pk, sk, credential_type, credential_id, issuing_country, status, valid_until,
+                                      version, payload, created_at, updated_at)
+             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             ON CONFLICT (pk, sk) DO UPDATE SET
+                 status = excluded.status, valid_until = excluded.valid_until, version = excluded.version,
+                 payload = excluded.payload, updated_at = excluded.updated_at'''
+_UPDATE_IF_VERSION = '''UPDATE credentials SET status = ?, version = ?, payload = ?, updated_at = ?
+                        WHERE pk = ? AND sk = ? AND version = ?'''
+_SELECT_VERSION = 'SELECT version FROM credentials WHERE pk = ? AND sk = ?'
+_SELECT_EXPIRING = '''SELECT valid_until, issuing_country, credential_type, credential_id, payload FROM credentials
+                      WHERE status IN ('active', 'suspended') AND valid_until >= ? AND valid_until < ?
+                        AND (valid_until, issuing_country, credential_type, credential_id) > (?, ?, ?, ?)
+                      ORDER BY valid_until, issuing_country, credential_type, credential_id
+                      LIMIT ?'''
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class SqliteCredentialRepository(AbstractCredentialRepository):
+    """Credentials in a local SQLite database, for single-host deployments without DynamoDB.
+
+    Rows are keyed by the DynamoDB PK/SK strings and carry the credential as a CredentialRecordCodec
+    record, next to the columns the country/status and expiry indexes are built on. Listing cursors
+    are signed like DynamoDB's, over the last row's index key.
+    """
+
+    def __init__(self, database: SqliteDatabase, cursor_codec: PaginationCursorCodec | None = None,
+                 mapper_provider: CredentialMapperProvider | None = None):
+        self._database = database
+        self._cursor_codec = cursor_codec or PaginationCursorCodec(secrets.token_bytes(32))
+        self._mapper_provider = mapper_provider or CredentialMapperProvider()
+        self._codec = CredentialRecordCodec(self._mapper_provider)
+
+    @staticmethod
+    def _key(credential_id: str, credential_type: CredentialType, issuing_country: str) -> tuple[str, str]:
+        return f'CRED#{issuing_country}#{str(credential_id)}', f'METADATA#{credential_type.value}'
+
+    def _row(self, credential: Credential, now: str) -> tuple:
+        return (*self._key(credential.credential_id, credential.get_credential_type(), credential.issuing_country),
+                credential.get_credential_type().value, str(credential.credential_id), credential.issuing_country,
+                credential.status.value, _to_micros(credential.valid_until), credential.version,
+                self._codec.encode(credential), now, now)
+
+    def get_credential(self, credential_id: str, credential_type: CredentialType, issuing_country: str) -> Credential:
+        try:
+            row = self._database.connection().execute(
+                _SELECT_PAYLOAD, self._key(credential_id, credential_type, issuing_country)).fetchone()
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error getting credential: {str(e)}")
+        if row is None:
+            raise CredentialNotFoundException(credential_id, credential_type.value)
+        return self._codec.decode(row[0])
+
+    def get_credential_fields(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                              fields: Collection[str]) -> dict[str, Any]:
+        unknown = set(fields) - self._mapper_provider.get_mapper(credential_type).FIELDS
+        if unknown:
+            raise ValueError(f"Unknown {credential_type.value} fields: {', '.join(sorted(unknown))}")
+        credential = self.get_credential(credential_id, credential_type, issuing_country)
+        return {field: getattr(credential, field) for field in fields}
+
+    def get_credentials(self, keys: list[CredentialKey]) -> dict[CredentialKey, Credential]:
+        credentials = {}
+        try:
+            connection = self._database.connection()
+            for key in keys:
+                row = connection.execute(
+                    _SELECT_PAYLOAD, self._key(key.credential_id, key.credential_type, key.issuing_country)).fetchone()
+                if row is not None:
+                    credentials[key] = self._codec.decode(row[0])
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error getting credentials: {str(e)}")
+        return credentials
+
+    def list_credentials(self, issuing_country: str, status: CredentialStatus | None = None,
+                         credential_type: CredentialType | None = None, limit: int = 50,
+                         cursor: str | None = None) -> CredentialPage:
+        scope = f"{issuing_country}|{status.value if status else ''}|{credential_type.value if credential_type else ''}"
+        conditions = ['issuing_country = ?']
+        parameters: list[Any] = [issuing_country]
+        if status is not None:
+            conditions.append('status = ?')
+            parameters.append(status.value)
+        if credential_type is not None:
+            conditions.append('credential_type = ?')
+            parameters.append(credential_type.value)
+        if cursor is not None:
+            conditions.append('(status, credential_type, credential_id) > (?, ?, ?)')
+            parameters.extend(self._cursor_codec.decode(cursor, scope)['after'])
+
+        # One row past the page tells whether there is a next one
+        query = (f"SELECT status, credential_type, credential_id, payload FROM credentials "
+                 f"WHERE {' AND '.join(conditions)} ORDER BY status, credential_type, credential_id LIMIT ?")
+        try:
+            rows = self._database.connection().execute(query, (*parameters, limit + 1)).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error listing credentials: {str(e)}")
+
+        credentials = [self._codec.decode(row[3]) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = self._cursor_codec.encode({'after': list(rows[limit - 1][:3])}, scope)
+        return CredentialPage(credentials, next_cursor)
+
+    def expiry_shard_count(self) -> int:
+        # The partial expiry index already answers any range with one ordered scan
+        return 1
+
+    def list_expiring_credentials(self, shard: int, valid_until_before: datetime,
+                                  valid_until_from: datetime | None = None, limit: int = 100,
+                                  cursor: str | None = None) -> CredentialPage:
+        scope = f'expiry|{shard}'
+        after = self._cursor_codec.decode(cursor, scope)['after'] if cursor is not None else [-1, '', '', '']
+        lower = _to_micros(valid_until_from) if valid_until_from is not None else -1
+        try:
+            rows = self._database.connection().execute(
+                _SELECT_EXPIRING, (lower, _to_micros(valid_until_before), *after, limit + 1)).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error listing expiring credentials: {str(e)}")
+
+        credentials = [self._codec.decode(row[4]) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = self._cursor_codec.encode({'after': list(rows[limit - 1][:4])}, scope)
+        return CredentialPage(credentials, next_cursor)
+
+    def create_credential(self, credential: Credential) -> None:
+        try:
+            self._database.connection().execute(_UPSERT, self._row(credential, datetime.now(UTC).isoformat()))
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error creating credential: {str(e)}")
+
+    def create_credentials(self, credentials: list[Credential]) -> list[Credential]:
+        """Writes chunks of BULK_INSERT_CHUNK rows per transaction; a failed chunk is returned whole"""
+        failed = []
+        now = datetime.now(UTC).isoformat()
+        for start in range(0, len(credentials), BULK_INSERT_CHUNK):
+            chunk = credentials[start:start + BULK_INSERT_CHUNK]
+            try:
+                with self._database.transaction() as connection:
+                    connection.executemany(_UPSERT, [self._row(credential, now) for credential in chunk])
+            except sqlite3.Error:
+                failed.extend(chunk)
+        return failed
+
+    def update_credential_status(self, credential: Credential) -> None:
+        key = self._key(credential.credential_id, credential.get_credential_type(), credential.issuing_country)
+        credential.set_version(credential.version + 1)
+        try:
+            with self._database.transaction() as connection:
+                updated = connection.execute(_UPDATE_IF_VERSION, (
+                    credential.status.value, credential.version, self._codec.encode(credential),
+                    datetime.now(UTC).isoformat(), *key, credential.version - 1)).rowcount
+                current = connection.execute(_SELECT_VERSION, key).fetchone() if not updated else None
+        except sqlite3.Error as e:
+            credential.set_version(credential.version - 1)
+            raise DatabaseException(f"Error updating credential: {str(e)}")
+
+        if not updated:
+            credential.set_version(credential.version - 1)
+            if current is None:
+                raise CredentialNotFoundException(credential.credential_id, credential.get_credential_type().value)
+            raise CredentialVersionConflictException(credential.credential_id, credential.version, current[0])
+
+    def transition_credential_status(self, credential_id: str, credential_type: CredentialType, issuing_country: str,
+                                     new_status: CredentialStatus, reason: str | None,
+                                     expected_version: int | None = None) -> Credential:
+        key = self._key(credential_id, credential_type, issuing_country)
+        try:
+            with self._database.transaction() as connection:
+                row = connection.execute(_SELECT_PAYLOAD, key).fetchone()
+                if row is None:
+                    raise CredentialNotFoundException(credential_id, credential_type.value)
+                credential = self._codec.decode(row[0])
+                if expected_version is not None and credential.version != expected_version:
+                    raise CredentialVersionConflictException(credential_id, expected_version, credential.version)
+                message = STATUS_TRANSITION_GUARDS[new_status].get(credential.status)
+                if message:
+                    raise InvalidCredentialStateException(message)
+
+                # Mirrors the attributes DynamoDBCredentialRepository writes for each transition
+                credential.set_status(new_status)
+                if new_status == CredentialStatus.SUSPENDED:
+                    credential.set_suspension_reason(reason)
+                elif new_status == CredentialStatus.ACTIVE:
+                    credential.set_suspension_reason(None)
+                elif new_status == CredentialStatus.REVOKED:
+                    credential.set_revocation_reason(reason)
+                credential.set_version(credential.version + 1)
+                connection.execute(_UPDATE_IF_VERSION, (
+                    new_status.value, credential.version, self._codec.encode(credential),
+                    datetime.now(UTC).isoformat(), *key, credential.version - 1))
+        except sqlite3.Error as e:
+            raise DatabaseException(f"Error updating credential: {str(e)}")
+        return credential
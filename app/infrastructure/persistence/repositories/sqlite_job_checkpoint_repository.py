@@ -0,0 +1,25 @@
+from datetime import datetime, UTC
+
+from app.domain.repositories.job_checkpoint_repository import AbstractJobCheckpointRepository
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+
+class SqliteJobCheckpointRepository(AbstractJobCheckpointRepository):
+    """Job checkpoints in the SQLite database, so sweeps resume across restarts"""
+
+    def __init__(self, database: SqliteDatabase):
+        self._database = database
+
+    def get_checkpoint(self, job: str, partition: int) -> str | None:
+        row = self._database.connection().execute(
+            'SELECT cursor FROM job_checkpoints WHERE job = ? AND partition_index = ?', (job, partition)).fetchone()
+        return row[0] if row else None
+
+    def save_checkpoint(self, job: str, partition: int, cursor: str) -> None:
+        self._database.connection().execute(
+            'INSERT OR REPLACE INTO job_checkpoints (job, partition_index, cursor, updated_at) VALUES (?, ?, ?, ?)',
+            (job, partition, cursor, datetime.now(UTC).isoformat()))
+
+    def clear_checkpoint(self, job: str, partition: int) -> None:
+        self._database.connection().execute(
+            'DELETE FROM job_checkpoints WHERE job = ? AND partition_index = ?', (job, partition))
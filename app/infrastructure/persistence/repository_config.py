@@ -0,0 +1,22 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class RepositoryConfig:
+    # Where credentials and API keys live: 'dynamodb', 'memory' or 'sqlite'
+    type: str = 'dynamodb'
+    # With the memory type, a directory for the write log and snapshots; None keeps nothing across restarts
+    memory_data_dir: str | None = None
+    memory_snapshot_every: int = 10_000
+    # With the sqlite type, the database file
+    sqlite_path: str = 'credentials.db'
+
+    @classmethod
+    def from_environment(cls) -> 'RepositoryConfig':
+        return cls(
+            type=os.getenv('REPOSITORY_TYPE', 'dynamodb').lower(),
+            memory_data_dir=os.getenv('MEMORY_REPOSITORY_DATA_DIR') or None,
+            memory_snapshot_every=int(os.getenv('MEMORY_REPOSITORY_SNAPSHOT_EVERY', '10000')),
+            sqlite_path=os.getenv('SQLITE_DATABASE_PATH', 'credentials.db')
+        )
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+_SCHEMA = [
+    # PK/SK mirror the DynamoDB item keys; the payload holds the whole credential as a CredentialRecordCodec
+    # record and the other columns are the ones queries filter and sort on
+    '''CREATE TABLE IF NOT EXISTS credentials (
+        pk TEXT NOT NULL,
+        sk TEXT NOT NULL,
+        credential_type TEXT NOT NULL,
+        credential_id TEXT NOT NULL,
+        issuing_country TEXT NOT NULL,
+        status TEXT NOT NULL,
+        valid_until INTEGER NOT NULL,
+        version INTEGER NOT NULL,
+        payload BLOB NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (pk, sk)
+    ) WITHOUT ROWID''',
+    # Same order as the CountryStatusIndex sort key
+    '''CREATE INDEX IF NOT EXISTS credentials_country_status
+        ON credentials (issuing_country, status, credential_type, credential_id)''',
+    # Partial, like the sparse ExpiryIndex: only credentials that can still expire
+    '''CREATE INDEX IF NOT EXISTS credentials_expiry
+        ON credentials (valid_until, issuing_country, credential_type, credential_id)
+        WHERE status IN ('active', 'suspended')''',
+    '''CREATE TABLE IF NOT EXISTS api_keys (
+        key TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        last_used TEXT,
+        description TEXT,
+        request_count INTEGER NOT NULL DEFAULT 0
+    )''',
+    '''CREATE TABLE IF NOT EXISTS api_key_usage (
+        key TEXT NOT NULL,
+        interval_start TEXT NOT NULL,
+        request_count INTEGER NOT NULL,
+        last_used TEXT NOT NULL,
+        PRIMARY KEY (key, interval_start)
+    ) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS job_checkpoints (
+        job TEXT NOT NULL,
+        partition_index INTEGER NOT NULL,
+        cursor TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (job, partition_index)
+    ) WITHOUT ROWID'''
+]
+
+
+class SqliteDatabase:
+    """One SQLite database file shared by the SQLite repositories, with a connection per thread.
+
+    sqlite3 connections must not be shared between threads, so each executor thread opens its own
+    on first use and keeps it. Connections run in WAL mode, so readers never wait for the single
+    writer, and in autocommit mode: multi-statement writes go through transaction(). Statements
+    are constant SQL strings, so sqlite3's per-connection statement cache prepares each only once.
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000, cached_statements: int = 256):
+        self._path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        with self.transaction() as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Only ever used by this thread; check_same_thread is off so close() can run from any thread
+            connection = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False,
+                                         cached_statements=self._cached_statements)
+            connection.execute('PRAGMA journal_mode=WAL')
+            # WAL is durable across crashes at NORMAL; only a power loss can drop the last commits
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(f'PRAGMA busy_timeout={int(self._busy_timeout_ms)}')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE takes the write lock up front, so read-then-write sequences cannot interleave"""
+        connection = self.connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
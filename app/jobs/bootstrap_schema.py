@@ -0,0 +1,22 @@
+"""Create and verify the DynamoDB tables and indexes used by the API.
+
+Run once per environment (or after a schema change) with ``python -m app.jobs.bootstrap_schema``.
+Table names come from ``DYNAMODB_CREDENTIALS_TABLE`` / ``DYNAMODB_API_KEYS_TABLE``.
+"""
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.schema_bootstrap import SchemaBootstrap
+
+
+def main() -> None:
+    bootstrap = SchemaBootstrap(DynamoDBManager(DatabaseConfig.from_environment()))
+    created = bootstrap.ensure_tables()
+
+    for definition in bootstrap.definitions:
+        print(f"verified table {definition.name}")
+    for name in created:
+        print(f"created {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Count credentials by validity reason across the files of a table export.
+
+Run with ``python -m app.jobs.classify_credentials <directory>`` on the output of
+``app.jobs.export_credentials``. Every ``credentials-*.ndjson.gz`` file is loaded into one columnar
+batch and classified in a single vectorized pass; ``--at`` evaluates at an ISO-8601 instant instead of
+now.
+"""
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from app.application.services.batch_validity_evaluator import BatchValidityEvaluator
+from app.application.services.credential_batch import CredentialBatch
+from app.domain.enums.validity_reason import ValidityReason
+
+
+def run(directory: Path, at: datetime | None = None) -> dict[ValidityReason, int]:
+    batch = CredentialBatch.from_export(sorted(directory.glob('credentials-*.ndjson.gz')))
+    evaluator = BatchValidityEvaluator()
+    return evaluator.summarize(evaluator.evaluate(batch, at))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('directory', type=Path)
+    parser.add_argument('--at', type=datetime.fromisoformat, default=None,
+                        help='Timezone-aware ISO-8601 instant to evaluate at')
+    args = parser.parse_args()
+
+    for reason, count in run(args.directory, args.at).items():
+        print(f"{reason.name.lower()}: {count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Mark credentials whose validity window has passed as expired.
+
+Run on a schedule: deployed as the ``ExpirySweeperFunction`` Lambda (see template.yml), or by hand
+with ``python -m app.jobs.expire_credentials``. A run that hits its time budget leaves per-shard
+checkpoints behind and the next run picks up from them.
+"""
+from typing import Any
+
+from app.container import get_container
+
+
+def run(time_budget_seconds: float | None = None) -> dict:
+    result = get_container().expiry_sweeper.sweep(time_budget_seconds)
+    return {
+        'expired': result.expired,
+        'skipped': result.skipped,
+        'failed': result.failed,
+        'shards_completed': result.shards_completed,
+        'shards_total': result.shards_total
+    }
+
+
+def handler(event: dict, context: Any) -> dict:
+    margin = get_container().expiry_sweep_config.safety_margin_seconds
+    return run(context.get_remaining_time_in_millis() / 1000 - margin)
+
+
+def main() -> None:
+    for name, value in run().items():
+        print(f"{name}: {value}")
+
+
+if __name__ == '__main__':
+    main()
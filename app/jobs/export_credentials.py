@@ -0,0 +1,41 @@
+"""Export every credential to gzip-compressed NDJSON files with a parallel segmented Scan.
+
+Run with ``python -m app.jobs.export_credentials <directory>``. Each segment gets its own
+``credentials-NNNN-of-MMMM.ndjson.gz`` file; ``export-checkpoint.json`` tracks progress, so re-running
+the same command after an interruption continues where each segment stopped. ``--max-rcu`` caps the
+read capacity the export consumes per second, leaving headroom for live traffic.
+"""
+import argparse
+from pathlib import Path
+
+from app.container import get_container
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+from app.infrastructure.persistence.dynamodb.credential_export_result import CredentialExportResult
+from app.infrastructure.persistence.dynamodb.credential_table_exporter import CredentialTableExporter
+
+
+def run(directory: Path, segments: int = 8, workers: int = 4, max_rcu: float | None = None,
+        page_size: int | None = None) -> CredentialExportResult:
+    limiter = TokenBucket(max_rcu) if max_rcu is not None else None
+    exporter = CredentialTableExporter(get_container().db_manager, read_capacity_limiter=limiter, page_size=page_size)
+    return exporter.export(directory, total_segments=segments, workers=workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('directory', type=Path)
+    parser.add_argument('--segments', type=int, default=8, help='Scan segments (TotalSegments)')
+    parser.add_argument('--workers', type=int, default=4, help='Segments scanned concurrently')
+    parser.add_argument('--max-rcu', type=float, default=None, help='Read capacity units per second')
+    parser.add_argument('--page-size', type=int, default=None, help='Items evaluated per Scan call')
+    args = parser.parse_args()
+
+    result = run(args.directory, args.segments, args.workers, args.max_rcu, args.page_size)
+    print(f"credentials: {result.credentials}")
+    print(f"consumed_read_capacity: {result.consumed_read_capacity}")
+    for path in result.files:
+        print(f"file: {path}")
+
+
+if __name__ == '__main__':
+    main()
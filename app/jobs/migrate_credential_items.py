@@ -0,0 +1,37 @@
+"""Rewrite stored credentials in the compact (version 2) item encoding.
+
+Run with ``python -m app.jobs.migrate_credential_items``. Items are found with a parallel segmented
+Scan for those without the format marker, so the job can be stopped and re-run at any time; each run
+only touches what is left. Items written before the CountryStatusIndex or ExpiryIndex existed also
+get their index keys. ``--max-rcu`` caps the read capacity the scan consumes per second.
+"""
+import argparse
+
+from app.container import get_container
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+from app.infrastructure.persistence.dynamodb.credential_item_migrator import CredentialItemMigrator
+from app.infrastructure.persistence.dynamodb.credential_migration_result import CredentialMigrationResult
+
+
+def run(segments: int = 8, workers: int = 4, max_rcu: float | None = None,
+        page_size: int | None = None) -> CredentialMigrationResult:
+    limiter = TokenBucket(max_rcu) if max_rcu is not None else None
+    migrator = CredentialItemMigrator(get_container().db_manager, read_capacity_limiter=limiter, page_size=page_size)
+    return migrator.migrate(total_segments=segments, workers=workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--segments', type=int, default=8, help='Scan segments (TotalSegments)')
+    parser.add_argument('--workers', type=int, default=4, help='Segments scanned concurrently')
+    parser.add_argument('--max-rcu', type=float, default=None, help='Read capacity units per second')
+    parser.add_argument('--page-size', type=int, default=None, help='Items evaluated per Scan call')
+    args = parser.parse_args()
+
+    result = run(args.segments, args.workers, args.max_rcu, args.page_size)
+    print(f"migrated: {result.migrated}")
+    print(f"skipped: {result.skipped}")
+
+
+if __name__ == '__main__':
+    main()
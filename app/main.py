@@ -1,12 +1,14 @@
 from mangum import Mangum
 from fastapi import FastAPI
 
-from app.rest.assemblers.assembler_registry import AssemblerRegistry
+from app.container import get_container
 from app.rest.assemblers.drivers_license_assembler import DriversLicenseAssembler
 from app.rest.assemblers.passport_assembler import PassportAssembler
+from app.rest.invocation_end_handler import InvocationEndHandler
 from app.rest.exceptions.credential_middleware import setup_exception_handlers
 from app.rest.routes.api_key_router import ApiKeyRouter
 from app.rest.routes.credential_router import CredentialRouter
+from app.rest.routes.metrics_router import MetricsRouter
 
 
 
@@ -17,13 +19,15 @@ app = FastAPI(
 )
 
 setup_exception_handlers(app)
-assembler_registry = AssemblerRegistry()
-credential_router = CredentialRouter(assembler_registry)
+credential_router = CredentialRouter(get_container().assembler_registry)
 api_key_router = ApiKeyRouter()
+metrics_router = MetricsRouter()
 app.include_router(api_key_router.router)
 app.include_router(credential_router.router)
+app.include_router(metrics_router.router)
 
-handler = Mangum(app, lifespan="off")
+# Write all batched API key usage before Lambda can freeze the container, which may never be invoked again
+handler = InvocationEndHandler(Mangum(app, lifespan="off"), lambda: get_container().flush_api_key_usage(force=True))
 
 @app.get("/")
 async def heartbeat():
@@ -7,6 +7,10 @@ from app.rest.assemblers.credential_assembler import CredentialAssembler
 class AssemblerRegistry:
     _assemblers: Dict[str, Type[CredentialAssembler]] = {}
 
+    def __init__(self) -> None:
+        # Assemblers are stateless, so instances are reused across requests
+        self._instances: Dict[Type[CredentialAssembler], CredentialAssembler] = {}
+
     @classmethod
     def register(cls, credential_type: str):
         def decorator(assembler_class: Type[CredentialAssembler]):
@@ -21,4 +25,7 @@ class AssemblerRegistry:
                 status_code=400,
                 detail=f"Unsupported credential type: {credential_type}"
             )
-        return assembler_class()
\ No newline at end of file
+        assembler = self._instances.get(assembler_class)
+        if assembler is None:
+            assembler = self._instances.setdefault(assembler_class, assembler_class())
+        return assembler
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from typing import Any, Type
 
 from app.domain.models.credential import Credential
 from app.rest.dto.credential_dto import CredentialDTO
+from app.rest.exceptions.invalid_credential_data_exception import InvalidCredentialDataException
 
 
 class CredentialAssembler(ABC):
+    dto_class: Type[CredentialDTO] = CredentialDTO
 
     @abstractmethod
     def to_dto(self, credential: Credential) -> CredentialDTO:
@@ -12,4 +17,22 @@ class CredentialAssembler(ABC):
 
     @abstractmethod
     def to_domain(self, credential_dto: dict) -> Credential:
-        pass
\ No newline at end of file
+        pass
+
+    def parse_fields(self, fields: str) -> list[str]:
+        """Turns a comma-separated fields= parameter into DTO field names, rejecting unknown ones"""
+        names = list(dict.fromkeys(name.strip() for name in fields.split(',') if name.strip()))
+        unknown = [name for name in names if name not in self.dto_class.model_fields]
+        if not names or unknown:
+            raise InvalidCredentialDataException(
+                "fields", f"expected a comma-separated subset of {', '.join(self.dto_class.model_fields)}")
+        return names
+
+    @staticmethod
+    def to_partial_dto(values: dict[str, Any]) -> dict[str, Any]:
+        return {
+            name: value.isoformat() if isinstance(value, datetime)
+            else value.value if isinstance(value, Enum)
+            else value
+            for name, value in values.items()
+        }
@@ -9,6 +9,8 @@ from app.domain.models.drivers_license import DriversLicense
 
 @AssemblerRegistry.register("drivers_license")
 class DriversLicenseAssembler(CredentialAssembler):
+    dto_class = DriversLicenseDTO
+
     def _to_specific_dto(self, credential_dict: dict) -> DriversLicenseDTO:
         try:
             return DriversLicenseDTO(**credential_dict)
@@ -8,6 +8,8 @@ from app.rest.dto.passport_dto import PassportDTO
 
 @AssemblerRegistry.register("passport")
 class PassportAssembler(CredentialAssembler):
+    dto_class = PassportDTO
+
     def _to_specific_dto(self, credential_dict: dict) -> PassportDTO:
         try:
             return PassportDTO(**credential_dict)
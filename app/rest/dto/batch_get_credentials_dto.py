@@ -0,0 +1,11 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.rest.dto.credential_key_dto import CredentialKeyDTO
+
+MAX_BATCH_GET_KEYS = 500
+
+
+class BatchGetCredentialsDTO(BaseModel):
+    keys: List[CredentialKeyDTO] = Field(..., min_length=1, max_length=MAX_BATCH_GET_KEYS)
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CredentialKeyDTO(BaseModel):
+    issuing_country: str
+    credential_id: str
+    credential_type: str
@@ -0,0 +1,24 @@
+from fastapi import status
+
+from app.rest.exceptions.api_exception import APIException
+
+
+def format_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_if_match(header: str | None) -> int | None:
+    """Returns the credential version named by an If-Match header, or None when any version matches"""
+    if header is None or header.strip() == "*":
+        return None
+
+    tag = header.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    if not tag.isdigit():
+        raise APIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"If-Match must be a single credential ETag, got '{header}'"
+        )
+    return int(tag)
@@ -1,12 +1,14 @@
+from typing import Awaitable, Callable
+
 from fastapi import Security, HTTPException, status
 from fastapi.security.api_key import APIKeyHeader
-from app.application.services.api_auth_service import ApiAuthService
+from app.application.services.async_api_auth_service import AsyncApiAuthService
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=True)
 
-def verify_api_key(auth_service: ApiAuthService):
+def verify_api_key(auth_service: AsyncApiAuthService) -> Callable[[str], Awaitable[str]]:
     async def verify_key(api_key: str = Security(api_key_header)) -> str:
-        if auth_service.validate_api_key(api_key):
+        if await auth_service.validate_api_key(api_key):
             return api_key
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
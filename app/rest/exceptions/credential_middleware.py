@@ -10,5 +10,6 @@ def setup_exception_handlers(app: FastAPI):
         api_exception = ExceptionHandlerRegistry.get_handler(exc)
         return JSONResponse(
             status_code=api_exception.status_code,
-            content={"detail": api_exception.detail}
+            content={"detail": api_exception.detail},
+            headers=api_exception.headers
         )
\ No newline at end of file
@@ -2,21 +2,35 @@ from fastapi import status
 from typing import Callable, Dict
 
 from app.rest.exceptions.api_exception import APIException
+from app.rest.etag import format_etag
 from app.rest.exceptions.assembler_exception import AssemblerException
 from app.rest.exceptions.invalid_credential_data_exception import InvalidCredentialDataException
 from app.application.exceptions.validation_exceptions import CredentialValidationException
 from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
 from app.domain.exceptions.credential.expired_credential_exception import ExpiredCredentialException
 from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
 from app.domain.exceptions.unauthorized_issuer_exception import UnauthorizedIssuerException
+from app.infrastructure.exceptions.coalesced_read_timeout_exception import CoalescedReadTimeoutException
 from app.infrastructure.exceptions.database_connection_exception import DatabaseConnectionException
 from app.infrastructure.exceptions.database_exception import DatabaseException
 from app.infrastructure.exceptions.database_operation_exception import DatabaseOperationException
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
 
 ExceptionHandler = Callable[[Exception], APIException]
 
+
+def _version_conflict(e: Exception) -> APIException:
+    actual_version = e.actual_version if isinstance(e, CredentialVersionConflictException) else None
+    return APIException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=str(e),
+        headers={"ETag": format_etag(actual_version)} if actual_version is not None else None
+    )
+
+
 class ExceptionHandlerRegistry:
-    _handlers: Dict[Exception, ExceptionHandler] = {
+    _handlers: Dict[type[Exception], ExceptionHandler] = {
         # Domain Exceptions
         CredentialNotFoundException: lambda e: APIException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,6 +48,7 @@ class ExceptionHandlerRegistry:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         ),
+        CredentialVersionConflictException: _version_conflict,
 
         # Application Exceptions
         CredentialValidationException: lambda e: APIException(
@@ -52,6 +67,14 @@ class ExceptionHandlerRegistry:
         ),
 
         # Infrastructure Exceptions
+        InvalidCursorException: lambda e: APIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ),
+        CoalescedReadTimeoutException: lambda e: APIException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        ),
         DatabaseException: lambda e: APIException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -67,7 +90,7 @@ class ExceptionHandlerRegistry:
     }
 
     @classmethod
-    def register(cls, exception_class: Exception, handler: ExceptionHandler):
+    def register(cls, exception_class: type[Exception], handler: ExceptionHandler) -> None:
         cls._handlers[exception_class] = handler
 
     @classmethod
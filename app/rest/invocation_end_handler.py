@@ -0,0 +1,21 @@
+from typing import Any, Callable
+
+
+class InvocationEndHandler:
+    """Wraps the Lambda handler to run a hook after every invocation, e.g. flushing batched writes.
+
+    The hook runs after the response has been built and must not fail the invocation.
+    """
+
+    def __init__(self, handler: Callable[[dict, Any], dict], on_invocation_end: Callable[[], None]):
+        self._handler = handler
+        self._on_invocation_end = on_invocation_end
+
+    def __call__(self, event: dict, context: Any) -> dict:
+        try:
+            return self._handler(event, context)
+        finally:
+            try:
+                self._on_invocation_end()
+            except Exception:
+                pass
@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, Query, Body, Security
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Body, Security, Request, Response, Header
 from fastapi.responses import JSONResponse
 
 from app.rest.assemblers.assembler_registry import AssemblerRegistry
+from app.rest.etag import format_etag, parse_if_match
+from app.rest.exceptions.invalid_credential_data_exception import InvalidCredentialDataException
+from app.rest.dto.batch_get_credentials_dto import BatchGetCredentialsDTO
 from app.rest.dto.status_update_dto import StatusUpdateDTO
-from app.application.services.credential_service import CredentialService
-from app.dependencies import get_credential_service, get_api_key_verifier
+from app.rest.streaming.bulk_credential_importer import BulkCredentialImporter
+from app.rest.streaming.ndjson_reader import iter_ndjson_lines
+from app.rest.streaming.request_streaming_response import RequestStreamingResponse
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.dependencies import get_async_credential_service, get_api_key_verifier
 from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
 
@@ -30,26 +40,104 @@ class CredentialRouter:
         async def get_credential(
                 credential_id: str,
                 issuing_country: str,
+                response: Response,
                 credential_type: str = Query(..., description="Type of credential to get"),
-                service: CredentialService = Depends(get_credential_service)):
-            """Read-only endpoint - no authentication required"""
+                fields: str | None = Query(None, description="Comma-separated attributes to return"),
+                service: AsyncCredentialService = Depends(get_async_credential_service)):
+            """Read-only endpoint - no authentication required. The ETag is the stored version, for use in If-Match"""
             assembler = self.assembler_registry.get_assembler(credential_type)
-            credential: Credential = service.get_credential(
+            if fields is not None:
+                names = assembler.parse_fields(fields)
+                values = await service.get_credential_fields(
+                    credential_id,
+                    CredentialType(credential_type),
+                    issuing_country.lower(),
+                    names + ['version']
+                )
+                version = values.pop('version')
+                return JSONResponse(
+                    content=assembler.to_partial_dto(values),
+                    headers={"ETag": format_etag(version)}
+                )
+
+            credential: Credential = await service.get_credential(
                 credential_id,
                 CredentialType(credential_type),
                 issuing_country.lower()
             )
 
+            response.headers["ETag"] = format_etag(credential.version)
             return assembler.to_dto(credential)
 
+        @self._router.get("/credentials")
+        async def list_credentials(
+                issuing_country: str = Query(..., description="Country whose credentials to list"),
+                status: str | None = Query(None, description="Only credentials in this status"),
+                credential_type: str | None = Query(None, description="Only credentials of this type"),
+                limit: int = Query(50, ge=1, le=100, description="Maximum credentials per page"),
+                cursor: str | None = Query(None, description="next_cursor of the previous page"),
+                service: AsyncCredentialService = Depends(get_async_credential_service)) -> JSONResponse:
+            """Read-only endpoint - no authentication required. Follow next_cursor until it is null"""
+            if credential_type is not None:
+                self.assembler_registry.get_assembler(credential_type)
+            try:
+                status_filter = CredentialStatus(status) if status is not None else None
+            except ValueError:
+                raise InvalidCredentialDataException("status", f"unknown status '{status}'")
+
+            page = await service.list_credentials(
+                issuing_country.lower(),
+                status_filter,
+                CredentialType(credential_type) if credential_type is not None else None,
+                limit,
+                cursor
+            )
+
+            return JSONResponse(content={
+                "items": [self.assembler_registry.get_assembler(credential.get_credential_type().value)
+                          .to_dto(credential).model_dump() for credential in page.credentials],
+                "next_cursor": page.next_cursor
+            })
+
+        @self._router.post("/credentials:batchGet")
+        async def batch_get_credentials(
+                request: BatchGetCredentialsDTO,
+                service: AsyncCredentialService = Depends(get_async_credential_service)) -> JSONResponse:
+            """Read-only endpoint - no authentication required. Missing credentials are reported per key"""
+            keys = []
+            for key_dto in request.keys:
+                # Rejects the batch up front if any key names an unsupported type
+                self.assembler_registry.get_assembler(key_dto.credential_type)
+                keys.append(CredentialKey(
+                    credential_id=key_dto.credential_id,
+                    credential_type=CredentialType(key_dto.credential_type),
+                    issuing_country=key_dto.issuing_country.lower()
+                ))
+
+            credentials = await service.get_credentials(keys)
+
+            results = []
+            for key in keys:
+                credential = credentials.get(key)
+                results.append({
+                    "issuing_country": key.issuing_country,
+                    "credential_id": key.credential_id,
+                    "credential_type": key.credential_type.value,
+                    "found": credential is not None,
+                    "credential": (self.assembler_registry.get_assembler(key.credential_type.value)
+                                   .to_dto(credential).model_dump() if credential else None)
+                })
+
+            return JSONResponse(content={"results": results}, status_code=200)
+
         @self._router.get("/credentials/validate/{issuing_country}/{credential_id}")
         async def validate_credential(
                 credential_id: str,
                 issuing_country: str,
                 credential_type: str = Query(..., description="Type of credential to validate"),
-                service: CredentialService = Depends(get_credential_service)):
+                service: AsyncCredentialService = Depends(get_async_credential_service)):
             """Read-only endpoint - no authentication required"""
-            credential_status: CredentialStatus = service.validate_credential(
+            credential_status: CredentialStatus = await service.validate_credential(
                 credential_id,
                 CredentialType(credential_type),
                 issuing_country.lower()
@@ -64,33 +152,54 @@ class CredentialRouter:
         async def create_credential(
                 credential_type: str = Query(..., description="Type of credential to create"),
                 credential_dto: dict = Body(...),
-                service: CredentialService = Depends(get_credential_service),
+                service: AsyncCredentialService = Depends(get_async_credential_service),
                 api_key: str = Security(verify_key)):
             """Protected endpoint - requires valid API key"""
             assembler = self.assembler_registry.get_assembler(credential_type)
             credential: Credential = assembler.to_domain(credential_dto)
-            service.create_credential(credential)
+            await service.create_credential(credential)
 
             return JSONResponse(
                 content={"message": "Credential created"},
                 status_code=201
             )
 
+        @self._router.post("/credentials:bulkCreate")
+        async def bulk_create_credentials(
+                request: Request,
+                credential_type: str = Query(..., description="Type of the credentials to create"),
+                service: AsyncCredentialService = Depends(get_async_credential_service),
+                api_key: str = Security(verify_key)) -> RequestStreamingResponse:
+            """Protected endpoint - requires valid API key. Body is NDJSON, one credential per line"""
+            assembler = self.assembler_registry.get_assembler(credential_type)
+            importer = BulkCredentialImporter(service, assembler)
+
+            async def results() -> AsyncIterator[str]:
+                async for result in importer.import_lines(iter_ndjson_lines(request.stream())):
+                    yield json.dumps(result) + "\n"
+                yield json.dumps(importer.summary()) + "\n"
+
+            return RequestStreamingResponse(results(), media_type="application/x-ndjson")
+
         @self._router.patch("/credentials/{issuing_country}/{credential_id}")
         async def update_credential(
                 credential_id: str,
                 issuing_country: str,
+                response: Response,
                 credential_type: str = Query(..., description="Type of credential to update"),
                 status_update_dict: dict = Body(...),
-                service: CredentialService = Depends(get_credential_service),
+                if_match: str | None = Header(None),
+                service: AsyncCredentialService = Depends(get_async_credential_service),
                 api_key: str = Security(verify_key)):
-            """Protected endpoint - requires valid API key"""
-            service.update_credential(
+            """Protected endpoint - requires valid API key. A stale If-Match answers 412 with the current ETag"""
+            credential: Credential = await service.update_credential(
                 credential_id,
                 issuing_country.lower(),
                 CredentialType(credential_type),
                 CredentialStatus(status_update_dict.get("status")),
-                status_update_dict.get("reason")
+                status_update_dict.get("reason"),
+                expected_version=parse_if_match(if_match)
             )
 
+            response.headers["ETag"] = format_etag(credential.version)
             return StatusUpdateDTO(**status_update_dict)
\ No newline at end of file
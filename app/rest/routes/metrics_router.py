@@ -0,0 +1,46 @@
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import APIRouter, Depends, Security
+
+from app.dependencies import get_api_key_verifier, get_cache_stats, get_coalescing_stats, get_read_batching_stats
+from app.infrastructure.cache.cache_stats import CacheStats
+from app.infrastructure.concurrency.coalescing_stats import CoalescingStats
+from app.infrastructure.concurrency.micro_batch_stats import MicroBatchStats
+
+
+class MetricsRouter:
+    def __init__(self) -> None:
+        self._router = APIRouter(prefix="/metrics", tags=["Metrics"])
+        self.setup_routes()
+
+    @property
+    def router(self) -> APIRouter:
+        return self._router
+
+    def setup_routes(self) -> None:
+        verify_key = get_api_key_verifier()
+
+        @self._router.get("/caches")
+        async def get_cache_metrics(
+                cache_stats: dict[str, CacheStats] = Depends(get_cache_stats),
+                api_key: str = Security(verify_key)) -> dict[str, dict[str, Any]]:
+            """Protected endpoint - counters of this container's caches since it started"""
+            return {name: {**asdict(stats), "hit_ratio": stats.hit_ratio} for name, stats in cache_stats.items()}
+
+        @self._router.get("/coalescing")
+        async def get_coalescing_metrics(
+                coalescing_stats: dict[str, CoalescingStats] = Depends(get_coalescing_stats),
+                api_key: str = Security(verify_key)) -> dict[str, dict[str, Any]]:
+            """Protected endpoint - how many credential reads were shared with an identical in-flight read"""
+            return {name: {**asdict(stats), "coalescing_ratio": stats.coalescing_ratio}
+                    for name, stats in coalescing_stats.items()}
+
+        @self._router.get("/batching")
+        async def get_batching_metrics(
+                batching_stats: MicroBatchStats | None = Depends(get_read_batching_stats),
+                api_key: str = Security(verify_key)) -> dict[str, Any]:
+            """Protected endpoint - how many point reads were folded into shared BatchGetItem calls"""
+            if batching_stats is None:
+                return {}
+            return {**asdict(batching_stats), "average_batch_size": batching_stats.average_batch_size}
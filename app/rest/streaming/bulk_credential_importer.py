@@ -0,0 +1,86 @@
+import json
+from typing import AsyncIterator
+
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.domain.models.credential import Credential
+from app.rest.assemblers.credential_assembler import CredentialAssembler
+from app.rest.streaming.ndjson_reader import NdjsonLine
+
+BULK_WRITE_BATCH_SIZE = 25
+
+
+class BulkCredentialImporter:
+    """Validates NDJSON credential lines and writes them in batches, yielding one result per line.
+
+    A bad line only fails itself; a failed batch write only fails the lines in that batch.
+    """
+
+    def __init__(self, service: AsyncCredentialService, assembler: CredentialAssembler,
+                 batch_size: int = BULK_WRITE_BATCH_SIZE):
+        self._service = service
+        self._assembler = assembler
+        self._batch_size = batch_size
+        self.created = 0
+        self.failed = 0
+
+    async def import_lines(self, lines: AsyncIterator[NdjsonLine]) -> AsyncIterator[dict]:
+        batch: list[tuple[int, Credential]] = []
+
+        async for line in lines:
+            try:
+                credential = self._to_domain(line)
+            except Exception as e:
+                yield self._error(line.number, _detail(e))
+                continue
+
+            batch.append((line.number, credential))
+            if len(batch) == self._batch_size:
+                for result in await self._write(batch):
+                    yield result
+                batch = []
+
+        for result in await self._write(batch):
+            yield result
+
+    def summary(self) -> dict:
+        return {"summary": {"created": self.created, "failed": self.failed}}
+
+    def _to_domain(self, line: NdjsonLine) -> Credential:
+        if line.content is None:
+            raise ValueError("Line exceeds the maximum allowed size")
+        try:
+            credential_dict = json.loads(line.content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e.msg}")
+        if not isinstance(credential_dict, dict):
+            raise ValueError("Each line must be a JSON object")
+        return self._assembler.to_domain(credential_dict)
+
+    async def _write(self, batch: list[tuple[int, Credential]]) -> list[dict]:
+        if not batch:
+            return []
+        try:
+            failed = {id(credential) for credential in await self._service.create_credentials([c for _, c in batch])}
+        except Exception as e:
+            return [self._error(number, _detail(e), credential) for number, credential in batch]
+
+        results = []
+        for number, credential in batch:
+            if id(credential) in failed:
+                results.append(self._error(number, "Write was throttled, retry this credential", credential))
+            else:
+                self.created += 1
+                results.append({"line": number, "credential_id": credential.credential_id, "status": "created"})
+        return results
+
+    def _error(self, number: int, detail: str, credential: Credential | None = None) -> dict:
+        self.failed += 1
+        result = {"line": number, "status": "error", "error": detail}
+        if credential is not None:
+            result["credential_id"] = credential.credential_id
+        return result
+
+
+def _detail(exception: Exception) -> str:
+    # API exceptions carry the client-facing message in `detail`; str() would prefix the status code
+    return getattr(exception, 'detail', None) or str(exception)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+DEFAULT_MAX_LINE_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class NdjsonLine:
+    number: int
+    content: bytes | None  # None when the line exceeded the size limit
+
+    @property
+    def too_long(self) -> bool:
+        return self.content is None
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes],
+                            max_line_bytes: int = DEFAULT_MAX_LINE_BYTES) -> AsyncIterator[NdjsonLine]:
+    """Splits a byte stream into lines without buffering more than one line at a time.
+
+    Blank lines are skipped but still counted, so line numbers match the uploaded file.
+    """
+    buffer = bytearray()
+    number = 0
+    discarding = False
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            newline = chunk.find(b'\n', start)
+            if newline == -1:
+                if not discarding:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        buffer.clear()
+                        discarding = True
+                break
+
+            number += 1
+            if discarding:
+                discarding = False
+                yield NdjsonLine(number, None)
+            else:
+                buffer += chunk[start:newline]
+                line = _complete_line(number, buffer, max_line_bytes)
+                if line:
+                    yield line
+            buffer.clear()
+            start = newline + 1
+
+    if discarding:
+        yield NdjsonLine(number + 1, None)
+    elif buffer.strip():
+        line = _complete_line(number + 1, buffer, max_line_bytes)
+        if line:
+            yield line
+
+
+def _complete_line(number: int, buffer: bytearray, max_line_bytes: int) -> NdjsonLine | None:
+    if len(buffer) > max_line_bytes:
+        return NdjsonLine(number, None)
+    content = bytes(buffer).strip()
+    return NdjsonLine(number, content) if content else None
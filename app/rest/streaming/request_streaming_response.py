@@ -0,0 +1,15 @@
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """A StreamingResponse whose body is produced while the request body is still being read.
+
+    Starlette's StreamingResponse listens for client disconnects on ``receive``, which would
+    swallow the remaining request body messages, so this variant only streams.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,76 @@
+"""Latency of an authenticated PATCH with and without the validated API key cache.
+
+Run with ``python -m benchmarks.api_key_cache``. Repository stubs sleep for a DynamoDB-like
+round trip. Each request runs the API key verifier used by the protected routes and then the
+status transition, as PATCH /credentials/... does.
+"""
+import asyncio
+import statistics
+import time
+from datetime import datetime, UTC
+
+from app.application.services.async_api_auth_service import AsyncApiAuthService
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.api_key import ApiKey
+from app.domain.models.passport import Passport
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+from app.infrastructure.persistence.repositories.executor_api_key_repository import ExecutorApiKeyRepository
+from app.infrastructure.persistence.repositories.executor_credential_repository import ExecutorCredentialRepository
+from app.rest.exceptions.api_auth_middleware import verify_api_key
+
+ROUND_TRIP_SECONDS = 0.005
+REQUESTS = 300
+
+
+class SleepingApiKeyRepository:
+    def __init__(self):
+        self.calls = 0
+
+    def get_api_key(self, key):
+        self.calls += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+        return ApiKey(key=key, created_at=datetime(2024, 1, 1, tzinfo=UTC))
+
+    def update_api_key(self, key, timestamp):
+        self.calls += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+
+
+class SleepingCredentialRepository:
+    def transition_credential_status(self, credential_id, credential_type, issuing_country, new_status, reason,
+                                     expected_version=None):
+        time.sleep(ROUND_TRIP_SECONDS)
+        return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                        "Canadian", issuing_country)
+
+
+async def _measure(validated_keys: LruTtlCache | None, executor: BlockingCallExecutor) -> tuple[list[float], int]:
+    api_keys = SleepingApiKeyRepository()
+    verify = verify_api_key(AsyncApiAuthService(ExecutorApiKeyRepository(api_keys, executor), validated_keys))
+    service = AsyncCredentialService(ExecutorCredentialRepository(SleepingCredentialRepository(), executor))
+
+    latencies = []
+    for i in range(REQUESTS):
+        start = time.perf_counter()
+        await verify("integration-client-key")
+        await service.update_credential(f"id-{i}", "ca", CredentialType.PASSPORT, CredentialStatus.SUSPENDED, "Audit")
+        latencies.append(time.perf_counter() - start)
+    return latencies, api_keys.calls
+
+
+async def main() -> None:
+    executor = BlockingCallExecutor(4)
+    print(f"{REQUESTS} sequential PATCHes, {ROUND_TRIP_SECONDS * 1000:.0f} ms simulated round trip")
+    print(f"{'api key cache':>14} {'p50 ms':>8} {'p99 ms':>8} {'ApiKeys calls':>14}")
+    for name, cache in [("off", None), ("on", LruTtlCache(1000, 256_000, 60, size_of=lambda _: 256))]:
+        latencies, calls = await _measure(cache, executor)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(f"{name:>14} {statistics.median(latencies) * 1000:>8.2f} {p99 * 1000:>8.2f} {calls:>14}")
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Throughput of the async credential read path as in-flight requests grow.
+
+Run with ``python -m benchmarks.async_concurrency``. A repository stub sleeps for a fixed
+DynamoDB-like round trip; "blocking" calls the sync service from the async handler (the old
+behaviour), "offloaded" awaits AsyncCredentialService on the bounded executor.
+"""
+import asyncio
+import time
+from datetime import datetime, UTC
+
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.application.services.credential_service import CredentialService
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+from app.infrastructure.persistence.repositories.executor_credential_repository import ExecutorCredentialRepository
+
+ROUND_TRIP_SECONDS = 0.01
+REQUESTS = 400
+IN_FLIGHT_LEVELS = [1, 4, 16, 64]
+EXECUTOR_WORKERS = 64
+
+
+class SleepingRepository:
+    def get_credential(self, credential_id, credential_type, issuing_country):
+        time.sleep(ROUND_TRIP_SECONDS)
+        return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                        "Canadian", issuing_country)
+
+
+async def _drive(handler, in_flight: int) -> float:
+    semaphore = asyncio.Semaphore(in_flight)
+
+    async def one(i: int):
+        async with semaphore:
+            await handler(f"id-{i}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    repository = SleepingRepository()
+    sync_service = CredentialService(repository)
+    executor = BlockingCallExecutor(EXECUTOR_WORKERS)
+    async_service = AsyncCredentialService(ExecutorCredentialRepository(repository, executor))
+
+    async def blocking_handler(credential_id: str):
+        sync_service.get_credential(credential_id, CredentialType.PASSPORT, "ca")
+
+    async def offloaded_handler(credential_id: str):
+        await async_service.get_credential(credential_id, CredentialType.PASSPORT, "ca")
+
+    print(f"{REQUESTS} reads, {ROUND_TRIP_SECONDS * 1000:.0f} ms simulated round trip, {EXECUTOR_WORKERS} executor workers")
+    print(f"{'in-flight':>10} {'blocking req/s':>16} {'offloaded req/s':>16}")
+    for in_flight in IN_FLIGHT_LEVELS:
+        blocking = await _drive(blocking_handler, in_flight)
+        offloaded = await _drive(offloaded_handler, in_flight)
+        print(f"{in_flight:>10} {blocking:>16.0f} {offloaded:>16.0f}")
+
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+"""Cost of materialising a cached credential versus a DynamoDB item.
+
+Run with ``python -m benchmarks.credential_cache_codec``. "dynamodb item" is the low-level
+GetItem response run through TypeDeserializer and the mapper, which is what every cache miss
+pays; "cache payload" is CredentialCodec.decode on the bytes the shared cache stores.
+"""
+import timeit
+from datetime import datetime, UTC
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.domain.models.drivers_license import DriversLicense
+from app.infrastructure.cache.credential_codec import CredentialCodec
+from app.infrastructure.persistence.mappers.drivers_license_mapper import DriversLicenseMapper
+
+ITERATIONS = 20_000
+
+
+def main() -> None:
+    credential = DriversLicense("DL-123456789", datetime(2024, 1, 1, tzinfo=UTC), datetime(2030, 1, 1, tzinfo=UTC),
+                                ["A", "B", "C"], "ca", "on")
+    credential.suspend("Pending medical review")
+    mapper = DriversLicenseMapper()
+    codec = CredentialCodec()
+
+    wire_item = {name: TypeSerializer().serialize(value) for name, value in mapper.to_dynamo(credential).items()}
+    payload = codec.encode(credential)
+    deserializer = TypeDeserializer()
+
+    def from_item():
+        mapper.to_domain({name: deserializer.deserialize(value) for name, value in wire_item.items()})
+
+    def from_payload():
+        codec.decode(payload)
+
+    print(f"{'source':>15} {'bytes':>7} {'us/credential':>14}")
+    for name, size, fn in [("dynamodb item", len(str(wire_item)), from_item),
+                           ("cache payload", len(payload), from_payload)]:
+        seconds = min(timeit.repeat(fn, number=ITERATIONS, repeat=3))
+        print(f"{name:>15} {size:>7} {seconds / ITERATIONS * 1e6:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""Many concurrent clients updating one credential.
+
+Run with ``python -m benchmarks.credential_contention``. A fake table keeps one versioned item
+behind a lock and sleeps for a DynamoDB-like round trip on every call. "atomic" issues the
+single conditional transition used by PATCH without If-Match, "read-modify-write" uses
+CredentialService.modify_credential (version-checked write, jittered retry on conflict), and
+"if-match" mimics clients that send the ETag they read and give up on a 412.
+"""
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+
+from app.application.services.credential_service import CredentialService
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
+
+ROUND_TRIP_SECONDS = 0.002
+UPDATES_PER_CLIENT = 20
+CLIENT_LEVELS = [1, 4, 16, 32]
+
+
+class VersionedTable:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credential = Passport("hot", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                                    "Canadian", "ca")
+        self.writes = 0
+        self.conflicts = 0
+
+    def get_credential(self, credential_id, credential_type, issuing_country):
+        time.sleep(ROUND_TRIP_SECONDS)
+        with self._lock:
+            return copy.deepcopy(self._credential)
+
+    def update_credential_status(self, credential):
+        time.sleep(ROUND_TRIP_SECONDS)
+        with self._lock:
+            if credential.version != self._credential.version:
+                self.conflicts += 1
+                raise CredentialVersionConflictException(credential.credential_id, credential.version,
+                                                         self._credential.version)
+            credential.set_version(credential.version + 1)
+            self._credential = copy.deepcopy(credential)
+            self.writes += 1
+
+    def transition_credential_status(self, credential_id, credential_type, issuing_country, new_status, reason,
+                                     expected_version=None):
+        time.sleep(ROUND_TRIP_SECONDS)
+        with self._lock:
+            if expected_version is not None and expected_version != self._credential.version:
+                self.conflicts += 1
+                raise CredentialVersionConflictException(credential_id, expected_version, self._credential.version)
+            if new_status == CredentialStatus.SUSPENDED:
+                self._credential.suspend(reason)
+            else:
+                self._credential.reinstate()
+            self._credential.set_version(self._credential.version + 1)
+            self.writes += 1
+            return copy.deepcopy(self._credential)
+
+
+def _toggle(credential):
+    if credential.status == CredentialStatus.ACTIVE:
+        credential.suspend("benchmark")
+    else:
+        credential.reinstate()
+
+
+def _run(clients: int, update) -> tuple[float, VersionedTable, int]:
+    table = VersionedTable()
+    service = CredentialService(table, BackoffPolicy(max_attempts=50, base_delay=0.001, max_delay=0.05))
+    failures = 0
+    failures_lock = threading.Lock()
+
+    def client(_):
+        nonlocal failures
+        for i in range(UPDATES_PER_CLIENT):
+            try:
+                update(service, table, i)
+            except CredentialVersionConflictException:
+                with failures_lock:
+                    failures += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        list(pool.map(client, range(clients)))
+    return time.perf_counter() - start, table, failures
+
+
+def atomic(service, table, i):
+    new_status = CredentialStatus.SUSPENDED if i % 2 == 0 else CredentialStatus.ACTIVE
+    service.update_credential("hot", "ca", CredentialType.PASSPORT, new_status, "benchmark")
+
+
+def read_modify_write(service, table, i):
+    service.modify_credential("hot", CredentialType.PASSPORT, "ca", _toggle)
+
+
+def if_match(service, table, i):
+    current = service.get_credential("hot", CredentialType.PASSPORT, "ca")
+    new_status = (CredentialStatus.SUSPENDED if current.status == CredentialStatus.ACTIVE
+                  else CredentialStatus.ACTIVE)
+    service.update_credential("hot", "ca", CredentialType.PASSPORT, new_status, "benchmark",
+                              expected_version=current.version)
+
+
+def main() -> None:
+    print(f"{UPDATES_PER_CLIENT} updates per client, {ROUND_TRIP_SECONDS * 1000:.0f} ms simulated round trip")
+    print(f"{'clients':>8} {'strategy':>18} {'writes/s':>10} {'writes':>8} {'conflicts':>10} {'412s':>6}")
+    for clients in CLIENT_LEVELS:
+        for name, update in [("atomic", atomic), ("read-modify-write", read_modify_write), ("if-match", if_match)]:
+            elapsed, table, failures = _run(clients, update)
+            print(f"{clients:>8} {name:>18} {table.writes / elapsed:>10.0f} {table.writes:>8} "
+                  f"{table.conflicts:>10} {failures:>6}")
+
+
+if __name__ == '__main__':
+    main()
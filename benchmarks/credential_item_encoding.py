@@ -0,0 +1,81 @@
+"""Stored size and decode cost of a credential item in the v1 and v2 encodings.
+
+Run with ``python -m benchmarks.credential_item_encoding``. v1 is the original encoding (ISO-8601
+timestamps, full status names, null reason attributes); v2 is what the mappers write now. Sizes
+follow DynamoDB's item-size rules, which is what reads are billed on; "RCU/1k items" is the
+eventually consistent read capacity a Query or Scan of 1000 such items consumes. "wire decode" starts
+from the low-level item, as every read does, and so includes boto3 turning each number into a Decimal;
+"to_domain" is the mapper alone on an already deserialized item.
+"""
+import math
+import timeit
+from datetime import datetime, UTC
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.domain.models.drivers_license import DriversLicense
+from app.infrastructure.persistence.mappers.drivers_license_mapper import DriversLicenseMapper
+
+ITERATIONS = 20_000
+ITEMS_PER_READ = 1000
+
+
+def _value_size(value) -> int:
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, Decimal)):
+        digits = len(Decimal(value).normalize().as_tuple().digits)
+        return (digits + 1) // 2 + 1
+    if isinstance(value, list):
+        return 3 + sum(_value_size(element) + 1 for element in value)
+    if isinstance(value, dict):
+        return 3 + sum(len(name.encode()) + _value_size(element) + 1 for name, element in value.items())
+    raise TypeError(type(value))
+
+
+def item_size(item: dict) -> int:
+    return sum(len(name.encode()) + _value_size(value) for name, value in item.items())
+
+
+def v1_item(mapper: DriversLicenseMapper, credential: DriversLicense) -> dict:
+    """The item as the mappers wrote it before the v2 encoding"""
+    now = datetime.now(UTC).isoformat()
+    item = {name: value for name, value in mapper.to_dynamo(credential).items() if name != 'fmt'}
+    item.update(valid_from=credential.valid_from.isoformat(), valid_until=credential.valid_until.isoformat(),
+                status=credential.status.value, created_at=now, updated_at=now,
+                suspension_reason=credential.suspension_reason, revocation_reason=credential.revocation_reason)
+    return item
+
+
+def main() -> None:
+    credential = DriversLicense("DL-123456789", datetime(2024, 1, 1, tzinfo=UTC), datetime(2030, 1, 1, tzinfo=UTC),
+                                ["A", "B", "C"], "ca", "on")
+    mapper = DriversLicenseMapper()
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+
+    print(f"{'encoding':>9} {'bytes':>6} {'RCU/1k items':>13} {'us/wire decode':>15} {'us/to_domain':>13}")
+    for name, item in [("v1", v1_item(mapper, credential)), ("v2", mapper.to_dynamo(credential))]:
+        wire_item = {attribute: serializer.serialize(value) for attribute, value in item.items()}
+
+        read_item = {attribute: deserializer.deserialize(value) for attribute, value in wire_item.items()}
+
+        def wire_decode():
+            mapper.to_domain({attribute: deserializer.deserialize(value) for attribute, value in wire_item.items()})
+
+        def to_domain():
+            mapper.to_domain(read_item)
+
+        size = item_size(item)
+        read_units = math.ceil(size * ITEMS_PER_READ / 4096) / 2
+        wire_seconds = min(timeit.repeat(wire_decode, number=ITERATIONS, repeat=3))
+        mapper_seconds = min(timeit.repeat(to_domain, number=ITERATIONS, repeat=3))
+        print(f"{name:>9} {size:>6} {read_units:>13.1f} {wire_seconds / ITERATIONS * 1e6:>15.1f} "
+              f"{mapper_seconds / ITERATIONS * 1e6:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Memory held per cached credential, in the old dict-backed layout, slotted, and as a snapshot.
+
+Run with ``python -m benchmarks.credential_memory``. COUNT credentials, half passports and half
+driver's licenses, each with its own id, dates and reasons, are built and kept alive; tracemalloc
+reports what each layout holds per credential, attribute values included. "dict-backed" keeps the
+same attributes in a per-instance __dict__, as Credential did before it declared __slots__;
+"snapshot" is the CredentialSnapshot the in-process cache and in-memory repository now store.
+"""
+import gc
+import tracemalloc
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+from app.domain.models.credential import Credential
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+
+COUNT = 100_000
+
+
+def _credential(i: int) -> Credential:
+    valid_from = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(seconds=i)
+    valid_until = valid_from + timedelta(days=3650)
+    if i % 2:
+        credential = DriversLicense(f"DL-{i:09d}", valid_from, valid_until, ["A", "B"], "ca", "on")
+    else:
+        credential = Passport(f"P-{i:09d}", valid_from, valid_until, "Canadian", "ca")
+    credential.suspend(f"reported lost #{i}")
+    return credential
+
+
+def _dict_backed(credential: Credential) -> SimpleNamespace:
+    slots = [slot for cls in type(credential).__mro__ for slot in getattr(cls, '__slots__', ())]
+    return SimpleNamespace(**{slot: getattr(credential, slot) for slot in slots})
+
+
+def _bytes_per_credential(layout) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = [layout(_credential(i)) for i in range(COUNT)]
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del kept
+    return held / COUNT
+
+
+def main() -> None:
+    layouts = [
+        ("dict-backed", _dict_backed),
+        ("slotted", lambda credential: credential),
+        ("snapshot", lambda credential: credential.snapshot())
+    ]
+    print(f"{COUNT} credentials")
+    print(f"{'layout':>12} {'bytes/credential':>17}")
+    for name, layout in layouts:
+        print(f"{name:>12} {_bytes_per_credential(layout):>17.0f}")
+
+
+if __name__ == '__main__':
+    main()
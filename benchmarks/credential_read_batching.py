@@ -0,0 +1,92 @@
+"""Point reads of different credentials: direct GetItem vs. micro-batched BatchGetItem.
+
+Run with ``python -m benchmarks.credential_read_batching``. A fake table sleeps for a
+DynamoDB-like round trip per request (plus a small per-key cost for BatchGetItem) and, like
+botocore's default client, allows only a limited number of requests in flight at once.
+"direct" reads every key with its own request; "batched" routes the same reads through
+BatchingCredentialRepository with different collection windows.
+"""
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.passport import Passport
+from app.infrastructure.concurrency.micro_batcher import MicroBatcher
+from app.infrastructure.persistence.repositories.batching_credential_repository import BatchingCredentialRepository
+
+ROUND_TRIP_SECONDS = 0.004
+PER_KEY_SECONDS = 0.00002
+MAX_POOL_CONNECTIONS = 10
+READS_PER_CLIENT = 50
+CLIENT_LEVELS = [1, 8, 32, 64]
+WINDOWS_MS = [0.5, 2]
+
+
+class PooledTable:
+    def __init__(self):
+        self._connections = threading.BoundedSemaphore(MAX_POOL_CONNECTIONS)
+        self.requests = 0
+
+    @staticmethod
+    def _passport(credential_id, issuing_country):
+        return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                        "Canadian", issuing_country)
+
+    def get_credential(self, credential_id, credential_type, issuing_country):
+        with self._connections:
+            self.requests += 1
+            time.sleep(ROUND_TRIP_SECONDS)
+        return self._passport(credential_id, issuing_country)
+
+    def get_credentials(self, keys):
+        with self._connections:
+            self.requests += 1
+            time.sleep(ROUND_TRIP_SECONDS + PER_KEY_SECONDS * len(keys))
+        return {key: self._passport(key.credential_id, key.issuing_country) for key in keys}
+
+
+def _run(clients: int, make_repository) -> tuple[float, list[float], int]:
+    table = PooledTable()
+    repository = make_repository(table)
+    latencies = []
+    latencies_lock = threading.Lock()
+
+    def client(c):
+        own = []
+        for i in range(READS_PER_CLIENT):
+            start = time.perf_counter()
+            repository.get_credential(f"P{c}-{i}", CredentialType.PASSPORT, "ca")
+            own.append(time.perf_counter() - start)
+        with latencies_lock:
+            latencies.extend(own)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        list(pool.map(client, range(clients)))
+    return time.perf_counter() - start, latencies, table.requests
+
+
+def _batched(window_ms: float):
+    def make(table):
+        return BatchingCredentialRepository(table, MicroBatcher(table.get_credentials, window_ms / 1000))
+    return make
+
+
+def main() -> None:
+    print(f"{READS_PER_CLIENT} reads per client, {ROUND_TRIP_SECONDS * 1000:.0f} ms simulated round trip, "
+          f"{MAX_POOL_CONNECTIONS} connections")
+    print(f"{'clients':>8} {'strategy':>16} {'reads/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'requests':>9}")
+    strategies = [("direct", lambda table: table)] + [(f"batched {w}ms", _batched(w)) for w in WINDOWS_MS]
+    for clients in CLIENT_LEVELS:
+        for name, make_repository in strategies:
+            elapsed, latencies, requests = _run(clients, make_repository)
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(f"{clients:>8} {name:>16} {len(latencies) / elapsed:>10.0f} {percentiles[49] * 1000:>8.1f} "
+                  f"{percentiles[98] * 1000:>8.1f} {requests:>9}")
+
+
+if __name__ == '__main__':
+    main()
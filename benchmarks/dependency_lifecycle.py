@@ -0,0 +1,57 @@
+"""Per-request dependency overhead: per-request construction vs. the application container.
+
+Run with ``python -m benchmarks.dependency_lifecycle``. No DynamoDB calls are made,
+only object/session construction is measured.
+"""
+import os
+import statistics
+import time
+
+from app.application.services.credential_service import CredentialService
+from app.container import ApplicationContainer
+from app.dependencies import get_credential_service
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
+
+ITERATIONS = 200
+
+
+def _per_request_chain() -> CredentialService:
+    # The dependency chain as it used to run for every request
+    manager = DynamoDBManager(DatabaseConfig.from_environment())
+    return CredentialService(DynamoDBCredentialRepository(manager))
+
+
+def _measure(factory, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        factory()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<28} mean={statistics.mean(samples):8.3f} ms  p50={statistics.median(samples):8.3f} ms  p99={p99:8.3f} ms")
+
+
+def main() -> None:
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'dummy')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'dummy')
+
+    before = _measure(_per_request_chain, ITERATIONS)
+
+    container = ApplicationContainer(DatabaseConfig.from_environment())
+    container.credential_service  # warm container, as after the first invocation
+    after = _measure(lambda: get_credential_service(container), ITERATIONS)
+
+    print(f"Per-request dependency resolution over {ITERATIONS} requests")
+    _report("per-request construction", before)
+    _report("application container", after)
+
+
+if __name__ == '__main__':
+    main()
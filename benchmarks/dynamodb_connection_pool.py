@@ -0,0 +1,90 @@
+"""GetItem throughput against botocore's connection pool size under concurrent load.
+
+Run with ``python -m benchmarks.dynamodb_connection_pool``. A local HTTP server answers DynamoDB
+GetItem calls after SERVICE_SECONDS, and charges HANDSHAKE_SECONDS for the first request on each
+new connection, standing in for the TCP and TLS setup a real endpoint costs. THREADS threads share
+one DynamoDBManager built from DatabaseConfig, as the API's executor does. Once the threads
+outnumber the pool, a call that finds it empty opens a new connection, and a connection handed
+back to a full pool is closed; the connections column counts those the server accepted. On a
+single core, botocore's own CPU time per call can cap throughput before the pool does.
+"""
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+
+SERVICE_SECONDS = 0.01
+HANDSHAKE_SECONDS = 0.03
+THREADS = 32
+REQUESTS = 2_000
+POOL_SIZES = [4, 10, 32, 64]
+
+_ITEM = json.dumps({'Item': {
+    'PK': {'S': 'CRED#ca#P-1'}, 'SK': {'S': 'METADATA#passport'}, 'status': {'S': 'A'}, 'version': {'N': '1'}
+}}).encode()
+
+
+class GetItemHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with GetItemHandler.lock:
+            GetItemHandler.connections += 1
+        self._handshake_pending = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(SERVICE_SECONDS + (HANDSHAKE_SECONDS if self._handshake_pending else 0))
+        self._handshake_pending = False
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-amz-json-1.0')
+        self.send_header('Content-Length', str(len(_ITEM)))
+        self.end_headers()
+        self.wfile.write(_ITEM)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run(endpoint_url: str, pool_size: int) -> tuple[float, int]:
+    config = DatabaseConfig(endpoint_url=endpoint_url, region='us-east-1', access_key_id='benchmark',
+                            secret_access_key='benchmark', max_pool_connections=pool_size)
+    table = DynamoDBManager(config).client.Table(config.credentials_table)
+    key = {'PK': 'CRED#ca#P-1', 'SK': 'METADATA#passport'}
+    GetItemHandler.connections = 0
+    with ThreadPoolExecutor(THREADS) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda _: table.get_item(Key=key), range(REQUESTS)))
+        elapsed = time.perf_counter() - started
+    return REQUESTS / elapsed, GetItemHandler.connections
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GetItemHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint_url = f'http://127.0.0.1:{server.server_address[1]}'
+    # urllib3 warns on every connection it drops from a full pool
+    logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
+
+    print(f"{THREADS} threads, {REQUESTS} GetItem calls, {SERVICE_SECONDS * 1000:.0f} ms service time, "
+          f"{HANDSHAKE_SECONDS * 1000:.0f} ms per new connection")
+    print(f"{'pool size':>10} {'calls/s':>10} {'connections':>12}")
+    try:
+        for pool_size in POOL_SIZES:
+            throughput, connections = _run(endpoint_url, pool_size)
+            print(f"{pool_size:>10} {throughput:>10.0f} {connections:>12}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
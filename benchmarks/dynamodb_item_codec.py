@@ -0,0 +1,49 @@
+"""Per-item encode and decode cost of the resource and low-level client repository paths.
+
+Run with ``python -m benchmarks.dynamodb_item_codec``. "resource" is what DynamoDBCredentialRepository
+pays on every put and read: the mapper's to_dynamo/to_domain plus boto3's TypeSerializer/
+TypeDeserializer over each attribute, numbers becoming Decimal on the way back. "client" is
+DynamoDBClientCredentialRepository's to_wire/from_wire on the attribute maps botocore sends and
+receives. Both paths share botocore's JSON handling, which is left out.
+"""
+import timeit
+from datetime import datetime, UTC
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.mappers.drivers_license_mapper import DriversLicenseMapper
+from app.infrastructure.persistence.mappers.passport_mapper import PassportMapper
+
+ITERATIONS = 20_000
+
+
+def main() -> None:
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+    credentials = [
+        (PassportMapper(), Passport("P-123456789", datetime(2024, 1, 1, tzinfo=UTC),
+                                    datetime(2034, 1, 1, tzinfo=UTC), "Canadian", "ca")),
+        (DriversLicenseMapper(), DriversLicense("DL-123456789", datetime(2024, 1, 1, tzinfo=UTC),
+                                                datetime(2030, 1, 1, tzinfo=UTC), ["A", "B", "C"], "ca", "on"))
+    ]
+
+    print(f"{'credential':>16} {'path':>9} {'us/encode':>10} {'us/decode':>10}")
+    for mapper, credential in credentials:
+        wire_item = mapper.to_wire(credential)
+        paths = [
+            ("resource",
+             lambda: {name: serializer.serialize(value) for name, value in mapper.to_dynamo(credential).items()},
+             lambda: mapper.to_domain({name: deserializer.deserialize(value) for name, value in wire_item.items()})),
+            ("client", lambda: mapper.to_wire(credential), lambda: mapper.from_wire(wire_item))
+        ]
+        for path, encode, decode in paths:
+            encode_seconds = min(timeit.repeat(encode, number=ITERATIONS, repeat=3)) / ITERATIONS
+            decode_seconds = min(timeit.repeat(decode, number=ITERATIONS, repeat=3)) / ITERATIONS
+            print(f"{credential.get_credential_type().value:>16} {path:>9} "
+                  f"{encode_seconds * 1e6:>10.1f} {decode_seconds * 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Operation costs of InMemoryCredentialRepository, to confirm it stays out of the way in API benchmarks.
+
+Run with ``python -m benchmarks.in_memory_repository``. The store is filled with STORE_SIZE
+passports spread over a few countries; each operation is timed directly and, for point reads,
+also through AsyncCredentialService as the API routes call it: via the thread-pool executor used
+for DynamoDB, and inline on the event loop as the container wires the in-memory store.
+"""
+import asyncio
+import time
+import timeit
+from datetime import datetime, timedelta, UTC
+
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+from app.infrastructure.persistence.inline_call_executor import InlineCallExecutor
+from app.infrastructure.persistence.repositories.executor_credential_repository import ExecutorCredentialRepository
+from app.infrastructure.persistence.repositories.in_memory_credential_repository import InMemoryCredentialRepository
+
+STORE_SIZE = 100_000
+COUNTRIES = ["ca", "us", "fr", "de"]
+ITERATIONS = 5_000
+ASYNC_READS = 2_000
+
+
+def _fill(repository: InMemoryCredentialRepository) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    repository.create_credentials([
+        Passport(f"P-{i:06d}", start, start + timedelta(days=365 + i % 3650), "Canadian", COUNTRIES[i % len(COUNTRIES)])
+        for i in range(STORE_SIZE)
+    ])
+
+
+async def _async_reads(repository: InMemoryCredentialRepository, executor: BlockingCallExecutor) -> float:
+    service = AsyncCredentialService(ExecutorCredentialRepository(repository, executor))
+    started = time.perf_counter()
+    for i in range(ASYNC_READS):
+        await service.get_credential(f"P-{i * 4:06d}", CredentialType.PASSPORT, "ca")
+    return (time.perf_counter() - started) / ASYNC_READS
+
+
+def main() -> None:
+    repository = InMemoryCredentialRepository()
+    started = time.perf_counter()
+    _fill(repository)
+    print(f"loaded {STORE_SIZE} credentials in {time.perf_counter() - started:.2f} s")
+
+    keys = [CredentialKey(f"P-{i * 4:06d}", CredentialType.PASSPORT, "ca") for i in range(25)]
+    toggle = iter([CredentialStatus.SUSPENDED, CredentialStatus.ACTIVE] * ITERATIONS)
+    operations = [
+        ("get_credential", lambda: repository.get_credential("P-000400", CredentialType.PASSPORT, "ca")),
+        ("get_credentials x25", lambda: repository.get_credentials(keys)),
+        ("list_credentials x50", lambda: repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=50)),
+        ("transition_status", lambda: repository.transition_credential_status(
+            "P-000400", CredentialType.PASSPORT, "ca", next(toggle), "audit")),
+        ("list_expiring x50", lambda: repository.list_expiring_credentials(
+            0, datetime(2026, 1, 1, tzinfo=UTC), limit=50)),
+    ]
+
+    print(f"{'operation':>22} {'us/op':>8}")
+    for name, operation in operations:
+        seconds = min(timeit.repeat(operation, number=ITERATIONS // 5, repeat=3))
+        print(f"{name:>22} {seconds / (ITERATIONS // 5) * 1e6:>8.1f}")
+    for name, executor in [("async get, thread pool", BlockingCallExecutor(10)), ("async get, inline", InlineCallExecutor())]:
+        print(f"{name:>22} {asyncio.run(_async_reads(repository, executor)) * 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
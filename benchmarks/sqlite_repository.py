@@ -0,0 +1,102 @@
+"""Point-read and write throughput of SqliteCredentialRepository next to the DynamoDB path.
+
+Run with ``python -m benchmarks.sqlite_repository``. The DynamoDB repository runs unchanged over a
+fake table that keeps items in a dict and sleeps for a round trip on every call, so its numbers
+include the mapper work but no real network. The SQLite repository writes to a temporary file in
+WAL mode. Reads are spread over THREADS threads, as the API's executor would spread them.
+"""
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
+from app.infrastructure.persistence.repositories.sqlite_credential_repository import SqliteCredentialRepository
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+ROUND_TRIP_SECONDS = 0.004
+STORE_SIZE = 20_000
+THREADS = 8
+READS = 4_000
+SINGLE_WRITES = 500
+
+
+class FakeTable:
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def Table(self, name):
+        return self
+
+    def get_item(self, Key, **kwargs):
+        time.sleep(ROUND_TRIP_SECONDS)
+        item = self._items.get((Key['PK'], Key['SK']))
+        return {'Item': dict(item)} if item else {}
+
+    def put_item(self, Item, **kwargs):
+        time.sleep(ROUND_TRIP_SECONDS)
+        with self._lock:
+            self._items[(Item['PK'], Item['SK'])] = Item
+
+    def batch_write_item(self, RequestItems):
+        time.sleep(ROUND_TRIP_SECONDS)
+        with self._lock:
+            for requests in RequestItems.values():
+                for request in requests:
+                    item = request['PutRequest']['Item']
+                    self._items[(item['PK'], item['SK'])] = item
+        return {}
+
+
+def _passports(count: int, prefix: str = "P") -> list[Passport]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [Passport(f"{prefix}-{i:06d}", start, start + timedelta(days=365 + i % 3650), "Canadian", "ca")
+            for i in range(count)]
+
+
+def _measure(repository) -> dict[str, float]:
+    results = {}
+    started = time.perf_counter()
+    repository.create_credentials(_passports(STORE_SIZE))
+    results['bulk writes/s'] = STORE_SIZE / (time.perf_counter() - started)
+
+    writes = _passports(SINGLE_WRITES, "W")
+    started = time.perf_counter()
+    for credential in writes:
+        repository.create_credential(credential)
+    results['single writes/s'] = SINGLE_WRITES / (time.perf_counter() - started)
+
+    ids = [f"P-{(i * 7919) % STORE_SIZE:06d}" for i in range(READS)]
+    with ThreadPoolExecutor(THREADS) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda credential_id: repository.get_credential(
+            credential_id, CredentialType.PASSPORT, "ca"), ids))
+        results[f'reads/s, {THREADS} threads'] = READS / (time.perf_counter() - started)
+    return results
+
+
+def main() -> None:
+    print(f"{STORE_SIZE} credentials, {ROUND_TRIP_SECONDS * 1000:.0f} ms simulated DynamoDB round trip")
+    manager = SimpleNamespace(client=FakeTable(), config=SimpleNamespace(credentials_table='credentials'))
+    dynamodb = _measure(DynamoDBCredentialRepository(manager))
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = SqliteDatabase(os.path.join(directory, 'credentials.db'))
+        try:
+            sqlite = _measure(SqliteCredentialRepository(database))
+        finally:
+            database.close()
+
+    print(f"{'':>20} {'dynamodb':>10} {'sqlite':>10}")
+    for name in dynamodb:
+        print(f"{name:>20} {dynamodb[name]:>10.0f} {sqlite[name]:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
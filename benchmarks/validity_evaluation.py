@@ -0,0 +1,89 @@
+"""Classifying many credentials: one Credential at a time vs. a vectorized CredentialBatch.
+
+Run with ``python -m benchmarks.validity_evaluation``. COUNT passports with spread-out validity
+windows and a mix of statuses are classified at one instant three ways: is_valid() with its
+ExpiredCredentialException caught, validity_reason() in a loop, and the classify_credentials path over
+an export of the same credentials: reading the gzip NDJSON files into a CredentialBatch, then one
+BatchValidityEvaluator pass. The load is reported on its own and together with the evaluation, since a
+compliance run pays both.
+"""
+import gzip
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+from app.application.services.batch_validity_evaluator import BatchValidityEvaluator
+from app.application.services.credential_batch import CredentialBatch
+from app.domain.exceptions.credential.expired_credential_exception import ExpiredCredentialException
+from app.domain.models.passport import Passport
+
+COUNT = 200_000
+NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def _credentials() -> list[Passport]:
+    credentials = []
+    for i in range(COUNT):
+        valid_from = datetime(2025, 1, 1, tzinfo=UTC) + timedelta(hours=i % 60_000)
+        credential = Passport(f"P-{i:09d}", valid_from, valid_from + timedelta(days=1800), "Canadian", "ca")
+        if i % 10 == 1:
+            credential.suspend("reported lost")
+        elif i % 10 == 2:
+            credential.revoke("fraud")
+        credentials.append(credential)
+    return credentials
+
+
+def _write_export(credentials: list[Passport], directory: Path, files: int = 8) -> list[Path]:
+    """The credentials in CredentialTableExporter's file layout and record shape"""
+    paths = [directory / f'credentials-{file:04d}-of-{files:04d}.ndjson.gz' for file in range(files)]
+    for file, path in enumerate(paths):
+        with gzip.open(path, 'wt', encoding='utf-8') as output:
+            output.writelines(json.dumps({
+                'credential_type': credential.get_credential_type().value,
+                'credential_id': credential.credential_id,
+                'issuing_country': credential.issuing_country,
+                'valid_from': credential.valid_from.isoformat(),
+                'valid_until': credential.valid_until.isoformat(),
+                'status': credential.status.value}) + '\n' for credential in credentials[file::files])
+    return paths
+
+
+def _is_valid(credential: Passport) -> bool:
+    try:
+        return credential.is_valid()
+    except ExpiredCredentialException:
+        return False
+
+
+def _timed(action) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    credentials = _credentials()
+    evaluator = BatchValidityEvaluator()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_export(credentials, Path(directory))
+        batch_holder = []
+        timings = [
+            ("is_valid loop", _timed(lambda: [_is_valid(credential) for credential in credentials])),
+            ("reason loop", _timed(lambda: [credential.validity_reason(NOW) for credential in credentials])),
+            ("export load", _timed(lambda: batch_holder.append(CredentialBatch.from_export(paths)))),
+        ]
+        batch = batch_holder[0]
+        timings.append(("vectorized", _timed(lambda: evaluator.evaluate(batch, NOW))))
+        timings.append(("export e2e", _timed(lambda: evaluator.evaluate(CredentialBatch.from_export(paths), NOW))))
+
+    print(f"{COUNT} credentials")
+    print(f"{'approach':>14} {'ms':>9} {'ns/credential':>14}")
+    for name, seconds in timings:
+        print(f"{name:>14} {seconds * 1000:>9.1f} {seconds / COUNT * 1e9:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@ from datetime import datetime, UTC
 from unittest.mock import Mock
 from app.domain.models.api_key import ApiKey
 from app.application.services.api_auth_service import ApiAuthService
+from app.application.services.api_key_usage_accumulator import ApiKeyUsageAccumulator
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
 from app.infrastructure.exceptions.database_exception import DatabaseException
 
 
@@ -16,6 +18,11 @@ def auth_service(mock_repository):
     return ApiAuthService(mock_repository)
 
 
+@pytest.fixture
+def cached_auth_service(mock_repository):
+    return ApiAuthService(mock_repository, LruTtlCache(max_entries=10, max_bytes=10_000, ttl_seconds=60))
+
+
 @pytest.fixture
 def sample_api_key():
     return ApiKey(
@@ -76,4 +83,53 @@ class TestApiAuthService:
         mock_repository.get_api_key.side_effect = DatabaseException("Test error")
 
         with pytest.raises(DatabaseException):
-            auth_service.validate_api_key("test-key-123")
\ No newline at end of file
+            auth_service.validate_api_key("test-key-123")
+
+    def test_given_validated_key_when_validating_again_within_ttl_then_skips_repository(
+            self, cached_auth_service, mock_repository, sample_api_key):
+        mock_repository.get_api_key.return_value = sample_api_key
+
+        assert cached_auth_service.validate_api_key("test-key-123") is True
+        assert cached_auth_service.validate_api_key("test-key-123") is True
+
+        mock_repository.get_api_key.assert_called_once()
+        mock_repository.update_api_key.assert_called_once()
+
+    def test_given_cached_key_when_revoking_then_deletes_it_and_stops_accepting_it(
+            self, cached_auth_service, mock_repository, sample_api_key):
+        mock_repository.get_api_key.return_value = sample_api_key
+        cached_auth_service.validate_api_key("test-key-123")
+        mock_repository.delete_api_key.return_value = True
+
+        assert cached_auth_service.revoke_api_key("test-key-123") is True
+        mock_repository.get_api_key.return_value = None
+
+        assert cached_auth_service.validate_api_key("test-key-123") is False
+        mock_repository.delete_api_key.assert_called_once_with("test-key-123")
+
+    def test_given_usage_accumulator_when_validating_then_batches_usage_instead_of_updating(
+            self, mock_repository, sample_api_key):
+        usage = ApiKeyUsageAccumulator(max_pending_keys=100)
+        auth_service = ApiAuthService(mock_repository, usage=usage)
+        mock_repository.get_api_key.return_value = sample_api_key
+        mock_repository.record_api_key_usage.return_value = []
+
+        for _ in range(3):
+            auth_service.validate_api_key("test-key-123")
+        auth_service.flush_usage()
+
+        mock_repository.update_api_key.assert_not_called()
+        usages = mock_repository.record_api_key_usage.call_args.args[0]
+        assert [(u.key, u.request_count) for u in usages] == [("test-key-123", 3)]
+
+    def test_given_failing_usage_write_when_flushing_then_keeps_usage_for_next_flush(
+            self, mock_repository, sample_api_key):
+        usage = ApiKeyUsageAccumulator(max_pending_keys=100)
+        auth_service = ApiAuthService(mock_repository, usage=usage)
+        mock_repository.get_api_key.return_value = sample_api_key
+        mock_repository.record_api_key_usage.side_effect = DatabaseException("Test error")
+        auth_service.validate_api_key("test-key-123")
+
+        auth_service.flush_usage()
+
+        assert usage.drain()[0].request_count == 1
@@ -0,0 +1,60 @@
+from datetime import datetime, UTC
+
+from app.application.services.api_key_usage_accumulator import ApiKeyUsageAccumulator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestApiKeyUsageAccumulator:
+    def test_given_many_requests_for_one_key_when_draining_then_returns_one_aggregated_usage(self):
+        accumulator = ApiKeyUsageAccumulator(usage_interval_seconds=3600)
+
+        for minute in range(3):
+            accumulator.record("key-1", datetime(2025, 1, 1, 10, minute, tzinfo=UTC))
+        usages = accumulator.drain()
+
+        assert len(usages) == 1
+        assert usages[0].request_count == 3
+        assert usages[0].interval_start == datetime(2025, 1, 1, 10, tzinfo=UTC)
+        assert usages[0].last_used == datetime(2025, 1, 1, 10, 2, tzinfo=UTC)
+        assert accumulator.drain() == []
+
+    def test_given_requests_in_two_intervals_when_draining_then_counts_each_interval(self):
+        accumulator = ApiKeyUsageAccumulator(usage_interval_seconds=3600)
+
+        accumulator.record("key-1", datetime(2025, 1, 1, 10, 59, tzinfo=UTC))
+        accumulator.record("key-1", datetime(2025, 1, 1, 11, 0, tzinfo=UTC))
+
+        assert sorted(u.interval_start.hour for u in accumulator.drain()) == [10, 11]
+
+    def test_given_flush_interval_elapsed_when_recording_then_reports_flush_due(self):
+        clock = FakeClock()
+        accumulator = ApiKeyUsageAccumulator(flush_interval_seconds=60, clock=clock)
+
+        assert accumulator.record("key-1", datetime.now(UTC)) is False
+        clock.now = 60
+
+        assert accumulator.record("key-1", datetime.now(UTC)) is True
+
+    def test_given_max_pending_keys_reached_when_recording_then_reports_flush_due(self):
+        accumulator = ApiKeyUsageAccumulator(max_pending_keys=2)
+
+        assert accumulator.record("key-1", datetime.now(UTC)) is False
+        assert accumulator.record("key-2", datetime.now(UTC)) is True
+
+    def test_given_failed_write_when_restoring_then_counts_merge_into_next_flush(self):
+        accumulator = ApiKeyUsageAccumulator()
+        timestamp = datetime(2025, 1, 1, 10, tzinfo=UTC)
+        accumulator.record("key-1", timestamp)
+        failed = accumulator.drain()
+
+        accumulator.record("key-1", timestamp)
+        accumulator.restore(failed)
+
+        assert accumulator.drain()[0].request_count == 2
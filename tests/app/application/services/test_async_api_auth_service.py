@@ -0,0 +1,72 @@
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock
+
+from app.application.services.async_api_auth_service import AsyncApiAuthService
+from app.domain.models.api_key import ApiKey
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.exceptions.database_exception import DatabaseException
+
+
+@pytest.fixture
+def mock_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def auth_service(mock_repository):
+    return AsyncApiAuthService(mock_repository)
+
+
+class TestAsyncApiAuthService:
+    @pytest.mark.asyncio
+    async def test_given_description_when_generating_api_key_then_stores_new_key(self, auth_service, mock_repository):
+        result = await auth_service.generate_api_key("Test description")
+
+        assert len(result.key) == 32
+        mock_repository.store_api_key.assert_awaited_once_with(result)
+
+    @pytest.mark.asyncio
+    async def test_given_valid_api_key_when_validating_then_returns_true_and_updates_timestamp(
+            self, auth_service, mock_repository):
+        mock_repository.get_api_key.return_value = ApiKey(key="test-key-123", created_at=datetime.now(UTC))
+
+        assert await auth_service.validate_api_key("test-key-123") is True
+        mock_repository.update_api_key.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_given_failing_timestamp_update_when_validating_then_still_returns_true(
+            self, auth_service, mock_repository):
+        mock_repository.get_api_key.return_value = ApiKey(key="test-key-123", created_at=datetime.now(UTC))
+        mock_repository.update_api_key.side_effect = DatabaseException("Test error")
+
+        assert await auth_service.validate_api_key("test-key-123") is True
+
+    @pytest.mark.asyncio
+    async def test_given_nonexistent_api_key_when_validating_then_returns_false(self, auth_service, mock_repository):
+        mock_repository.get_api_key.return_value = None
+
+        assert await auth_service.validate_api_key("invalid-key") is False
+        mock_repository.update_api_key.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_given_validated_key_when_validating_again_within_ttl_then_skips_repository(self, mock_repository):
+        auth_service = AsyncApiAuthService(mock_repository, LruTtlCache(max_entries=10, max_bytes=10_000, ttl_seconds=60))
+        mock_repository.get_api_key.return_value = ApiKey(key="test-key-123", created_at=datetime.now(UTC))
+
+        assert await auth_service.validate_api_key("test-key-123") is True
+        assert await auth_service.validate_api_key("test-key-123") is True
+
+        mock_repository.get_api_key.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_given_key_revoked_elsewhere_when_forgetting_then_next_validation_reads_repository(
+            self, mock_repository):
+        auth_service = AsyncApiAuthService(mock_repository, LruTtlCache(max_entries=10, max_bytes=10_000, ttl_seconds=60))
+        mock_repository.get_api_key.return_value = ApiKey(key="test-key-123", created_at=datetime.now(UTC))
+        await auth_service.validate_api_key("test-key-123")
+        mock_repository.get_api_key.return_value = None
+
+        auth_service.forget_api_key("test-key-123")
+
+        assert await auth_service.validate_api_key("test-key-123") is False
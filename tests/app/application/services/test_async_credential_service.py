@@ -0,0 +1,66 @@
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock
+
+from app.application.services.async_credential_service import AsyncCredentialService
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.drivers_license import DriversLicense
+
+
+@pytest.fixture
+def mock_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def credential_service(mock_repository):
+    return AsyncCredentialService(mock_repository)
+
+
+@pytest.fixture
+def sample_drivers_license():
+    return DriversLicense(
+        credential_id="test-issuer-123",
+        valid_from=datetime(2024, 1, 1, tzinfo=UTC),
+        valid_until=datetime(2029, 12, 31, tzinfo=UTC),
+        vehicle_classes=["A", "B"],
+        issuing_country="CA",
+        issuing_region="ON"
+    )
+
+
+class TestAsyncCredentialService:
+    @pytest.mark.asyncio
+    async def test_given_valid_credential_id_when_getting_credential_then_returns_credential(
+            self, credential_service, mock_repository, sample_drivers_license):
+        mock_repository.get_credential.return_value = sample_drivers_license
+
+        credential = await credential_service.get_credential("test-id", CredentialType.DRIVERS_LICENSE, "ca")
+
+        mock_repository.get_credential.assert_awaited_once_with("test-id", CredentialType.DRIVERS_LICENSE, "ca")
+        assert credential == sample_drivers_license
+
+    @pytest.mark.asyncio
+    async def test_given_valid_credential_id_when_validating_credential_then_projects_only_status(
+            self, credential_service, mock_repository):
+        mock_repository.get_credential_fields.return_value = {'status': CredentialStatus.ACTIVE}
+
+        status = await credential_service.validate_credential("test-id", CredentialType.DRIVERS_LICENSE, "ca")
+
+        mock_repository.get_credential_fields.assert_awaited_once_with(
+            "test-id", CredentialType.DRIVERS_LICENSE, "ca", ['status'])
+
+        assert status == CredentialStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_given_status_update_when_updating_credential_then_applies_conditional_transition(
+            self, credential_service, mock_repository, sample_drivers_license):
+        mock_repository.transition_credential_status.return_value = sample_drivers_license
+
+        updated = await credential_service.update_credential(
+            "test-id", "ca", CredentialType.DRIVERS_LICENSE, CredentialStatus.SUSPENDED, "Test suspension", None)
+
+        assert updated == sample_drivers_license
+        mock_repository.transition_credential_status.assert_awaited_once_with(
+            "test-id", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.SUSPENDED, "Test suspension", None)
@@ -0,0 +1,133 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone, UTC
+
+import numpy as np
+import pytest
+
+from app.application.services.batch_validity_evaluator import BatchValidityEvaluator
+from app.application.services.credential_batch import CredentialBatch
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.enums.validity_reason import ValidityReason
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential import Credential
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.mappers.credential_mapper_provider import CredentialMapperProvider
+
+NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def credentials() -> list[Credential]:
+    """One credential per reason, plus both inclusive window boundaries"""
+    valid = Passport("P-VALID", NOW - timedelta(days=1), NOW + timedelta(days=1), "Canadian", "ca")
+    starts_now = Passport("P-STARTS", NOW, NOW + timedelta(days=1), "Canadian", "ca")
+    ends_now = DriversLicense("DL-ENDS", NOW - timedelta(days=1), NOW, ["A"], "ca", "on")
+    expired = Passport("P-EXPIRED", NOW - timedelta(days=2), NOW - timedelta(microseconds=1), "Canadian", "ca")
+    pending = DriversLicense("DL-PENDING", NOW + timedelta(days=1), NOW + timedelta(days=2), ["B"], "ca", "qc")
+    suspended = Passport("P-SUSPENDED", NOW - timedelta(days=1), NOW + timedelta(days=1), "Canadian", "ca")
+    suspended.suspend("lost")
+    revoked = Passport("P-REVOKED", NOW - timedelta(days=1), NOW + timedelta(days=1), "Canadian", "ca")
+    revoked.revoke("fraud")
+    revoked_and_past = Passport("P-REVOKED-PAST", NOW - timedelta(days=2), NOW - timedelta(days=1), "Canadian", "ca")
+    revoked_and_past.revoke("fraud")
+    swept = Passport("P-SWEPT", NOW - timedelta(days=1), NOW + timedelta(days=1), "Canadian", "ca")
+    swept.expire()
+    return [valid, starts_now, ends_now, expired, pending, suspended, revoked, revoked_and_past, swept]
+
+
+class TestBatchValidityEvaluator:
+    def test_given_credentials_when_evaluating_batch_then_each_row_matches_validity_reason(self):
+        batch = CredentialBatch.from_credentials(credentials())
+
+        reasons = BatchValidityEvaluator().evaluate(batch, NOW)
+
+        assert reasons.dtype == np.uint8
+        assert [ValidityReason(reason) for reason in reasons] == [
+            credential.validity_reason(NOW) for credential in credentials()]
+        assert [ValidityReason(reason) for reason in reasons] == [
+            ValidityReason.VALID, ValidityReason.VALID, ValidityReason.VALID, ValidityReason.EXPIRED,
+            ValidityReason.NOT_YET_VALID, ValidityReason.SUSPENDED, ValidityReason.REVOKED,
+            ValidityReason.EXPIRED, ValidityReason.EXPIRED]
+
+    def test_given_mapper_items_in_both_encodings_when_building_batch_then_matches_credentials(self):
+        provider = CredentialMapperProvider()
+        items = [provider.get_mapper(credential.get_credential_type()).to_dynamo(credential)
+                 for credential in credentials()]
+        legacy = dict(items[0], valid_from=credentials()[0].valid_from.isoformat(), status='active')
+        legacy.pop('fmt')
+
+        from_items = CredentialBatch.from_items(items + [legacy])
+        expected = CredentialBatch.from_credentials(credentials() + [credentials()[0]])
+
+        assert np.array_equal(from_items.credential_id, expected.credential_id)
+        assert np.array_equal(from_items.credential_type, expected.credential_type)
+        assert np.array_equal(from_items.issuing_country, expected.issuing_country)
+        assert np.array_equal(from_items.valid_from, expected.valid_from)
+        assert np.array_equal(from_items.valid_until, expected.valid_until)
+        assert np.array_equal(from_items.status, expected.status)
+
+    def test_given_export_files_when_building_batch_then_reads_every_record(self, tmp_path):
+        records = [{'credential_type': credential.get_credential_type().value,
+                    'credential_id': credential.credential_id,
+                    'issuing_country': credential.issuing_country,
+                    'valid_from': credential.valid_from.isoformat(),
+                    'valid_until': credential.valid_until.isoformat(),
+                    'status': credential.status.value} for credential in credentials()]
+        paths = [tmp_path / 'credentials-0000-of-0002.ndjson.gz', tmp_path / 'credentials-0001-of-0002.ndjson.gz']
+        for path, chunk in zip(paths, (records[:4], records[4:])):
+            with gzip.open(path, 'wt', encoding='utf-8') as output:
+                output.writelines(json.dumps(record) + '\n' for record in chunk)
+
+        batch = CredentialBatch.from_export(paths)
+        evaluator = BatchValidityEvaluator()
+
+        assert len(batch) == len(records)
+        assert evaluator.summarize(evaluator.evaluate(batch, NOW)) == {
+            ValidityReason.VALID: 3, ValidityReason.EXPIRED: 3, ValidityReason.NOT_YET_VALID: 1,
+            ValidityReason.SUSPENDED: 1, ValidityReason.REVOKED: 1}
+
+    def test_given_export_records_when_building_batch_then_columns_match_credentials(self):
+        records = [{'credential_type': credential.get_credential_type().value,
+                    'credential_id': credential.credential_id,
+                    'issuing_country': credential.issuing_country,
+                    'valid_from': credential.valid_from.isoformat(),
+                    'valid_until': credential.valid_until.isoformat(),
+                    'status': credential.status.value} for credential in credentials()]
+        records[0]['valid_from'] = credentials()[0].valid_from.astimezone(timezone(timedelta(hours=-5))).isoformat()
+
+        batch = CredentialBatch.from_records(records)
+        expected = CredentialBatch.from_credentials(credentials())
+
+        assert batch.key(2) == CredentialKey("DL-ENDS", CredentialType.DRIVERS_LICENSE, "ca")
+        assert np.array_equal(batch.credential_id, expected.credential_id)
+        assert np.array_equal(batch.valid_from, expected.valid_from)
+        assert np.array_equal(batch.valid_until, expected.valid_until)
+        assert np.array_equal(batch.status, expected.status)
+
+    def test_given_record_with_unknown_status_when_building_batch_then_raises_value_error(self):
+        record = {'credential_type': 'passport', 'credential_id': 'P1', 'issuing_country': 'ca',
+                  'valid_from': NOW.isoformat(), 'valid_until': NOW.isoformat(), 'status': 'lost'}
+
+        with pytest.raises(ValueError, match="'lost'"):
+            CredentialBatch.from_records([record])
+
+    def test_given_target_status_when_checking_transitions_then_mask_follows_update_status(self):
+        batch = CredentialBatch.from_credentials(credentials())
+
+        for status in (CredentialStatus.ACTIVE, CredentialStatus.SUSPENDED, CredentialStatus.REVOKED):
+            allowed = BatchValidityEvaluator.transition_allowed(batch, status)
+            for credential, row_allowed in zip(credentials(), allowed):
+                try:
+                    credential.update_status(status, "reason")
+                    expected = True
+                except InvalidCredentialStateException:
+                    expected = False
+                assert bool(row_allowed) == expected
+
+    def test_given_columns_of_different_lengths_when_building_batch_then_raises_value_error(self):
+        with pytest.raises(ValueError, match="same length"):
+            CredentialBatch(np.array([], dtype=np.str_), np.array([], dtype=np.str_), np.array([], dtype=np.str_),
+                            np.array([1]), np.array([], dtype=np.int64), np.array([], dtype=np.uint8))
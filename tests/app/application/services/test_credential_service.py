@@ -5,7 +5,11 @@ from unittest.mock import Mock
 from app.application.services.credential_service import CredentialService
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential_key import CredentialKey
 from app.domain.models.drivers_license import DriversLicense
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
 
 
 @pytest.fixture
@@ -48,9 +52,19 @@ class TestCredentialService:
         )
         assert credential == sample_drivers_license
 
-    def test_given_valid_credential_id_when_validating_credential_then_returns_status(
+    def test_given_keys_when_getting_credentials_then_returns_found_credentials(
             self, credential_service, mock_repository, sample_drivers_license):
-        mock_repository.get_credential.return_value = sample_drivers_license
+        key = CredentialKey("test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca")
+        mock_repository.get_credentials.return_value = {key: sample_drivers_license}
+
+        credentials = credential_service.get_credentials([key])
+
+        mock_repository.get_credentials.assert_called_once_with([key])
+        assert credentials == {key: sample_drivers_license}
+
+    def test_given_valid_credential_id_when_validating_credential_then_projects_only_status(
+            self, credential_service, mock_repository):
+        mock_repository.get_credential_fields.return_value = {'status': CredentialStatus.ACTIVE}
 
         status = credential_service.validate_credential(
             "test-id",
@@ -58,11 +72,13 @@ class TestCredentialService:
             "CA"
         )
 
-        mock_repository.get_credential.assert_called_once_with(
+        mock_repository.get_credential_fields.assert_called_once_with(
             "test-id",
             CredentialType.DRIVERS_LICENSE,
-            "CA"
+            "CA",
+            ['status']
         )
+        mock_repository.get_credential.assert_not_called()
         assert status == CredentialStatus.ACTIVE
 
     def test_given_valid_credential_when_creating_credential_then_returns_created_credential(
@@ -74,11 +90,12 @@ class TestCredentialService:
         mock_repository.create_credential.assert_called_once_with(sample_drivers_license)
         assert created == sample_drivers_license
 
-    def test_given_active_credential_when_suspending_then_updates_status_to_suspended(
+    def test_given_status_update_when_updating_credential_then_applies_single_conditional_transition(
             self, credential_service, mock_repository, sample_drivers_license):
-        mock_repository.get_credential.return_value = sample_drivers_license
+        sample_drivers_license.suspend("Test suspension")
+        mock_repository.transition_credential_status.return_value = sample_drivers_license
 
-        credential_service.update_credential(
+        updated = credential_service.update_credential(
             "test-id",
             "CA",
             CredentialType.DRIVERS_LICENSE,
@@ -86,37 +103,68 @@ class TestCredentialService:
             "Test suspension"
         )
 
-        assert sample_drivers_license.status == CredentialStatus.SUSPENDED
-        assert sample_drivers_license.suspension_reason == "Test suspension"
-        mock_repository.update_credential_status.assert_called_once_with(sample_drivers_license)
-
-    def test_given_active_credential_when_revoking_then_updates_status_to_revoked(
+        assert updated == sample_drivers_license
+        mock_repository.transition_credential_status.assert_called_once_with(
+            "test-id", CredentialType.DRIVERS_LICENSE, "CA", CredentialStatus.SUSPENDED, "Test suspension", None)
+        mock_repository.get_credential.assert_not_called()
+
+    def test_given_revocation_without_reason_when_updating_then_raises_before_touching_repository(
+            self, credential_service, mock_repository):
+        with pytest.raises(InvalidCredentialStateException, match="Revocation reason cannot be empty"):
+            credential_service.update_credential(
+                "test-id",
+                "CA",
+                CredentialType.DRIVERS_LICENSE,
+                CredentialStatus.REVOKED,
+                None
+            )
+
+        mock_repository.transition_credential_status.assert_not_called()
+
+    def test_given_reinstatement_without_reason_when_updating_then_transitions_to_active(
             self, credential_service, mock_repository, sample_drivers_license):
-        mock_repository.get_credential.return_value = sample_drivers_license
+        mock_repository.transition_credential_status.return_value = sample_drivers_license
 
         credential_service.update_credential(
             "test-id",
             "CA",
             CredentialType.DRIVERS_LICENSE,
-            CredentialStatus.REVOKED,
-            "Test revocation"
+            CredentialStatus.ACTIVE,
+            None
         )
 
-        assert sample_drivers_license.status == CredentialStatus.REVOKED
-        assert sample_drivers_license.revocation_reason == "Test revocation"
-        mock_repository.update_credential_status.assert_called_once_with(sample_drivers_license)
+        mock_repository.transition_credential_status.assert_called_once_with(
+            "test-id", CredentialType.DRIVERS_LICENSE, "CA", CredentialStatus.ACTIVE, None, None)
 
-    def test_given_suspended_credential_when_reinstating_then_updates_status_to_active(
-            self, credential_service, mock_repository, sample_drivers_license):
+    def test_given_if_match_version_when_updating_credential_then_passes_expected_version(
+            self, credential_service, mock_repository):
+        credential_service.update_credential(
+            "test-id", "CA", CredentialType.DRIVERS_LICENSE, CredentialStatus.REVOKED, "Fraud", expected_version=3)
+
+        mock_repository.transition_credential_status.assert_called_once_with(
+            "test-id", CredentialType.DRIVERS_LICENSE, "CA", CredentialStatus.REVOKED, "Fraud", 3)
+
+    def test_given_version_conflict_when_modifying_credential_then_rereads_and_retries(
+            self, mock_repository, sample_drivers_license):
+        service = CredentialService(mock_repository, BackoffPolicy(max_attempts=3, base_delay=0, max_delay=0))
         mock_repository.get_credential.return_value = sample_drivers_license
-        sample_drivers_license.suspend("Initial suspension")
+        mock_repository.update_credential_status.side_effect = [
+            CredentialVersionConflictException("test-id", 1, 2), None]
 
-        credential_service.update_credential(
-            "test-id",
-            "CA",
-            CredentialType.DRIVERS_LICENSE,
-            CredentialStatus.ACTIVE,
-            None
-        )
+        credential = service.modify_credential(
+            "test-id", CredentialType.DRIVERS_LICENSE, "ca", lambda c: c.suspend("Audit"))
+
+        assert credential.status == CredentialStatus.SUSPENDED
+        assert mock_repository.get_credential.call_count == 2
+        assert mock_repository.update_credential_status.call_count == 2
+
+    def test_given_persistent_conflicts_when_modifying_credential_then_raises_after_retry_budget(
+            self, mock_repository, sample_drivers_license):
+        service = CredentialService(mock_repository, BackoffPolicy(max_attempts=2, base_delay=0, max_delay=0))
+        mock_repository.get_credential.return_value = sample_drivers_license
+        mock_repository.update_credential_status.side_effect = CredentialVersionConflictException("test-id", 1, 2)
+
+        with pytest.raises(CredentialVersionConflictException):
+            service.modify_credential("test-id", CredentialType.DRIVERS_LICENSE, "ca", lambda c: None)
 
-        assert sample_drivers_license.status == CredentialStatus.ACTIVE
\ No newline at end of file
+        assert mock_repository.update_credential_status.call_count == 2
@@ -0,0 +1,106 @@
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+from app.application.services.expiry_sweeper import ExpirySweeper
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential_page import CredentialPage
+from app.domain.models.passport import Passport
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+from app.infrastructure.persistence.repositories.in_memory_credential_repository import InMemoryCredentialRepository
+from app.infrastructure.persistence.repositories.in_memory_job_checkpoint_repository import (
+    InMemoryJobCheckpointRepository)
+
+NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def passport(credential_id: str) -> Passport:
+    return Passport(credential_id, datetime(2020, 1, 1, tzinfo=UTC), datetime(2029, 1, 1, tzinfo=UTC),
+                    "Canadian", "ca")
+
+
+@pytest.fixture
+def repository():
+    repository = Mock()
+    repository.expiry_shard_count.return_value = 2
+    return repository
+
+
+@pytest.fixture
+def checkpoints():
+    checkpoints = Mock()
+    checkpoints.get_checkpoint.return_value = None
+    return checkpoints
+
+
+class TestExpirySweeper:
+    def test_given_expired_credentials_in_every_shard_when_sweeping_then_expires_all_and_clears_checkpoints(
+            self, repository, checkpoints):
+        pages = {
+            (0, None): CredentialPage([passport("P1")], "c1"),
+            (0, "c1"): CredentialPage([passport("P2")], None),
+            (1, None): CredentialPage([passport("P3")], None)
+        }
+        repository.list_expiring_credentials.side_effect = lambda shard, before, limit, cursor: pages[(shard, cursor)]
+
+        result = ExpirySweeper(repository, checkpoints, workers=2, clock=lambda: NOW).sweep()
+
+        assert (result.expired, result.shards_completed, result.complete) == (3, 2, True)
+        expired_ids = {call.args[0] for call in repository.transition_credential_status.call_args_list}
+        assert expired_ids == {"P1", "P2", "P3"}
+        assert repository.transition_credential_status.call_args.args[3] == CredentialStatus.EXPIRED
+        checkpoints.save_checkpoint.assert_called_once_with(ExpirySweeper.JOB_NAME, 0, "c1")
+        assert checkpoints.clear_checkpoint.call_count == 2
+
+    def test_given_saved_checkpoint_when_sweeping_then_resumes_from_it(self, repository, checkpoints):
+        repository.expiry_shard_count.return_value = 1
+        checkpoints.get_checkpoint.return_value = "saved"
+        repository.list_expiring_credentials.return_value = CredentialPage([], None)
+
+        ExpirySweeper(repository, checkpoints, clock=lambda: NOW).sweep()
+
+        assert repository.list_expiring_credentials.call_args.kwargs['cursor'] == "saved"
+
+    def test_given_exhausted_time_budget_when_sweeping_then_stops_and_keeps_checkpoints(self, repository, checkpoints):
+        ticks = iter([0, 0, 100, 100])
+        repository.expiry_shard_count.return_value = 1
+        repository.list_expiring_credentials.return_value = CredentialPage([passport("P1")], "next")
+
+        result = ExpirySweeper(repository, checkpoints, clock=lambda: NOW, monotonic=lambda: next(ticks)).sweep(10)
+
+        assert (result.expired, result.complete) == (1, False)
+        checkpoints.save_checkpoint.assert_called_once_with(ExpirySweeper.JOB_NAME, 0, "next")
+        checkpoints.clear_checkpoint.assert_not_called()
+
+    def test_given_concurrent_revocation_or_write_error_when_sweeping_then_counts_and_continues(
+            self, repository, checkpoints):
+        repository.expiry_shard_count.return_value = 1
+        repository.list_expiring_credentials.return_value = CredentialPage(
+            [passport("P1"), passport("P2"), passport("P3")], None)
+        repository.transition_credential_status.side_effect = [
+            InvalidCredentialStateException("Cannot expire a revoked credential"), DatabaseException("boom"), None]
+
+        result = ExpirySweeper(repository, checkpoints, clock=lambda: NOW).sweep()
+
+        assert (result.expired, result.skipped, result.failed) == (1, 1, 1)
+
+    def test_given_checkpoint_signed_with_another_key_when_sweeping_then_restarts_shard_and_completes(self):
+        def repository_with(secret: bytes) -> InMemoryCredentialRepository:
+            repository = InMemoryCredentialRepository(cursor_codec=PaginationCursorCodec(secret))
+            for credential_id in ("P1", "P2", "P3"):
+                repository.create_credential(passport(credential_id))
+            return repository
+
+        # Left behind by a process that signed cursors with its own random key
+        previous = repository_with(b'a' * 32)
+        checkpoints = InMemoryJobCheckpointRepository()
+        checkpoints.save_checkpoint(ExpirySweeper.JOB_NAME, 0,
+                                    previous.list_expiring_credentials(0, NOW, limit=1).next_cursor)
+        current = repository_with(b'b' * 32)
+
+        result = ExpirySweeper(current, checkpoints, page_size=2, clock=lambda: NOW).sweep()
+
+        assert (result.expired, result.complete) == (3, True)
+        assert checkpoints.get_checkpoint(ExpirySweeper.JOB_NAME, 0) is None
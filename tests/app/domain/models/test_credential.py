@@ -1,8 +1,14 @@
+import dataclasses
+
 import pytest
 from datetime import datetime, UTC, timedelta
 from app.domain.models.credential import Credential
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
+from app.domain.enums.validity_reason import ValidityReason
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
 
 
 class ConcreteTestCredential(Credential):
@@ -78,4 +84,71 @@ class TestCredentialBase:
         credential.reinstate()
         assert credential.status == CredentialStatus.ACTIVE
         assert credential.suspension_reason is None
-        assert credential.revocation_reason is None
\ No newline at end of file
+        assert credential.revocation_reason is None
+
+    def test_given_revoked_credential_when_suspending_or_reinstating_then_raises_invalid_state(
+            self, credential):
+        credential.revoke("Test revocation")
+
+        with pytest.raises(InvalidCredentialStateException, match="Cannot suspend a revoked credential"):
+            credential.suspend("Test suspension")
+        with pytest.raises(InvalidCredentialStateException, match="Cannot reinstate a revoked credential"):
+            credential.reinstate()
+
+    def test_given_expired_credential_when_reinstating_or_expiring_again_then_raises_invalid_state(self, credential):
+        credential.suspend("Test suspension")
+        credential.expire()
+
+        assert credential.status == CredentialStatus.EXPIRED
+        with pytest.raises(InvalidCredentialStateException, match="Cannot reinstate an expired credential"):
+            credential.reinstate()
+        with pytest.raises(InvalidCredentialStateException, match="already expired"):
+            credential.expire()
+
+    def test_given_expired_status_when_validating_requested_update_then_rejects_it(self):
+        with pytest.raises(InvalidCredentialStateException, match="expire on their own"):
+            Credential.validate_status_update(CredentialStatus.EXPIRED, None)
+
+    def test_given_drivers_license_when_snapshotting_then_snapshot_is_hashable_and_unaffected_by_updates(self):
+        drivers_license = DriversLicense("DL-1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2030, 1, 1, tzinfo=UTC),
+                                         ["A", "B"], "ca", "on")
+        snapshot = drivers_license.snapshot()
+
+        drivers_license.update_status(CredentialStatus.SUSPENDED, "lost")
+
+        assert hash(snapshot) == hash(dataclasses.replace(snapshot))
+        assert snapshot.status == CredentialStatus.ACTIVE
+        assert snapshot.details == (("A", "B"), "on")
+        with pytest.raises(AttributeError):
+            drivers_license.cached_at = datetime.now(UTC)
+
+    def test_given_snapshot_when_restoring_then_each_credential_is_independent_and_mutable(self):
+        snapshot = Passport("P-1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2030, 1, 1, tzinfo=UTC),
+                            "Canadian", "ca").snapshot()
+
+        first = Credential.from_snapshot(snapshot)
+        second = Credential.from_snapshot(snapshot)
+        first.revoke("fraud")
+
+        assert isinstance(second, Passport) and second.nationality == "Canadian"
+        assert second.status == CredentialStatus.ACTIVE
+        assert first.snapshot() != snapshot
+
+    def test_given_each_status_and_instant_when_classifying_then_reason_follows_is_valid_precedence(self, credential):
+        before, inside, after = (credential.valid_from - timedelta(seconds=1), credential.valid_from,
+                                 credential.valid_until + timedelta(seconds=1))
+
+        assert credential.validity_reason(inside) == ValidityReason.VALID
+        assert credential.validity_reason(credential.valid_until) == ValidityReason.VALID
+        assert credential.validity_reason(before) == ValidityReason.NOT_YET_VALID
+        assert credential.validity_reason(after) == ValidityReason.EXPIRED
+        credential.suspend("lost")
+        assert credential.validity_reason(before) == ValidityReason.SUSPENDED
+        assert credential.validity_reason(after) == ValidityReason.EXPIRED
+        credential.revoke("fraud")
+        assert credential.validity_reason(inside) == ValidityReason.REVOKED
+
+    def test_given_expired_status_inside_window_when_classifying_then_reason_is_expired(self, credential):
+        credential.expire()
+
+        assert credential.validity_reason(credential.valid_from) == ValidityReason.EXPIRED
@@ -0,0 +1,42 @@
+from datetime import datetime, UTC
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.cache.credential_codec import CredentialCodec
+
+
+class TestCredentialCodec:
+    def test_given_suspended_drivers_license_when_round_tripping_then_preserves_every_field(self):
+        license = DriversLicense("DL1", datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=UTC),
+                                 datetime(2030, 1, 1, tzinfo=UTC), ["A", "B"], "CA", "ON")
+        license.suspend("Audit")
+        license.set_version(7)
+        codec = CredentialCodec()
+
+        decoded = codec.decode(codec.encode(license))
+
+        assert isinstance(decoded, DriversLicense)
+        assert decoded.valid_from == license.valid_from
+        assert decoded.valid_until == license.valid_until
+        assert decoded.vehicle_classes == ["A", "B"]
+        assert decoded.issuing_region == "ON"
+        assert decoded.issuing_country == "ca"
+        assert decoded.status == CredentialStatus.SUSPENDED
+        assert decoded.suspension_reason == "Audit"
+        assert decoded.version == 7
+
+    def test_given_passport_when_encoding_then_payload_is_compact_and_round_trips(self):
+        passport = Passport("P1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC), "Canadian", "ca")
+        codec = CredentialCodec()
+
+        payload = codec.encode(passport)
+        decoded = codec.decode(payload)
+
+        assert b' ' not in payload
+        assert isinstance(decoded, Passport)
+        assert decoded.nationality == "Canadian"
+        assert decoded.status == CredentialStatus.ACTIVE
+
+    def test_given_payload_from_other_format_version_when_decoding_then_returns_none(self):
+        assert CredentialCodec().decode(b'[99,"passport"]') is None
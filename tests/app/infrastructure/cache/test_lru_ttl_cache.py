@@ -0,0 +1,76 @@
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLruTtlCache:
+    def test_given_cached_value_when_getting_then_returns_it_and_counts_hit(self):
+        cache = LruTtlCache(max_entries=10, max_bytes=1000, ttl_seconds=60, size_of=lambda v: 1)
+
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_given_full_cache_when_putting_then_evicts_least_recently_used(self):
+        cache = LruTtlCache(max_entries=2, max_bytes=1000, ttl_seconds=60, size_of=lambda v: 1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+
+    def test_given_byte_budget_when_putting_then_keeps_estimated_size_within_it(self):
+        cache = LruTtlCache(max_entries=100, max_bytes=250, ttl_seconds=60, size_of=lambda v: 100)
+
+        for key in range(5):
+            cache.put(key, key)
+
+        assert len(cache) == 2
+        assert cache.stats().size_bytes == 200
+
+    def test_given_expired_entry_when_getting_then_misses_and_counts_expiration(self):
+        clock = FakeClock()
+        cache = LruTtlCache(max_entries=10, max_bytes=1000, ttl_seconds=5, size_of=lambda v: 1, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 5
+
+        assert cache.get("a") is None
+        assert cache.stats().expirations == 1
+        assert len(cache) == 0
+
+    def test_given_cached_value_when_invalidating_then_removes_it(self):
+        cache = LruTtlCache(max_entries=10, max_bytes=1000, ttl_seconds=60, size_of=lambda v: 10)
+        cache.put("a", 1)
+
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+        assert cache.stats().size_bytes == 0
+
+    def test_given_keep_predicate_when_putting_then_leaves_only_matching_live_entries(self):
+        clock = FakeClock()
+        cache = LruTtlCache(max_entries=10, max_bytes=1000, ttl_seconds=60, size_of=lambda v: 1, clock=clock)
+        cache.put("a", 5)
+
+        cache.put("a", 3, keep=lambda current: current > 3)
+        assert cache.get("a") == 5
+        cache.put("a", 7, keep=lambda current: current > 7)
+        assert cache.get("a") == 7
+
+        clock.now = 61
+        cache.put("a", 1, keep=lambda current: current > 1)
+        assert cache.get("a") == 1
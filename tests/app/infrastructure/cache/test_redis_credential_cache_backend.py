@@ -0,0 +1,112 @@
+import json
+
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.cache.redis_credential_cache_backend import RedisCredentialCacheBackend
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+
+    def get(self, name):
+        return self.values.get(name)
+
+    def mget(self, names):
+        return [self.values.get(name) for name in names]
+
+    def set(self, name, value, ex=None):
+        self.values[name] = value
+        self.expirations[name] = ex
+
+    def eval(self, script, numkeys, name, value, version, ex, version_position, format_version):
+        """What the put script does server-side"""
+        cached = self.values.get(name)
+        if cached is not None:
+            try:
+                values = json.loads(cached)
+            except ValueError:
+                values = None
+            if isinstance(values, list) and values[0] == format_version and values[version_position - 1] > version:
+                return 0
+        self.set(name, value, ex=ex)
+        return 1
+
+    def delete(self, name):
+        self.values.pop(name, None)
+
+
+@pytest.fixture
+def passport():
+    return Passport("P1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC), "Canadian", "ca")
+
+
+@pytest.fixture
+def key():
+    return CredentialKey("P1", CredentialType.PASSPORT, "ca")
+
+
+class TestRedisCredentialCacheBackend:
+    def test_given_stored_credential_when_getting_then_decodes_it_and_sets_ttl(self, passport, key):
+        client = FakeRedis()
+        backend = RedisCredentialCacheBackend(client, ttl_seconds=30)
+
+        backend.put(key, passport)
+        cached = backend.get(key)
+
+        assert cached.credential_id == "P1"
+        assert client.expirations == {'cred:ca:passport:P1': 30}
+        assert backend.stats().hits == 1
+
+    def test_given_invalidated_credential_when_getting_many_then_reports_only_present_keys(self, passport, key):
+        backend = RedisCredentialCacheBackend(FakeRedis(), ttl_seconds=30)
+        other = CredentialKey("P2", CredentialType.PASSPORT, "ca")
+        backend.put(key, passport)
+        backend.put(other, passport)
+
+        backend.invalidate(other)
+        found = backend.get_many([key, other])
+
+        assert list(found) == [key]
+        assert (backend.stats().hits, backend.stats().misses) == (1, 1)
+
+    def test_given_unreachable_redis_when_reading_and_writing_then_behaves_as_miss(self, passport, key):
+        client = Mock()
+        client.get.side_effect = ConnectionError("down")
+        client.eval.side_effect = ConnectionError("down")
+        backend = RedisCredentialCacheBackend(client, ttl_seconds=30)
+
+        backend.put(key, passport)
+
+        assert backend.get(key) is None
+        assert backend.stats().misses == 1
+
+    def test_given_malformed_payload_when_getting_many_then_counts_it_as_miss(self, passport, key):
+        client = FakeRedis()
+        backend = RedisCredentialCacheBackend(client, ttl_seconds=30)
+        other = CredentialKey("P2", CredentialType.PASSPORT, "ca")
+        backend.put(key, passport)
+        client.values['cred:ca:passport:P2'] = b'not json'
+
+        found = backend.get_many([key, other])
+
+        assert list(found) == [key]
+        assert (backend.stats().hits, backend.stats().misses) == (1, 1)
+
+    def test_given_newer_cached_version_when_putting_older_one_then_keeps_newer(self, passport, key):
+        backend = RedisCredentialCacheBackend(FakeRedis(), ttl_seconds=30)
+        newer = Passport("P1", passport.valid_from, passport.valid_until, "Canadian", "ca")
+        newer.revoke("Fraud")
+        newer.set_version(2)
+
+        backend.put(key, newer)
+        backend.put(key, passport)
+
+        assert backend.get(key).status == CredentialStatus.REVOKED
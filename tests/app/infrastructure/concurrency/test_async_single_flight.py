@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.concurrency.async_single_flight import AsyncSingleFlight
+from app.infrastructure.exceptions.coalesced_read_timeout_exception import CoalescedReadTimeoutException
+
+
+class TestAsyncSingleFlight:
+    @pytest.mark.asyncio
+    async def test_given_concurrent_calls_with_same_key_when_awaiting_then_executes_once(self):
+        flight = AsyncSingleFlight(timeout_seconds=5)
+        executions = []
+
+        async def read():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", read) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert len(executions) == 1
+        assert flight.stats().shared == 4
+
+    @pytest.mark.asyncio
+    async def test_given_failing_execution_when_calls_are_coalesced_then_every_caller_gets_the_error(self):
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_given_slow_execution_when_waiter_times_out_then_shared_call_keeps_running(self):
+        flight = AsyncSingleFlight(timeout_seconds=0.01)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "value"
+
+        first = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(CoalescedReadTimeoutException):
+            await flight.do("key", slow)
+        release.set()
+
+        assert await first == "value"
+        assert flight.stats().timeouts == 1
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.concurrency.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    def test_given_concurrent_loads_when_batch_fills_then_sends_one_batch_without_waiting_for_window(self):
+        batches = []
+        batcher = MicroBatcher(lambda keys: batches.append(keys) or {key: key.upper() for key in keys},
+                               window_seconds=5, max_batch_size=3)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(batcher.load, ["a", "b", "c"]))
+
+        assert results == ["A", "B", "C"]
+        assert len(batches) == 1
+        assert sorted(batches[0]) == ["a", "b", "c"]
+        assert batcher.stats().average_batch_size == 3
+
+    def test_given_duplicate_keys_when_batching_then_requests_each_key_once(self):
+        batches = []
+        batcher = MicroBatcher(lambda keys: batches.append(keys) or {key: 1 for key in keys},
+                               window_seconds=5, max_batch_size=2)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(batcher.load, ["a", "a", "b"]))
+
+        assert results == [1, 1, 1]
+        assert sorted(batches[0]) == ["a", "b"]
+
+    def test_given_key_missing_from_results_when_loading_then_returns_none(self):
+        batcher = MicroBatcher(lambda keys: {}, window_seconds=0)
+
+        assert batcher.load("a") is None
+
+    def test_given_failing_batch_when_loading_then_every_caller_gets_the_error(self):
+
+        def fail(keys):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(fail, window_seconds=5, max_batch_size=2)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(batcher.load, key) for key in ["a", "b"]]
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_given_invalid_max_batch_size_when_creating_then_raises(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda keys: {}, max_batch_size=0)
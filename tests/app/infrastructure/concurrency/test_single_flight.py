@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.concurrency.single_flight import SingleFlight
+from app.infrastructure.exceptions.coalesced_read_timeout_exception import CoalescedReadTimeoutException
+
+
+def _run_concurrently(flight: SingleFlight, callers: int, fn):
+    release = threading.Event()
+    started = threading.Event()
+
+    def leader_fn():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        leader = pool.submit(flight.do, "key", leader_fn)
+        started.wait(5)
+        waiters = [pool.submit(flight.do, "key", fn) for _ in range(callers - 1)]
+        while flight.stats().shared < callers - 1:
+            threading.Event().wait(0.001)
+        release.set()
+        return [leader] + waiters
+
+
+class TestSingleFlight:
+    def test_given_concurrent_calls_with_same_key_when_calling_then_executes_once(self):
+        flight = SingleFlight(timeout_seconds=5)
+        executions = []
+
+        futures = _run_concurrently(flight, 4, lambda: executions.append(1) or "value")
+
+        assert [future.result() for future in futures] == ["value"] * 4
+        assert len(executions) == 1
+        assert flight.stats().executions == 1
+        assert flight.stats().coalescing_ratio == 0.75
+
+    def test_given_failing_execution_when_calls_are_coalesced_then_every_caller_gets_the_error(self):
+        flight = SingleFlight(timeout_seconds=5)
+
+        def fail():
+            raise ValueError("boom")
+
+        futures = _run_concurrently(flight, 3, fail)
+
+        for future in futures:
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    def test_given_completed_call_when_calling_again_then_executes_again(self):
+        flight = SingleFlight()
+
+        flight.do("key", lambda: 1)
+
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.stats().shared == 0
+
+    def test_given_slow_execution_when_waiter_times_out_then_raises_timeout(self):
+        flight = SingleFlight(timeout_seconds=0.01)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            started.wait(5)
+            with pytest.raises(CoalescedReadTimeoutException):
+                flight.do("key", slow)
+            release.set()
+            assert leader.result() == "value"
+        assert flight.stats().timeouts == 1
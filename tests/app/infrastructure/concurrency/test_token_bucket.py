@@ -0,0 +1,43 @@
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_given_tokens_available_when_acquiring_then_does_not_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_given_bucket_overdrawn_when_acquiring_then_waits_until_debt_is_repaid(self):
+        clock = FakeClock()
+        bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+
+        bucket.take(30)
+        bucket.acquire()
+
+        assert sum(clock.sleeps) == 2.0
+
+    def test_given_idle_time_when_refilling_then_never_exceeds_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(10, capacity=5, clock=clock, sleep=clock.sleep)
+
+        clock.now = 100
+        bucket.take(6)
+        bucket.acquire()
+
+        assert sum(clock.sleeps) == 0.1
@@ -0,0 +1,81 @@
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.credential_item_migrator import CredentialItemMigrator
+
+
+@pytest.fixture
+def v1_item():
+    return {
+        'PK': 'CRED#CA#test-issuer-123',
+        'SK': 'METADATA#drivers_license',
+        'credential_type': 'drivers_license',
+        'credential_id': 'test-issuer-123',
+        'valid_from': '2024-01-01T00:00:00+00:00',
+        'valid_until': '2029-12-31T00:00:00+00:00',
+        'status': 'active',
+        'vehicle_classes': ['A', 'B'],
+        'issuing_country': 'CA',
+        'issuing_region': 'ON',
+        'suspension_reason': None,
+        'revocation_reason': None,
+        'version': 3
+    }
+
+
+def migrator_for(table: Mock) -> CredentialItemMigrator:
+    db_manager = Mock()
+    db_manager.client.Table.return_value = table
+    return CredentialItemMigrator(db_manager)
+
+
+def conditional_check_failed() -> ClientError:
+    return ClientError({'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'}}, 'PutItem')
+
+
+class TestCredentialItemMigrator:
+    def test_given_v1_items_when_migrating_then_rewrites_them_conditionally(self, v1_item):
+        table = Mock()
+        table.scan.return_value = {'Items': [v1_item]}
+
+        result = migrator_for(table).migrate(total_segments=2, workers=2)
+
+        assert result.migrated == 2
+        put_args = table.put_item.call_args.kwargs
+        assert put_args['Item']['fmt'] == 2
+        assert put_args['Item']['valid_from'] == 1704067200
+        assert put_args['Item']['GSI1SK'] == 'active#drivers_license#test-issuer-123'
+        assert 'version = :version' in put_args['ConditionExpression']
+        assert put_args['ExpressionAttributeValues'] == {':version': 3}
+        assert 'attribute_not_exists(#fmt)' in table.scan.call_args.kwargs['FilterExpression']
+
+    def test_given_item_changed_since_scan_when_migrating_then_skips_it(self, v1_item):
+        table = Mock()
+        table.scan.return_value = {'Items': [v1_item]}
+        table.put_item.side_effect = conditional_check_failed()
+
+        result = migrator_for(table).migrate(total_segments=1, workers=1)
+
+        assert (result.migrated, result.skipped) == (0, 1)
+
+    def test_given_unversioned_item_when_migrating_then_requires_version_to_still_be_absent(self, v1_item):
+        del v1_item['version']
+        table = Mock()
+        table.scan.side_effect = [{'Items': [], 'LastEvaluatedKey': {'PK': 'x'}}, {'Items': [v1_item]}]
+
+        migrator_for(table).migrate(total_segments=1, workers=1)
+
+        put_args = table.put_item.call_args.kwargs
+        assert put_args['ConditionExpression'].endswith('attribute_not_exists(version)')
+        assert 'ExpressionAttributeValues' not in put_args
+        assert table.scan.call_args.kwargs['ExclusiveStartKey'] == {'PK': 'x'}
+
+    def test_given_scan_failure_when_migrating_then_raises_database_exception(self):
+        table = Mock()
+        table.scan.side_effect = ClientError({'Error': {'Code': 'InternalServerError', 'Message': 'boom'}}, 'Scan')
+
+        with pytest.raises(DatabaseException):
+            migrator_for(table).migrate(total_segments=1, workers=1)
@@ -0,0 +1,124 @@
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.infrastructure.concurrency.token_bucket import TokenBucket
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.persistence.dynamodb.credential_table_exporter import CredentialTableExporter
+
+
+def dynamo_item(credential_id: str) -> dict:
+    return {
+        'PK': f'CRED#CA#{credential_id}',
+        'SK': 'METADATA#drivers_license',
+        'credential_type': 'drivers_license',
+        'credential_id': credential_id,
+        'valid_from': '2024-01-01T00:00:00+00:00',
+        'valid_until': '2029-12-31T00:00:00+00:00',
+        'status': 'active',
+        'vehicle_classes': ['A', 'B'],
+        'issuing_country': 'CA',
+        'issuing_region': 'ON',
+        'suspension_reason': None,
+        'revocation_reason': None,
+        'version': 1
+    }
+
+
+def paged_scan(pages: dict[int, list[list[str]]], fail_after: int | None = None):
+    """Serves each segment's pages in order, using the page index as the scan cursor."""
+    calls = []
+
+    def scan(**kwargs):
+        calls.append(kwargs)
+        if fail_after is not None and len(calls) > fail_after:
+            raise ClientError({'Error': {'Code': 'InternalServerError', 'Message': 'boom'}}, 'Scan')
+        segment_pages = pages[kwargs['Segment']]
+        index = kwargs.get('ExclusiveStartKey', {}).get('page', 0)
+        response = {'Items': [dynamo_item(i) for i in segment_pages[index]],
+                    'ConsumedCapacity': {'CapacityUnits': 0.5}}
+        if index + 1 < len(segment_pages):
+            response['LastEvaluatedKey'] = {'page': index + 1}
+        return response
+
+    return scan, calls
+
+
+def exporter_for(scan, **kwargs) -> CredentialTableExporter:
+    db_manager = Mock()
+    db_manager.client.Table.return_value.scan.side_effect = scan
+    return CredentialTableExporter(db_manager, **kwargs)
+
+
+def exported_ids(result) -> list[str]:
+    ids = []
+    for path in result.files:
+        with gzip.open(path, 'rt') as lines:
+            ids.extend(json.loads(line)['credential_id'] for line in lines)
+    return sorted(ids)
+
+
+class TestCredentialTableExporter:
+    def test_given_segmented_table_when_exporting_then_writes_every_credential_once(self, tmp_path):
+        scan, calls = paged_scan({0: [['a', 'b'], ['c']], 1: [[], ['d']]})
+
+        result = exporter_for(scan).export(tmp_path, total_segments=2, workers=2)
+
+        assert exported_ids(result) == ['a', 'b', 'c', 'd']
+        assert result.credentials == 4
+        assert result.consumed_read_capacity == 2.0
+        assert {call['TotalSegments'] for call in calls} == {2}
+        assert all(call['ReturnConsumedCapacity'] == 'TOTAL' for call in calls)
+
+    def test_given_exported_line_when_decoding_then_matches_api_fields(self, tmp_path):
+        scan, _ = paged_scan({0: [['a']]})
+
+        result = exporter_for(scan).export(tmp_path, total_segments=1, workers=1)
+
+        with gzip.open(result.files[0], 'rt') as lines:
+            record = json.loads(lines.readline())
+        assert record['credential_type'] == 'drivers_license'
+        assert record['status'] == 'active'
+        assert record['valid_until'] == '2029-12-31T00:00:00+00:00'
+        assert 'PK' not in record
+
+    def test_given_interrupted_export_when_rerunning_then_resumes_without_duplicates(self, tmp_path):
+        pages = {0: [['a'], ['b'], ['c']]}
+        failing_scan, _ = paged_scan(pages, fail_after=2)
+
+        with pytest.raises(DatabaseException):
+            exporter_for(failing_scan).export(tmp_path, total_segments=1, workers=1)
+
+        scan, calls = paged_scan(pages)
+        result = exporter_for(scan).export(tmp_path, total_segments=1, workers=1)
+
+        assert exported_ids(result) == ['a', 'b', 'c']
+        assert [call['ExclusiveStartKey'] for call in calls] == [{'page': 2}]
+
+    def test_given_finished_export_when_rerunning_then_does_not_scan_again(self, tmp_path):
+        scan, calls = paged_scan({0: [['a']]})
+        exporter_for(scan).export(tmp_path, total_segments=1, workers=1)
+        calls.clear()
+
+        exporter_for(scan).export(tmp_path, total_segments=1, workers=1)
+
+        assert calls == []
+
+    def test_given_checkpoint_with_other_segment_count_when_exporting_then_raises_value_error(self, tmp_path):
+        scan, _ = paged_scan({0: [['a']], 1: [['b']]})
+        exporter_for(scan).export(tmp_path, total_segments=2, workers=1)
+
+        with pytest.raises(ValueError):
+            exporter_for(scan).export(tmp_path, total_segments=1, workers=1)
+
+    def test_given_rate_limiter_when_exporting_then_charges_consumed_capacity(self, tmp_path):
+        scan, _ = paged_scan({0: [['a'], ['b']]})
+        limiter = Mock(spec=TokenBucket)
+
+        exporter_for(scan, read_capacity_limiter=limiter).export(tmp_path, total_segments=1, workers=1)
+
+        assert limiter.acquire.call_count == 2
+        assert [call.args[0] for call in limiter.take.call_args_list] == [0.5, 0.5]
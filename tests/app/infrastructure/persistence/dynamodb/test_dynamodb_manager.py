@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+
+
+class TestDynamoDBManager:
+    def test_given_environment_when_loading_config_then_reads_transport_settings(self, monkeypatch):
+        monkeypatch.setenv('DYNAMODB_MAX_RETRIES', '4')
+        monkeypatch.setenv('DYNAMODB_RETRY_MODE', 'Adaptive')
+        monkeypatch.setenv('DYNAMODB_CONNECT_TIMEOUT_SECONDS', '0.5')
+        monkeypatch.setenv('DYNAMODB_READ_TIMEOUT_SECONDS', '2')
+        monkeypatch.setenv('DYNAMODB_MAX_POOL_CONNECTIONS', '64')
+        monkeypatch.setenv('DYNAMODB_TCP_KEEPALIVE', 'false')
+
+        config = DatabaseConfig.from_environment()
+
+        assert (config.max_retries, config.retry_mode, config.connect_timeout_seconds, config.read_timeout_seconds,
+                config.max_pool_connections, config.tcp_keepalive) == (4, 'adaptive', 0.5, 2.0, 64, False)
+
+    def test_given_config_when_creating_manager_then_passes_transport_settings_to_boto3(self):
+        config = DatabaseConfig(endpoint_url=None, region='us-east-1', access_key_id=None, secret_access_key=None,
+                                retry_mode='adaptive', max_pool_connections=64)
+
+        with patch('boto3.resource') as mock_resource:
+            DynamoDBManager(config)
+
+        client_config = mock_resource.call_args.kwargs['config']
+        assert client_config.retries == {'max_attempts': 2, 'mode': 'adaptive'}
+        assert (client_config.connect_timeout, client_config.read_timeout) == (1.0, 3.0)
+        assert (client_config.max_pool_connections, client_config.tcp_keepalive) == (64, True)
+
+    def test_given_unknown_retry_mode_when_loading_config_then_raises(self, monkeypatch):
+        monkeypatch.setenv('DYNAMODB_RETRY_MODE', 'legacy-ish')
+
+        with pytest.raises(ValueError, match="Unknown DynamoDB retry mode"):
+            DatabaseConfig.from_environment()
+        with pytest.raises(ValueError, match="Unknown DynamoDB retry mode"):
+            DatabaseConfig(endpoint_url=None, region='us-east-1', access_key_id=None, secret_access_key=None,
+                           retry_mode='legacy-ish')
@@ -0,0 +1,37 @@
+import pytest
+
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
+
+LAST_KEY = {'PK': 'CRED#ca#P1', 'SK': 'METADATA#passport', 'GSI1PK': 'COUNTRY#ca', 'GSI1SK': 'active#passport#P1'}
+
+
+class TestPaginationCursorCodec:
+    def test_given_encoded_key_when_decoding_with_same_scope_then_returns_key(self):
+        codec = PaginationCursorCodec(b'secret')
+
+        assert codec.decode(codec.encode(LAST_KEY, 'ca|active|'), 'ca|active|') == LAST_KEY
+
+    def test_given_tampered_payload_when_decoding_then_raises_invalid_cursor(self):
+        codec = PaginationCursorCodec(b'secret')
+        other = codec.encode({**LAST_KEY, 'PK': 'CRED#ca#P9'}, 'ca||')
+        cursor = codec.encode(LAST_KEY, 'ca||')
+
+        with pytest.raises(InvalidCursorException):
+            codec.decode(other.split('.')[0] + '.' + cursor.split('.')[1], 'ca||')
+
+    def test_given_cursor_from_other_scope_when_decoding_then_raises_invalid_cursor(self):
+        codec = PaginationCursorCodec(b'secret')
+
+        with pytest.raises(InvalidCursorException):
+            codec.decode(codec.encode(LAST_KEY, 'ca|active|'), 'us|active|')
+
+    def test_given_cursor_signed_with_other_secret_when_decoding_then_raises_invalid_cursor(self):
+        cursor = PaginationCursorCodec(b'other').encode(LAST_KEY, 'ca||')
+
+        with pytest.raises(InvalidCursorException):
+            PaginationCursorCodec(b'secret').decode(cursor, 'ca||')
+
+    def test_given_garbage_when_decoding_then_raises_invalid_cursor(self):
+        with pytest.raises(InvalidCursorException):
+            PaginationCursorCodec(b'secret').decode('not-a-cursor', 'ca||')
@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.exceptions.schema_mismatch_exception import SchemaMismatchException
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.schema_bootstrap import SchemaBootstrap
+from app.infrastructure.persistence.dynamodb.table_definitions import TableDefinition
+
+
+@pytest.fixture
+def mock_client():
+    return Mock()
+
+
+@pytest.fixture
+def bootstrap(mock_client):
+    with patch('boto3.resource') as mock_resource:
+        mock_resource.return_value.meta.client = mock_client
+        config = DatabaseConfig(
+            endpoint_url='http://localhost:8000',
+            region='local',
+            access_key_id='dummy',
+            secret_access_key='dummy',
+            credentials_table='test-credentials',
+            api_keys_table='test-api-keys'
+        )
+        return SchemaBootstrap(DynamoDBManager(config), poll_interval=0)
+
+
+def not_found():
+    return ClientError(
+        error_response={'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Not found'}},
+        operation_name='DescribeTable'
+    )
+
+
+def existing_table(definition: TableDefinition, indexes: list[str] | None = None) -> dict:
+    return {'Table': {
+        'KeySchema': definition.key_schema,
+        'GlobalSecondaryIndexes': [{'IndexName': name, 'IndexStatus': 'ACTIVE'} for name in indexes or []]
+    }}
+
+
+class TestSchemaBootstrap:
+    def test_given_missing_tables_when_ensuring_then_creates_configured_tables(self, bootstrap, mock_client):
+        mock_client.describe_table.side_effect = not_found()
+
+        created = bootstrap.ensure_tables()
+
+        assert created == ['test-credentials', 'test-api-keys']
+        created_names = [call.kwargs['TableName'] for call in mock_client.create_table.call_args_list]
+        assert created_names == ['test-credentials', 'test-api-keys']
+        mock_client.get_waiter.assert_called_with('table_exists')
+
+    def test_given_existing_tables_when_ensuring_then_only_verifies(self, bootstrap, mock_client):
+        mock_client.describe_table.side_effect = [
+            existing_table(d, [index['IndexName'] for index in d.global_secondary_indexes]) for d in bootstrap.definitions]
+
+        created = bootstrap.ensure_tables()
+
+        assert created == []
+        mock_client.create_table.assert_not_called()
+
+    def test_given_table_with_wrong_key_schema_when_ensuring_then_raises_schema_mismatch(self, bootstrap, mock_client):
+        mock_client.describe_table.return_value = {'Table': {'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}}
+
+        with pytest.raises(SchemaMismatchException):
+            bootstrap.ensure_tables()
+
+    def test_given_missing_index_when_ensuring_then_creates_index(self, bootstrap, mock_client):
+        definition = TableDefinition(
+            name='test-credentials',
+            key_schema=bootstrap.definitions[0].key_schema,
+            attribute_definitions=bootstrap.definitions[0].attribute_definitions,
+            global_secondary_indexes=[{'IndexName': 'TestIndex'}]
+        )
+        bootstrap._definitions = [definition]
+        mock_client.describe_table.side_effect = [existing_table(definition), existing_table(definition, ['TestIndex'])]
+
+        created = bootstrap.ensure_tables()
+
+        assert created == ['test-credentials/TestIndex']
+        update_args = mock_client.update_table.call_args.kwargs
+        assert update_args['GlobalSecondaryIndexUpdates'] == [{'Create': {'IndexName': 'TestIndex'}}]
+
+    def test_given_describe_error_when_ensuring_then_raises_database_exception(self, bootstrap, mock_client):
+        mock_client.describe_table.side_effect = ClientError(
+            error_response={'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}},
+            operation_name='DescribeTable'
+        )
+
+        with pytest.raises(DatabaseException):
+            bootstrap.ensure_tables()
@@ -0,0 +1,39 @@
+import json
+from datetime import datetime, UTC
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.mappers.credential_mapper import ITEM_FORMAT_ATTRIBUTE, ITEM_FORMAT_VERSION
+from app.infrastructure.persistence.mappers.credential_record_codec import CredentialRecordCodec
+
+
+class TestCredentialRecordCodec:
+    def test_given_suspended_drivers_license_when_round_tripping_then_preserves_every_field(self):
+        license = DriversLicense("DL1", datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=UTC),
+                                 datetime(2030, 1, 1, tzinfo=UTC), ["A", "B"], "CA", "ON")
+        license.suspend("Audit")
+        license.set_version(7)
+        codec = CredentialRecordCodec()
+
+        decoded = codec.decode(codec.encode(license))
+
+        assert decoded.snapshot() == license.snapshot()
+
+    def test_given_credential_when_encoding_then_record_carries_the_item_format_version(self):
+        passport = Passport("P1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC), "Canadian", "ca")
+
+        record = json.loads(CredentialRecordCodec().encode(passport))
+
+        assert record[ITEM_FORMAT_ATTRIBUTE] == {'N': str(ITEM_FORMAT_VERSION)}
+
+    def test_given_legacy_cache_array_when_decoding_then_reads_it(self):
+        payload = json.dumps([1, "drivers_license", "DL1", "ca", 1704067200000000, 1893456000000000, "suspended",
+                              "Audit", None, 3, ["A"], "ON"]).encode()
+
+        decoded = CredentialRecordCodec().decode(payload)
+
+        assert isinstance(decoded, DriversLicense)
+        assert (decoded.status, decoded.suspension_reason, decoded.version) == (CredentialStatus.SUSPENDED, "Audit", 3)
+        assert decoded.valid_until == datetime(2030, 1, 1, tzinfo=UTC)
+        assert (decoded.vehicle_classes, decoded.issuing_region) == (["A"], "ON")
@@ -1,5 +1,8 @@
 import pytest
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeSerializer
 
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.models.passport import Passport
@@ -47,8 +50,17 @@ class TestPassportMapper:
         passport.revoke("Test revocation")
         dynamo_item = mapper.to_dynamo(passport)
 
-        assert dynamo_item['status'] == CredentialStatus.REVOKED.value
+        assert dynamo_item['status'] == 'R'
         assert dynamo_item['revocation_reason'] == "Test revocation"
+        assert 'EXP_PK' not in dynamo_item
+
+    def test_given_active_passport_when_converting_to_dynamo_then_includes_index_keys(self, passport):
+        dynamo_item = PassportMapper().to_dynamo(passport)
+
+        assert dynamo_item['GSI1PK'] == 'COUNTRY#ca'
+        assert dynamo_item['GSI1SK'] == 'active#passport#test-issuer-789'
+        assert dynamo_item['EXP_PK'].startswith('EXPIRY#')
+        assert dynamo_item['EXP_SK'] == '2034-12-31T00:00:00+00:00#ca#passport#test-issuer-789'
 
     def test_given_revoked_dynamo_item_when_converting_to_domain_then_includes_revocation_details(
             self, passport):
@@ -66,4 +78,91 @@ class TestPassportMapper:
 
         credential = mapper.to_domain(dynamo_item)
         assert credential.status == CredentialStatus.REVOKED
-        assert credential.revocation_reason == "Test revocation"
\ No newline at end of file
+        assert credential.revocation_reason == "Test revocation"
+    def test_given_passport_when_converting_to_dynamo_then_uses_compact_encoding(self, passport):
+        dynamo_item = PassportMapper().to_dynamo(passport)
+
+        assert dynamo_item['fmt'] == 2
+        assert dynamo_item['valid_from'] == 1704067200
+        assert dynamo_item['status'] == 'A'
+        assert 'suspension_reason' not in dynamo_item
+        assert 'revocation_reason' not in dynamo_item
+
+    def test_given_compact_item_as_read_by_boto3_when_converting_to_domain_then_decodes_numbers(self, passport):
+        dynamo_item = {
+            'credential_id': 'test-issuer-789',
+            'valid_from': Decimal('1704067200'),
+            'valid_until': Decimal('2050000000.25'),
+            'nationality': 'Canadian',
+            'issuing_country': 'CA',
+            'status': 'S',
+            'suspension_reason': 'lost',
+            'version': Decimal('3')
+        }
+
+        credential = PassportMapper().to_domain(dynamo_item)
+
+        assert credential.valid_from == datetime(2024, 1, 1, tzinfo=UTC)
+        assert credential.valid_until == datetime.fromtimestamp(2050000000, UTC) + timedelta(milliseconds=250)
+        assert credential.status == CredentialStatus.SUSPENDED
+        assert credential.revocation_reason is None
+        assert credential.version == 3
+
+    def test_given_v1_item_when_upgrading_then_re_encodes_and_keeps_other_attributes(self):
+        mapper = PassportMapper()
+        v1_item = {
+            'PK': 'CRED#ca#test-issuer-789',
+            'SK': 'METADATA#passport',
+            'credential_type': 'passport',
+            'credential_id': 'test-issuer-789',
+            'valid_from': '2024-01-01T00:00:00+00:00',
+            'valid_until': '2034-12-31T00:00:00+00:00',
+            'nationality': 'Canadian',
+            'issuing_country': 'ca',
+            'status': 'revoked',
+            'revocation_reason': 'fraud',
+            'suspension_reason': None,
+            'created_at': '2024-02-01T12:30:00.500000+00:00',
+            'version': 2
+        }
+
+        upgraded = mapper.upgrade_item(v1_item)
+
+        assert upgraded['fmt'] == 2
+        assert upgraded['status'] == 'R'
+        assert upgraded['created_at'] == Decimal('1706790600.5')
+        assert 'suspension_reason' not in upgraded
+        assert upgraded['GSI1SK'] == 'revoked#passport#test-issuer-789'
+        assert 'EXP_PK' not in upgraded
+        assert mapper.to_domain(upgraded).revocation_reason == 'fraud'
+
+    def test_given_passport_when_converting_to_wire_then_matches_serialized_dynamo_item(self, passport):
+        mapper = PassportMapper()
+        passport.suspend("lost")
+
+        wire_item = mapper.to_wire(passport)
+        serialized = {name: TypeSerializer().serialize(value) for name, value in mapper.to_dynamo(passport).items()}
+
+        for timestamp in ('created_at', 'updated_at'):
+            assert wire_item.pop(timestamp).keys() == serialized.pop(timestamp).keys() == {'N'}
+        assert wire_item == serialized
+        assert mapper.from_wire(mapper.to_wire(passport)).snapshot() == passport.snapshot()
+
+    def test_given_v1_wire_item_when_converting_from_wire_then_decodes_strings_and_nulls(self):
+        wire_item = {
+            'credential_id': {'S': 'test-issuer-789'},
+            'valid_from': {'S': '2024-01-01T00:00:00+00:00'},
+            'valid_until': {'N': '2050000000.25'},
+            'nationality': {'S': 'Canadian'},
+            'issuing_country': {'S': 'CA'},
+            'status': {'S': 'revoked'},
+            'suspension_reason': {'NULL': True},
+            'revocation_reason': {'S': 'fraud'}
+        }
+
+        credential = PassportMapper().from_wire(wire_item)
+
+        assert credential.valid_from == datetime(2024, 1, 1, tzinfo=UTC)
+        assert credential.valid_until == datetime.fromtimestamp(2050000000, UTC) + timedelta(milliseconds=250)
+        assert (credential.status, credential.revocation_reason) == (CredentialStatus.REVOKED, "fraud")
+        assert (credential.suspension_reason, credential.version) == (None, 1)
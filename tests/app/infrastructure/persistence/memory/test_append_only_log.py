@@ -0,0 +1,25 @@
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+
+
+class TestAppendOnlyLog:
+    def test_given_appended_records_when_replaying_new_log_then_returns_them_in_order(self, tmp_path):
+        log = AppendOnlyLog(tmp_path / 'store.log')
+        log.append(['put', 1], lambda: [])
+        log.append(['put', 2], lambda: [])
+        log.close()
+
+        assert list(AppendOnlyLog(tmp_path / 'store.log').replay()) == [['put', 1], ['put', 2]]
+
+    def test_given_snapshot_due_when_appending_then_replaces_log_with_current_state(self, tmp_path):
+        log = AppendOnlyLog(tmp_path / 'store.log', snapshot_every=2)
+        log.append(['put', 1], lambda: [])
+        log.append(['put', 2], lambda: [['put', 'state']])
+        log.append(['put', 3], lambda: [])
+        log.close()
+
+        assert list(AppendOnlyLog(tmp_path / 'store.log').replay()) == [['put', 'state'], ['put', 3]]
+
+    def test_given_torn_last_line_when_replaying_then_skips_it(self, tmp_path):
+        (tmp_path / 'store.log').write_text('["put",1]\n["put",')
+
+        assert list(AppendOnlyLog(tmp_path / 'store.log').replay()) == [['put', 1]]
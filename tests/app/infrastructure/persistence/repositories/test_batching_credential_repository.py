@@ -0,0 +1,66 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.concurrency.micro_batcher import MicroBatcher
+from app.infrastructure.persistence.repositories.batching_credential_repository import BatchingCredentialRepository
+
+
+@pytest.fixture
+def passport():
+    return Passport(
+        credential_id="P123",
+        valid_from=datetime(2024, 1, 1, tzinfo=UTC),
+        valid_until=datetime(2034, 1, 1, tzinfo=UTC),
+        nationality="Canadian",
+        issuing_country="ca"
+    )
+
+
+@pytest.fixture
+def inner(passport):
+    repository = Mock()
+    repository.get_credentials.side_effect = lambda keys: {
+        key: passport for key in keys if key.credential_id == "P123"}
+    return repository
+
+
+@pytest.fixture
+def repo(inner):
+    return BatchingCredentialRepository(inner, MicroBatcher(inner.get_credentials, window_seconds=0))
+
+
+class TestBatchingCredentialRepository:
+    def test_given_point_read_when_getting_credential_then_loads_through_batch_get(self, repo, inner, passport):
+        assert repo.get_credential("P123", CredentialType.PASSPORT, "ca").snapshot() == passport.snapshot()
+
+        inner.get_credentials.assert_called_once_with([CredentialKey("P123", CredentialType.PASSPORT, "ca")])
+        inner.get_credential.assert_not_called()
+
+    def test_given_key_missing_from_batch_when_getting_credential_then_raises_not_found(self, repo):
+        with pytest.raises(CredentialNotFoundException):
+            repo.get_credential("P404", CredentialType.PASSPORT, "ca")
+
+    def test_given_fields_read_when_getting_fields_then_projects_the_batched_credential(self, repo, inner):
+        fields = repo.get_credential_fields("P123", CredentialType.PASSPORT, "ca", ["status", "nationality"])
+
+        assert fields == {"status": CredentialStatus.ACTIVE, "nationality": "Canadian"}
+        inner.get_credential_fields.assert_not_called()
+
+    def test_given_same_key_twice_in_one_batch_when_one_caller_mutates_then_other_is_unaffected(self, inner):
+        repo = BatchingCredentialRepository(inner, MicroBatcher(inner.get_credentials, window_seconds=0.05))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(repo.get_credential, "P123", CredentialType.PASSPORT, "ca") for _ in range(2)]
+            first, second = [future.result() for future in futures]
+        first.expire()
+
+        assert first is not second
+        assert second.status == CredentialStatus.ACTIVE
+        inner.get_credentials.assert_called_once()
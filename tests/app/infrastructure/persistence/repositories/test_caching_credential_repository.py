@@ -0,0 +1,160 @@
+import threading
+
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.cache.in_process_credential_cache_backend import InProcessCredentialCacheBackend
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.persistence.repositories.caching_credential_repository import (
+    CachingCredentialRepository, estimate_credential_size)
+
+
+@pytest.fixture
+def passport():
+    return Passport(
+        credential_id="P123",
+        valid_from=datetime(2024, 1, 1, tzinfo=UTC),
+        valid_until=datetime(2034, 1, 1, tzinfo=UTC),
+        nationality="Canadian",
+        issuing_country="ca"
+    )
+
+
+@pytest.fixture
+def inner(passport):
+    repository = Mock()
+    repository.get_credential.return_value = passport
+    return repository
+
+
+@pytest.fixture
+def repo(inner):
+    return CachingCredentialRepository(inner, InProcessCredentialCacheBackend(
+        LruTtlCache(max_entries=100, max_bytes=1_000_000, ttl_seconds=60, size_of=estimate_credential_size)))
+
+
+class TestCachingCredentialRepository:
+    def test_given_repeated_reads_when_getting_credential_then_hits_inner_repository_once(self, repo, inner):
+        first = repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+        second = repo.get_credential("P123", CredentialType.PASSPORT, "CA")
+
+        inner.get_credential.assert_called_once()
+        assert first is not second
+        assert second.credential_id == "P123"
+        assert repo.cache_stats().hits == 1
+
+    def test_given_caller_mutates_result_when_reading_again_then_cache_is_unaffected(self, repo):
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca").suspend("local change")
+
+        assert repo.get_credential("P123", CredentialType.PASSPORT, "ca").status == CredentialStatus.ACTIVE
+
+    def test_given_cached_credential_when_getting_fields_then_answers_from_cache(self, repo, inner):
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+
+        fields = repo.get_credential_fields("P123", CredentialType.PASSPORT, "ca", ['status', 'version'])
+
+        assert fields == {'status': CredentialStatus.ACTIVE, 'version': 1}
+        inner.get_credential_fields.assert_not_called()
+        inner.get_credential.assert_called_once()
+
+    def test_given_transition_when_reading_then_returns_updated_credential(self, repo, inner, passport):
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+        revoked = Passport("P123", passport.valid_from, passport.valid_until, "Canadian", "ca")
+        revoked.revoke("Fraud")
+        inner.transition_credential_status.return_value = revoked
+
+        repo.transition_credential_status("P123", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "Fraud")
+
+        assert repo.get_credential("P123", CredentialType.PASSPORT, "ca").status == CredentialStatus.REVOKED
+        inner.get_credential.assert_called_once()
+
+    def test_given_version_conflict_when_updating_then_drops_cached_entry(self, repo, inner, passport):
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+        inner.update_credential_status.side_effect = CredentialVersionConflictException("P123", 1, 2)
+
+        with pytest.raises(CredentialVersionConflictException):
+            repo.update_credential_status(passport)
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+
+        assert inner.get_credential.call_count == 2
+
+    def test_given_partially_cached_keys_when_batch_getting_then_fetches_only_misses(self, repo, inner, passport):
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+        cached_key = CredentialKey("P123", CredentialType.PASSPORT, "ca")
+        missing_key = CredentialKey("P999", CredentialType.PASSPORT, "ca")
+        inner.get_credentials.return_value = {}
+
+        found = repo.get_credentials([cached_key, missing_key])
+
+        inner.get_credentials.assert_called_once_with([missing_key])
+        assert list(found) == [cached_key]
+
+    def test_given_slow_read_overlapping_revoke_when_read_finishes_then_cache_keeps_revoked_credential(
+            self, repo, inner, passport):
+        read_started, release_read = threading.Event(), threading.Event()
+
+        def slow_read(*args):
+            read_started.set()
+            release_read.wait(5)
+            return passport
+
+        inner.get_credential.side_effect = slow_read
+        revoked = Passport("P123", passport.valid_from, passport.valid_until, "Canadian", "ca")
+        revoked.revoke("Fraud")
+        revoked.set_version(2)
+        inner.transition_credential_status.return_value = revoked
+
+        reader = threading.Thread(target=repo.get_credential, args=("P123", CredentialType.PASSPORT, "ca"))
+        reader.start()
+        read_started.wait(5)
+        repo.transition_credential_status("P123", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "Fraud")
+        release_read.set()
+        reader.join(5)
+
+        assert repo.get_credential("P123", CredentialType.PASSPORT, "ca").status == CredentialStatus.REVOKED
+        assert inner.get_credential.call_count == 1
+
+    def test_given_slow_read_overlapping_failed_write_when_read_finishes_then_does_not_fill_cache(
+            self, repo, inner, passport):
+        read_started, release_read = threading.Event(), threading.Event()
+
+        def slow_read(*args):
+            read_started.set()
+            release_read.wait(5)
+            return passport
+
+        inner.get_credential.side_effect = slow_read
+        inner.transition_credential_status.side_effect = CredentialVersionConflictException("P123", 1, 2)
+
+        reader = threading.Thread(target=repo.get_credential, args=("P123", CredentialType.PASSPORT, "ca"))
+        reader.start()
+        read_started.wait(5)
+        with pytest.raises(CredentialVersionConflictException):
+            repo.transition_credential_status("P123", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED,
+                                              "Fraud", expected_version=1)
+        release_read.set()
+        reader.join(5)
+        inner.get_credential.side_effect = None
+
+        repo.get_credential("P123", CredentialType.PASSPORT, "ca")
+
+        assert inner.get_credential.call_count == 2
+
+    def test_given_newer_cached_version_when_putting_older_one_then_keeps_newer(self, passport):
+        backend = InProcessCredentialCacheBackend(
+            LruTtlCache(max_entries=10, max_bytes=1_000_000, ttl_seconds=60, size_of=estimate_credential_size))
+        key = CredentialKey("P123", CredentialType.PASSPORT, "ca")
+        newer = Passport("P123", passport.valid_from, passport.valid_until, "Canadian", "ca")
+        newer.revoke("Fraud")
+        newer.set_version(2)
+
+        backend.put(key, newer)
+        backend.put(key, passport)
+
+        assert backend.get(key).status == CredentialStatus.REVOKED
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, Mock
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.concurrency.async_single_flight import AsyncSingleFlight
+from app.infrastructure.concurrency.single_flight import SingleFlight
+from app.infrastructure.persistence.repositories.coalescing_async_credential_repository import (
+    CoalescingAsyncCredentialRepository)
+from app.infrastructure.persistence.repositories.coalescing_credential_repository import CoalescingCredentialRepository
+
+
+@pytest.fixture
+def passport():
+    return Passport(
+        credential_id="P123",
+        valid_from=datetime(2024, 1, 1, tzinfo=UTC),
+        valid_until=datetime(2034, 1, 1, tzinfo=UTC),
+        nationality="Canadian",
+        issuing_country="ca"
+    )
+
+
+class TestCoalescingCredentialRepository:
+    def test_given_concurrent_reads_of_same_credential_when_getting_then_reads_once(self, passport):
+        release = threading.Event()
+        inner = Mock()
+        inner.get_credential.side_effect = lambda *args: release.wait(5) and passport
+        repo = CoalescingCredentialRepository(inner, SingleFlight(timeout_seconds=5))
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(repo.get_credential, "P123", CredentialType.PASSPORT, country)
+                       for country in ("ca", "CA", "ca")]
+            while repo.coalescing_stats().shared < 2:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        inner.get_credential.assert_called_once()
+        assert all(result.credential_id == "P123" for result in results)
+        assert len({id(result) for result in results}) == 3
+
+    def test_given_shared_drivers_license_when_one_caller_mutates_it_then_others_are_unaffected(self):
+        release = threading.Event()
+        drivers_license = DriversLicense("DL-1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                                         ["A", "B"], "ca", "on")
+        inner = Mock()
+        inner.get_credential.side_effect = lambda *args: release.wait(5) and drivers_license
+        repo = CoalescingCredentialRepository(inner, SingleFlight(timeout_seconds=5))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(repo.get_credential, "DL-1", CredentialType.DRIVERS_LICENSE, "ca")
+                       for _ in range(2)]
+            while repo.coalescing_stats().shared < 1:
+                threading.Event().wait(0.001)
+            release.set()
+            first, second = [future.result() for future in futures]
+
+        first.vehicle_classes.append("C")
+        first.suspend("lost")
+
+        assert second.vehicle_classes == ["A", "B"]
+        assert second.status == CredentialStatus.ACTIVE
+        inner.get_credential.assert_called_once()
+
+    def test_given_different_fields_when_getting_fields_then_reads_are_not_shared(self):
+        inner = Mock()
+        inner.get_credential_fields.return_value = {"status": "active"}
+        repo = CoalescingCredentialRepository(inner, SingleFlight())
+
+        repo.get_credential_fields("P123", CredentialType.PASSPORT, "ca", ["status"])
+        repo.get_credential_fields("P123", CredentialType.PASSPORT, "ca", ["status", "valid_until"])
+
+        assert inner.get_credential_fields.call_count == 2
+
+    def test_given_write_when_transitioning_then_delegates(self):
+        inner = Mock()
+        repo = CoalescingCredentialRepository(inner, SingleFlight())
+
+        repo.transition_credential_status("P123", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "lost", 3)
+
+        inner.transition_credential_status.assert_called_once_with(
+            "P123", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "lost", 3)
+
+
+class TestCoalescingAsyncCredentialRepository:
+    @pytest.mark.asyncio
+    async def test_given_concurrent_reads_of_same_credential_when_getting_then_reads_once(self, passport):
+        async def read(*args):
+            await asyncio.sleep(0.01)
+            return passport
+
+        inner = Mock()
+        inner.get_credential = AsyncMock(side_effect=read)
+        repo = CoalescingAsyncCredentialRepository(inner, AsyncSingleFlight(timeout_seconds=5))
+
+        results = await asyncio.gather(
+            *(repo.get_credential("P123", CredentialType.PASSPORT, "ca") for _ in range(4)))
+
+        inner.get_credential.assert_awaited_once()
+        assert all(result.credential_id == "P123" for result in results)
+        assert repo.coalescing_stats().shared == 3
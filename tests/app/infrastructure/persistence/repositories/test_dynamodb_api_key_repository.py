@@ -3,6 +3,7 @@ from datetime import datetime, UTC
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
 from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
 from app.infrastructure.exceptions.database_exception import DatabaseException
 from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
@@ -112,4 +113,85 @@ class TestDynamoDBApiKeyRepository:
         with pytest.raises(DatabaseException) as exc_info:
             repo.update_api_key("test-key", datetime.now(UTC))
 
-        assert "Error updating API key" in str(exc_info.value)
\ No newline at end of file
+        assert "Error updating API key" in str(exc_info.value)
+    def test_given_existing_api_key_when_deleting_then_returns_true(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().delete_item.return_value = {'Attributes': {'key': 'test-key'}}
+
+        assert repo.delete_api_key("test-key") is True
+        delete_args = mock_db_manager._dynamodb.Table().delete_item.call_args.kwargs
+        assert delete_args['Key'] == {'PK': 'APIKEY#test-key', 'SK': 'METADATA'}
+
+    def test_given_nonexistent_api_key_when_deleting_then_returns_false(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().delete_item.return_value = {}
+
+        assert repo.delete_api_key("missing-key") is False
+
+    def test_given_usage_when_recording_then_adds_counts_in_one_transaction(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 42,
+                            datetime(2025, 1, 1, 10, 30, tzinfo=UTC))
+
+        assert repo.record_api_key_usage([usage]) == []
+
+        items = mock_db_manager._dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        assert [item['Update']['Key']['SK'] for item in items] == ['METADATA', 'USAGE#2025-01-01T10:00:00+00:00']
+        assert all(item['Update']['ExpressionAttributeValues'][':count'] == 42 for item in items)
+        assert items[0]['Update']['ConditionExpression'] == 'attribute_exists(PK)'
+
+    def test_given_usage_when_recording_then_only_moves_last_used_forward(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 42,
+                            datetime(2025, 1, 1, 10, 30, tzinfo=UTC))
+
+        repo.record_api_key_usage([usage])
+
+        calls = mock_db_manager._dynamodb.Table().update_item.call_args_list
+        assert [c.kwargs['Key']['SK'] for c in calls] == ['METADATA', 'USAGE#2025-01-01T10:00:00+00:00']
+        assert all('last_used < :timestamp' in c.kwargs['ConditionExpression'] for c in calls)
+        assert calls[0].kwargs['ExpressionAttributeValues'][':timestamp'] == '2025-01-01T10:30:00+00:00'
+
+    def test_given_newer_last_used_stored_when_recording_usage_then_succeeds(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Stale'}},
+            operation_name='UpdateItem'
+        )
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 1, datetime(2025, 1, 1, 10, tzinfo=UTC))
+
+        assert repo.record_api_key_usage([usage]) == []
+
+    def test_given_revoked_key_when_recording_usage_then_skips_it(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.meta.client.transact_write_items.side_effect = ClientError(
+            error_response={'Error': {'Code': 'TransactionCanceledException', 'Message': 'Cancelled'},
+                            'CancellationReasons': [{'Code': 'ConditionalCheckFailed'}, {'Code': 'None'}]},
+            operation_name='TransactWriteItems'
+        )
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 1, datetime(2025, 1, 1, 10, tzinfo=UTC))
+
+        assert repo.record_api_key_usage([usage]) == []
+        mock_db_manager._dynamodb.Table().update_item.assert_not_called()
+
+    def test_given_throttled_transaction_when_recording_usage_then_returns_it_as_failed(self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.meta.client.transact_write_items.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Slow down'}},
+            operation_name='TransactWriteItems'
+        )
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 1, datetime(2025, 1, 1, 10, tzinfo=UTC))
+
+        assert repo.record_api_key_usage([usage]) == [usage]
+
+    def test_given_failed_last_used_write_when_recording_usage_then_retries_it_without_the_count(
+            self, mock_db_manager):
+        repo = DynamoDBApiKeyRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Slow down'}},
+            operation_name='UpdateItem'
+        )
+        usage = ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 5, datetime(2025, 1, 1, 10, tzinfo=UTC))
+
+        assert repo.record_api_key_usage([usage]) == [
+            ApiKeyUsage("test-key", datetime(2025, 1, 1, 10, tzinfo=UTC), 0, datetime(2025, 1, 1, 10, tzinfo=UTC))]
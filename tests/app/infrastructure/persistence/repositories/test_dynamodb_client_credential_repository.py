@@ -0,0 +1,82 @@
+from datetime import datetime, UTC
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.mappers.passport_mapper import PassportMapper
+from app.infrastructure.persistence.repositories.dynamodb_client_credential_repository import (
+    DynamoDBClientCredentialRepository)
+
+
+@pytest.fixture
+def mock_client():
+    return Mock()
+
+
+@pytest.fixture
+def repository(mock_client):
+    with patch('boto3.resource') as mock_resource:
+        mock_resource.return_value.meta.client = mock_client
+        db_manager = DynamoDBManager(DatabaseConfig(endpoint_url='http://localhost:8000', region='local',
+                                                    access_key_id='dummy', secret_access_key='dummy'))
+        return DynamoDBClientCredentialRepository(db_manager)
+
+
+def passport(credential_id: str = "P-1") -> Passport:
+    return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                    "Canadian", "ca")
+
+
+class TestDynamoDBClientCredentialRepository:
+    def test_given_wire_item_when_getting_credential_then_decodes_without_resource(self, repository, mock_client):
+        mock_client.get_item.return_value = {'Item': PassportMapper().to_wire(passport())}
+
+        credential = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+        assert credential.snapshot() == passport().snapshot()
+        mock_client.get_item.assert_called_once_with(
+            TableName='Credentials', Key={'PK': {'S': 'CRED#ca#P-1'}, 'SK': {'S': 'METADATA#passport'}})
+
+    def test_given_missing_item_when_getting_credential_then_raises_not_found(self, repository, mock_client):
+        mock_client.get_item.return_value = {}
+
+        with pytest.raises(CredentialNotFoundException):
+            repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+    def test_given_credential_when_creating_then_puts_wire_item(self, repository, mock_client):
+        repository.create_credential(passport())
+
+        item = mock_client.put_item.call_args.kwargs['Item']
+        assert (item['PK'], item['status'], item['fmt']) == ({'S': 'CRED#ca#P-1'}, {'S': 'A'}, {'N': '2'})
+
+    def test_given_keys_when_getting_many_then_batches_wire_keys_on_client(self, repository, mock_client):
+        mock_client.batch_get_item.return_value = {'Responses': {'Credentials': [PassportMapper().to_wire(passport())]}}
+        found = CredentialKey("P-1", CredentialType.PASSPORT, "ca")
+        missing = CredentialKey("P-2", CredentialType.PASSPORT, "ca")
+
+        credentials = repository.get_credentials([found, missing])
+
+        assert list(credentials) == [found]
+        keys = mock_client.batch_get_item.call_args.kwargs['RequestItems']['Credentials']['Keys']
+        assert keys[1] == {'PK': {'S': 'CRED#ca#P-2'}, 'SK': {'S': 'METADATA#passport'}}
+
+    def test_given_page_with_last_key_when_listing_then_cursor_round_trips_as_wire_start_key(self, repository,
+                                                                                           mock_client):
+        last_key = {'PK': {'S': 'CRED#ca#P-1'}, 'SK': {'S': 'METADATA#passport'},
+                    'GSI1PK': {'S': 'COUNTRY#ca'}, 'GSI1SK': {'S': 'active#passport#P-1'}}
+        mock_client.query.return_value = {'Items': [PassportMapper().to_wire(passport())], 'LastEvaluatedKey': last_key}
+
+        first = repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1)
+        repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1, cursor=first.next_cursor)
+
+        second_call = mock_client.query.call_args.kwargs
+        assert [c.credential_id for c in first.credentials] == ["P-1"]
+        assert second_call['ExclusiveStartKey'] == last_key
+        assert second_call['ExpressionAttributeValues'] == {':pk': {'S': 'COUNTRY#ca'}, ':prefix': {'S': 'active#'}}
@@ -1,13 +1,20 @@
 import pytest
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
+from app.domain.enums.credential_status import CredentialStatus
 from app.domain.enums.credential_type import CredentialType
 from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential_key import CredentialKey
 from app.domain.models.drivers_license import DriversLicense
 from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+from app.infrastructure.persistence.dynamodb.backoff_policy import BackoffPolicy
 from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
+from app.infrastructure.persistence.dynamodb.pagination_cursor_codec import PaginationCursorCodec
 from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
 
 
@@ -147,4 +154,371 @@ class TestDynamoDBCredentialRepository:
         with pytest.raises(DatabaseException) as exc_info:
             repo.update_credential_status(sample_drivers_license)
 
-        assert "Error updating item in DynamoDB" in str(exc_info.value)
\ No newline at end of file
+        assert "Error updating item in DynamoDB" in str(exc_info.value)
+
+    def test_given_stale_version_when_updating_status_then_raises_version_conflict(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'},
+                            'Item': {'status': {'S': 'suspended'}, 'version': {'N': '3'}}},
+            operation_name='UpdateItem'
+        )
+
+        with pytest.raises(CredentialVersionConflictException) as exc_info:
+            repo.update_credential_status(sample_drivers_license)
+
+        assert exc_info.value.actual_version == 3
+        assert sample_drivers_license.version == 1
+
+    def test_given_current_version_when_updating_status_then_bumps_version(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        sample_drivers_license.set_version(2)
+
+        repo.update_credential_status(sample_drivers_license)
+
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['ConditionExpression'] == 'version = :expected_version'
+        assert update_args['ExpressionAttributeValues'][':expected_version'] == 2
+        assert update_args['ExpressionAttributeValues'][':next_version'] == 3
+        assert sample_drivers_license.version == 3
+
+    def test_given_configured_table_name_when_creating_repository_then_binds_without_creating_table(
+            self, mock_db_manager):
+        mock_db_manager._config.credentials_table = 'test-credentials'
+
+        DynamoDBCredentialRepository(mock_db_manager)
+
+        mock_db_manager._dynamodb.Table.assert_called_with('test-credentials')
+        mock_db_manager._dynamodb.create_table.assert_not_called()
+
+    def test_given_existing_and_missing_keys_when_batch_getting_then_returns_only_found_credentials(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        dynamo_item['PK'] = 'CRED#ca#test-issuer-123'
+        mock_db_manager._dynamodb.batch_get_item.return_value = {
+            'Responses': {'Credentials': [dynamo_item]},
+            'UnprocessedKeys': {}
+        }
+        found_key = CredentialKey("test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca")
+        missing_key = CredentialKey("missing", CredentialType.DRIVERS_LICENSE, "ca")
+
+        credentials = repo.get_credentials([found_key, missing_key, found_key])
+
+        assert list(credentials) == [found_key]
+        assert credentials[found_key].credential_id == "test-issuer-123"
+        request_keys = mock_db_manager._dynamodb.batch_get_item.call_args.kwargs['RequestItems']['Credentials']['Keys']
+        assert len(request_keys) == 2
+
+    def test_given_more_than_hundred_keys_when_batch_getting_then_chunks_requests(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.batch_get_item.return_value = {'Responses': {'Credentials': []}}
+        keys = [CredentialKey(f"id-{i}", CredentialType.PASSPORT, "ca") for i in range(250)]
+
+        repo.get_credentials(keys)
+
+        chunk_sizes = [len(call.kwargs['RequestItems']['Credentials']['Keys'])
+                       for call in mock_db_manager._dynamodb.batch_get_item.call_args_list]
+        assert chunk_sizes == [100, 100, 50]
+
+    def test_given_unprocessed_keys_when_batch_getting_then_retries_them(self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager, backoff_policy=BackoffPolicy(base_delay=0))
+        dynamo_item['PK'] = 'CRED#ca#test-issuer-123'
+        unprocessed = {'Credentials': {'Keys': [{'PK': dynamo_item['PK'], 'SK': dynamo_item['SK']}]}}
+        mock_db_manager._dynamodb.batch_get_item.side_effect = [
+            {'Responses': {'Credentials': []}, 'UnprocessedKeys': unprocessed},
+            {'Responses': {'Credentials': [dynamo_item]}, 'UnprocessedKeys': {}}
+        ]
+        key = CredentialKey("test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca")
+
+        credentials = repo.get_credentials([key])
+
+        assert key in credentials
+        assert mock_db_manager._dynamodb.batch_get_item.call_args_list[1].kwargs['RequestItems'] == unprocessed
+
+    def test_given_keys_never_processed_when_batch_getting_then_raises_database_exception(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager, backoff_policy=BackoffPolicy(max_attempts=2, base_delay=0))
+        unprocessed = {'Credentials': {'Keys': [{'PK': 'CRED#ca#id', 'SK': 'METADATA#passport'}]}}
+        mock_db_manager._dynamodb.batch_get_item.return_value = {
+            'Responses': {'Credentials': []}, 'UnprocessedKeys': unprocessed
+        }
+
+        with pytest.raises(DatabaseException) as exc_info:
+            repo.get_credentials([CredentialKey("id", CredentialType.PASSPORT, "ca")])
+
+        assert "unprocessed" in str(exc_info.value)
+
+    def test_given_many_credentials_when_creating_in_bulk_then_writes_25_item_chunks(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        credentials = [DriversLicense(f"id-{i}", sample_drivers_license.valid_from, sample_drivers_license.valid_until,
+                                      ["A"], "CA", "ON") for i in range(60)]
+
+        failed = repo.create_credentials(credentials)
+
+        assert failed == []
+        chunk_sizes = [len(call.kwargs['RequestItems']['Credentials'])
+                       for call in mock_db_manager._dynamodb.batch_write_item.call_args_list]
+        assert chunk_sizes == [25, 25, 10]
+
+    def test_given_repeated_key_when_creating_in_bulk_then_starts_new_chunk(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+
+        repo.create_credentials([sample_drivers_license, sample_drivers_license])
+
+        assert mock_db_manager._dynamodb.batch_write_item.call_count == 2
+
+    def test_given_items_left_unprocessed_when_creating_in_bulk_then_retries_and_returns_failures(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager, backoff_policy=BackoffPolicy(max_attempts=2, base_delay=0))
+        item = repo._mapperFactory.get_mapper(CredentialType.DRIVERS_LICENSE).to_dynamo(sample_drivers_license)
+        mock_db_manager._dynamodb.batch_write_item.return_value = {
+            'UnprocessedItems': {'Credentials': [{'PutRequest': {'Item': item}}]}
+        }
+
+        failed = repo.create_credentials([sample_drivers_license])
+
+        assert failed == [sample_drivers_license]
+        assert mock_db_manager._dynamodb.batch_write_item.call_count == 2
+
+
+    def test_given_suspension_when_transitioning_then_issues_one_conditional_update(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        dynamo_item.update(status='suspended', suspension_reason='Test suspension')
+        mock_db_manager._dynamodb.Table().update_item.return_value = {'Attributes': dynamo_item}
+
+        credential = repo.transition_credential_status(
+            "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.SUSPENDED, "Test suspension")
+
+        assert credential.status == CredentialStatus.SUSPENDED
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['ConditionExpression'] == (
+            'attribute_exists(PK) AND #status <> :forbidden0 AND #status <> :forbidden0_name'
+            ' AND #status <> :forbidden1 AND #status <> :forbidden1_name')
+        assert update_args['ExpressionAttributeValues'][':forbidden0'] == 'R'
+        assert update_args['ExpressionAttributeValues'][':forbidden0_name'] == 'revoked'
+        assert update_args['ExpressionAttributeValues'][':forbidden1'] == 'E'
+        assert update_args['ExpressionAttributeValues'][':status'] == 'S'
+        assert update_args['ExpressionAttributeValues'][':reason'] == 'Test suspension'
+        mock_db_manager._dynamodb.Table().get_item.assert_not_called()
+
+    def test_given_reinstatement_when_transitioning_then_removes_suspension_reason_instead_of_storing_null(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.return_value = {'Attributes': dynamo_item}
+
+        repo.transition_credential_status(
+            "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.ACTIVE, None)
+
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['UpdateExpression'].endswith(' REMOVE suspension_reason')
+        assert None not in update_args['ExpressionAttributeValues'].values()
+
+    def test_given_compact_item_when_transition_is_rejected_then_decodes_status_code(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'},
+                            'Item': {'status': {'S': 'R'}}},
+            operation_name='UpdateItem'
+        )
+
+        with pytest.raises(InvalidCredentialStateException, match="Cannot suspend a revoked credential"):
+            repo.transition_credential_status(
+                "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.SUSPENDED, "reason")
+
+    def test_given_revoked_credential_when_suspending_then_raises_invalid_state(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'},
+                            'Item': {'status': {'S': 'revoked'}}},
+            operation_name='UpdateItem'
+        )
+
+        with pytest.raises(InvalidCredentialStateException, match="Cannot suspend a revoked credential"):
+            repo.transition_credential_status(
+                "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.SUSPENDED, "reason")
+
+    def test_given_missing_credential_when_transitioning_then_raises_not_found(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'}},
+            operation_name='UpdateItem'
+        )
+        mock_db_manager._dynamodb.Table().get_item.return_value = {}
+
+        with pytest.raises(CredentialNotFoundException):
+            repo.transition_credential_status(
+                "missing", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.REVOKED, "reason")
+
+    def test_given_expected_version_when_transitioning_then_conditions_on_version(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        dynamo_item.update(status='revoked', revocation_reason='reason', version=5)
+        mock_db_manager._dynamodb.Table().update_item.return_value = {'Attributes': dynamo_item}
+
+        credential = repo.transition_credential_status(
+            "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.REVOKED, "reason",
+            expected_version=4)
+
+        assert credential.version == 5
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['ConditionExpression'] == 'attribute_exists(PK) AND (version = :expected_version)'
+        assert update_args['ExpressionAttributeValues'][':expected_version'] == 4
+
+    def test_given_stale_expected_version_when_transitioning_then_raises_version_conflict(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.side_effect = ClientError(
+            error_response={'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Failed'},
+                            'Item': {'status': {'S': 'active'}, 'version': {'N': '7'}}},
+            operation_name='UpdateItem'
+        )
+
+        with pytest.raises(CredentialVersionConflictException) as exc_info:
+            repo.transition_credential_status(
+                "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.SUSPENDED, "reason",
+                expected_version=6)
+
+        assert exc_info.value.actual_version == 7
+
+    def test_given_fields_when_getting_credential_fields_then_projects_and_decodes_only_those(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().get_item.return_value = {
+            'Item': {'PK': 'CRED#ca#test-issuer-123', 'status': 'suspended', 'valid_until': '2029-12-31T00:00:00+00:00'}}
+
+        fields = repo.get_credential_fields(
+            "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", ['status', 'valid_until', 'version'])
+
+        assert fields == {'status': CredentialStatus.SUSPENDED,
+                          'valid_until': datetime(2029, 12, 31, tzinfo=UTC),
+                          'version': 1}
+        get_args = mock_db_manager._dynamodb.Table().get_item.call_args.kwargs
+        assert get_args['ProjectionExpression'] == '#pk, #f0, #f1, #f2'
+        assert get_args['ExpressionAttributeNames'] == {
+            '#pk': 'PK', '#f0': 'status', '#f1': 'valid_until', '#f2': 'version'}
+
+    def test_given_missing_credential_when_getting_credential_fields_then_raises_not_found(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().get_item.return_value = {}
+
+        with pytest.raises(CredentialNotFoundException):
+            repo.get_credential_fields("missing", CredentialType.DRIVERS_LICENSE, "ca", ['status'])
+
+    def test_given_field_of_other_type_when_getting_credential_fields_then_raises_value_error(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+
+        with pytest.raises(ValueError, match="nationality"):
+            repo.get_credential_fields("test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", ['nationality'])
+
+        mock_db_manager._dynamodb.Table().get_item.assert_not_called()
+
+    def test_given_status_and_type_when_listing_then_queries_index_by_sort_key_prefix(self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().query.return_value = {'Items': [dynamo_item]}
+
+        page = repo.list_credentials("ca", CredentialStatus.ACTIVE, CredentialType.DRIVERS_LICENSE, limit=10)
+
+        assert [credential.credential_id for credential in page.credentials] == ["test-issuer-123"]
+        assert page.next_cursor is None
+        query_args = mock_db_manager._dynamodb.Table().query.call_args.kwargs
+        assert query_args['IndexName'] == 'CountryStatusIndex'
+        assert query_args['Limit'] == 10
+        assert query_args['ExpressionAttributeValues'] == {':pk': 'COUNTRY#ca', ':prefix': 'active#drivers_license#'}
+        assert 'FilterExpression' not in query_args
+
+    def test_given_type_without_status_when_listing_then_filters_on_type(self, mock_db_manager):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().query.return_value = {'Items': []}
+
+        repo.list_credentials("ca", credential_type=CredentialType.PASSPORT)
+
+        query_args = mock_db_manager._dynamodb.Table().query.call_args.kwargs
+        assert query_args['KeyConditionExpression'] == 'GSI1PK = :pk'
+        assert query_args['FilterExpression'] == 'credential_type = :type'
+
+    def test_given_next_cursor_when_listing_next_page_then_resumes_from_last_key(self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager, cursor_codec=PaginationCursorCodec(b'secret'))
+        last_key = {'PK': dynamo_item['PK'], 'SK': dynamo_item['SK'], 'GSI1PK': 'COUNTRY#ca', 'GSI1SK': 'active#x'}
+        mock_db_manager._dynamodb.Table().query.return_value = {'Items': [dynamo_item], 'LastEvaluatedKey': last_key}
+
+        first = repo.list_credentials("ca", CredentialStatus.ACTIVE, limit=1)
+        repo.list_credentials("ca", CredentialStatus.ACTIVE, limit=1, cursor=first.next_cursor)
+
+        assert mock_db_manager._dynamodb.Table().query.call_args.kwargs['ExclusiveStartKey'] == last_key
+
+    def test_given_cursor_of_other_filter_when_listing_then_raises_invalid_cursor(self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().query.return_value = {
+            'Items': [dynamo_item], 'LastEvaluatedKey': {'PK': dynamo_item['PK'], 'SK': dynamo_item['SK']}}
+        cursor = repo.list_credentials("ca", CredentialStatus.ACTIVE).next_cursor
+
+        with pytest.raises(InvalidCursorException):
+            repo.list_credentials("ca", CredentialStatus.REVOKED, cursor=cursor)
+
+    def test_given_several_pages_when_iterating_credentials_then_follows_cursors_to_the_end(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().query.side_effect = [
+            {'Items': [dynamo_item], 'LastEvaluatedKey': {'PK': dynamo_item['PK'], 'SK': dynamo_item['SK']}},
+            {'Items': [dynamo_item]}
+        ]
+
+        credentials = list(repo.iter_credentials("ca", page_size=1))
+
+        assert len(credentials) == 2
+        assert mock_db_manager._dynamodb.Table().query.call_count == 2
+
+    def test_given_status_transition_when_transitioning_then_moves_credential_in_status_index(self, mock_db_manager,
+                                                                                            dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().update_item.return_value = {'Attributes': {**dynamo_item, 'status': 'revoked'}}
+
+        repo.transition_credential_status("test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca",
+                                          CredentialStatus.REVOKED, "fraud")
+
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert 'GSI1SK = :gsi1sk' in update_args['UpdateExpression']
+        assert update_args['ExpressionAttributeValues'][':gsi1sk'] == 'revoked#drivers_license#test-issuer-123'
+
+    def test_given_expiry_when_transitioning_then_removes_credential_from_expiry_index_and_sets_ttl(
+            self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager, archive_expired_after=timedelta(days=90))
+        mock_db_manager._dynamodb.Table().update_item.return_value = {'Attributes': {**dynamo_item, 'status': 'expired'}}
+
+        credential = repo.transition_credential_status(
+            "test-issuer-123", CredentialType.DRIVERS_LICENSE, "ca", CredentialStatus.EXPIRED, None)
+
+        assert credential.status == CredentialStatus.EXPIRED
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['UpdateExpression'].endswith(' REMOVE EXP_PK, EXP_SK')
+        assert 'archive_at = :archive_at' in update_args['UpdateExpression']
+        assert ':reason' not in update_args['ExpressionAttributeValues']
+
+    def test_given_expiry_shard_when_listing_expiring_then_range_queries_expiry_index(self, mock_db_manager, dynamo_item):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        mock_db_manager._dynamodb.Table().query.return_value = {'Items': [dynamo_item]}
+
+        page = repo.list_expiring_credentials(3, datetime(2030, 1, 1, tzinfo=UTC),
+                                              valid_until_from=datetime(2029, 1, 1, tzinfo=UTC))
+
+        assert len(page.credentials) == 1
+        query_args = mock_db_manager._dynamodb.Table().query.call_args.kwargs
+        assert query_args['IndexName'] == 'ExpiryIndex'
+        assert query_args['KeyConditionExpression'] == 'EXP_PK = :pk AND EXP_SK BETWEEN :from AND :before'
+        assert query_args['ExpressionAttributeValues'] == {
+            ':pk': 'EXPIRY#03', ':from': '2029-01-01T00:00:00+00:00', ':before': '2030-01-01T00:00:00+00:00'}
+
+    def test_given_revoked_credential_when_saving_status_then_removes_it_from_expiry_index(
+            self, mock_db_manager, sample_drivers_license):
+        repo = DynamoDBCredentialRepository(mock_db_manager)
+        sample_drivers_license.revoke("fraud")
+
+        repo.update_credential_status(sample_drivers_license)
+
+        update_args = mock_db_manager._dynamodb.Table().update_item.call_args.kwargs
+        assert update_args['UpdateExpression'].endswith(' REMOVE suspension_reason, EXP_PK, EXP_SK')
+        assert update_args['ExpressionAttributeValues'][':gsi1sk'] == 'revoked#drivers_license#test-issuer-123'
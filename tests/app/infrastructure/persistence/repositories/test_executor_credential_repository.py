@@ -0,0 +1,39 @@
+import threading
+import pytest
+from unittest.mock import Mock
+
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.infrastructure.persistence.blocking_call_executor import BlockingCallExecutor
+from app.infrastructure.persistence.repositories.executor_credential_repository import ExecutorCredentialRepository
+
+
+@pytest.fixture
+def executor():
+    executor = BlockingCallExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+class TestExecutorCredentialRepository:
+    @pytest.mark.asyncio
+    async def test_given_blocking_repository_when_getting_credential_then_runs_off_the_event_loop(self, executor):
+        calling_threads = []
+        repository = Mock()
+        repository.get_credential.side_effect = lambda *args: calling_threads.append(threading.current_thread()) or "credential"
+
+        result = await ExecutorCredentialRepository(repository, executor).get_credential(
+            "test-id", CredentialType.PASSPORT, "ca")
+
+        assert result == "credential"
+        assert calling_threads[0] is not threading.current_thread()
+        repository.get_credential.assert_called_once_with("test-id", CredentialType.PASSPORT, "ca")
+
+    @pytest.mark.asyncio
+    async def test_given_repository_error_when_getting_credential_then_propagates_exception(self, executor):
+        repository = Mock()
+        repository.get_credential.side_effect = CredentialNotFoundException("test-id", "passport")
+
+        with pytest.raises(CredentialNotFoundException):
+            await ExecutorCredentialRepository(repository, executor).get_credential(
+                "test-id", CredentialType.PASSPORT, "ca")
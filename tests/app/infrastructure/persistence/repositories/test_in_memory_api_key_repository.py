@@ -0,0 +1,43 @@
+from datetime import datetime, UTC
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+from app.infrastructure.persistence.repositories.in_memory_api_key_repository import InMemoryApiKeyRepository
+
+
+class TestInMemoryApiKeyRepository:
+    def test_given_stored_key_when_recording_usage_then_updates_last_used(self):
+        repository = InMemoryApiKeyRepository()
+        api_key = ApiKey.generate("test")
+        repository.store_api_key(api_key)
+        used_at = datetime(2025, 1, 1, tzinfo=UTC)
+
+        failed = repository.record_api_key_usage([
+            ApiKeyUsage(api_key.key, used_at, 3, used_at),
+            ApiKeyUsage("revoked-key", used_at, 1, used_at)
+        ])
+
+        assert failed == []
+        assert repository.get_api_key(api_key.key).last_used == used_at
+        assert repository.get_api_key("revoked-key") is None
+
+    def test_given_deleted_key_when_deleting_again_then_returns_false(self):
+        repository = InMemoryApiKeyRepository()
+        api_key = ApiKey.generate()
+        repository.store_api_key(api_key)
+
+        assert repository.delete_api_key(api_key.key) is True
+        assert repository.delete_api_key(api_key.key) is False
+
+    def test_given_log_when_restarting_then_restores_stored_and_deleted_keys(self, tmp_path):
+        repository = InMemoryApiKeyRepository(AppendOnlyLog(tmp_path / 'api_keys.log'))
+        kept, deleted = ApiKey.generate("kept"), ApiKey.generate()
+        repository.store_api_key(kept)
+        repository.store_api_key(deleted)
+        repository.delete_api_key(deleted.key)
+
+        restarted = InMemoryApiKeyRepository(AppendOnlyLog(tmp_path / 'api_keys.log'))
+
+        assert restarted.get_api_key(kept.key) == kept
+        assert restarted.get_api_key(deleted.key) is None
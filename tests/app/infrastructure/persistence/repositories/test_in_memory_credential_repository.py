@@ -0,0 +1,161 @@
+import json
+from datetime import datetime, UTC
+
+import pytest
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+from app.infrastructure.persistence.memory.append_only_log import AppendOnlyLog
+from app.infrastructure.persistence.repositories.in_memory_credential_repository import InMemoryCredentialRepository
+
+
+def passport(credential_id: str, valid_until: datetime = datetime(2034, 1, 1, tzinfo=UTC),
+             issuing_country: str = "ca") -> Passport:
+    return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), valid_until, "Canadian", issuing_country)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryCredentialRepository()
+
+
+class TestInMemoryCredentialRepository:
+    def test_given_stored_credential_when_getting_then_returns_independent_copy(self, repository):
+        repository.create_credential(passport("P-1"))
+
+        first = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        first.suspend("lost")
+
+        assert repository.get_credential("P-1", CredentialType.PASSPORT, "ca").status == CredentialStatus.ACTIVE
+
+    def test_given_missing_credential_when_getting_then_raises_not_found(self, repository):
+        with pytest.raises(CredentialNotFoundException):
+            repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+    def test_given_stored_credentials_when_getting_many_then_omits_missing_keys(self, repository):
+        repository.create_credentials([passport("P-1")])
+        found = CredentialKey("P-1", CredentialType.PASSPORT, "ca")
+        missing = CredentialKey("P-2", CredentialType.PASSPORT, "ca")
+
+        assert list(repository.get_credentials([found, missing])) == [found]
+
+    def test_given_fields_when_getting_credential_fields_then_returns_only_those(self, repository):
+        repository.create_credential(passport("P-1"))
+
+        fields = repository.get_credential_fields("P-1", CredentialType.PASSPORT, "ca", ["status", "version"])
+
+        assert fields == {"status": CredentialStatus.ACTIVE, "version": 1}
+
+    def test_given_credentials_when_listing_by_status_then_pages_through_matches_in_index_order(self, repository):
+        for credential_id in ["P-3", "P-1", "P-2"]:
+            repository.create_credential(passport(credential_id))
+        repository.create_credential(passport("P-9", issuing_country="us"))
+        repository.transition_credential_status("P-2", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        first = repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1)
+        second = repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1, cursor=first.next_cursor)
+
+        assert [c.credential_id for c in first.credentials] == ["P-1"]
+        assert [c.credential_id for c in second.credentials] == ["P-3"]
+        assert second.next_cursor is None
+
+    def test_given_type_filter_without_status_when_listing_then_returns_only_that_type(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.create_credential(DriversLicense("D-1", datetime(2024, 1, 1, tzinfo=UTC),
+                                                    datetime(2030, 1, 1, tzinfo=UTC), ["A"], "ca", "on"))
+
+        page = repository.list_credentials("ca", credential_type=CredentialType.DRIVERS_LICENSE)
+
+        assert [c.credential_id for c in page.credentials] == ["D-1"]
+
+    def test_given_cursor_for_other_filter_when_listing_then_raises_invalid_cursor(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.create_credential(passport("P-2"))
+        cursor = repository.list_credentials("ca", limit=1).next_cursor
+
+        with pytest.raises(InvalidCursorException):
+            repository.list_credentials("ca", CredentialStatus.ACTIVE, cursor=cursor)
+
+    def test_given_expiring_credentials_when_listing_then_returns_expirable_ones_in_range(self, repository):
+        repository.create_credential(passport("P-1", datetime(2025, 1, 1, tzinfo=UTC)))
+        repository.create_credential(passport("P-2", datetime(2025, 6, 1, tzinfo=UTC)))
+        repository.create_credential(passport("P-3", datetime(2026, 1, 1, tzinfo=UTC)))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        expiring = list(repository.iter_expiring_credentials(datetime(2026, 1, 1, tzinfo=UTC), page_size=1))
+
+        assert [c.credential_id for c in expiring] == ["P-2"]
+
+    def test_given_stale_version_when_updating_status_then_raises_version_conflict(self, repository):
+        repository.create_credential(passport("P-1"))
+        stale = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+
+        stale.revoke("fraud")
+        with pytest.raises(CredentialVersionConflictException):
+            repository.update_credential_status(stale)
+
+    def test_given_current_version_when_updating_status_then_saves_and_bumps_version(self, repository):
+        repository.create_credential(passport("P-1"))
+        credential = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+        credential.revoke("fraud")
+        repository.update_credential_status(credential)
+
+        assert credential.version == 2
+        stored = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        assert (stored.status, stored.revocation_reason, stored.version) == (CredentialStatus.REVOKED, "fraud", 2)
+
+    def test_given_revoked_credential_when_suspending_then_raises_invalid_state(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        with pytest.raises(InvalidCredentialStateException, match="Cannot suspend a revoked credential"):
+            repository.transition_credential_status(
+                "P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+
+    def test_given_reinstatement_when_transitioning_then_clears_suspension_reason(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+
+        credential = repository.transition_credential_status(
+            "P-1", CredentialType.PASSPORT, "ca", CredentialStatus.ACTIVE, None, expected_version=2)
+
+        assert (credential.status, credential.suspension_reason, credential.version) == (
+            CredentialStatus.ACTIVE, None, 3)
+
+    def test_given_log_when_restarting_then_replays_every_write(self, tmp_path):
+        repository = InMemoryCredentialRepository(AppendOnlyLog(tmp_path / 'credentials.log', snapshot_every=2))
+        repository.create_credential(passport("P-1"))
+        repository.create_credential(passport("P-2"))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        restarted = InMemoryCredentialRepository(AppendOnlyLog(tmp_path / 'credentials.log'))
+
+        assert restarted.get_credential("P-1", CredentialType.PASSPORT, "ca").status == CredentialStatus.REVOKED
+        assert [c.credential_id for c in restarted.list_credentials("ca", CredentialStatus.ACTIVE).credentials] == [
+            "P-2"]
+
+    def test_given_log_in_older_formats_when_restarting_then_replays_it(self, tmp_path):
+        # A CredentialCodec array as earlier logs stored it, then a version 1 item with ISO timestamps
+        legacy_record = json.dumps([1, "passport", "P-1", "ca", 1704067200000000, 2019686400000000, "revoked",
+                                    None, "fraud", 2, "Canadian"])
+        v1_item = {'credential_type': {'S': 'passport'}, 'credential_id': {'S': 'P-2'},
+                   'valid_from': {'S': '2024-01-01T00:00:00+00:00'}, 'valid_until': {'S': '2034-01-01T00:00:00+00:00'},
+                   'status': {'S': 'active'}, 'nationality': {'S': 'Canadian'}, 'issuing_country': {'S': 'ca'},
+                   'suspension_reason': {'NULL': True}, 'version': {'N': '1'}}
+        (tmp_path / 'credentials.log').write_text(json.dumps(legacy_record) + '\n' + json.dumps(v1_item) + '\n')
+
+        restarted = InMemoryCredentialRepository(AppendOnlyLog(tmp_path / 'credentials.log'))
+
+        revoked = restarted.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        assert (revoked.status, revoked.revocation_reason, revoked.version) == (CredentialStatus.REVOKED, "fraud", 2)
+        assert revoked.valid_until == datetime(2034, 1, 1, tzinfo=UTC)
+        assert restarted.get_credential("P-2", CredentialType.PASSPORT, "ca").snapshot() == passport("P-2").snapshot()
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.passport import Passport
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.persistence.repositories.negative_caching_credential_repository import (
+    NegativeCachingCredentialRepository, estimate_miss_size)
+
+
+@pytest.fixture
+def inner():
+    repository = Mock()
+    repository.get_credential.side_effect = CredentialNotFoundException("P404", "passport")
+    return repository
+
+
+@pytest.fixture
+def repo(inner):
+    return NegativeCachingCredentialRepository(
+        inner, LruTtlCache(max_entries=100, max_bytes=100_000, ttl_seconds=5, size_of=estimate_miss_size))
+
+
+class TestNegativeCachingCredentialRepository:
+    def test_given_repeated_lookups_of_missing_credential_when_getting_then_reads_once(self, repo, inner):
+        for _ in range(3):
+            with pytest.raises(CredentialNotFoundException):
+                repo.get_credential("P404", CredentialType.PASSPORT, "ca")
+
+        inner.get_credential.assert_called_once()
+        assert repo.cache_stats().hits == 2
+
+    def test_given_remembered_miss_when_creating_credential_then_it_is_visible_immediately(self, repo, inner):
+        with pytest.raises(CredentialNotFoundException):
+            repo.get_credential("P404", CredentialType.PASSPORT, "ca")
+        passport = Passport("P404", datetime(2024, 1, 1, tzinfo=UTC), datetime(2034, 1, 1, tzinfo=UTC),
+                            "Canadian", "CA")
+        inner.get_credential.side_effect = None
+        inner.get_credential.return_value = passport
+
+        repo.create_credential(passport)
+
+        assert repo.get_credential("P404", CredentialType.PASSPORT, "ca") is passport
+
+    def test_given_remembered_miss_when_getting_fields_then_raises_without_reading(self, repo, inner):
+        with pytest.raises(CredentialNotFoundException):
+            repo.get_credential("P404", CredentialType.PASSPORT, "ca")
+
+        with pytest.raises(CredentialNotFoundException):
+            repo.get_credential_fields("P404", CredentialType.PASSPORT, "ca", ['status'])
+
+        inner.get_credential_fields.assert_not_called()
+
+    def test_given_batch_with_missing_keys_when_getting_again_then_skips_them(self, repo, inner):
+        missing = CredentialKey("P404", CredentialType.PASSPORT, "ca")
+        present = CredentialKey("P1", CredentialType.PASSPORT, "ca")
+        inner.get_credentials.return_value = {present: Mock()}
+        repo.get_credentials([missing, present])
+
+        repo.get_credentials([missing, present])
+
+        assert inner.get_credentials.call_args.args[0] == [present]
@@ -0,0 +1,46 @@
+from datetime import datetime, UTC
+
+import pytest
+
+from app.domain.models.api_key import ApiKey
+from app.domain.models.api_key_usage import ApiKeyUsage
+from app.infrastructure.persistence.repositories.sqlite_api_key_repository import SqliteApiKeyRepository
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SqliteDatabase(str(tmp_path / 'credentials.db'))
+    yield database
+    database.close()
+
+
+class TestSqliteApiKeyRepository:
+    def test_given_stored_key_when_recording_usage_then_adds_counts_and_skips_unknown_keys(self, database):
+        repository = SqliteApiKeyRepository(database)
+        api_key = ApiKey.generate("test")
+        repository.store_api_key(api_key)
+        interval = datetime(2025, 1, 1, tzinfo=UTC)
+        used_at = datetime(2025, 1, 1, 0, 0, 30, tzinfo=UTC)
+
+        failed = repository.record_api_key_usage([
+            ApiKeyUsage(api_key.key, interval, 3, used_at),
+            ApiKeyUsage(api_key.key, interval, 2, used_at),
+            ApiKeyUsage("revoked-key", interval, 1, used_at)
+        ])
+
+        assert failed == []
+        assert repository.get_api_key(api_key.key).last_used == used_at
+        assert repository.get_api_key("revoked-key") is None
+        connection = database.connection()
+        assert connection.execute('SELECT request_count FROM api_keys').fetchall() == [(5,)]
+        assert connection.execute('SELECT key, request_count FROM api_key_usage').fetchall() == [(api_key.key, 5)]
+
+    def test_given_deleted_key_when_deleting_again_then_returns_false(self, database):
+        repository = SqliteApiKeyRepository(database)
+        api_key = ApiKey.generate()
+        repository.store_api_key(api_key)
+
+        assert repository.delete_api_key(api_key.key) is True
+        assert repository.delete_api_key(api_key.key) is False
+        assert repository.get_api_key(api_key.key) is None
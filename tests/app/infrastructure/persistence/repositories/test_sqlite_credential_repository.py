@@ -0,0 +1,179 @@
+import json
+import threading
+from datetime import datetime, UTC
+
+import pytest
+
+from app.domain.enums.credential_status import CredentialStatus
+from app.domain.enums.credential_type import CredentialType
+from app.domain.exceptions.credential.credential_not_found_exception import CredentialNotFoundException
+from app.domain.exceptions.credential.credential_version_conflict_exception import CredentialVersionConflictException
+from app.domain.exceptions.credential.invalid_credential_state_exception import InvalidCredentialStateException
+from app.domain.models.credential_key import CredentialKey
+from app.domain.models.drivers_license import DriversLicense
+from app.domain.models.passport import Passport
+from app.infrastructure.exceptions.invalid_cursor_exception import InvalidCursorException
+from app.infrastructure.persistence.repositories.sqlite_credential_repository import SqliteCredentialRepository
+from app.infrastructure.persistence.sqlite.sqlite_database import SqliteDatabase
+
+
+def passport(credential_id: str, valid_until: datetime = datetime(2034, 1, 1, tzinfo=UTC),
+             issuing_country: str = "ca") -> Passport:
+    return Passport(credential_id, datetime(2024, 1, 1, tzinfo=UTC), valid_until, "Canadian", issuing_country)
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SqliteDatabase(str(tmp_path / 'credentials.db'))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repository(database):
+    return SqliteCredentialRepository(database)
+
+
+class TestSqliteCredentialRepository:
+    def test_given_stored_credential_when_getting_then_round_trips_every_field(self, repository):
+        credential = DriversLicense("D-1", datetime(2024, 1, 1, tzinfo=UTC), datetime(2030, 1, 1, tzinfo=UTC),
+                                    ["A", "B"], "ca", "on")
+        repository.create_credential(credential)
+
+        stored = repository.get_credential("D-1", CredentialType.DRIVERS_LICENSE, "ca")
+
+        assert stored.snapshot() == credential.snapshot()
+
+    def test_given_missing_credential_when_getting_then_raises_not_found(self, repository):
+        with pytest.raises(CredentialNotFoundException):
+            repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+    def test_given_bulk_issuance_when_creating_many_then_writes_all_and_omits_missing_keys_on_read(self, repository):
+        assert repository.create_credentials([passport(f"P-{i}") for i in range(1200)]) == []
+        found = CredentialKey("P-1199", CredentialType.PASSPORT, "ca")
+        missing = CredentialKey("P-1200", CredentialType.PASSPORT, "ca")
+
+        assert list(repository.get_credentials([found, missing])) == [found]
+
+    def test_given_fields_when_getting_credential_fields_then_returns_only_those(self, repository):
+        repository.create_credential(passport("P-1"))
+
+        fields = repository.get_credential_fields("P-1", CredentialType.PASSPORT, "ca", ["status", "version"])
+
+        assert fields == {"status": CredentialStatus.ACTIVE, "version": 1}
+
+    def test_given_credentials_when_listing_by_status_then_pages_through_matches_in_index_order(self, repository):
+        for credential_id in ["P-3", "P-1", "P-2"]:
+            repository.create_credential(passport(credential_id))
+        repository.create_credential(passport("P-9", issuing_country="us"))
+        repository.transition_credential_status("P-2", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        first = repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1)
+        second = repository.list_credentials("ca", CredentialStatus.ACTIVE, limit=1, cursor=first.next_cursor)
+
+        assert [c.credential_id for c in first.credentials] == ["P-1"]
+        assert [c.credential_id for c in second.credentials] == ["P-3"]
+        assert second.next_cursor is None
+
+    def test_given_cursor_for_other_filter_when_listing_then_raises_invalid_cursor(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.create_credential(passport("P-2"))
+        cursor = repository.list_credentials("ca", limit=1).next_cursor
+
+        with pytest.raises(InvalidCursorException):
+            repository.list_credentials("ca", CredentialStatus.ACTIVE, cursor=cursor)
+
+    def test_given_expiring_credentials_when_listing_then_returns_expirable_ones_in_range(self, repository):
+        repository.create_credential(passport("P-1", datetime(2025, 1, 1, tzinfo=UTC)))
+        repository.create_credential(passport("P-2", datetime(2025, 6, 1, tzinfo=UTC)))
+        repository.create_credential(passport("P-3", datetime(2025, 6, 1, tzinfo=UTC)))
+        repository.create_credential(passport("P-4", datetime(2026, 1, 1, tzinfo=UTC)))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        expiring = list(repository.iter_expiring_credentials(datetime(2026, 1, 1, tzinfo=UTC), page_size=1))
+
+        assert [c.credential_id for c in expiring] == ["P-2", "P-3"]
+
+    def test_given_stale_version_when_updating_status_then_raises_version_conflict(self, repository):
+        repository.create_credential(passport("P-1"))
+        stale = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+
+        stale.revoke("fraud")
+        with pytest.raises(CredentialVersionConflictException):
+            repository.update_credential_status(stale)
+        assert stale.version == 1
+
+    def test_given_current_version_when_updating_status_then_saves_and_bumps_version(self, repository):
+        repository.create_credential(passport("P-1"))
+        credential = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+        credential.revoke("fraud")
+        repository.update_credential_status(credential)
+
+        assert credential.version == 2
+        stored = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+        assert (stored.status, stored.revocation_reason, stored.version) == (CredentialStatus.REVOKED, "fraud", 2)
+        assert repository.list_credentials("ca", CredentialStatus.REVOKED).credentials[0].credential_id == "P-1"
+
+    def test_given_revoked_credential_when_suspending_then_raises_invalid_state_and_keeps_row(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        with pytest.raises(InvalidCredentialStateException, match="Cannot suspend a revoked credential"):
+            repository.transition_credential_status(
+                "P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+        assert repository.get_credential("P-1", CredentialType.PASSPORT, "ca").version == 2
+
+    def test_given_reinstatement_when_transitioning_then_clears_suspension_reason(self, repository):
+        repository.create_credential(passport("P-1"))
+        repository.transition_credential_status("P-1", CredentialType.PASSPORT, "ca", CredentialStatus.SUSPENDED, "lost")
+
+        credential = repository.transition_credential_status(
+            "P-1", CredentialType.PASSPORT, "ca", CredentialStatus.ACTIVE, None, expected_version=2)
+
+        assert (credential.status, credential.suspension_reason, credential.version) == (
+            CredentialStatus.ACTIVE, None, 3)
+
+    def test_given_threads_when_transitioning_concurrently_then_each_sees_its_own_connection(self, database,
+                                                                                            repository):
+        repository.create_credentials([passport(f"P-{i}") for i in range(8)])
+
+        def revoke(credential_id):
+            repository.transition_credential_status(
+                credential_id, CredentialType.PASSPORT, "ca", CredentialStatus.REVOKED, "fraud")
+
+        threads = [threading.Thread(target=revoke, args=(f"P-{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(repository.list_credentials("ca", CredentialStatus.REVOKED).credentials) == 8
+        assert len(database._connections) == 9
+
+    def test_given_reopened_database_when_getting_then_reads_committed_rows(self, tmp_path):
+        database = SqliteDatabase(str(tmp_path / 'credentials.db'))
+        SqliteCredentialRepository(database).create_credential(passport("P-1"))
+        database.close()
+
+        reopened = SqliteDatabase(str(tmp_path / 'credentials.db'))
+        try:
+            credential = SqliteCredentialRepository(reopened).get_credential("P-1", CredentialType.PASSPORT, "ca")
+        finally:
+            reopened.close()
+
+        assert credential.credential_id == "P-1"
+
+    def test_given_row_in_older_payload_format_when_getting_then_reads_it(self, database, repository):
+        repository.create_credential(passport("P-1"))
+        # The cache codec's version-1 array that earlier releases stored
+        legacy_payload = json.dumps([1, "passport", "P-1", "ca", 1704067200000000, 2019686400000000, "suspended",
+                                     "lost", None, 4, "Canadian"]).encode()
+        database.connection().execute("UPDATE credentials SET payload = ?", (legacy_payload,))
+
+        credential = repository.get_credential("P-1", CredentialType.PASSPORT, "ca")
+
+        assert (credential.status, credential.suspension_reason, credential.version) == (
+            CredentialStatus.SUSPENDED, "lost", 4)
+        assert credential.valid_until == datetime(2034, 1, 1, tzinfo=UTC)
@@ -1,15 +1,15 @@
 import pytest
 from fastapi import HTTPException
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 
 from app.infrastructure.exceptions.database_exception import DatabaseException
 from app.rest.exceptions.api_auth_middleware import verify_api_key
-from app.application.services.api_auth_service import ApiAuthService
+from app.application.services.async_api_auth_service import AsyncApiAuthService
 
 
 @pytest.fixture
 def mock_auth_service():
-    return Mock(spec=ApiAuthService)
+    return AsyncMock(spec=AsyncApiAuthService)
 
 
 class TestApiAuthMiddleware:
@@ -22,7 +22,7 @@ class TestApiAuthMiddleware:
         result = await verify_key("valid-api-key")
 
         assert result == "valid-api-key"
-        mock_auth_service.validate_api_key.assert_called_once_with("valid-api-key")
+        mock_auth_service.validate_api_key.assert_awaited_once_with("valid-api-key")
 
     @pytest.mark.asyncio
     async def test_given_invalid_api_key_when_verifying_then_raises_unauthorized_exception(
@@ -35,7 +35,7 @@ class TestApiAuthMiddleware:
 
         assert exc_info.value.status_code == 401
         assert "Invalid API key" in exc_info.value.detail
-        mock_auth_service.validate_api_key.assert_called_once_with("invalid-api-key")
+        mock_auth_service.validate_api_key.assert_awaited_once_with("invalid-api-key")
 
     @pytest.mark.asyncio
     async def test_given_database_error_when_verifying_api_key_then_raises_database_exception(
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, UTC
 
 from app.rest.assemblers.passport_assembler import PassportAssembler
+from app.rest.exceptions.invalid_credential_data_exception import InvalidCredentialDataException
 from app.domain.enums.credential_status import CredentialStatus
 from app.domain.models.passport import Passport
 
@@ -60,4 +61,23 @@ class TestPassportAssembler:
         dto = assembler.to_dto(passport)
 
         assert dto.status == CredentialStatus.REVOKED.value
-        assert dto.revocation_reason == "Test revocation"
\ No newline at end of file
+        assert dto.revocation_reason == "Test revocation"
+
+    def test_given_fields_parameter_when_parsing_then_returns_unique_field_names(self):
+        assembler = PassportAssembler()
+
+        assert assembler.parse_fields("status, nationality,status") == ["status", "nationality"]
+
+    def test_given_unknown_field_when_parsing_then_raises_invalid_data_exception(self):
+        assembler = PassportAssembler()
+
+        with pytest.raises(InvalidCredentialDataException):
+            assembler.parse_fields("status,vehicle_classes")
+
+    def test_given_decoded_fields_when_converting_to_partial_dto_then_serializes_values(self):
+        assembler = PassportAssembler()
+
+        partial = assembler.to_partial_dto({"status": CredentialStatus.REVOKED,
+                                            "valid_until": datetime(2034, 12, 31, tzinfo=UTC)})
+
+        assert partial == {"status": "revoked", "valid_until": "2034-12-31T00:00:00+00:00"}
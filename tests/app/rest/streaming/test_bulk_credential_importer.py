@@ -0,0 +1,83 @@
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from app.infrastructure.exceptions.database_exception import DatabaseException
+from app.rest.assemblers.passport_assembler import PassportAssembler
+from app.rest.streaming.bulk_credential_importer import BulkCredentialImporter
+from app.rest.streaming.ndjson_reader import NdjsonLine
+
+
+def passport_line(number: int, credential_id: str) -> NdjsonLine:
+    return NdjsonLine(number, json.dumps({
+        "credential_id": credential_id,
+        "valid_from": "2024-01-01T00:00:00+00:00",
+        "valid_until": "2034-12-31T00:00:00+00:00",
+        "nationality": "Canadian",
+        "issuing_country": "CA"
+    }).encode())
+
+
+async def lines(*ndjson_lines: NdjsonLine):
+    for line in ndjson_lines:
+        yield line
+
+
+@pytest.fixture
+def mock_service():
+    service = AsyncMock()
+    service.create_credentials.return_value = []
+    return service
+
+
+@pytest.fixture
+def importer(mock_service):
+    return BulkCredentialImporter(mock_service, PassportAssembler(), batch_size=2)
+
+
+async def run(importer, *ndjson_lines):
+    return [result async for result in importer.import_lines(lines(*ndjson_lines))]
+
+
+class TestBulkCredentialImporter:
+    @pytest.mark.asyncio
+    async def test_given_valid_lines_when_importing_then_writes_in_batches(self, importer, mock_service):
+        results = await run(importer, passport_line(1, "p1"), passport_line(2, "p2"), passport_line(3, "p3"))
+
+        assert [result["status"] for result in results] == ["created"] * 3
+        assert [len(call.args[0]) for call in mock_service.create_credentials.call_args_list] == [2, 1]
+        assert importer.summary() == {"summary": {"created": 3, "failed": 0}}
+
+    @pytest.mark.asyncio
+    async def test_given_invalid_lines_when_importing_then_reports_them_without_aborting(self, importer):
+        results = await run(
+            importer,
+            NdjsonLine(1, b'{not json'),
+            NdjsonLine(2, b'{"credential_id": "missing-fields"}'),
+            NdjsonLine(3, None),
+            passport_line(4, "p4")
+        )
+
+        by_line = {result["line"]: result for result in results}
+        assert by_line[1]["error"].startswith("Invalid JSON")
+        assert "Invalid credential data" in by_line[2]["error"]
+        assert "maximum allowed size" in by_line[3]["error"]
+        assert by_line[4]["status"] == "created"
+
+    @pytest.mark.asyncio
+    async def test_given_unprocessed_credentials_when_importing_then_reports_only_those(self, importer, mock_service):
+        mock_service.create_credentials.side_effect = lambda credentials: credentials[1:]
+
+        results = await run(importer, passport_line(1, "p1"), passport_line(2, "p2"))
+
+        assert [result["status"] for result in results] == ["created", "error"]
+        assert results[1]["credential_id"] == "p2"
+
+    @pytest.mark.asyncio
+    async def test_given_failing_batch_write_when_importing_then_fails_only_that_batch(self, importer, mock_service):
+        mock_service.create_credentials.side_effect = [DatabaseException("boom"), []]
+
+        results = await run(importer, passport_line(1, "p1"), passport_line(2, "p2"), passport_line(3, "p3"))
+
+        assert [result["status"] for result in results] == ["error", "error", "created"]
+        assert importer.summary() == {"summary": {"created": 1, "failed": 2}}
@@ -0,0 +1,35 @@
+import pytest
+
+from app.rest.streaming.ndjson_reader import iter_ndjson_lines
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(chunks, **kwargs):
+    return [line async for line in iter_ndjson_lines(chunks, **kwargs)]
+
+
+class TestNdjsonReader:
+    @pytest.mark.asyncio
+    async def test_given_lines_split_across_chunks_when_reading_then_yields_complete_lines(self):
+        lines = await collect(stream(b'{"a": 1}\n{"b"', b': 2}\n', b'{"c": 3}'))
+
+        assert [(line.number, line.content) for line in lines] == [
+            (1, b'{"a": 1}'), (2, b'{"b": 2}'), (3, b'{"c": 3}')
+        ]
+
+    @pytest.mark.asyncio
+    async def test_given_blank_lines_when_reading_then_skips_them_but_keeps_numbering(self):
+        lines = await collect(stream(b'{"a": 1}\n\n  \r\n{"b": 2}\n'))
+
+        assert [line.number for line in lines] == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_given_oversized_line_when_reading_then_flags_it_and_continues(self):
+        lines = await collect(stream(b'{"a": 1}\n', b'x' * 30, b'x' * 30, b'\n{"b": 2}\n'), max_line_bytes=40)
+
+        assert [(line.number, line.too_long) for line in lines] == [(1, False), (2, True), (3, False)]
+        assert lines[2].content == b'{"b": 2}'
@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import Mock
+
+from app.rest.invocation_end_handler import InvocationEndHandler
+
+
+class TestInvocationEndHandler:
+    def test_given_invocation_when_handled_then_runs_hook_after_handler(self):
+        calls = []
+        handler = InvocationEndHandler(lambda event, context: calls.append("handler") or {"statusCode": 200},
+                                       lambda: calls.append("hook"))
+
+        response = handler({}, None)
+
+        assert response == {"statusCode": 200}
+        assert calls == ["handler", "hook"]
+
+    def test_given_failing_hook_when_handled_then_still_returns_response(self):
+        handler = InvocationEndHandler(Mock(return_value={"statusCode": 200}), Mock(side_effect=RuntimeError("down")))
+
+        assert handler({}, None) == {"statusCode": 200}
+
+    def test_given_failing_handler_when_handled_then_runs_hook_and_reraises(self):
+        hook = Mock()
+        handler = InvocationEndHandler(Mock(side_effect=ValueError("boom")), hook)
+
+        with pytest.raises(ValueError):
+            handler({}, None)
+        hook.assert_called_once()
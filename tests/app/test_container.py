@@ -0,0 +1,176 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from app.container import ApplicationContainer, get_container, set_container
+from app.infrastructure.cache.cache_config import CacheConfig
+from app.infrastructure.concurrency.coalescing_config import CoalescingConfig
+from app.infrastructure.concurrency.read_batching_config import ReadBatchingConfig
+from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
+from app.infrastructure.persistence.inline_call_executor import InlineCallExecutor
+from app.infrastructure.persistence.repositories.batching_credential_repository import BatchingCredentialRepository
+from app.infrastructure.persistence.repositories.caching_credential_repository import CachingCredentialRepository
+from app.infrastructure.persistence.repositories.coalescing_async_credential_repository import (
+    CoalescingAsyncCredentialRepository)
+from app.infrastructure.persistence.repositories.coalescing_credential_repository import CoalescingCredentialRepository
+from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
+from app.infrastructure.persistence.repositories.dynamodb_client_credential_repository import (
+    DynamoDBClientCredentialRepository)
+from app.infrastructure.persistence.repositories.in_memory_api_key_repository import InMemoryApiKeyRepository
+from app.infrastructure.persistence.repositories.in_memory_credential_repository import InMemoryCredentialRepository
+from app.infrastructure.persistence.repositories.sqlite_api_key_repository import SqliteApiKeyRepository
+from app.infrastructure.persistence.repositories.sqlite_credential_repository import SqliteCredentialRepository
+from app.infrastructure.persistence.repository_config import RepositoryConfig
+
+
+@pytest.fixture
+def config():
+    return DatabaseConfig(
+        endpoint_url='http://localhost:8000',
+        region='local',
+        access_key_id='dummy',
+        secret_access_key='dummy'
+    )
+
+
+@pytest.fixture
+def installed_container():
+    container = ApplicationContainer()
+    set_container(container)
+    yield container
+    set_container(None)
+
+
+class TestApplicationContainer:
+    def test_given_container_when_resolving_db_manager_twice_then_builds_resource_once(self, config):
+        with patch('boto3.resource') as mock_resource:
+            container = ApplicationContainer(config)
+
+            first = container.db_manager
+            second = container.db_manager
+
+        assert first is second
+        mock_resource.assert_called_once()
+
+    def test_given_container_when_resolving_services_then_repositories_are_shared(self, config):
+        with patch('boto3.resource'):
+            container = ApplicationContainer(config)
+
+            credential_service = container.credential_service
+            api_key_service = container.api_key_service
+
+        assert credential_service is container.credential_service
+        assert credential_service._repository is container.credential_repository
+        assert api_key_service._repository is container.api_key_repository
+        assert container.credential_repository._mapperFactory is container.mapper_provider
+
+    def test_given_enabled_cache_config_when_resolving_credential_repository_then_wraps_it_in_cache(self, config):
+        with patch('boto3.resource'):
+            container = ApplicationContainer(config, cache_config=CacheConfig(enabled=True))
+
+            repository = container.credential_repository
+
+        assert isinstance(repository, CachingCredentialRepository)
+        assert isinstance(repository._repository, DynamoDBCredentialRepository)
+
+    def test_given_enabled_coalescing_when_resolving_repositories_then_coalesces_directly_above_dynamodb(self, config):
+        with patch('boto3.resource'):
+            container = ApplicationContainer(config, cache_config=CacheConfig(enabled=True),
+                                             coalescing_config=CoalescingConfig(enabled=True))
+
+            repository = container.credential_repository
+            async_repository = container.async_credential_repository
+
+        assert isinstance(repository._repository, CoalescingCredentialRepository)
+        assert isinstance(repository._repository._repository, DynamoDBCredentialRepository)
+        assert isinstance(async_repository, CoalescingAsyncCredentialRepository)
+        assert set(container.coalescing_stats()) == {'credentials', 'async_credentials'}
+
+    def test_given_enabled_read_batching_when_resolving_repository_then_batches_point_reads_of_dynamodb(self, config):
+        with patch('boto3.resource'):
+            container = ApplicationContainer(config, read_batching_config=ReadBatchingConfig(enabled=True),
+                                             coalescing_config=CoalescingConfig(enabled=True))
+
+            repository = container.credential_repository
+
+        assert isinstance(repository._repository, BatchingCredentialRepository)
+        assert repository._repository._repository is container.dynamodb_credential_repository
+        assert container.read_batching_stats().batches == 0
+
+    def test_given_memory_repository_type_when_resolving_repositories_then_never_touches_dynamodb(self, config):
+        with patch('boto3.resource') as mock_resource:
+            container = ApplicationContainer(config, repository_config=RepositoryConfig(type='memory'))
+
+            credential_repository = container.credential_repository
+            api_key_repository = container.api_key_repository
+            sweeper = container.expiry_sweeper
+
+        assert isinstance(credential_repository, InMemoryCredentialRepository)
+        assert isinstance(api_key_repository, InMemoryApiKeyRepository)
+        assert sweeper._repository is credential_repository
+        assert isinstance(container.blocking_executor, InlineCallExecutor)
+        mock_resource.assert_not_called()
+
+    def test_given_sqlite_repository_type_when_resolving_repositories_then_share_one_database(self, config, tmp_path):
+        with patch('boto3.resource') as mock_resource:
+            container = ApplicationContainer(config, repository_config=RepositoryConfig(
+                type='sqlite', sqlite_path=str(tmp_path / 'credentials.db')))
+
+            credential_repository = container.credential_repository
+            api_key_repository = container.api_key_repository
+            checkpoints = container.job_checkpoint_repository
+
+        assert isinstance(credential_repository, SqliteCredentialRepository)
+        assert isinstance(api_key_repository, SqliteApiKeyRepository)
+        assert checkpoints._database is credential_repository._database is api_key_repository._database
+        assert not isinstance(container.blocking_executor, InlineCallExecutor)
+        mock_resource.assert_not_called()
+        container.sqlite_database.close()
+
+    def test_given_client_api_when_resolving_dynamodb_repository_then_uses_low_level_client_path(self, config):
+        config.client_api = 'client'
+        with patch('boto3.resource'):
+            container = ApplicationContainer(config)
+
+            repository = container.dynamodb_credential_repository
+
+        assert isinstance(repository, DynamoDBClientCredentialRepository)
+
+    def test_given_memory_repository_with_read_batching_when_resolving_executor_then_keeps_thread_pool(self, config):
+        container = ApplicationContainer(config, repository_config=RepositoryConfig(type='memory'),
+                                         read_batching_config=ReadBatchingConfig(enabled=True))
+
+        assert not isinstance(container.blocking_executor, InlineCallExecutor)
+
+    def test_given_container_when_resolving_async_services_then_wrap_the_shared_repositories(self, config):
+        repository = Mock()
+        container = ApplicationContainer(config, credential_repository=repository)
+
+        async_repository = container.async_credential_service._repository
+
+        assert async_repository._repository is repository
+        assert async_repository._executor is container.blocking_executor
+        assert container.blocking_executor.max_workers == config.executor_max_workers
+
+    def test_given_overridden_repository_when_resolving_service_then_uses_override(self, config):
+        repository = Mock()
+        container = ApplicationContainer(config, credential_repository=repository)
+
+        assert container.credential_service._repository is repository
+
+    def test_given_unknown_component_when_overriding_then_raises_attribute_error(self, config):
+        container = ApplicationContainer(config)
+
+        with pytest.raises(AttributeError):
+            container.override(unknown=Mock())
+
+    def test_given_reset_container_when_resolving_then_rebuilds_components(self, config):
+        container = ApplicationContainer(config, credential_repository=Mock())
+        first = container.credential_service
+
+        container.reset()
+        container.override(credential_repository=Mock())
+
+        assert container.credential_service is not first
+
+    def test_given_installed_container_when_getting_container_then_returns_it(self, installed_container):
+        assert get_container() is installed_container
@@ -2,7 +2,8 @@ import pytest
 from unittest.mock import patch, Mock
 
 from app.application.services.credential_service import CredentialService
-from app.dependencies import get_credential_service
+from app.container import ApplicationContainer
+from app.dependencies import get_credential_service, get_credential_repository
 from app.infrastructure.persistence.dynamodb.database_config import DatabaseConfig
 from app.infrastructure.persistence.dynamodb.dynamodb_manager import DynamoDBManager
 from app.infrastructure.persistence.repositories.dynamodb_credential_repository import DynamoDBCredentialRepository
@@ -27,11 +28,16 @@ def mock_db_manager():
 
 
 @pytest.fixture
-def mock_repository(mock_db_manager):
-    return DynamoDBCredentialRepository(mock_db_manager)
+def container(mock_db_manager):
+    return ApplicationContainer(db_manager=mock_db_manager)
 
 
-def test_when_getting_credential_service_then_return_repository_and_service(mock_repository):
-    service = get_credential_service(mock_repository)
+def test_when_getting_credential_service_then_return_repository_and_service(container):
+    service = get_credential_service(container)
     assert isinstance(service, CredentialService)
-    assert isinstance(service._repository, DynamoDBCredentialRepository)
\ No newline at end of file
+    assert isinstance(service._repository, DynamoDBCredentialRepository)
+
+
+def test_when_getting_credential_service_twice_then_returns_same_instance(container):
+    assert get_credential_service(container) is get_credential_service(container)
+    assert get_credential_repository(container) is get_credential_service(container)._repository